@@ -1,15 +1,17 @@
 """Main FastAPI application with clean architecture."""
 
 import os
+import hmac
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 import time
 from dotenv import load_dotenv
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 # Load environment variables
 load_dotenv()
@@ -17,6 +19,13 @@ load_dotenv()
 from src.infrastructure.web.api.auth_routes import router as auth_router
 from src.infrastructure.web.api.telegram_routes import router as telegram_router  
 from src.infrastructure.web.api.group_routes import router as group_router
+from src.infrastructure.web.api.sync_routes import router as sync_router
+from src.infrastructure.web.api.template_routes import router as template_router
+from src.infrastructure.web.api.media_routes import router as media_router
+from src.infrastructure.container import Container, get_settings
+from src.infrastructure.rate_limiting.rate_limit_middleware import RateLimitMiddleware
+from src.infrastructure.rate_limiting.rate_limit_policy import DEFAULT_RATE_LIMIT_POLICIES
+from src.infrastructure.database.indexes import ensure_indexes, log_index_reports
 
 
 # Configure logging
@@ -32,14 +41,24 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     logger.info("🚀 Starting Telegram Auto Sender API v2.0")
     
-    # Startup
+    # Startup: build application-scoped repositories, services and pools once
+    container = Container(get_settings())
+    app.state.container = container
+    
     try:
-        # Initialize database connections, etc.
+        # Warm the Mongo pool, start write-behind flushing of template usage counters
+        await container.start()
+        
+        # Initialize database indexes
+        if container.database is not None:
+            log_index_reports(await ensure_indexes(container.database))
+        
         logger.info("✅ Application started successfully")
         yield
     finally:
         # Cleanup
         logger.info("🔄 Shutting down application...")
+        await container.close()
         logger.info("✅ Application shutdown complete")
 
 
@@ -61,6 +80,17 @@ app.add_middleware(
     allowed_hosts=os.environ.get("ALLOWED_HOSTS", "*").split(",")
 )
 
+# Rate limiting, before routing so throttled requests never reach dependencies
+# (added before CORS so 429 responses still carry CORS headers)
+if get_settings()["rate_limit_enabled"]:
+    app.add_middleware(
+        RateLimitMiddleware,
+        policies=DEFAULT_RATE_LIMIT_POLICIES,
+        jwt_secret=get_settings()["jwt_secret"],
+        jwt_algorithm=get_settings()["jwt_algorithm"],
+        trust_forwarded=get_settings()["rate_limit_trust_forwarded"]
+    )
+
 # CORS Middleware
 app.add_middleware(
     CORSMiddleware,
@@ -137,6 +167,25 @@ async def health_check():
     }
 
 
+# Prometheus metrics endpoint
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus metrics, for scrapers presenting METRICS_TOKEN as bearer token."""
+    metrics_token = get_settings()["metrics_token"]
+    if not metrics_token:
+        return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content={"detail": "Not Found"})
+    
+    authorization = request.headers.get("authorization", "")
+    if not hmac.compare_digest(authorization.encode(), f"Bearer {metrics_token}".encode()):
+        return JSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": "Invalid metrics token"},
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -154,6 +203,9 @@ async def root():
 app.include_router(auth_router, prefix="/api")
 app.include_router(telegram_router, prefix="/api") 
 app.include_router(group_router, prefix="/api")
+app.include_router(template_router, prefix="/api")
+app.include_router(sync_router, prefix="/api")
+app.include_router(media_router, prefix="/api")
 
 
 if __name__ == "__main__":
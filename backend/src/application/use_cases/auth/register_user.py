@@ -6,7 +6,7 @@ from typing import Dict, Any
 from dataclasses import dataclass
 
 from ....domain.entities.user import User, UserId, UserStatus, SubscriptionType
-from ....domain.repositories.user_repository import UserRepository
+from ....domain.repositories.user_repository import UserRepository, DuplicateUserError
 from ....domain.services.authentication_service import AuthenticationService
 
 
@@ -31,29 +31,26 @@ class RegisterUserUseCase:
         # Validate input
         await self._validate_command(command)
         
-        # Check if user already exists
-        if await self.user_repository.exists_username(command.username):
-            raise ValueError("Username already exists")
-        
-        if await self.user_repository.exists_email(command.email):
-            raise ValueError("Email already exists")
-        
         # Create new user
         user = User(
             id=UserId(str(uuid.uuid4())),
             username=command.username,
             email=command.email,
-            password_hash=self.auth_service.hash_password(command.password),
+            password_hash=await self.auth_service.hash_password(command.password),
             full_name=command.full_name,
             status=UserStatus.ACTIVE,
             subscription_type=SubscriptionType.FREE,
-            api_token=self.auth_service.generate_api_token(),
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow()
         )
         
-        # Save user
-        await self.user_repository.save(user)
+        api_token = self.auth_service.issue_api_token(user)
+        
+        # Single insert; unique indexes reject taken usernames and emails atomically
+        try:
+            await self.user_repository.create(user)
+        except DuplicateUserError as e:
+            raise ValueError(str(e))
         
         # Create access token
         access_token = self.auth_service.create_access_token(user)
@@ -65,7 +62,7 @@ class RegisterUserUseCase:
                 "email": user.email,
                 "full_name": user.full_name,
                 "subscription_type": user.subscription_type.value,
-                "api_token": user.api_token
+                "api_token": api_token
             },
             "access_token": access_token,
             "token_type": "bearer"
@@ -13,6 +13,7 @@ from ....domain.services.telegram_service import TelegramService, TelegramError
 @dataclass
 class AddGroupCommand:
     """Command to add group."""
+    user_id: str
     session_id: str
     identifier: str  # Can be username, group_id, or invite_link
 
@@ -41,13 +42,14 @@ class AddGroupUseCase:
                 raise ValueError(f"Invalid group: {validation_result['error']}")
             
             # Check if group already exists
-            existing = await self.group_repository.find_by_telegram_id(validation_result["id"])
+            existing = await self.group_repository.find_by_telegram_id(command.user_id, validation_result["id"])
             if existing:
                 raise ValueError("Group already exists")
             
             # Create group entity
             group = Group(
                 id=GroupId(str(uuid.uuid4())),
+                user_id=command.user_id,
                 telegram_id=validation_result["id"],
                 name=validation_result["title"],
                 username=validation_result.get("username"),
@@ -74,6 +76,9 @@ class AddGroupUseCase:
     
     def _validate_command(self, command: AddGroupCommand) -> None:
         """Validate add group command."""
+        if not command.user_id or len(command.user_id.strip()) == 0:
+            raise ValueError("User ID is required")
+        
         if not command.session_id or len(command.session_id.strip()) == 0:
             raise ValueError("Session ID is required")
         
@@ -6,13 +6,14 @@ from dataclasses import dataclass
 
 from ....domain.entities.group import Group, GroupId
 from ....domain.entities.telegram_session import SessionId
-from ....domain.repositories.group_repository import GroupRepository
+from ....domain.repositories.group_repository import GroupRepository, GroupWriteError
 from ....domain.services.telegram_service import TelegramService, TelegramError
 
 
 @dataclass
 class BulkAddGroupsCommand:
     """Command to bulk add groups."""
+    user_id: str
     session_id: str
     identifiers: List[str]  # List of username/group_id/invite_link
 
@@ -59,7 +60,7 @@ class BulkAddGroupsUseCase:
                         continue
                     
                     # Check if group already exists
-                    existing = await self.group_repository.find_by_telegram_id(validation_result["id"])
+                    existing = await self.group_repository.find_by_telegram_id(command.user_id, validation_result["id"])
                     if existing:
                         results["skipped"].append({
                             "identifier": identifier,
@@ -71,19 +72,20 @@ class BulkAddGroupsUseCase:
                     # Create group entity
                     group = Group(
                         id=GroupId(str(uuid.uuid4())),
+                        user_id=command.user_id,
                         telegram_id=validation_result["id"],
                         name=validation_result["title"],
                         username=validation_result.get("username"),
                         invite_link=identifier if identifier.startswith('https://t.me/+') else None
                     )
                     
-                    groups_to_save.append(group)
-                    
-                    results["added"].append({
+                    added = {
                         "identifier": identifier,
                         "name": validation_result["title"],
                         "group_id": validation_result["id"]
-                    })
+                    }
+                    groups_to_save.append((group, added))
+                    results["added"].append(added)
                     
                 except Exception as e:
                     results["errors"].append({
@@ -93,7 +95,19 @@ class BulkAddGroupsUseCase:
             
             # Bulk save groups
             if groups_to_save:
-                await self.group_repository.bulk_save(groups_to_save)
+                try:
+                    await self.group_repository.bulk_save([group for group, _ in groups_to_save])
+                except GroupWriteError as e:
+                    # e.g. two identifiers of the same group; the other groups were saved
+                    failed_ids = {group.id.value for group in e.failed}
+                    for group, added in groups_to_save:
+                        if group.id.value in failed_ids:
+                            results["added"].remove(added)
+                            results["skipped"].append({
+                                "identifier": added["identifier"],
+                                "name": added["name"],
+                                "reason": "Already exists"
+                            })
             
             return results
             
@@ -104,6 +118,9 @@ class BulkAddGroupsUseCase:
     
     def _validate_command(self, command: BulkAddGroupsCommand) -> None:
         """Validate bulk add groups command."""
+        if not command.user_id or len(command.user_id.strip()) == 0:
+            raise ValueError("User ID is required")
+        
         if not command.session_id or len(command.session_id.strip()) == 0:
             raise ValueError("Session ID is required")
         
@@ -0,0 +1,129 @@
+"""Bulk group mutation use case."""
+
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass
+
+from ....domain.entities.group import GroupId, GroupStatus, BlacklistReason
+from ....domain.repositories.group_repository import GroupRepository
+
+
+MAX_BULK_IDS = 10000
+
+# Filter-only actions can match any number of groups; list at most this many outcomes
+MAX_BULK_RESULTS = MAX_BULK_IDS
+
+BULK_ACTIONS = ("delete", "activate", "deactivate", "blacklist", "unblacklist")
+
+BLACKLISTED_STATUSES = [GroupStatus.BLACKLISTED_TEMP, GroupStatus.BLACKLISTED_PERM]
+
+
+@dataclass
+class BulkGroupActionCommand:
+    """Command to mutate many groups at once."""
+    user_id: str
+    action: str  # One of BULK_ACTIONS
+    group_ids: Optional[List[str]] = None
+    status_filter: Optional[str] = None
+    blacklist_reason: Optional[str] = None
+    duration_seconds: Optional[int] = None  # Temporary blacklist when set, permanent otherwise
+
+
+class BulkGroupActionUseCase:
+    """Use case for bulk delete/activate/deactivate/blacklist/unblacklist."""
+    
+    def __init__(self, group_repository: GroupRepository):
+        self.group_repository = group_repository
+    
+    async def execute(self, command: BulkGroupActionCommand) -> Dict[str, Any]:
+        """Execute bulk group action use case."""
+        self._validate_command(command)
+        
+        group_ids = [GroupId(group_id) for group_id in command.group_ids] if command.group_ids is not None else None
+        statuses = [GroupStatus(command.status_filter)] if command.status_filter else None
+        
+        if command.action == "delete":
+            affected = await self.group_repository.bulk_delete(command.user_id, group_ids, statuses)
+            outcome = "deleted"
+        else:
+            affected = await self._update_status(command, group_ids, statuses)
+            outcome = "updated"
+        
+        # Per-id outcomes: requested IDs that did not match are reported too
+        affected_set = set(affected)
+        requested = command.group_ids if command.group_ids is not None else affected
+        results = [
+            {"group_id": group_id, "outcome": outcome if group_id in affected_set else "not_matched"}
+            for group_id in islice(dict.fromkeys(requested), MAX_BULK_RESULTS)
+        ]
+        
+        return {
+            "action": command.action,
+            "matched": len(affected),
+            "results": results,
+            "results_truncated": len(affected) > MAX_BULK_RESULTS and command.group_ids is None
+        }
+    
+    async def _update_status(self, command: BulkGroupActionCommand, group_ids: Optional[List[GroupId]],
+                             statuses: Optional[List[GroupStatus]]) -> List[str]:
+        """Apply status-changing action."""
+        if command.action == "activate":
+            return await self.group_repository.bulk_update_status(
+                command.user_id, GroupStatus.ACTIVE, group_ids, statuses
+            )
+        
+        if command.action == "deactivate":
+            return await self.group_repository.bulk_update_status(
+                command.user_id, GroupStatus.INACTIVE, group_ids, statuses
+            )
+        
+        if command.action == "unblacklist":
+            # Only blacklisted groups are affected, whatever the filter
+            if statuses and not set(statuses) & set(BLACKLISTED_STATUSES):
+                return []
+            return await self.group_repository.bulk_update_status(
+                command.user_id, GroupStatus.ACTIVE, group_ids, statuses or BLACKLISTED_STATUSES
+            )
+        
+        # blacklist
+        reason = BlacklistReason(command.blacklist_reason)
+        if command.duration_seconds is not None:
+            return await self.group_repository.bulk_update_status(
+                command.user_id, GroupStatus.BLACKLISTED_TEMP, group_ids, statuses,
+                blacklist_reason=reason,
+                blacklist_until=datetime.utcnow() + timedelta(seconds=command.duration_seconds)
+            )
+        return await self.group_repository.bulk_update_status(
+            command.user_id, GroupStatus.BLACKLISTED_PERM, group_ids, statuses,
+            blacklist_reason=reason
+        )
+    
+    def _validate_command(self, command: BulkGroupActionCommand) -> None:
+        """Validate bulk group action command."""
+        if not command.user_id or len(command.user_id.strip()) == 0:
+            raise ValueError("User ID is required")
+        
+        if command.action not in BULK_ACTIONS:
+            raise ValueError(f"Unknown action: {command.action}")
+        
+        if command.group_ids is None and not command.status_filter:
+            raise ValueError("Either group_ids or status_filter is required")
+        
+        if command.group_ids is not None and len(command.group_ids) > MAX_BULK_IDS:
+            raise ValueError(f"At most {MAX_BULK_IDS} group IDs per request")
+        
+        if command.status_filter:
+            try:
+                GroupStatus(command.status_filter)
+            except ValueError:
+                raise ValueError("Invalid status filter")
+        
+        if command.action == "blacklist":
+            try:
+                BlacklistReason(command.blacklist_reason)
+            except ValueError:
+                raise ValueError("Valid blacklist reason is required")
+            
+            if command.duration_seconds is not None and command.duration_seconds <= 0:
+                raise ValueError("Blacklist duration must be positive; omit it for a permanent blacklist")
\ No newline at end of file
@@ -0,0 +1,113 @@
+"""Delta sync use case."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional, List
+from dataclasses import dataclass
+
+from ....domain.entities.message_template import MessageTemplate
+from ....domain.read_models.group_summary import GroupSummary
+from ....domain.read_models.session_summary import SessionSummary
+from ....domain.repositories.group_repository import GroupRepository
+from ....domain.repositories.telegram_session_repository import TelegramSessionRepository
+from ....domain.repositories.message_template_repository import MessageTemplateRepository
+from ....domain.repositories.tombstone_repository import TombstoneRepository
+
+
+# Changes are re-read from slightly before the watermark so writes whose
+# updated_at was stamped just before a previous sync are not missed.
+# Clients apply changes by id, so the overlap is harmless.
+SYNC_OVERLAP = timedelta(seconds=5)
+
+# Watermarks older than tombstone retention cannot be served as deltas
+MAX_DELTA_AGE = timedelta(days=30)
+
+
+@dataclass
+class GetChangesCommand:
+    """Command to get changes since a watermark."""
+    user_id: str
+    since: Optional[datetime] = None  # Full snapshot when None
+    
+    def __post_init__(self):
+        # Stored timestamps are naive UTC; convert offset-aware watermarks to match
+        if self.since is not None and self.since.tzinfo is not None:
+            self.since = self.since.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class GetChangesUseCase:
+    """Use case for delta sync of groups, sessions and templates."""
+    
+    def __init__(self, group_repository: GroupRepository, session_repository: TelegramSessionRepository,
+                 template_repository: MessageTemplateRepository, tombstone_repository: TombstoneRepository):
+        self.group_repository = group_repository
+        self.session_repository = session_repository
+        self.template_repository = template_repository
+        self.tombstone_repository = tombstone_repository
+    
+    async def execute(self, command: GetChangesCommand) -> Dict[str, Any]:
+        """Execute get changes use case."""
+        # Captured before reading so concurrent writes show up next time
+        watermark = datetime.utcnow()
+        
+        since = command.since
+        full = since is None or since < watermark - MAX_DELTA_AGE
+        query_since = None if full else since - SYNC_OVERLAP
+        
+        groups = await self.group_repository.list_changed_since(command.user_id, query_since)
+        sessions = await self.session_repository.list_changed_since(command.user_id, query_since)
+        templates = await self.template_repository.list_changed_since(query_since)
+        
+        deleted: Dict[str, List[str]] = {"groups": [], "sessions": [], "templates": []}
+        if not full:
+            for tombstone in await self.tombstone_repository.list_since(command.user_id, query_since):
+                deleted[f"{tombstone.entity_type}s"].append(tombstone.entity_id)
+        
+        return {
+            "watermark": watermark.isoformat(),
+            "full": full,
+            "groups": [self._group_to_dict(group) for group in groups],
+            "sessions": [self._session_to_dict(session) for session in sessions],
+            "templates": [self._template_to_dict(template) for template in templates],
+            "deleted": deleted
+        }
+    
+    def _group_to_dict(self, group: GroupSummary) -> Dict[str, Any]:
+        """Serialize group summary."""
+        return {
+            "id": group.id,
+            "telegram_id": group.telegram_id,
+            "name": group.name,
+            "username": group.username,
+            "invite_link": group.invite_link,
+            "status": group.status.value,
+            "message_count": group.message_count,
+            "last_message_sent": group.last_message_sent.isoformat() if group.last_message_sent else None,
+            "created_at": group.created_at.isoformat()
+        }
+    
+    def _session_to_dict(self, session: SessionSummary) -> Dict[str, Any]:
+        """Serialize session summary."""
+        return {
+            "session_id": session.session_id,
+            "phone_number": session.phone_number,
+            "is_authenticated": session.is_authenticated,
+            "telegram_user": {
+                "id": session.telegram_user.id,
+                "first_name": session.telegram_user.first_name,
+                "last_name": session.telegram_user.last_name,
+                "username": session.telegram_user.username
+            } if session.telegram_user else None
+        }
+    
+    def _template_to_dict(self, template: MessageTemplate) -> Dict[str, Any]:
+        """Serialize template."""
+        return {
+            "id": template.id.value,
+            "name": template.name,
+            "content": template.content,
+            "is_default": template.is_default,
+            "media_hash": template.media_hash.value if template.media_hash else None,
+            "usage_count": template.usage_count,
+            "last_used_at": template.last_used_at.isoformat() if template.last_used_at else None,
+            "created_at": template.created_at.isoformat()
+        }
\ No newline at end of file
@@ -0,0 +1,140 @@
+"""Send template to groups use case."""
+
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass
+
+from ....domain.entities.group import Group, GroupId, GroupStatus
+from ....domain.entities.media import MediaNotFoundError
+from ....domain.entities.message_template import MessageTemplate, TemplateId
+from ....domain.entities.telegram_session import SessionId
+from ....domain.repositories.group_repository import GroupRepository
+from ....domain.repositories.message_template_repository import MessageTemplateRepository
+from ....domain.repositories.telegram_session_repository import TelegramSessionRepository
+from ....domain.services.media_service import MediaService
+from ....domain.services.telegram_service import (
+    TelegramService, TelegramError, TelegramFloodError, TelegramFileReferenceExpiredError
+)
+from ....domain.services.template_renderer import TemplateRenderer
+from ....domain.services.template_usage_recorder import TemplateUsageRecorder
+
+
+MAX_GROUPS_PER_SEND = 1000
+
+# Groups loaded, rendered and saved together
+SEND_BATCH_SIZE = 50
+
+
+@dataclass
+class SendTemplateCommand:
+    """Command to send a template to the user's available groups."""
+    user_id: str
+    session_id: str
+    template_id: Optional[str] = None  # Default template when None
+    variables: Optional[Dict[str, Any]] = None
+    max_groups: int = 100
+
+
+class SendTemplateUseCase:
+    """Use case for sending a template to every available group of a user.
+    
+    Candidates are picked from the columnar GroupSet, so a large group
+    list is filtered without building an entity per group; the chosen
+    groups are then loaded, rendered and saved in batches. Messages are
+    rendered through the shared TemplateRenderer and every delivery
+    attempt is counted by the usage recorder. A flood wait applies
+    to the whole session, so it ends the run.
+    """
+    
+    def __init__(self, group_repository: GroupRepository, template_repository: MessageTemplateRepository,
+                 session_repository: TelegramSessionRepository, telegram_service: TelegramService,
+                 media_service: MediaService, renderer: TemplateRenderer, usage_recorder: TemplateUsageRecorder):
+        self.group_repository = group_repository
+        self.template_repository = template_repository
+        self.session_repository = session_repository
+        self.telegram_service = telegram_service
+        self.media_service = media_service
+        self.renderer = renderer
+        self.usage_recorder = usage_recorder
+    
+    async def execute(self, command: SendTemplateCommand) -> Optional[Dict[str, Any]]:
+        """Execute send template use case. Returns None if the session is not found."""
+        if not 1 <= command.max_groups <= MAX_GROUPS_PER_SEND:
+            raise ValueError(f"max_groups must be between 1 and {MAX_GROUPS_PER_SEND}")
+        
+        session_id = SessionId(command.session_id)
+        session = await self.session_repository.find_by_id(session_id)
+        if not session or session.user_id != command.user_id:
+            return None
+        if not session.is_valid():
+            raise ValueError("Session expired or invalid")
+        
+        if command.template_id:
+            template = await self.template_repository.find_by_id(TemplateId(command.template_id))
+        else:
+            template = await self.template_repository.find_default_template()
+        if not template:
+            raise ValueError("Template not found")
+        
+        group_set = await self.group_repository.load_group_set(
+            command.user_id, [GroupStatus.ACTIVE, GroupStatus.BLACKLISTED_TEMP]
+        )
+        group_ids = group_set.available_ids()[:command.max_groups]
+        
+        result = {"template_id": template.id.value, "attempted": 0, "sent": 0, "failed": 0,
+                  "flood_wait_seconds": None, "errors": []}
+        media_reference = None
+        
+        for start in range(0, len(group_ids), SEND_BATCH_SIZE):
+            groups = await self._load_groups(command.user_id, group_ids[start:start + SEND_BATCH_SIZE])
+            if template.media_hash and media_reference is None and groups:
+                try:
+                    media_reference = await self.media_service.get_file_reference(session_id, template.media_hash)
+                except MediaNotFoundError:
+                    raise ValueError("Template media not found")
+            
+            try:
+                for rendered in self.renderer.render_for_groups(template, groups, command.variables):
+                    media_reference = await self._send(
+                        session_id, template, rendered.row, rendered.content, rendered.variant,
+                        media_reference, result
+                    )
+            except TelegramFloodError as e:
+                result["flood_wait_seconds"] = e.seconds
+            finally:
+                # Sends and blacklisting changed the groups
+                await self.group_repository.bulk_save(groups)
+            
+            if result["flood_wait_seconds"] is not None:
+                break
+        
+        return result
+    
+    async def _send(self, session_id: SessionId, template: MessageTemplate, group: Group, content: str,
+                    variant: str, media_reference: Optional[str], result: Dict[str, Any]) -> Optional[str]:
+        """Send one message and count the outcome. Returns the media reference to reuse."""
+        result["attempted"] += 1
+        variant_name = variant if template.variants else None
+        
+        try:
+            try:
+                await self.telegram_service.send_message_to_group(session_id, group, content, media_reference)
+            except TelegramFileReferenceExpiredError:
+                await self.media_service.invalidate_file_reference(session_id, template.media_hash)
+                media_reference = await self.media_service.get_file_reference(session_id, template.media_hash)
+                await self.telegram_service.send_message_to_group(session_id, group, content, media_reference)
+        except TelegramError as e:
+            result["failed"] += 1
+            result["errors"].append({"group_id": group.id.value, "error": str(e)})
+            self.usage_recorder.record(template.id, variant_name, delivered=False)
+            if isinstance(e, TelegramFloodError):
+                raise
+            return media_reference
+        
+        result["sent"] += 1
+        self.usage_recorder.record(template.id, variant_name, delivered=True)
+        return media_reference
+    
+    async def _load_groups(self, user_id: str, group_ids: List[str]) -> List[Group]:
+        """Load the batch in one query, keeping groups that are still available; the set may be stale by now."""
+        groups = await self.group_repository.find_by_ids(user_id, [GroupId(group_id) for group_id in group_ids])
+        return [group for group in groups if group.is_available_for_sending()]
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""Create message template use case."""
+
+import uuid
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass
+
+from ....domain.entities.message_template import MessageTemplate, TemplateId
+from ....domain.entities.media import MediaHash
+from ....domain.repositories.media_asset_repository import MediaAssetRepository
+from ....domain.repositories.message_template_repository import MessageTemplateRepository
+from .template_dto import template_to_dict, variants_from_dicts
+
+
+@dataclass
+class CreateTemplateCommand:
+    """Command to create message template."""
+    name: str
+    content: str
+    variables: Optional[Dict[str, Any]] = None
+    is_default: bool = False
+    variants: Optional[List[Dict[str, Any]]] = None
+    media_hash: Optional[str] = None
+
+
+class CreateTemplateUseCase:
+    """Use case for creating message template."""
+    
+    def __init__(self, template_repository: MessageTemplateRepository,
+                 media_repository: Optional[MediaAssetRepository] = None):
+        self.template_repository = template_repository
+        self.media_repository = media_repository
+    
+    async def execute(self, command: CreateTemplateCommand) -> Dict[str, Any]:
+        """Execute create template use case."""
+        template = MessageTemplate(
+            id=TemplateId(str(uuid.uuid4())),
+            name=command.name,
+            content=command.content,
+            variables=command.variables,
+            variants=variants_from_dicts(command.variants)
+        )
+        
+        if not template.validate_name():
+            raise ValueError("Template name must be 1-100 characters")
+        
+        if not template.validate_content():
+            raise ValueError("Template content must be 1-4096 characters")
+        
+        if not template.validate_variants():
+            raise ValueError("Variant names must be unique and contents 1-4096 characters")
+        
+        # Raises TemplateSyntaxError (a ValueError) for over-nested spintax
+        template.compile()
+        
+        if command.media_hash:
+            template.media_hash = await self._resolve_media(command.media_hash)
+        
+        # The unique name index rejects duplicates (DuplicateTemplateNameError),
+        # so the template is stored before any other template loses the default
+        await self.template_repository.save(template)
+        
+        if command.is_default:
+            await self.template_repository.clear_default_flags()
+            template.set_as_default()
+            await self.template_repository.save(template)
+        
+        return template_to_dict(template)
+    
+    async def _resolve_media(self, value: str) -> MediaHash:
+        """Validate media hash and check that the asset exists."""
+        media_hash = MediaHash(value)
+        if self.media_repository and not await self.media_repository.find_by_hash(media_hash):
+            raise ValueError("Media not found")
+        return media_hash
\ No newline at end of file
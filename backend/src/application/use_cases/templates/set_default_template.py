@@ -0,0 +1,32 @@
+"""Set default message template use case."""
+
+from typing import Dict, Any, Optional
+from dataclasses import dataclass
+
+from ....domain.entities.message_template import TemplateId
+from ....domain.repositories.message_template_repository import MessageTemplateRepository
+from .template_dto import template_to_dict
+
+
+@dataclass
+class SetDefaultTemplateCommand:
+    """Command to mark a template as the default."""
+    template_id: str
+
+
+class SetDefaultTemplateUseCase:
+    """Use case for marking a template as the default."""
+    
+    def __init__(self, template_repository: MessageTemplateRepository):
+        self.template_repository = template_repository
+    
+    async def execute(self, command: SetDefaultTemplateCommand) -> Optional[Dict[str, Any]]:
+        """Execute set default template use case. Returns None if not found."""
+        template = await self.template_repository.find_by_id(TemplateId(command.template_id))
+        if not template:
+            return None
+        
+        await self.template_repository.clear_default_flags()
+        template.set_as_default()
+        await self.template_repository.save(template)
+        return template_to_dict(template)
\ No newline at end of file
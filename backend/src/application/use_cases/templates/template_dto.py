@@ -0,0 +1,44 @@
+"""Message template serialization for use case results."""
+
+from typing import Dict, Any, List, Optional
+
+from ....domain.entities.message_template import MessageTemplate, TemplateVariant
+
+
+def template_to_dict(template: MessageTemplate) -> Dict[str, Any]:
+    """Serialize template, including its compile-time variable report."""
+    compiled = template.compile()
+    
+    return {
+        "id": template.id.value,
+        "name": template.name,
+        "content": template.content,
+        "is_default": template.is_default,
+        "variables": template.variables,
+        "variants": [
+            {"name": variant.name, "content": variant.content, "weight": variant.weight}
+            for variant in template.variants
+        ],
+        "variant_stats": template.variant_stats,
+        "media_hash": template.media_hash.value if template.media_hash else None,
+        "missing_variables": compiled.missing_variables,
+        "unused_variables": compiled.unused_variables,
+        "usage_count": template.usage_count,
+        "last_used_at": template.last_used_at.isoformat() if template.last_used_at else None,
+        "created_at": template.created_at.isoformat(),
+        "updated_at": template.updated_at.isoformat()
+    }
+
+
+def variants_from_dicts(variants: Optional[List[Dict[str, Any]]]) -> Optional[List[TemplateVariant]]:
+    """Build variant value objects from request data (None passes through)."""
+    if variants is None:
+        return None
+    return [
+        TemplateVariant(
+            name=variant.get("name", ""),
+            content=variant.get("content", ""),
+            weight=float(variant.get("weight", 1.0))
+        )
+        for variant in variants
+    ]
\ No newline at end of file
@@ -0,0 +1,65 @@
+"""Update message template use case."""
+
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass
+
+from ....domain.entities.message_template import TemplateId
+from ....domain.entities.media import MediaHash
+from ....domain.repositories.media_asset_repository import MediaAssetRepository
+from ....domain.repositories.message_template_repository import MessageTemplateRepository
+from .template_dto import template_to_dict, variants_from_dicts
+
+
+@dataclass
+class UpdateTemplateCommand:
+    """Command to update message template."""
+    template_id: str
+    name: str
+    content: str
+    variables: Optional[Dict[str, Any]] = None
+    variants: Optional[List[Dict[str, Any]]] = None  # None keeps current variants
+    media_hash: Optional[str] = None  # None keeps current media, "" detaches it
+
+
+class UpdateTemplateUseCase:
+    """Use case for updating message template."""
+    
+    def __init__(self, template_repository: MessageTemplateRepository,
+                 media_repository: Optional[MediaAssetRepository] = None):
+        self.template_repository = template_repository
+        self.media_repository = media_repository
+    
+    async def execute(self, command: UpdateTemplateCommand) -> Optional[Dict[str, Any]]:
+        """Execute update template use case. Returns None if not found."""
+        template = await self.template_repository.find_by_id(TemplateId(command.template_id))
+        if not template:
+            return None
+        
+        template.update_content(
+            command.name, command.content, command.variables, variants_from_dicts(command.variants)
+        )
+        
+        if command.media_hash is not None:
+            template.attach_media(await self._resolve_media(command.media_hash) if command.media_hash else None)
+        
+        if not template.validate_name():
+            raise ValueError("Template name must be 1-100 characters")
+        
+        if not template.validate_content():
+            raise ValueError("Template content must be 1-4096 characters")
+        
+        if not template.validate_variants():
+            raise ValueError("Variant names must be unique and contents 1-4096 characters")
+        
+        # Raises TemplateSyntaxError (a ValueError) for over-nested spintax
+        template.compile()
+        
+        await self.template_repository.save(template)
+        return template_to_dict(template)
+    
+    async def _resolve_media(self, value: str) -> MediaHash:
+        """Validate media hash and check that the asset exists."""
+        media_hash = MediaHash(value)
+        if self.media_repository and not await self.media_repository.find_by_hash(media_hash):
+            raise ValueError("Media not found")
+        return media_hash
\ No newline at end of file
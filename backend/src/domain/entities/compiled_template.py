@@ -0,0 +1,339 @@
+"""Compiled message template value object."""
+
+import hashlib
+from bisect import bisect_right
+from itertools import accumulate
+from typing import (
+    Dict, Any, List, Set, Tuple, Optional, Iterable, Iterator, Callable, TypeVar, NamedTuple, Sequence, Union
+)
+
+
+Row = TypeVar("Row")
+
+_MASK64 = (1 << 64) - 1
+
+# Deepest spintax nesting accepted; bounds parse and render recursion
+MAX_NESTING_DEPTH = 32
+
+
+class TemplateSyntaxError(ValueError):
+    """Raised when template content cannot be compiled."""
+
+
+class _Slot:
+    """Variable placeholder node."""
+    __slots__ = ("name", "placeholder")
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.placeholder = "{" + name + "}"
+
+
+class _Choice:
+    """Spintax alternative node: one option is picked per render."""
+    __slots__ = ("options",)
+    
+    def __init__(self, options: Tuple[tuple, ...]):
+        self.options = options
+
+
+Node = Union[str, _Slot, _Choice]
+
+
+class RenderedMessage(NamedTuple):
+    """Message rendered for one recipient row."""
+    row: Any
+    variant: str
+    content: str
+
+
+def _parse(text: str) -> Tuple[Node, ...]:
+    """Parse content into literal, variable and spintax nodes.
+    
+    ``{name}`` is a variable, ``{a|b|c}`` picks one alternative and may
+    nest or contain variables. Unbalanced braces are kept as literals.
+    Braces are paired in one pass first, so parsing is linear and never
+    backtracks; groups nested deeper than MAX_NESTING_DEPTH are rejected.
+    """
+    paired = _pair_braces(text)
+    # Open groups, outermost first: [start position, options, nodes, literal]
+    frames: List[list] = [[0, [], [], []]]
+    
+    for position, char in enumerate(text):
+        frame = frames[-1]
+        
+        if char == "{" and position in paired:
+            if len(frames) > MAX_NESTING_DEPTH:
+                raise TemplateSyntaxError(f"Spintax cannot be nested more than {MAX_NESTING_DEPTH} levels deep")
+            frames.append([position, [], [], []])
+        elif char == "}" and position in paired:
+            group_start, options, nodes, literal = frames.pop()
+            _flush_literal(nodes, literal)
+            options.append(tuple(nodes))
+            
+            parent = frames[-1]
+            node = _group_node(options, text[group_start:position + 1])
+            if isinstance(node, str):
+                parent[3].append(node)
+            else:
+                _flush_literal(parent[2], parent[3])
+                parent[2].append(node)
+        elif char == "|" and len(frames) > 1:
+            _flush_literal(frame[2], frame[3])
+            frame[1].append(tuple(frame[2]))
+            frame[2] = []
+        else:
+            frame[3].append(char)
+    
+    _, _, nodes, literal = frames[0]
+    _flush_literal(nodes, literal)
+    return tuple(nodes)
+
+
+def _pair_braces(text: str) -> Set[int]:
+    """Positions of braces that form balanced ``{...}`` pairs.
+    
+    Each ``}`` closes the nearest open ``{``; braces left without a partner
+    are literals.
+    """
+    open_positions: List[int] = []
+    paired: Set[int] = set()
+    for position, char in enumerate(text):
+        if char == "{":
+            open_positions.append(position)
+        elif char == "}" and open_positions:
+            paired.add(open_positions.pop())
+            paired.add(position)
+    return paired
+
+
+def _flush_literal(nodes: List[Node], literal: List[str]) -> None:
+    """Move pending literal characters into the node list."""
+    if literal:
+        nodes.append("".join(literal))
+        literal.clear()
+
+
+def _group_node(options: List[tuple], source: str) -> Node:
+    """Build node for a closed ``{...}`` group."""
+    if len(options) > 1:
+        return _Choice(tuple(options))
+    
+    body = options[0]
+    if len(body) == 1 and isinstance(body[0], str) and body[0].strip():
+        return _Slot(body[0])
+    
+    # Empty or non-name body, e.g. "{}" or "{ {x} }"
+    if all(isinstance(node, str) for node in body):
+        return source
+    return _Choice((("{",) + body + ("}",),))
+
+
+def _iter_nodes(nodes: Sequence[Node]) -> Iterator[Node]:
+    """Walk all nodes, including those inside spintax options."""
+    for node in nodes:
+        yield node
+        if isinstance(node, _Choice):
+            for option in node.options:
+                yield from _iter_nodes(option)
+
+
+def _seed_rng(seed: Any) -> Callable[[], int]:
+    """Deterministic 64-bit generator (splitmix64) seeded from any value."""
+    digest = hashlib.blake2b(str(seed).encode(), digest_size=8).digest()
+    state = int.from_bytes(digest, "little")
+    
+    def next_value() -> int:
+        nonlocal state
+        state = (state + 0x9E3779B97F4A7C15) & _MASK64
+        z = state
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+        return z ^ (z >> 31)
+    
+    return next_value
+
+
+class _CompiledBody:
+    """One compiled content body (the main content or a variant)."""
+    
+    __slots__ = ("name", "nodes", "has_choices", "parts", "slots")
+    
+    def __init__(self, name: str, content: str, defaults: Dict[str, Any]):
+        self.name = name
+        self.nodes = _parse(content)
+        self.has_choices = any(isinstance(node, _Choice) for node in self.nodes)
+        self.parts: List[str] = []
+        self.slots: Tuple[Tuple[int, str], ...] = ()
+        
+        if not self.has_choices:
+            # Flat fast path: pre-filled part list with slot positions
+            slots = []
+            for node in self.nodes:
+                if isinstance(node, _Slot):
+                    slots.append((len(self.parts), node.name))
+                    self.parts.append(str(defaults[node.name]) if node.name in defaults else node.placeholder)
+                else:
+                    self.parts.append(node)
+            self.slots = tuple(slots)
+    
+    def variable_names(self) -> List[str]:
+        """Referenced variable names in order of first use."""
+        return list(dict.fromkeys(node.name for node in _iter_nodes(self.nodes) if isinstance(node, _Slot)))
+    
+    def render_tree(self, resolve: Callable[[_Slot], str], rng: Callable[[], int]) -> str:
+        """Render by walking the choice tree."""
+        out: List[str] = []
+        
+        def walk(nodes):
+            for node in nodes:
+                if node.__class__ is str:
+                    out.append(node)
+                elif node.__class__ is _Slot:
+                    out.append(resolve(node))
+                else:
+                    walk(node.options[rng() % len(node.options)])
+        
+        walk(self.nodes)
+        return "".join(out)
+
+
+class CompiledTemplate:
+    """Template content parsed once into a compact render structure.
+    
+    Each body (the main content, or every variant when variants are
+    defined) is parsed into literal, variable and spintax choice nodes.
+    Bodies without spintax are flattened into a pre-filled part list so
+    rendering is a slot fill and a single join. Variant and spintax
+    choices are drawn from a generator seeded per recipient, so the same
+    seed always yields the same message.
+    """
+    
+    __slots__ = ("_defaults", "_bodies", "_cumulative_weights", "_needs_rng", "missing_variables", "unused_variables")
+    
+    def __init__(self, content: str, defaults: Optional[Dict[str, Any]] = None,
+                 variants: Optional[Sequence[Any]] = None):
+        self._defaults = {name: str(value) for name, value in (defaults or {}).items()}
+        
+        if variants:
+            self._bodies = [_CompiledBody(variant.name, variant.content, self._defaults) for variant in variants]
+            self._cumulative_weights = list(accumulate(variant.weight for variant in variants))
+        else:
+            self._bodies = [_CompiledBody("default", content, self._defaults)]
+            self._cumulative_weights = [1.0]
+        
+        # Plain templates never draw random numbers
+        self._needs_rng = len(self._bodies) > 1 or self._bodies[0].has_choices
+        
+        referenced = set(self.variable_names)
+        self.missing_variables = sorted(referenced - set(self._defaults))
+        self.unused_variables = sorted(set(self._defaults) - referenced)
+    
+    @property
+    def variable_names(self) -> List[str]:
+        """Names of variables referenced by the template, in order of first use."""
+        return list(dict.fromkeys(name for body in self._bodies for name in body.variable_names()))
+    
+    @property
+    def variant_names(self) -> List[str]:
+        """Names of compiled variants."""
+        return [body.name for body in self._bodies]
+    
+    def render(self, variables: Optional[Dict[str, Any]] = None, seed: Any = 0) -> str:
+        """Render content, overriding template defaults with given variables."""
+        return self.render_variant(variables, seed)[1]
+    
+    def render_variant(self, variables: Optional[Dict[str, Any]] = None, seed: Any = 0) -> Tuple[str, str]:
+        """Render content and return ``(variant name, content)``."""
+        rng = _seed_rng(seed) if self._needs_rng else None
+        body = self._pick_body(rng)
+        
+        if not body.has_choices:
+            if not variables:
+                return body.name, "".join(body.parts)
+            
+            parts = body.parts.copy()
+            for index, name in body.slots:
+                if name in variables:
+                    parts[index] = str(variables[name])
+            return body.name, "".join(parts)
+        
+        defaults = self._defaults
+        
+        def resolve(slot: _Slot) -> str:
+            if variables and slot.name in variables:
+                return str(variables[slot.name])
+            return defaults.get(slot.name, slot.placeholder)
+        
+        return body.name, body.render_tree(resolve, rng)
+    
+    def render_many(self, rows: Iterable[Row], row_bindings: Dict[str, Callable[[Row], Any]],
+                    variables: Optional[Dict[str, Any]] = None,
+                    seed_of: Optional[Callable[[Row], Any]] = None) -> Iterator[RenderedMessage]:
+        """Lazily render once per row.
+        
+        Shared ``variables`` are applied once up front; only slots named in
+        ``row_bindings`` are evaluated per row, with the binding taking
+        precedence over a shared variable of the same name. ``seed_of``
+        gives each row its seed for variant and spintax choices.
+        """
+        variables = variables or {}
+        defaults = self._defaults
+        
+        # Per body: shared values pre-applied, plus the slots bound per row
+        prepared = []
+        for body in self._bodies:
+            base = body.parts.copy()
+            row_slots = []
+            for index, name in body.slots:
+                binding = row_bindings.get(name)
+                if binding is not None:
+                    row_slots.append((index, binding))
+                elif name in variables:
+                    base[index] = str(variables[name])
+            prepared.append((base, row_slots, "".join(base) if not row_slots else None))
+        
+        for row in rows:
+            if not self._needs_rng:
+                body_index = 0
+                rng = None
+            else:
+                rng = _seed_rng(seed_of(row) if seed_of else 0)
+                body_index = self._pick_index(rng)
+            
+            body = self._bodies[body_index]
+            
+            if not body.has_choices:
+                base, row_slots, static_content = prepared[body_index]
+                if static_content is not None:
+                    yield RenderedMessage(row, body.name, static_content)
+                    continue
+                
+                parts = base.copy()
+                for index, binding in row_slots:
+                    parts[index] = str(binding(row))
+                yield RenderedMessage(row, body.name, "".join(parts))
+                continue
+            
+            def resolve(slot: _Slot, row=row) -> str:
+                binding = row_bindings.get(slot.name)
+                if binding is not None:
+                    return str(binding(row))
+                if slot.name in variables:
+                    return str(variables[slot.name])
+                return defaults.get(slot.name, slot.placeholder)
+            
+            yield RenderedMessage(row, body.name, body.render_tree(resolve, rng))
+    
+    def _pick_index(self, rng: Optional[Callable[[], int]]) -> int:
+        """Pick a body index by weight."""
+        if len(self._bodies) == 1:
+            return 0
+        
+        total = self._cumulative_weights[-1]
+        point = (rng() / (_MASK64 + 1)) * total
+        return min(bisect_right(self._cumulative_weights, point), len(self._bodies) - 1)
+    
+    def _pick_body(self, rng: Optional[Callable[[], int]]) -> _CompiledBody:
+        """Pick a body by weight."""
+        return self._bodies[self._pick_index(rng)]
\ No newline at end of file
@@ -0,0 +1,55 @@
+"""Field-level change tracking for persisted entities."""
+
+from typing import Dict, Set, Tuple
+
+
+class DirtyTrackingMixin:
+    """Records which dataclass fields changed since the entity was persisted.
+    
+    Repositories call ``mark_clean`` after loading or saving an entity.
+    From then on, assigning a field a different value marks it dirty and
+    ``increment`` records counter deltas, so a save can write just those
+    fields (or nothing). An entity never marked clean is new and is
+    written whole. Containers mutated in place must be flagged with
+    ``mark_dirty``.
+    """
+    
+    def __setattr__(self, name, value):
+        dirty = self.__dict__.get("_dirty_fields")
+        if dirty is not None and name not in dirty and name in self.__dataclass_fields__:
+            current = self.__dict__.get(name)
+            if current is not value and current != value:
+                dirty.add(name)
+        object.__setattr__(self, name, value)
+    
+    @property
+    def is_new(self) -> bool:
+        """True until the entity has been loaded from or written to storage."""
+        return self.__dict__.get("_dirty_fields") is None
+    
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Add to a counter field, recording the delta for an atomic increment."""
+        object.__setattr__(self, name, getattr(self, name) + amount)
+        increments = self.__dict__.get("_increments")
+        if increments is not None:
+            increments[name] = increments.get(name, 0) + amount
+    
+    def mark_dirty(self, *names: str) -> None:
+        """Flag fields mutated in place."""
+        dirty = self.__dict__.get("_dirty_fields")
+        if dirty is not None:
+            dirty.update(names)
+    
+    def mark_clean(self) -> None:
+        """Start tracking from the current state."""
+        object.__setattr__(self, "_dirty_fields", set())
+        object.__setattr__(self, "_increments", {})
+    
+    def pending_changes(self) -> Tuple[Set[str], Dict[str, int]]:
+        """Return ``(assigned fields, counter increments)`` since last mark_clean.
+        
+        A counter that was also assigned is reported as assigned only.
+        """
+        dirty = self.__dict__.get("_dirty_fields") or set()
+        increments = self.__dict__.get("_increments") or {}
+        return set(dirty), {name: amount for name, amount in increments.items() if name not in dirty}
\ No newline at end of file
@@ -1,10 +1,12 @@
 """Group domain entity."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from .dirty_tracking import DirtyTrackingMixin
+
 
 class GroupStatus(Enum):
     ACTIVE = "active"
@@ -33,10 +35,11 @@ class GroupId:
 
 
 @dataclass
-class Group:
+class Group(DirtyTrackingMixin):
     """Group domain entity with blacklist logic."""
     
     id: GroupId
+    user_id: str
     telegram_id: str
     name: str
     username: Optional[str] = None
@@ -73,7 +76,7 @@ class Group:
         """Temporarily blacklist group."""
         self.status = GroupStatus.BLACKLISTED_TEMP
         self.blacklist_reason = reason
-        self.blacklist_until = datetime.utcnow() + datetime.timedelta(seconds=duration_seconds)
+        self.blacklist_until = datetime.utcnow() + timedelta(seconds=duration_seconds)
         self.updated_at = datetime.utcnow()
     
     def blacklist_permanently(self, reason: BlacklistReason) -> None:
@@ -97,7 +100,7 @@ class Group:
     
     def record_message_sent(self) -> None:
         """Record that a message was sent to this group."""
-        self.message_count += 1
+        self.increment("message_count")
         self.last_message_sent = datetime.utcnow()
         self.updated_at = datetime.utcnow()
     
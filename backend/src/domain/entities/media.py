@@ -0,0 +1,86 @@
+"""Media domain entities."""
+
+import re
+from datetime import datetime
+from dataclasses import dataclass
+from enum import Enum
+
+from .telegram_session import SessionId
+
+
+_SHA256_HEX = re.compile(r"^[0-9a-f]{64}$")
+
+
+class MediaKind(Enum):
+    PHOTO = "photo"
+    VIDEO = "video"
+    DOCUMENT = "document"
+    
+    @classmethod
+    def from_mime_type(cls, mime_type: str) -> "MediaKind":
+        """Telegram media kind for a MIME type."""
+        if mime_type.startswith("image/"):
+            return cls.PHOTO
+        if mime_type.startswith("video/"):
+            return cls.VIDEO
+        return cls.DOCUMENT
+
+
+class MediaError(Exception):
+    """Media related errors."""
+    pass
+
+
+class MediaNotFoundError(MediaError):
+    """Media blob or asset does not exist."""
+    pass
+
+
+class MediaTooLargeError(MediaError):
+    """Uploaded media exceeds the size limit."""
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        super().__init__(f"Media exceeds {max_size} bytes")
+
+
+@dataclass(frozen=True)
+class MediaHash:
+    """Value object for a content hash (hex SHA-256 of the media bytes)."""
+    value: str
+    
+    def __post_init__(self):
+        if not self.value or not _SHA256_HEX.match(self.value):
+            raise ValueError("Media hash must be a lowercase hex SHA-256 digest")
+
+
+@dataclass
+class MediaAsset:
+    """Stored media blob metadata.
+    
+    Blobs are addressed by content, so identical uploads share one asset.
+    """
+    
+    content_hash: MediaHash
+    size: int
+    mime_type: str
+    kind: MediaKind
+    uploaded_by: str
+    created_at: datetime = None
+    
+    def __post_init__(self):
+        if self.created_at is None:
+            self.created_at = datetime.utcnow()
+
+
+@dataclass
+class MediaFileReference:
+    """Telegram file reference of an asset uploaded through a session."""
+    
+    content_hash: MediaHash
+    session_id: SessionId
+    file_reference: str
+    uploaded_at: datetime = None
+    
+    def __post_init__(self):
+        if self.uploaded_at is None:
+            self.uploaded_at = datetime.utcnow()
\ No newline at end of file
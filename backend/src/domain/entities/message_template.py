@@ -1,9 +1,14 @@
 """Message template domain entity."""
 
+import math
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 
+from .compiled_template import CompiledTemplate
+from .media import MediaHash
+from .dirty_tracking import DirtyTrackingMixin
+
 
 @dataclass(frozen=True)
 class TemplateId:
@@ -15,8 +20,24 @@ class TemplateId:
             raise ValueError("Template ID cannot be empty")
 
 
+@dataclass(frozen=True)
+class TemplateVariant:
+    """Value object for a weighted A/B content variant."""
+    name: str
+    content: str
+    weight: float = 1.0
+    
+    def __post_init__(self):
+        if not self.name or len(self.name.strip()) == 0:
+            raise ValueError("Variant name cannot be empty")
+        if "." in self.name or self.name.startswith("$"):
+            raise ValueError("Variant name cannot contain '.' or start with '$'")
+        if not math.isfinite(self.weight) or self.weight <= 0:
+            raise ValueError("Variant weight must be a positive finite number")
+
+
 @dataclass
-class MessageTemplate:
+class MessageTemplate(DirtyTrackingMixin):
     """Message template domain entity."""
     
     id: TemplateId
@@ -24,6 +45,9 @@ class MessageTemplate:
     content: str
     is_default: bool = False
     variables: Dict[str, Any] = None
+    variants: List[TemplateVariant] = None
+    variant_stats: Dict[str, Dict[str, int]] = None
+    media_hash: Optional[MediaHash] = None  # Attached photo/video/document
     usage_count: int = 0
     last_used_at: datetime = None
     created_at: datetime = None
@@ -32,6 +56,10 @@ class MessageTemplate:
     def __post_init__(self):
         if self.variables is None:
             self.variables = {}
+        if self.variants is None:
+            self.variants = []
+        if self.variant_stats is None:
+            self.variant_stats = {}
         if self.created_at is None:
             self.created_at = datetime.utcnow()
         if self.updated_at is None:
@@ -47,6 +75,20 @@ class MessageTemplate:
         
         return True
     
+    def validate_variants(self) -> bool:
+        """Validate variant contents and name uniqueness."""
+        names = [variant.name for variant in self.variants]
+        if len(names) != len(set(names)):
+            return False
+        
+        for variant in self.variants:
+            if not variant.content or len(variant.content.strip()) == 0:
+                return False
+            if len(variant.content) > 4096:  # Telegram message limit
+                return False
+        
+        return True
+    
     def validate_name(self) -> bool:
         """Validate template name."""
         if not self.name or len(self.name.strip()) == 0:
@@ -57,21 +99,22 @@ class MessageTemplate:
         
         return True
     
-    def render_content(self, variables: Dict[str, Any] = None) -> str:
-        """Render template content with variables."""
-        content = self.content
-        
-        # Merge template variables with provided variables
-        all_variables = {**self.variables}
-        if variables:
-            all_variables.update(variables)
+    def compile(self) -> CompiledTemplate:
+        """Compile content (or variants) into literal, variable and spintax nodes.
         
-        # Simple variable substitution
-        for key, value in all_variables.items():
-            placeholder = f"{{{key}}}"
-            content = content.replace(placeholder, str(value))
+        When variants are defined, each render picks one of them by weight;
+        otherwise the main content is used.
+        """
+        return CompiledTemplate(self.content, self.variables, self.variants)
+    
+    def render_content(self, variables: Dict[str, Any] = None, seed: Any = 0) -> str:
+        """Render template content with variables.
         
-        return content
+        ``seed`` selects the variant and spintax alternatives. Compiles on
+        every call; hot paths should render through TemplateRenderer, which
+        caches compiled templates.
+        """
+        return self.compile().render(variables, seed)
     
     def set_as_default(self) -> None:
         """Mark this template as default."""
@@ -84,15 +127,31 @@ class MessageTemplate:
         self.updated_at = datetime.utcnow()
     
     def record_usage(self) -> None:
-        """Record template usage."""
+        """Record template usage in memory.
+        
+        Counters are not content, so updated_at is left alone. Persist usage
+        through TemplateUsageBuffer rather than by saving the entity.
+        """
         self.usage_count += 1
         self.last_used_at = datetime.utcnow()
+    
+    def record_variant_outcome(self, variant_name: str, delivered: bool) -> None:
+        """Record delivery result of a variant in memory."""
+        stats = self.variant_stats.setdefault(variant_name, {"sent": 0, "failed": 0})
+        stats["sent" if delivered else "failed"] += 1
+    
+    def attach_media(self, media_hash: Optional[MediaHash]) -> None:
+        """Attach media to the template (None detaches)."""
+        self.media_hash = media_hash
         self.updated_at = datetime.utcnow()
     
-    def update_content(self, name: str, content: str, variables: Dict[str, Any] = None) -> None:
+    def update_content(self, name: str, content: str, variables: Dict[str, Any] = None,
+                       variants: Optional[List[TemplateVariant]] = None) -> None:
         """Update template content."""
         self.name = name
         self.content = content
         if variables is not None:
             self.variables = variables
+        if variants is not None:
+            self.variants = variants
         self.updated_at = datetime.utcnow()
\ No newline at end of file
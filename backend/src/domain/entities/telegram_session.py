@@ -5,6 +5,8 @@ from typing import Optional, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
 
+from .dirty_tracking import DirtyTrackingMixin
+
 
 class SessionStatus(Enum):
     ACTIVE = "active"
@@ -46,7 +48,7 @@ class TelegramUser:
 
 
 @dataclass
-class TelegramSession:
+class TelegramSession(DirtyTrackingMixin):
     """Telegram session domain entity."""
     
     id: SessionId
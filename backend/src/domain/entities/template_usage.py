@@ -0,0 +1,37 @@
+"""Template usage delta value object."""
+
+from datetime import datetime
+from typing import Dict
+from dataclasses import dataclass, field
+
+from .message_template import TemplateId
+
+
+@dataclass
+class TemplateUsageDelta:
+    """Usage accumulated for one template since the last flush."""
+    template_id: TemplateId
+    count: int = 0
+    last_used_at: datetime = None
+    variant_outcomes: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    
+    def add(self, used_at: datetime, variant_name: str = None, delivered: bool = True, count: int = 1) -> None:
+        """Fold usage into the delta."""
+        self.count += count
+        if self.last_used_at is None or used_at > self.last_used_at:
+            self.last_used_at = used_at
+        
+        if variant_name:
+            outcomes = self.variant_outcomes.setdefault(variant_name, {"sent": 0, "failed": 0})
+            outcomes["sent" if delivered else "failed"] += count
+    
+    def merge(self, other: "TemplateUsageDelta") -> None:
+        """Fold another delta for the same template into this one."""
+        self.count += other.count
+        if other.last_used_at is not None and (self.last_used_at is None or other.last_used_at > self.last_used_at):
+            self.last_used_at = other.last_used_at
+        
+        for variant_name, outcomes in other.variant_outcomes.items():
+            totals = self.variant_outcomes.setdefault(variant_name, {"sent": 0, "failed": 0})
+            for counter, value in outcomes.items():
+                totals[counter] = totals.get(counter, 0) + value
\ No newline at end of file
@@ -0,0 +1,15 @@
+"""Tombstone domain entity."""
+
+from datetime import datetime
+from typing import Optional
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Tombstone:
+    """Record of a deleted entity, kept so clients can sync deletions."""
+    
+    entity_type: str  # "group", "session" or "template"
+    entity_id: str
+    user_id: Optional[str]  # None for entities shared by all users
+    deleted_at: datetime
\ No newline at end of file
@@ -5,6 +5,8 @@ from typing import Optional, List
 from dataclasses import dataclass
 from enum import Enum
 
+from .dirty_tracking import DirtyTrackingMixin
+
 
 class SubscriptionType(Enum):
     FREE = "free"
@@ -29,7 +31,7 @@ class UserId:
 
 
 @dataclass
-class User:
+class User(DirtyTrackingMixin):
     """User domain entity with rich business logic."""
     
     id: UserId
@@ -41,7 +43,8 @@ class User:
     is_admin: bool = False
     subscription_type: SubscriptionType = SubscriptionType.FREE
     subscription_expires: Optional[datetime] = None
-    api_token: Optional[str] = None
+    api_token: Optional[str] = None  # Plaintext only right after issuing (or legacy records)
+    api_token_hash: Optional[str] = None
     telegram_sessions: List[str] = None
     created_at: datetime = None
     updated_at: datetime = None
@@ -90,12 +93,14 @@ class User:
         """Add a Telegram session to user."""
         if session_id not in self.telegram_sessions:
             self.telegram_sessions.append(session_id)
+            self.mark_dirty("telegram_sessions")
             self.updated_at = datetime.utcnow()
     
     def remove_telegram_session(self, session_id: str) -> None:
         """Remove a Telegram session from user."""
         if session_id in self.telegram_sessions:
             self.telegram_sessions.remove(session_id)
+            self.mark_dirty("telegram_sessions")
             self.updated_at = datetime.utcnow()
     
     def upgrade_subscription(self, new_type: SubscriptionType, expires_at: datetime) -> None:
@@ -104,6 +109,17 @@ class User:
         self.subscription_expires = expires_at
         self.updated_at = datetime.utcnow()
     
+    def issue_api_token(self, api_token: str, api_token_hash: str) -> None:
+        """Replace API token; only the hash is persisted."""
+        self.api_token = api_token
+        self.api_token_hash = api_token_hash
+        self.updated_at = datetime.utcnow()
+    
+    def change_password_hash(self, password_hash: str) -> None:
+        """Replace stored password hash."""
+        self.password_hash = password_hash
+        self.updated_at = datetime.utcnow()
+    
     def suspend(self) -> None:
         """Suspend user account."""
         self.status = UserStatus.SUSPENDED
@@ -0,0 +1,142 @@
+"""Columnar group working set read model."""
+
+import time
+from array import array
+from datetime import datetime
+from itertools import compress
+from typing import Optional, List, Dict, Iterable
+
+from ..entities.group import Group, GroupStatus
+
+
+# Compact status codes stored in the status column
+STATUS_CODES = {
+    GroupStatus.ACTIVE: 0,
+    GroupStatus.INACTIVE: 1,
+    GroupStatus.BLACKLISTED_TEMP: 2,
+    GroupStatus.BLACKLISTED_PERM: 3,
+}
+CODE_STATUSES = {code: status for status, code in STATUS_CODES.items()}
+STATUS_VALUE_CODES = {status.value: code for status, code in STATUS_CODES.items()}
+
+_ACTIVE = STATUS_CODES[GroupStatus.ACTIVE]
+_BLACKLISTED_TEMP = STATUS_CODES[GroupStatus.BLACKLISTED_TEMP]
+_BLACKLISTED_TEMP_BYTE = _BLACKLISTED_TEMP.to_bytes(1, "little", signed=True)
+
+# Maps each status byte to 1 when it is always available, else 0
+_AVAILABLE_TABLE = bytes(int(code == _ACTIVE) for code in range(256))
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch(value: Optional[datetime]) -> float:
+    """Convert naive UTC datetime to epoch seconds (0.0 when unset)."""
+    if value is None:
+        return 0.0
+    return (value - _EPOCH).total_seconds()
+
+
+class GroupSet:
+    """Compact columnar set of groups for large campaign working sets.
+    
+    Instead of one Group dataclass per group, the set keeps parallel
+    columns: ids and Telegram ids as plain strings, status as a signed
+    byte array and blacklist deadlines as an array of epoch seconds.
+    Availability filtering and status counts run over whole columns.
+    """
+    
+    __slots__ = ("ids", "telegram_ids", "status_codes", "blacklist_until")
+    
+    def __init__(self):
+        self.ids: List[str] = []
+        self.telegram_ids: List[str] = []
+        self.status_codes = array("b")
+        self.blacklist_until = array("d")
+    
+    @classmethod
+    def from_groups(cls, groups: Iterable[Group]) -> "GroupSet":
+        """Build set from Group entities."""
+        group_set = cls()
+        for group in groups:
+            group_set.append(group.id.value, group.telegram_id, group.status, group.blacklist_until)
+        return group_set
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def append(self, group_id: str, telegram_id: str, status: GroupStatus,
+               blacklist_until: Optional[datetime] = None) -> None:
+        """Append a group to the set."""
+        self.append_raw(group_id, telegram_id, STATUS_CODES[status], to_epoch(blacklist_until))
+    
+    def append_raw(self, group_id: str, telegram_id: str, status_code: int, blacklist_until: float) -> None:
+        """Append a group using pre-encoded column values."""
+        self.ids.append(group_id)
+        self.telegram_ids.append(telegram_id)
+        self.status_codes.append(status_code)
+        self.blacklist_until.append(blacklist_until)
+    
+    def status_at(self, index: int) -> GroupStatus:
+        """Decode status of group at index."""
+        return CODE_STATUSES[self.status_codes[index]]
+    
+    def available_mask(self, now: Optional[float] = None) -> bytearray:
+        """Availability flag per group: one byte, 1 when available.
+        
+        Active groups are available, as are temporarily blacklisted groups
+        whose deadline has passed. The status column is translated to flags
+        in C; only temporarily blacklisted rows are checked in Python.
+        """
+        mask = bytearray(self.status_codes.tobytes().translate(_AVAILABLE_TABLE))
+        for index in self._expired_indices(now):
+            mask[index] = 1
+        return mask
+    
+    def available_indices(self, now: Optional[float] = None) -> List[int]:
+        """Indices of groups available for sending."""
+        return list(compress(range(len(self.ids)), self.available_mask(now)))
+    
+    def available_ids(self, now: Optional[float] = None) -> List[str]:
+        """IDs of groups available for sending."""
+        return list(compress(self.ids, self.available_mask(now)))
+    
+    def reactivate_expired(self, now: Optional[float] = None) -> List[int]:
+        """Flip expired temporary blacklists to active in place.
+        
+        Returns the indices that were reactivated.
+        """
+        expired = self._expired_indices(now)
+        for index in expired:
+            self.status_codes[index] = _ACTIVE
+            self.blacklist_until[index] = 0.0
+        return expired
+    
+    def mark_status(self, index: int, status: GroupStatus, blacklist_until: Optional[datetime] = None) -> None:
+        """Update status of group at index."""
+        self.status_codes[index] = STATUS_CODES[status]
+        self.blacklist_until[index] = to_epoch(blacklist_until)
+    
+    def count_by_status(self) -> Dict[GroupStatus, int]:
+        """Count groups per status."""
+        # Count bytes in C rather than iterating the column in Python
+        raw = self.status_codes.tobytes()
+        return {
+            status: raw.count(code.to_bytes(1, "little", signed=True))
+            for status, code in STATUS_CODES.items()
+        }
+    
+    def _expired_indices(self, now: Optional[float] = None) -> List[int]:
+        """Indices of temporary blacklists whose deadline has passed."""
+        if now is None:
+            now = time.time()
+        
+        raw = self.status_codes.tobytes()
+        until = self.blacklist_until
+        expired = []
+        # bytes.find skips over the other statuses in C
+        index = raw.find(_BLACKLISTED_TEMP_BYTE)
+        while index != -1:
+            if until[index] <= now:
+                expired.append(index)
+            index = raw.find(_BLACKLISTED_TEMP_BYTE, index + 1)
+        return expired
\ No newline at end of file
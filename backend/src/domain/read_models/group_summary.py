@@ -0,0 +1,26 @@
+"""Group summary read model."""
+
+from datetime import datetime
+from typing import Optional
+from dataclasses import dataclass
+
+from ..entities.group import GroupStatus
+
+
+@dataclass(slots=True)
+class GroupSummary:
+    """Lightweight group view for list endpoints.
+    
+    Carries only the fields the API serializes, so repositories can fetch
+    it with a projection instead of loading the full Group entity.
+    """
+    
+    id: str
+    telegram_id: str
+    name: str
+    username: Optional[str]
+    invite_link: Optional[str]
+    status: GroupStatus
+    message_count: int
+    last_message_sent: Optional[datetime]
+    created_at: datetime
\ No newline at end of file
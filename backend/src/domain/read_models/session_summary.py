@@ -0,0 +1,28 @@
+"""Telegram session summary read model."""
+
+from datetime import datetime
+from typing import Optional
+from dataclasses import dataclass
+
+from ..entities.telegram_session import SessionStatus, TelegramUser
+
+
+@dataclass(slots=True)
+class SessionSummary:
+    """Lightweight session view for list endpoints.
+    
+    Excludes credentials and the encrypted session blob, which list
+    endpoints never display.
+    """
+    
+    session_id: str
+    phone_number: str
+    status: SessionStatus
+    telegram_user: Optional[TelegramUser]
+    last_used_at: Optional[datetime]
+    created_at: datetime
+    
+    @property
+    def is_authenticated(self) -> bool:
+        """Check if session is authenticated and active."""
+        return self.status == SessionStatus.ACTIVE
\ No newline at end of file
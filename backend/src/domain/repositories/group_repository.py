@@ -1,12 +1,25 @@
 """Group repository interface."""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional, List
-from ..entities.group import Group, GroupId, GroupStatus
+from ..entities.group import Group, GroupId, GroupStatus, BlacklistReason
+from ..read_models.group_summary import GroupSummary
+from ..read_models.group_set import GroupSet
+
+
+class GroupWriteError(ValueError):
+    """Some groups were not written (e.g. a taken Telegram ID); the others were saved."""
+    def __init__(self, failed: List[Group], message: str):
+        self.failed = failed
+        super().__init__(message)
 
 
 class GroupRepository(ABC):
-    """Abstract group repository interface."""
+    """Abstract group repository interface.
+    
+    Groups are partitioned by owner: every query is scoped to a ``user_id``.
+    """
     
     @abstractmethod
     async def save(self, group: Group) -> None:
@@ -14,36 +27,105 @@ class GroupRepository(ABC):
         pass
     
     @abstractmethod
-    async def find_by_id(self, group_id: GroupId) -> Optional[Group]:
-        """Find group by ID."""
+    async def find_by_id(self, user_id: str, group_id: GroupId) -> Optional[Group]:
+        """Find user's group by ID."""
+        pass
+    
+    @abstractmethod
+    async def find_by_ids(self, user_id: str, group_ids: List[GroupId]) -> List[Group]:
+        """Find user's groups by ID in one query, in the given order; missing IDs are skipped."""
+        pass
+    
+    @abstractmethod
+    async def find_by_telegram_id(self, user_id: str, telegram_id: str) -> Optional[Group]:
+        """Find user's group by Telegram ID."""
+        pass
+    
+    @abstractmethod
+    async def list_by_user(self, user_id: str, skip: int = 0, limit: int = 100) -> List[Group]:
+        """List user's groups with pagination."""
+        pass
+    
+    @abstractmethod
+    async def list_by_status(self, user_id: str, status: GroupStatus,
+                             skip: int = 0, limit: int = 100) -> List[Group]:
+        """List user's groups by status."""
         pass
     
     @abstractmethod
-    async def find_by_telegram_id(self, telegram_id: str) -> Optional[Group]:
-        """Find group by Telegram ID."""
+    async def list_summaries(self, user_id: str, status: Optional[GroupStatus] = None,
+                             skip: int = 0, limit: int = 100) -> List[GroupSummary]:
+        """List lightweight summaries of user's groups, optionally filtered by status."""
         pass
     
     @abstractmethod
-    async def list_by_status(self, status: GroupStatus) -> List[Group]:
-        """List groups by status."""
+    async def list_changed_since(self, user_id: str, since: Optional[datetime] = None) -> List[GroupSummary]:
+        """List summaries of user's groups updated after the given time (all when None)."""
         pass
     
     @abstractmethod
-    async def list_available_for_sending(self) -> List[Group]:
-        """List groups available for sending messages."""
+    async def load_group_set(self, user_id: str, statuses: Optional[List[GroupStatus]] = None) -> GroupSet:
+        """Load user's groups into a compact columnar working set."""
         pass
     
     @abstractmethod
-    async def count_by_status(self, status: GroupStatus) -> int:
-        """Count groups by status."""
+    async def list_available_for_sending(self, user_id: str) -> List[Group]:
+        """List user's groups available for sending messages.
+        
+        Expired temporary blacklists are reactivated first, so only groups
+        with ``active`` status are returned.
+        """
         pass
     
     @abstractmethod
-    async def delete(self, group_id: GroupId) -> bool:
-        """Delete group."""
+    async def reactivate_expired_blacklists(self, user_id: str) -> int:
+        """Reactivate user's temporarily blacklisted groups whose blacklist has expired."""
+        pass
+    
+    @abstractmethod
+    async def count_by_user(self, user_id: str) -> int:
+        """Count user's groups."""
+        pass
+    
+    @abstractmethod
+    async def count_by_status(self, user_id: str, status: GroupStatus) -> int:
+        """Count user's groups by status."""
+        pass
+    
+    @abstractmethod
+    async def delete(self, user_id: str, group_id: GroupId) -> bool:
+        """Delete user's group."""
         pass
     
     @abstractmethod
     async def bulk_save(self, groups: List[Group]) -> None:
-        """Save multiple groups."""
+        """Save multiple groups.
+        
+        Like an unordered bulk write, a group that cannot be written does
+        not stop the others. Raises GroupWriteError naming the groups that
+        were not written; only written groups are marked clean, so the
+        failed ones keep their pending changes.
+        """
+        pass
+    
+    @abstractmethod
+    async def bulk_delete(self, user_id: str, group_ids: Optional[List[GroupId]] = None,
+                          statuses: Optional[List[GroupStatus]] = None) -> List[str]:
+        """Delete user's groups matching IDs and/or statuses.
+        
+        Returns the IDs of deleted groups.
+        """
+        pass
+    
+    @abstractmethod
+    async def bulk_update_status(self, user_id: str, new_status: GroupStatus,
+                                 group_ids: Optional[List[GroupId]] = None,
+                                 statuses: Optional[List[GroupStatus]] = None,
+                                 blacklist_reason: Optional[BlacklistReason] = None,
+                                 blacklist_until: Optional[datetime] = None) -> List[str]:
+        """Set status of user's groups matching IDs and/or statuses.
+        
+        Activation clears blacklist fields and blacklisting sets them.
+        Returns the IDs of updated groups.
+        """
         pass
\ No newline at end of file
@@ -0,0 +1,33 @@
+"""Media asset repository interface."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+from ..entities.media import MediaAsset, MediaHash
+
+
+class MediaAssetRepository(ABC):
+    """Abstract media asset repository interface."""
+    
+    @abstractmethod
+    async def save(self, asset: MediaAsset) -> MediaAsset:
+        """Save asset unless one with the same hash exists. Returns the stored asset.
+        
+        Links ``asset.uploaded_by`` to the hash either way, so every user
+        who uploaded the content can access it.
+        """
+        pass
+    
+    @abstractmethod
+    async def find_by_hash(self, content_hash: MediaHash) -> Optional[MediaAsset]:
+        """Find asset by content hash."""
+        pass
+    
+    @abstractmethod
+    async def find_linked(self, content_hash: MediaHash, user_id: str) -> Optional[MediaAsset]:
+        """Find asset by content hash if the user has uploaded it."""
+        pass
+    
+    @abstractmethod
+    async def delete(self, content_hash: MediaHash) -> bool:
+        """Delete asset."""
+        pass
\ No newline at end of file
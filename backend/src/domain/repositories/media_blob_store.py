@@ -0,0 +1,36 @@
+"""Media blob store interface."""
+
+from abc import ABC, abstractmethod
+from typing import AsyncIterable, AsyncIterator, Tuple
+from ..entities.media import MediaHash
+
+
+class MediaBlobStore(ABC):
+    """Abstract content-addressed media blob store.
+    
+    Blobs are written from a stream, hashed on the fly and stored under
+    their SHA-256, so storing the same bytes twice keeps a single copy.
+    """
+    
+    @abstractmethod
+    async def store(self, chunks: AsyncIterable[bytes], max_size: int) -> Tuple[MediaHash, int]:
+        """Stream bytes into the store. Returns content hash and size.
+        
+        Raises MediaTooLargeError once more than ``max_size`` bytes arrive.
+        """
+        pass
+    
+    @abstractmethod
+    def open(self, content_hash: MediaHash) -> AsyncIterator[bytes]:
+        """Stream blob contents in chunks. Raises MediaNotFoundError."""
+        pass
+    
+    @abstractmethod
+    async def exists(self, content_hash: MediaHash) -> bool:
+        """Check if blob exists."""
+        pass
+    
+    @abstractmethod
+    async def delete(self, content_hash: MediaHash) -> bool:
+        """Delete blob."""
+        pass
\ No newline at end of file
@@ -0,0 +1,25 @@
+"""Media file reference repository interface."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+from ..entities.media import MediaFileReference, MediaHash
+from ..entities.telegram_session import SessionId
+
+
+class MediaFileReferenceRepository(ABC):
+    """Abstract media file reference repository interface."""
+    
+    @abstractmethod
+    async def save(self, reference: MediaFileReference) -> None:
+        """Save file reference."""
+        pass
+    
+    @abstractmethod
+    async def find(self, session_id: SessionId, content_hash: MediaHash) -> Optional[MediaFileReference]:
+        """Find file reference of an asset uploaded through a session."""
+        pass
+    
+    @abstractmethod
+    async def delete(self, session_id: SessionId, content_hash: MediaHash) -> bool:
+        """Delete file reference (e.g. after Telegram reports it expired)."""
+        pass
\ No newline at end of file
@@ -1,8 +1,23 @@
 """Message template repository interface."""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional, List
 from ..entities.message_template import MessageTemplate, TemplateId
+from ..entities.template_usage import TemplateUsageDelta
+
+
+class DuplicateTemplateNameError(ValueError):
+    """A template with the same name already exists."""
+    def __init__(self):
+        super().__init__("Template name already exists")
+
+
+class TemplateUsageWriteError(Exception):
+    """Some usage deltas were not written; the others were applied."""
+    def __init__(self, failed: List[TemplateUsageDelta], message: str):
+        self.failed = failed
+        super().__init__(message)
 
 
 class MessageTemplateRepository(ABC):
@@ -10,7 +25,7 @@ class MessageTemplateRepository(ABC):
     
     @abstractmethod
     async def save(self, template: MessageTemplate) -> None:
-        """Save template to database."""
+        """Save template to database. Raises DuplicateTemplateNameError on a taken name."""
         pass
     
     @abstractmethod
@@ -33,6 +48,20 @@ class MessageTemplateRepository(ABC):
         """List all templates."""
         pass
     
+    @abstractmethod
+    async def list_changed_since(self, since: Optional[datetime] = None) -> List[MessageTemplate]:
+        """List templates updated after the given time (all when None)."""
+        pass
+    
+    @abstractmethod
+    async def apply_usage(self, deltas: List[TemplateUsageDelta]) -> None:
+        """Atomically add buffered usage counts and variant outcomes.
+        
+        Raises TemplateUsageWriteError naming the deltas that were not
+        applied when only some of them fail.
+        """
+        pass
+    
     @abstractmethod
     async def delete(self, template_id: TemplateId) -> bool:
         """Delete template."""
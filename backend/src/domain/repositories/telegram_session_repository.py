@@ -1,8 +1,10 @@
 """Telegram session repository interface."""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional, List
 from ..entities.telegram_session import TelegramSession, SessionId
+from ..read_models.session_summary import SessionSummary
 
 
 class TelegramSessionRepository(ABC):
@@ -23,6 +25,16 @@ class TelegramSessionRepository(ABC):
         """Find sessions by user ID."""
         pass
     
+    @abstractmethod
+    async def list_summaries_by_user(self, user_id: str) -> List[SessionSummary]:
+        """List lightweight summaries of user's sessions."""
+        pass
+    
+    @abstractmethod
+    async def list_changed_since(self, user_id: str, since: Optional[datetime] = None) -> List[SessionSummary]:
+        """List summaries of user's sessions updated after the given time (all when None)."""
+        pass
+    
     @abstractmethod
     async def find_by_phone_number(self, phone_number: str) -> Optional[TelegramSession]:
         """Find session by phone number."""
@@ -0,0 +1,20 @@
+"""Tombstone repository interface."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+from ..entities.tombstone import Tombstone
+
+
+class TombstoneRepository(ABC):
+    """Abstract tombstone repository interface."""
+    
+    @abstractmethod
+    async def record(self, tombstones: List[Tombstone]) -> None:
+        """Record deleted entities."""
+        pass
+    
+    @abstractmethod
+    async def list_since(self, user_id: str, since: datetime) -> List[Tombstone]:
+        """List tombstones visible to user recorded after the given time."""
+        pass
\ No newline at end of file
@@ -5,9 +5,21 @@ from typing import Optional, List
 from ..entities.user import User, UserId, SubscriptionType
 
 
+class DuplicateUserError(Exception):
+    """A user with the same unique field value already exists."""
+    def __init__(self, field: str):
+        self.field = field
+        super().__init__(f"{field.capitalize()} already exists")
+
+
 class UserRepository(ABC):
     """Abstract user repository interface."""
     
+    @abstractmethod
+    async def create(self, user: User) -> None:
+        """Insert new user. Raises DuplicateUserError on a taken username or email."""
+        pass
+    
     @abstractmethod
     async def save(self, user: User) -> None:
         """Save user to database."""
@@ -30,7 +42,12 @@ class UserRepository(ABC):
     
     @abstractmethod
     async def find_by_api_token(self, api_token: str) -> Optional[User]:
-        """Find user by API token."""
+        """Find user by legacy plaintext API token."""
+        pass
+    
+    @abstractmethod
+    async def find_by_api_token_hash(self, api_token_hash: str) -> Optional[User]:
+        """Find user by keyed hash of API token."""
         pass
     
     @abstractmethod
@@ -56,4 +73,9 @@ class UserRepository(ABC):
     @abstractmethod
     async def exists_email(self, email: str) -> bool:
         """Check if email exists."""
+        pass
+    
+    @abstractmethod
+    async def next_available_username(self, base: str) -> str:
+        """Return ``base`` if free, otherwise ``base_N`` with N above the suffixes allocated so far."""
         pass
\ No newline at end of file
@@ -1,12 +1,17 @@
 """Authentication domain service."""
 
 import hashlib
+import hmac
 import secrets
 import jwt
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from ..entities.user import User, UserId, UserStatus
 from ..repositories.user_repository import UserRepository
+from .password_hasher import PasswordHasher
+
+
+API_TOKEN_PREFIX = "tk_"
 
 
 class AuthenticationError(Exception):
@@ -17,25 +22,22 @@ class AuthenticationError(Exception):
 class AuthenticationService:
     """Domain service for user authentication."""
     
-    def __init__(self, user_repository: UserRepository, jwt_secret: str, jwt_algorithm: str = "HS256"):
+    def __init__(self, user_repository: UserRepository, password_hasher: PasswordHasher,
+                 jwt_secret: str, jwt_algorithm: str = "HS256", api_token_secret: Optional[str] = None):
         self.user_repository = user_repository
+        self.password_hasher = password_hasher
         self.jwt_secret = jwt_secret
         self.jwt_algorithm = jwt_algorithm
+        self.api_token_secret = (api_token_secret or jwt_secret).encode()
+        self._dummy_password_hash: Optional[str] = None
     
-    def hash_password(self, password: str) -> str:
-        """Hash password with salt."""
-        salt = secrets.token_hex(32)
-        pwd_hash = hashlib.sha256(f"{password}{salt}".encode()).hexdigest()
-        return f"{salt}${pwd_hash}"
+    async def hash_password(self, password: str) -> str:
+        """Hash password off the event loop."""
+        return await self.password_hasher.hash(password)
     
-    def verify_password(self, password: str, password_hash: str) -> bool:
-        """Verify password against hash."""
-        try:
-            salt, stored_hash = password_hash.split('$')
-            pwd_hash = hashlib.sha256(f"{password}{salt}".encode()).hexdigest()
-            return pwd_hash == stored_hash
-        except ValueError:
-            return False
+    async def verify_password(self, password: str, password_hash: str) -> bool:
+        """Verify password against hash off the event loop."""
+        return await self.password_hasher.verify(password, password_hash)
     
     def create_access_token(self, user: User, expires_delta: Optional[timedelta] = None) -> str:
         """Create JWT access token."""
@@ -67,14 +69,22 @@ class AuthenticationService:
         user = await self.user_repository.find_by_username(username)
         
         if not user:
+            # Spend the same hashing time as for a real user so response
+            # timing does not reveal which usernames exist
+            await self.verify_password(password, await self._get_dummy_password_hash())
             raise AuthenticationError("Invalid username or password")
         
-        if not self.verify_password(password, user.password_hash):
+        if not await self.verify_password(password, user.password_hash):
             raise AuthenticationError("Invalid username or password")
         
         if user.status != UserStatus.ACTIVE:
             raise AuthenticationError("Account is disabled")
         
+        # Upgrade legacy or outdated hashes while the plaintext is at hand
+        if self.password_hasher.needs_rehash(user.password_hash):
+            user.change_password_hash(await self.hash_password(password))
+            await self.user_repository.save(user)
+        
         return user
     
     async def authenticate_by_token(self, token: str) -> User:
@@ -93,7 +103,15 @@ class AuthenticationService:
     
     async def authenticate_by_api_token(self, api_token: str) -> User:
         """Authenticate user by API token."""
-        user = await self.user_repository.find_by_api_token(api_token)
+        api_token_hash = self.hash_api_token(api_token)
+        user = await self.user_repository.find_by_api_token_hash(api_token_hash)
+        
+        if not user:
+            # Tokens issued before hashing are stored in plaintext; migrate on first use
+            user = await self.user_repository.find_by_api_token(api_token)
+            if user:
+                user.issue_api_token(None, api_token_hash)
+                await self.user_repository.save(user)
         
         if not user:
             raise AuthenticationError("Invalid API token")
@@ -105,4 +123,24 @@ class AuthenticationService:
     
     def generate_api_token(self) -> str:
         """Generate new API token."""
-        return f"tk_{secrets.token_urlsafe(32)}"
\ No newline at end of file
+        return f"{API_TOKEN_PREFIX}{secrets.token_urlsafe(32)}"
+    
+    def hash_api_token(self, api_token: str) -> str:
+        """Keyed hash (HMAC-SHA256) under which API tokens are stored."""
+        return hmac.new(self.api_token_secret, api_token.encode(), hashlib.sha256).hexdigest()
+    
+    def issue_api_token(self, user: User) -> str:
+        """Generate a new API token for user and return its plaintext.
+        
+        The plaintext is only available now; afterwards the token can be
+        verified but not shown again.
+        """
+        api_token = self.generate_api_token()
+        user.issue_api_token(api_token, self.hash_api_token(api_token))
+        return api_token
+    
+    async def _get_dummy_password_hash(self) -> str:
+        """Hash with the current scheme to verify against for unknown users."""
+        if self._dummy_password_hash is None:
+            self._dummy_password_hash = await self.hash_password(secrets.token_urlsafe(16))
+        return self._dummy_password_hash
\ No newline at end of file
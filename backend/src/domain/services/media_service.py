@@ -0,0 +1,139 @@
+"""Media storage and Telegram upload domain service."""
+
+import asyncio
+from typing import AsyncIterable, AsyncIterator, Dict, List, Optional, Tuple
+
+from ..entities.media import (
+    MediaAsset, MediaFileReference, MediaHash, MediaKind, MediaNotFoundError
+)
+from ..entities.telegram_session import SessionId
+from ..repositories.media_asset_repository import MediaAssetRepository
+from ..repositories.media_blob_store import MediaBlobStore
+from ..repositories.media_file_reference_repository import MediaFileReferenceRepository
+from .telegram_service import TelegramService
+
+
+class MediaService:
+    """Domain service for media storage and upload-once Telegram references.
+    
+    Each asset is uploaded to Telegram at most once per session; the
+    returned file reference is stored and reused for every later message.
+    Concurrent requests for the same (session, asset) pair share a single
+    upload, so a campaign fanning out to many groups uploads once.
+    """
+    
+    def __init__(self, asset_repository: MediaAssetRepository,
+                 reference_repository: MediaFileReferenceRepository,
+                 blob_store: MediaBlobStore, telegram_service: TelegramService):
+        self.asset_repository = asset_repository
+        self.reference_repository = reference_repository
+        self.blob_store = blob_store
+        self.telegram_service = telegram_service
+        self._uploads: Dict[Tuple[SessionId, MediaHash], asyncio.Future] = {}
+    
+    async def store_upload(self, user_id: str, chunks: AsyncIterable[bytes],
+                           mime_type: str, max_size: int) -> MediaAsset:
+        """Store streamed upload, deduplicating identical content, and link it to the user.
+        
+        If the asset cannot be saved, the blob is deleted again unless an
+        existing asset already refers to the same content. Raises
+        MediaNotFoundError when a concurrent failed upload of the same
+        content discarded the blob before this asset was saved; uploading
+        again stores it anew.
+        """
+        content_hash, size = await self.blob_store.store(chunks, max_size)
+        
+        asset = MediaAsset(
+            content_hash=content_hash,
+            size=size,
+            mime_type=mime_type,
+            kind=MediaKind.from_mime_type(mime_type),
+            uploaded_by=user_id
+        )
+        try:
+            saved = await self.asset_repository.save(asset)
+        except Exception:
+            await self._discard_orphan_blob(content_hash, size)
+            raise
+        
+        if not await self.blob_store.exists(content_hash):
+            raise MediaNotFoundError(f"Media {content_hash.value} was discarded during upload, retry")
+        return saved
+    
+    async def get_asset(self, content_hash: MediaHash, user_id: Optional[str] = None) -> Optional[MediaAsset]:
+        """Get asset metadata; with ``user_id``, only if that user uploaded the content."""
+        if user_id is None:
+            return await self.asset_repository.find_by_hash(content_hash)
+        return await self.asset_repository.find_linked(content_hash, user_id)
+    
+    def open(self, content_hash: MediaHash) -> AsyncIterator[bytes]:
+        """Stream asset contents."""
+        return self.blob_store.open(content_hash)
+    
+    async def get_file_reference(self, session_id: SessionId, content_hash: MediaHash) -> str:
+        """Get Telegram file reference for asset, uploading it on first use."""
+        reference = await self.reference_repository.find(session_id, content_hash)
+        if reference:
+            return reference.file_reference
+        
+        key = (session_id, content_hash)
+        upload = self._uploads.get(key)
+        if upload is None:
+            upload = asyncio.ensure_future(self._upload(session_id, content_hash))
+            self._uploads[key] = upload
+            upload.add_done_callback(lambda _: self._uploads.pop(key, None))
+        
+        # Shield so one cancelled waiter does not abort the shared upload
+        return await asyncio.shield(upload)
+    
+    async def invalidate_file_reference(self, session_id: SessionId, content_hash: MediaHash) -> None:
+        """Forget a file reference Telegram no longer accepts; the next use re-uploads."""
+        await self.reference_repository.delete(session_id, content_hash)
+    
+    async def _discard_orphan_blob(self, content_hash: MediaHash, size: int) -> None:
+        """Delete a blob no asset refers to; keep it when that cannot be checked.
+        
+        A concurrent upload of the same content can save its asset between
+        the check and the delete, so references are checked again afterwards
+        and the blob is written back if one appeared.
+        """
+        try:
+            if await self.asset_repository.find_by_hash(content_hash):
+                return
+            contents = [chunk async for chunk in self.blob_store.open(content_hash)]
+            await self.blob_store.delete(content_hash)
+        except Exception:
+            return
+        
+        try:
+            if await self.asset_repository.find_by_hash(content_hash) is None:
+                return
+        except Exception:
+            pass  # Unknown whether it is referenced; write it back
+        try:
+            await self.blob_store.store(_replay(contents), size)
+        except Exception:
+            pass
+    
+    async def _upload(self, session_id: SessionId, content_hash: MediaHash) -> str:
+        """Upload asset through session and store the file reference."""
+        asset = await self.asset_repository.find_by_hash(content_hash)
+        if not asset:
+            raise MediaNotFoundError(f"Media {content_hash.value} not found")
+        
+        file_reference = await self.telegram_service.upload_media(
+            session_id, asset, self.blob_store.open(content_hash)
+        )
+        
+        await self.reference_repository.save(MediaFileReference(
+            content_hash=content_hash,
+            session_id=session_id,
+            file_reference=file_reference
+        ))
+        return file_reference
+
+
+async def _replay(chunks: List[bytes]) -> AsyncIterator[bytes]:
+    """Stream chunks read back from the blob store."""
+    for chunk in chunks:
+        yield chunk
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""Password hashing domain interface."""
+
+from abc import ABC, abstractmethod
+
+
+class PasswordHasherBusyError(Exception):
+    """Too many hashing requests are already waiting."""
+    pass
+
+
+class PasswordHasher(ABC):
+    """Abstract password hasher.
+    
+    Hashing is deliberately slow, so implementations are async and must
+    not run the key derivation on the event loop.
+    """
+    
+    @abstractmethod
+    async def hash(self, password: str) -> str:
+        """Hash password with the current scheme."""
+        pass
+    
+    @abstractmethod
+    async def verify(self, password: str, password_hash: str) -> bool:
+        """Verify password against a hash of any supported scheme."""
+        pass
+    
+    @abstractmethod
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Check if hash uses an outdated scheme or cost and should be replaced."""
+        pass
\ No newline at end of file
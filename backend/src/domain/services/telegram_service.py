@@ -1,10 +1,12 @@
 """Telegram integration domain service."""
 
 import asyncio
-from typing import Optional, Dict, Any, List
+import uuid
+from typing import Optional, Dict, Any, List, AsyncIterable
 from datetime import datetime, timedelta
 from ..entities.telegram_session import TelegramSession, SessionId, TelegramCredentials, TelegramUser, SessionStatus
 from ..entities.group import Group, GroupStatus, BlacklistReason
+from ..entities.media import MediaAsset
 from ..repositories.telegram_session_repository import TelegramSessionRepository
 
 
@@ -20,6 +22,11 @@ class TelegramFloodError(TelegramError):
         super().__init__(f"Flood wait: {seconds} seconds")
 
 
+class TelegramFileReferenceExpiredError(TelegramError):
+    """Stored file reference is no longer accepted and must be re-uploaded."""
+    pass
+
+
 class TelegramService:
     """Domain service for Telegram operations."""
     
@@ -149,8 +156,27 @@ class TelegramService:
                 "error": str(e)
             }
     
-    async def send_message_to_group(self, session_id: SessionId, group: Group, message: str) -> Dict[str, Any]:
-        """Send message to Telegram group."""
+    async def upload_media(self, session_id: SessionId, asset: MediaAsset,
+                           chunks: AsyncIterable[bytes]) -> str:
+        """Upload media through session and return its Telegram file reference."""
+        session = await self.session_repository.find_by_id(session_id)
+        if not session or not session.is_valid():
+            raise TelegramError("Invalid or expired session")
+        
+        # This would stream the parts to Telegram's upload API
+        # For now, simulate by consuming the stream
+        uploaded = 0
+        async for chunk in chunks:
+            uploaded += len(chunk)
+        
+        if uploaded != asset.size:
+            raise TelegramError("Media upload was incomplete")
+        
+        return f"{asset.kind.value}:{uuid.uuid4().hex}"
+    
+    async def send_message_to_group(self, session_id: SessionId, group: Group, message: str,
+                                    media_reference: Optional[str] = None) -> Dict[str, Any]:
+        """Send message to Telegram group, optionally with previously uploaded media."""
         session = await self.session_repository.find_by_id(session_id)
         if not session or not session.is_valid():
             raise TelegramError("Invalid or expired session")
@@ -184,10 +210,11 @@ class TelegramService:
             
             return {
                 "success": True,
-                "message_id": random.randint(1000, 9999)
+                "message_id": random.randint(1000, 9999),
+                "has_media": media_reference is not None
             }
             
-        except TelegramFloodError:
+        except (TelegramFloodError, TelegramFileReferenceExpiredError):
             raise
         except Exception as e:
             raise TelegramError(f"Failed to send message: {str(e)}")
@@ -0,0 +1,77 @@
+"""Template rendering domain service."""
+
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple, Iterable, Iterator, Union, Callable
+
+from ..entities.compiled_template import CompiledTemplate, RenderedMessage
+from ..entities.group import Group
+from ..read_models.group_summary import GroupSummary
+from ..entities.message_template import MessageTemplate, TemplateId
+
+
+GroupRow = Union[Group, GroupSummary]
+
+# Variables bound per recipient group
+GROUP_VARIABLES: Dict[str, Callable[[GroupRow], Any]] = {
+    "group_name": lambda group: group.name,
+    "group_username": lambda group: f"@{group.username}" if group.username else "",
+    "group_id": lambda group: group.telegram_id,
+}
+
+
+class TemplateRenderer:
+    """Renders message templates from a cache of compiled templates.
+    
+    Compiled templates are keyed by ``(TemplateId, updated_at)``, so an
+    edited template is recompiled on first use and stale versions age out
+    of the LRU.
+    """
+    
+    def __init__(self, max_templates: int = 256):
+        self.max_templates = max_templates
+        self._cache: "OrderedDict[Tuple[TemplateId, datetime], CompiledTemplate]" = OrderedDict()
+    
+    def compile(self, template: MessageTemplate) -> CompiledTemplate:
+        """Get compiled template, compiling on cache miss."""
+        key = (template.id, template.updated_at)
+        compiled = self._cache.get(key)
+        
+        if compiled is not None:
+            self._cache.move_to_end(key)
+            return compiled
+        
+        compiled = template.compile()
+        self._cache[key] = compiled
+        if len(self._cache) > self.max_templates:
+            self._cache.popitem(last=False)
+        
+        return compiled
+    
+    def render(self, template: MessageTemplate, variables: Optional[Dict[str, Any]] = None,
+               seed: Any = 0) -> str:
+        """Render template with variables."""
+        return self.compile(template).render(variables, seed)
+    
+    def render_for_groups(self, template: MessageTemplate, groups: Iterable[GroupRow],
+                          variables: Optional[Dict[str, Any]] = None) -> Iterator[RenderedMessage]:
+        """Lazily render template for each group.
+        
+        ``{date}`` and the given variables are resolved once for the whole
+        batch; ``{group_name}``, ``{group_username}`` and ``{group_id}`` are
+        bound per group. Variant and spintax choices are seeded by the
+        group's Telegram ID, so a group keeps getting the same wording
+        until the template changes. Yields ``RenderedMessage`` tuples.
+        """
+        shared = {"date": datetime.utcnow().date().isoformat()}
+        if variables:
+            shared.update(variables)
+        
+        return self.compile(template).render_many(
+            groups, GROUP_VARIABLES, shared, seed_of=lambda group: group.telegram_id
+        )
+    
+    def invalidate(self, template_id: TemplateId) -> None:
+        """Drop all cached versions of a template."""
+        for key in [key for key in self._cache if key[0] == template_id]:
+            del self._cache[key]
\ No newline at end of file
@@ -0,0 +1,17 @@
+"""Template usage recorder interface."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+from ..entities.message_template import TemplateId
+
+
+class TemplateUsageRecorder(ABC):
+    """Collects template uses and variant delivery outcomes for persistence."""
+    
+    @abstractmethod
+    def record(self, template_id: TemplateId, variant_name: Optional[str] = None,
+               delivered: bool = True, used_at: Optional[datetime] = None, count: int = 1) -> None:
+        """Record template use (and optionally a variant delivery outcome)."""
+        pass
\ No newline at end of file
@@ -0,0 +1,120 @@
+"""Write-behind buffer for template usage counters."""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from ...domain.entities.message_template import TemplateId
+from ...domain.entities.template_usage import TemplateUsageDelta
+from ...domain.repositories.message_template_repository import MessageTemplateRepository, TemplateUsageWriteError
+from ...domain.services.template_usage_recorder import TemplateUsageRecorder
+
+
+logger = logging.getLogger(__name__)
+
+
+class TemplateUsageBuffer(TemplateUsageRecorder):
+    """Aggregates template usage in memory and flushes it periodically.
+    
+    Recording a use is a dict update with no I/O. Every ``flush_interval``
+    seconds (or as soon as ``max_pending`` uses accumulate) the pending
+    deltas are written in a single bulk ``$inc``/``$max`` round trip, so a
+    hot template costs one write per flush instead of one per message.
+    Deltas from a failed flush are merged back and retried on the next one;
+    when the repository reports which deltas failed, only those are, so
+    counts already applied are never written twice. ``stop`` lets a flush
+    in progress finish instead of cancelling it, then writes the rest.
+    """
+    
+    def __init__(self, repository: MessageTemplateRepository,
+                 flush_interval: float = 1.0, max_pending: int = 1000):
+        self.repository = repository
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: Dict[TemplateId, TemplateUsageDelta] = {}
+        self._pending_uses = 0
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+    
+    @property
+    def pending_uses(self) -> int:
+        """Uses recorded but not yet flushed."""
+        return self._pending_uses
+    
+    def record(self, template_id: TemplateId, variant_name: Optional[str] = None,
+               delivered: bool = True, used_at: Optional[datetime] = None, count: int = 1) -> None:
+        """Record template use (and optionally a variant delivery outcome)."""
+        delta = self._pending.get(template_id)
+        if delta is None:
+            delta = self._pending[template_id] = TemplateUsageDelta(template_id=template_id)
+        
+        delta.add(used_at or datetime.utcnow(), variant_name, delivered, count)
+        self._pending_uses += count
+        
+        if self._pending_uses >= self.max_pending:
+            self._wakeup.set()
+    
+    async def flush(self) -> int:
+        """Write pending deltas. Returns number of templates flushed."""
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            
+            deltas, self._pending = self._pending, {}
+            self._pending_uses = 0
+            
+            try:
+                await self.repository.apply_usage(list(deltas.values()))
+            except TemplateUsageWriteError as e:
+                self._requeue(e.failed)
+                raise
+            except BaseException:
+                # Includes cancellation: the swapped-out deltas must not be dropped
+                self._requeue(deltas.values())
+                raise
+            
+            return len(deltas)
+    
+    def start(self) -> None:
+        """Start the periodic flush task."""
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop the flush task, letting a flush in progress finish, and write what is left."""
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        
+        await self.flush()
+    
+    async def _run(self) -> None:
+        """Flush loop, until stop is requested."""
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if self._stopping:
+                break
+            
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush template usage: {e}")
+    
+    def _requeue(self, deltas: Iterable[TemplateUsageDelta]) -> None:
+        """Merge unwritten deltas back under anything recorded meanwhile."""
+        for delta in deltas:
+            self._pending_uses += delta.count
+            newer = self._pending.get(delta.template_id)
+            if newer is not None:
+                delta.merge(newer)
+            self._pending[delta.template_id] = delta
\ No newline at end of file
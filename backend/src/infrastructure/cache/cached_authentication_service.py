@@ -0,0 +1,40 @@
+"""Authentication service with a decoded-token cache."""
+
+import time
+from typing import Optional, Dict, Any
+
+from ...domain.repositories.user_repository import UserRepository
+from ...domain.services.authentication_service import AuthenticationService
+from ...domain.services.password_hasher import PasswordHasher
+from .ttl_cache import TTLCache, MISSING
+
+
+class CachedAuthenticationService(AuthenticationService):
+    """Skips repeated signature verification of the same JWT.
+    
+    Successfully decoded payloads are cached by token. An entry never
+    outlives the token's ``exp`` claim, so expired tokens are always
+    re-verified and rejected. Failures are not cached.
+    """
+    
+    def __init__(self, user_repository: UserRepository, password_hasher: PasswordHasher,
+                 jwt_secret: str, jwt_algorithm: str = "HS256", api_token_secret: Optional[str] = None,
+                 token_cache: Optional[TTLCache] = None):
+        super().__init__(user_repository, password_hasher, jwt_secret, jwt_algorithm, api_token_secret)
+        self.token_cache = token_cache if token_cache is not None else TTLCache(maxsize=1024, ttl=300)
+    
+    def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
+        """Verify and decode JWT token, served from cache when possible."""
+        payload = self.token_cache.get(token)
+        if payload is not MISSING:
+            return payload
+        
+        payload = super().verify_token(token)
+        
+        ttl = self.token_cache.ttl
+        if "exp" in payload:
+            ttl = min(ttl, payload["exp"] - time.time())
+        if ttl > 0:
+            self.token_cache.set(token, payload, ttl=ttl)
+        
+        return payload
\ No newline at end of file
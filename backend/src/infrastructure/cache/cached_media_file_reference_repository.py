@@ -0,0 +1,50 @@
+"""Read-through caching decorator for media file reference repository."""
+
+from functools import partial
+from typing import Optional
+
+from ...domain.entities.media import MediaFileReference, MediaHash
+from ...domain.entities.telegram_session import SessionId
+from ...domain.repositories.media_file_reference_repository import MediaFileReferenceRepository
+from .read_through_cache import ReadThroughCache, CacheKey
+
+
+def _reference_key(session_id: SessionId, content_hash: MediaHash) -> CacheKey:
+    """Cache key of file reference by session and asset."""
+    return ("reference", session_id.value, content_hash.value)
+
+
+class CachedMediaFileReferenceRepository(MediaFileReferenceRepository):
+    """Serves file reference lookups from a read-through cache.
+    
+    A campaign looks up the same (session, asset) reference for every
+    group it sends to; after the first lookup those are memory hits.
+    Misses are not cached, so a reference saved by another process is
+    picked up on the next lookup.
+    """
+    
+    def __init__(self, repository: MediaFileReferenceRepository, cache: ReadThroughCache):
+        self.repository = repository
+        self.cache = cache
+    
+    async def save(self, reference: MediaFileReference) -> None:
+        """Save file reference and cache it."""
+        key = _reference_key(reference.session_id, reference.content_hash)
+        await self.repository.save(reference)
+        # Other workers may still hold the reference this one replaces
+        await self.cache.invalidate(key)
+        self.cache.put(key, reference)
+    
+    async def find(self, session_id: SessionId, content_hash: MediaHash) -> Optional[MediaFileReference]:
+        """Find file reference, served from cache when possible."""
+        return await self.cache.get_or_load(
+            "find", _reference_key(session_id, content_hash),
+            partial(self.repository.find, session_id, content_hash),
+            cache_none=False
+        )
+    
+    async def delete(self, session_id: SessionId, content_hash: MediaHash) -> bool:
+        """Delete file reference and its cache entry."""
+        deleted = await self.repository.delete(session_id, content_hash)
+        await self.cache.invalidate(_reference_key(session_id, content_hash))
+        return deleted
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""Read-through caching decorator for message template repository."""
+
+from datetime import datetime
+from functools import partial
+from typing import Optional, List
+
+from ...domain.entities.message_template import MessageTemplate, TemplateId
+from ...domain.entities.template_usage import TemplateUsageDelta
+from ...domain.repositories.message_template_repository import MessageTemplateRepository
+from .read_through_cache import ReadThroughCache, CacheKey
+
+
+DEFAULT_TEMPLATE_KEY = ("default",)
+
+
+def _id_key(template_id: TemplateId) -> CacheKey:
+    """Cache key of template by ID."""
+    return ("id", template_id.value)
+
+
+class CachedMessageTemplateRepository(MessageTemplateRepository):
+    """Serves find_by_id and find_default_template from an in-process cache.
+    
+    Writes go straight to the wrapped repository and invalidate the
+    affected entries (on every worker when the cache has an invalidation
+    bus). Callers receive copies and cannot mutate cached entities.
+    """
+    
+    def __init__(self, repository: MessageTemplateRepository, cache: ReadThroughCache):
+        self.repository = repository
+        self.cache = cache
+    
+    async def save(self, template: MessageTemplate) -> None:
+        """Save template and invalidate its cache entries."""
+        await self.repository.save(template)
+        await self.cache.invalidate(_id_key(template.id), DEFAULT_TEMPLATE_KEY)
+    
+    async def find_by_id(self, template_id: TemplateId) -> Optional[MessageTemplate]:
+        """Find template by ID, served from cache when possible."""
+        return await self.cache.get_or_load(
+            "find_by_id", _id_key(template_id), partial(self.repository.find_by_id, template_id)
+        )
+    
+    async def find_default_template(self) -> Optional[MessageTemplate]:
+        """Find default template, served from cache when possible."""
+        return await self.cache.get_or_load(
+            "find_default_template", DEFAULT_TEMPLATE_KEY, self.repository.find_default_template
+        )
+    
+    async def find_by_name(self, name: str) -> Optional[MessageTemplate]:
+        """Find template by name."""
+        return await self.repository.find_by_name(name)
+    
+    async def list_all(self) -> List[MessageTemplate]:
+        """List all templates."""
+        return await self.repository.list_all()
+    
+    async def list_changed_since(self, since: Optional[datetime] = None) -> List[MessageTemplate]:
+        """List templates updated after the given time (all when None)."""
+        return await self.repository.list_changed_since(since)
+    
+    async def apply_usage(self, deltas: List[TemplateUsageDelta]) -> None:
+        """Add buffered usage counters.
+        
+        Cached entries are left alone: counters do not affect rendering and
+        the TTL bounds their staleness.
+        """
+        await self.repository.apply_usage(deltas)
+    
+    async def delete(self, template_id: TemplateId) -> bool:
+        """Delete template and invalidate its cache entries."""
+        deleted = await self.repository.delete(template_id)
+        await self.cache.invalidate(_id_key(template_id), DEFAULT_TEMPLATE_KEY)
+        return deleted
+    
+    async def clear_default_flags(self) -> None:
+        """Clear all default flags and drop every cached template."""
+        await self.repository.clear_default_flags()
+        await self.cache.clear()
+    
+    async def count_templates(self) -> int:
+        """Count total templates."""
+        return await self.repository.count_templates()
\ No newline at end of file
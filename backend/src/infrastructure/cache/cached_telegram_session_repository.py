@@ -0,0 +1,71 @@
+"""Read-through caching decorator for telegram session repository."""
+
+from datetime import datetime
+from functools import partial
+from typing import Optional, List
+
+from ...domain.entities.telegram_session import TelegramSession, SessionId
+from ...domain.read_models.session_summary import SessionSummary
+from ...domain.repositories.telegram_session_repository import TelegramSessionRepository
+from .read_through_cache import ReadThroughCache, CacheKey
+
+
+def _id_key(session_id: SessionId) -> CacheKey:
+    """Cache key of session by ID."""
+    return ("id", session_id.value)
+
+
+class CachedTelegramSessionRepository(TelegramSessionRepository):
+    """Serves find_by_id from a read-through cache.
+    
+    Every message sent loads its session by ID, so a campaign reads the
+    same few sessions thousands of times. Entries are invalidated by save
+    and delete through this repository (on every worker when the cache
+    has an invalidation bus). Misses are not cached.
+    """
+    
+    def __init__(self, repository: TelegramSessionRepository, cache: ReadThroughCache):
+        self.repository = repository
+        self.cache = cache
+    
+    async def save(self, session: TelegramSession) -> None:
+        """Save session and invalidate its cache entry."""
+        await self.repository.save(session)
+        await self.cache.invalidate(_id_key(session.id))
+    
+    async def find_by_id(self, session_id: SessionId) -> Optional[TelegramSession]:
+        """Find session by ID, served from cache when possible."""
+        return await self.cache.get_or_load(
+            "find_by_id", _id_key(session_id), partial(self.repository.find_by_id, session_id),
+            cache_none=False
+        )
+    
+    async def find_by_user_id(self, user_id: str) -> List[TelegramSession]:
+        """Find sessions by user ID."""
+        return await self.repository.find_by_user_id(user_id)
+    
+    async def list_summaries_by_user(self, user_id: str) -> List[SessionSummary]:
+        """List lightweight summaries of user's sessions."""
+        return await self.repository.list_summaries_by_user(user_id)
+    
+    async def list_changed_since(self, user_id: str, since: Optional[datetime] = None) -> List[SessionSummary]:
+        """List summaries of user's sessions updated after the given time (all when None)."""
+        return await self.repository.list_changed_since(user_id, since)
+    
+    async def find_by_phone_number(self, phone_number: str) -> Optional[TelegramSession]:
+        """Find session by phone number."""
+        return await self.repository.find_by_phone_number(phone_number)
+    
+    async def list_active_sessions(self) -> List[TelegramSession]:
+        """List all active sessions."""
+        return await self.repository.list_active_sessions()
+    
+    async def delete(self, session_id: SessionId) -> bool:
+        """Delete session and invalidate its cache entry."""
+        deleted = await self.repository.delete(session_id)
+        await self.cache.invalidate(_id_key(session_id))
+        return deleted
+    
+    async def count_by_user(self, user_id: str) -> int:
+        """Count sessions by user."""
+        return await self.repository.count_by_user(user_id)
\ No newline at end of file
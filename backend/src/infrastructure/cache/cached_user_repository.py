@@ -0,0 +1,124 @@
+"""Read-through caching decorator for user repository."""
+
+from functools import partial
+from typing import Optional, List
+
+from ...domain.entities.user import User, UserId, SubscriptionType
+from ...domain.repositories.user_repository import UserRepository
+from .read_through_cache import ReadThroughCache, CacheKey
+from .ttl_cache import MISSING
+
+
+def _id_key(user_id: UserId) -> CacheKey:
+    """Cache key of user by ID."""
+    return ("id", user_id.value)
+
+
+def _api_token_hash_key(api_token_hash: str) -> CacheKey:
+    """Cache key of user ID by API token hash."""
+    return ("api_token_hash", api_token_hash)
+
+
+class CachedUserRepository(UserRepository):
+    """Serves find_by_id and API token lookups from a read-through cache.
+    
+    Every authenticated request resolves its user by ID, so this is the
+    hottest read in the API. Entries are invalidated by save and delete
+    through this repository (on every worker when the cache has an
+    invalidation bus); the short TTL bounds staleness otherwise.
+    
+    API token hashes map to user IDs with a longer TTL. A hit is
+    confirmed against the (cached) user's current hash, so a rotated
+    token stops matching as soon as the user entry is refreshed.
+    """
+    
+    def __init__(self, repository: UserRepository, cache: ReadThroughCache,
+                 ttl: float = 30.0, api_token_ttl: float = 3600.0):
+        self.repository = repository
+        self.cache = cache
+        self.ttl = ttl
+        self.api_token_ttl = api_token_ttl
+    
+    async def create(self, user: User) -> None:
+        """Insert new user."""
+        await self.repository.create(user)
+    
+    async def save(self, user: User) -> None:
+        """Save user and invalidate its cache entries."""
+        cached = self.cache.peek(_id_key(user.id))
+        await self.repository.save(user)
+        
+        keys = [_id_key(user.id)]
+        # Rotated token: drop the old hash right away
+        old_hash = cached.api_token_hash if cached is not MISSING and cached is not None else None
+        if old_hash and old_hash != user.api_token_hash:
+            keys.append(_api_token_hash_key(old_hash))
+        await self.cache.invalidate(*keys)
+    
+    async def find_by_id(self, user_id: UserId) -> Optional[User]:
+        """Find user by ID, served from cache when possible."""
+        return await self.cache.get_or_load(
+            "find_by_id", _id_key(user_id), partial(self.repository.find_by_id, user_id),
+            cache_none=False, ttl=self.ttl
+        )
+    
+    async def find_by_username(self, username: str) -> Optional[User]:
+        """Find user by username."""
+        return await self.repository.find_by_username(username)
+    
+    async def find_by_email(self, email: str) -> Optional[User]:
+        """Find user by email."""
+        return await self.repository.find_by_email(email)
+    
+    async def find_by_api_token(self, api_token: str) -> Optional[User]:
+        """Find user by API token."""
+        return await self.repository.find_by_api_token(api_token)
+    
+    async def find_by_api_token_hash(self, api_token_hash: str) -> Optional[User]:
+        """Find user by API token hash, served from cache when possible."""
+        key = _api_token_hash_key(api_token_hash)
+        user_id = await self.cache.get_or_load(
+            "find_by_api_token_hash", key, partial(self._find_user_id_by_api_token_hash, api_token_hash),
+            cache_none=False, ttl=self.api_token_ttl
+        )
+        if user_id is None:
+            return None
+        
+        user = await self.find_by_id(UserId(user_id))
+        if user is not None and user.api_token_hash == api_token_hash:
+            return user
+        
+        # Mapping or user entry predates a token rotation: drop both and read through
+        self.cache.invalidate_local(key, _id_key(UserId(user_id)))
+        return await self.repository.find_by_api_token_hash(api_token_hash)
+    
+    async def _find_user_id_by_api_token_hash(self, api_token_hash: str) -> Optional[str]:
+        """Load ID of user owning an API token hash."""
+        user = await self.repository.find_by_api_token_hash(api_token_hash)
+        return user.id.value if user else None
+    
+    async def list_users(self, skip: int = 0, limit: int = 100) -> List[User]:
+        """List users with pagination."""
+        return await self.repository.list_users(skip, limit)
+    
+    async def count_by_subscription_type(self, subscription_type: SubscriptionType) -> int:
+        """Count users by subscription type."""
+        return await self.repository.count_by_subscription_type(subscription_type)
+    
+    async def delete(self, user_id: UserId) -> bool:
+        """Delete user and invalidate its cache entry."""
+        deleted = await self.repository.delete(user_id)
+        await self.cache.invalidate(_id_key(user_id))
+        return deleted
+    
+    async def exists_username(self, username: str) -> bool:
+        """Check if username exists."""
+        return await self.repository.exists_username(username)
+    
+    async def exists_email(self, email: str) -> bool:
+        """Check if email exists."""
+        return await self.repository.exists_email(email)
+    
+    async def next_available_username(self, base: str) -> str:
+        """Find a free username based on ``base``."""
+        return await self.repository.next_available_username(base)
\ No newline at end of file
@@ -0,0 +1,116 @@
+"""Read-through cache shared by the caching repository decorators."""
+
+import asyncio
+import copy
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from prometheus_client import Counter
+
+from .ttl_cache import TTLCache, MISSING
+
+
+CacheKey = Tuple[Hashable, ...]
+
+CACHE_REQUESTS = Counter(
+    "repository_cache_requests_total",
+    "Cached repository reads by result (hit, miss, or coalesced into an in-flight load)",
+    ["cache", "method", "result"]
+)
+
+
+class ReadThroughCache:
+    """Bounded LRU/TTL cache that loads misses once and invalidates across workers.
+    
+    Concurrent misses on the same key share a single load (single-flight),
+    and a load that overlaps an invalidation is returned but not cached,
+    so a write can never be undone by a stale read. Callers receive deep
+    copies, so entities taken from the cache can be mutated freely.
+    
+    Keys are tuples of plain values (strings, numbers) so they can be
+    broadcast through an invalidation bus to the other workers.
+    Requests are counted per method and result; the hit ratio of a method
+    is ``hit / (hit + miss + coalesced)``.
+    """
+    
+    def __init__(self, name: str, maxsize: int = 1024, ttl: float = 60.0, bus=None):
+        self.name = name
+        self.bus = bus
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._loading: Dict[CacheKey, asyncio.Future] = {}
+        self._generation = 0
+        if bus is not None:
+            bus.register(self)
+    
+    async def get_or_load(self, method: str, key: CacheKey, loader: Callable[[], Awaitable[Any]],
+                          cache_none: bool = True, ttl: Optional[float] = None) -> Any:
+        """Return cached value for key, loading it on a miss.
+        
+        ``cache_none=False`` leaves misses (None) uncached, for lookups
+        whose result may be created elsewhere at any time.
+        """
+        value = self._entries.get(key)
+        if value is not MISSING:
+            CACHE_REQUESTS.labels(self.name, method, "hit").inc()
+            return copy.deepcopy(value)
+        
+        load = self._loading.get(key)
+        if load is None:
+            CACHE_REQUESTS.labels(self.name, method, "miss").inc()
+            load = asyncio.ensure_future(loader())
+            self._loading[key] = load
+            load.add_done_callback(partial(self._loaded, key, self._generation, cache_none, ttl))
+        else:
+            CACHE_REQUESTS.labels(self.name, method, "coalesced").inc()
+        
+        # Shielded: a cancelled caller must not cancel the load for the others
+        return copy.deepcopy(await asyncio.shield(load))
+    
+    def peek(self, key: CacheKey) -> Any:
+        """Cached value without loading or copying, or MISSING."""
+        return self._entries.get(key)
+    
+    def put(self, key: CacheKey, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache a value already loaded or written by the caller."""
+        self._entries.set(key, copy.deepcopy(value), ttl=ttl)
+    
+    async def invalidate(self, *keys: CacheKey) -> None:
+        """Drop keys here and on the other workers."""
+        self.invalidate_local(*keys)
+        if self.bus is not None:
+            await self.bus.publish(self.name, list(keys))
+    
+    async def clear(self) -> None:
+        """Drop all keys here and on the other workers."""
+        self.clear_local()
+        if self.bus is not None:
+            await self.bus.publish(self.name, None)
+    
+    def invalidate_local(self, *keys: CacheKey) -> None:
+        """Drop keys in this process only."""
+        self._generation += 1
+        for key in keys:
+            self._entries.invalidate(key)
+            self._loading.pop(key, None)
+    
+    def clear_local(self) -> None:
+        """Drop all keys in this process only."""
+        self._generation += 1
+        self._entries.clear()
+        self._loading.clear()
+    
+    def _loaded(self, key: CacheKey, generation: int, cache_none: bool, ttl: Optional[float],
+                load: asyncio.Future) -> None:
+        """Cache a finished load unless it was invalidated meanwhile."""
+        if self._loading.get(key) is load:
+            del self._loading[key]
+        
+        if load.cancelled() or load.exception() is not None:
+            return
+        
+        value = load.result()
+        if generation == self._generation and (value is not None or cache_none):
+            self._entries.set(key, value, ttl=ttl)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""Redis pub/sub broadcast of cache invalidations between workers."""
+
+import asyncio
+import json
+import logging
+import uuid
+from typing import Dict, List, Optional
+
+import redis.asyncio as redis
+
+from .read_through_cache import ReadThroughCache, CacheKey
+
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCacheInvalidationBus:
+    """Publishes invalidated keys and applies those published by other workers.
+    
+    Every worker subscribes to one channel; messages name the cache and
+    its keys (or none, meaning clear). A worker ignores its own messages.
+    Pub/sub is fire-and-forget, so when the subscription drops every
+    registered cache is cleared before resubscribing: invalidations
+    missed in between cannot leave stale entries behind. If Redis is
+    down or slow, publishing gives up after a short timeout so writes
+    still succeed, and entries age out through their TTL. The subscriber
+    has its own connection without a read timeout, since it sits idle
+    between messages.
+    """
+    
+    def __init__(self, url: str, channel: str = "cache_invalidation", timeout_seconds: float = 0.5):
+        self.channel = channel
+        self._client = redis.from_url(url, socket_timeout=timeout_seconds, socket_connect_timeout=timeout_seconds)
+        self._subscriber = redis.from_url(url, socket_connect_timeout=timeout_seconds)
+        self._origin = uuid.uuid4().hex
+        self._caches: Dict[str, ReadThroughCache] = {}
+        self._task: Optional[asyncio.Task] = None
+    
+    def register(self, cache: ReadThroughCache) -> None:
+        """Apply invalidations received for this cache."""
+        self._caches[cache.name] = cache
+    
+    async def publish(self, cache_name: str, keys: Optional[List[CacheKey]]) -> None:
+        """Broadcast invalidated keys (None clears the whole cache)."""
+        message = json.dumps({
+            "origin": self._origin,
+            "cache": cache_name,
+            "keys": None if keys is None else [list(key) for key in keys]
+        })
+        try:
+            await self._client.publish(self.channel, message)
+        except Exception as e:
+            logger.warning(f"Failed to broadcast invalidation of {cache_name}: {e}")
+    
+    def start(self) -> None:
+        """Start listening for invalidations from other workers."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+    
+    async def close(self) -> None:
+        """Stop listening and close the connection."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._client.aclose()
+        await self._subscriber.aclose()
+    
+    async def _listen(self) -> None:
+        """Subscribe and apply messages, resubscribing after failures."""
+        while True:
+            pubsub = self._subscriber.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._apply(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation subscription lost, clearing caches: {e}")
+                for cache in self._caches.values():
+                    cache.clear_local()
+                await asyncio.sleep(1.0)
+            finally:
+                await pubsub.aclose()
+    
+    def _apply(self, data: bytes) -> None:
+        """Apply one invalidation message."""
+        try:
+            message = json.loads(data)
+        except ValueError:
+            return
+        
+        cache = self._caches.get(message.get("cache"))
+        if cache is None or message.get("origin") == self._origin:
+            return
+        
+        if message.get("keys") is None:
+            cache.clear_local()
+        else:
+            cache.invalidate_local(*(tuple(key) for key in message["keys"]))
\ No newline at end of file
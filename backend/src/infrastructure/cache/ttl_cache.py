@@ -0,0 +1,50 @@
+"""Bounded in-process LRU cache with per-entry TTL."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+# Returned by get() on miss, so None can be cached as a real value
+MISSING = object()
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after ``ttl`` seconds."""
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Hashable) -> Any:
+        """Get cached value or MISSING."""
+        entry = self._data.get(key)
+        if entry is None:
+            return MISSING
+        
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return MISSING
+        
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache value under key."""
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def invalidate(self, key: Hashable) -> None:
+        """Drop cached value for key."""
+        self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop all cached values."""
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
\ No newline at end of file
@@ -0,0 +1,292 @@
+"""Application-scoped dependency container."""
+
+import logging
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, Optional
+
+import httpx
+
+from ..domain.repositories.user_repository import UserRepository
+from ..domain.repositories.telegram_session_repository import TelegramSessionRepository
+from ..domain.repositories.group_repository import GroupRepository
+from ..domain.repositories.message_template_repository import MessageTemplateRepository
+from ..domain.repositories.tombstone_repository import TombstoneRepository
+from ..domain.repositories.media_asset_repository import MediaAssetRepository
+from ..domain.repositories.media_file_reference_repository import MediaFileReferenceRepository
+from ..domain.repositories.media_blob_store import MediaBlobStore
+from ..domain.services.authentication_service import AuthenticationService
+from ..domain.services.telegram_service import TelegramService
+from ..domain.services.media_service import MediaService
+from .database.mongodb_client import create_mongo_client, warm_up_mongo
+from .database.mongodb_user_repository import MongoDBUserRepository
+from .database.mongodb_telegram_session_repository import MongoDBTelegramSessionRepository
+from .database.mongodb_group_repository import MongoDBGroupRepository
+from .database.mongodb_message_template_repository import MongoDBMessageTemplateRepository
+from .database.mongodb_tombstone_repository import MongoDBTombstoneRepository
+from .database.mongodb_media_asset_repository import MongoDBMediaAssetRepository
+from .database.mongodb_media_file_reference_repository import MongoDBMediaFileReferenceRepository
+from .memory.memory_user_repository import InMemoryUserRepository
+from .memory.memory_telegram_session_repository import InMemoryTelegramSessionRepository
+from .memory.memory_group_repository import InMemoryGroupRepository
+from .memory.memory_message_template_repository import InMemoryMessageTemplateRepository
+from .memory.memory_tombstone_repository import InMemoryTombstoneRepository
+from .memory.memory_media_asset_repository import InMemoryMediaAssetRepository
+from .memory.memory_media_file_reference_repository import InMemoryMediaFileReferenceRepository
+from .sqlite.sqlite_database import SQLiteDatabase
+from .sqlite.sqlite_user_repository import SQLiteUserRepository
+from .sqlite.sqlite_telegram_session_repository import SQLiteTelegramSessionRepository
+from .sqlite.sqlite_group_repository import SQLiteGroupRepository
+from .sqlite.sqlite_message_template_repository import SQLiteMessageTemplateRepository
+from .sqlite.sqlite_tombstone_repository import SQLiteTombstoneRepository
+from .sqlite.sqlite_media_asset_repository import SQLiteMediaAssetRepository
+from .sqlite.sqlite_media_file_reference_repository import SQLiteMediaFileReferenceRepository
+from .sqlite.schema import ensure_schema
+from .cache.ttl_cache import TTLCache
+from .cache.read_through_cache import ReadThroughCache
+from .cache.redis_cache_invalidation_bus import RedisCacheInvalidationBus
+from .cache.cached_telegram_session_repository import CachedTelegramSessionRepository
+from .cache.cached_message_template_repository import CachedMessageTemplateRepository
+from .cache.cached_user_repository import CachedUserRepository
+from .cache.cached_authentication_service import CachedAuthenticationService
+from .cache.cached_media_file_reference_repository import CachedMediaFileReferenceRepository
+from .buffering.template_usage_buffer import TemplateUsageBuffer
+from .security.bcrypt_password_hasher import BcryptPasswordHasher
+from .media.local_media_blob_store import LocalMediaBlobStore
+from .media.gridfs_media_blob_store import GridFSMediaBlobStore
+from .media.memory_media_blob_store import InMemoryMediaBlobStore
+from .rate_limiting.rate_limit_backend import RateLimitBackend
+from .rate_limiting.memory_rate_limit_backend import InMemoryRateLimitBackend
+from .rate_limiting.redis_rate_limit_backend import RedisRateLimitBackend
+
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache()
+def get_settings() -> Dict[str, Any]:
+    """Get application settings from the environment."""
+    return {
+        "storage_backend": os.environ.get("STORAGE_BACKEND", "mongodb"),  # mongodb | sqlite | memory
+        "sqlite_path": os.environ.get("SQLITE_PATH", "data/telegram_auto_sender.db"),
+        "mongo_url": os.environ.get("MONGO_URL"),
+        "mongo_max_pool_size": int(os.environ.get("MONGO_MAX_POOL_SIZE", "100")),
+        "mongo_min_pool_size": int(os.environ.get("MONGO_MIN_POOL_SIZE", "10")),
+        "mongo_max_idle_time_ms": int(os.environ.get("MONGO_MAX_IDLE_TIME_MS", "300000")),
+        "mongo_wait_queue_timeout_ms": _optional_int(os.environ.get("MONGO_WAIT_QUEUE_TIMEOUT_MS")),
+        "mongo_server_selection_timeout_ms": int(os.environ.get("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000")),
+        "mongo_connect_timeout_ms": int(os.environ.get("MONGO_CONNECT_TIMEOUT_MS", "5000")),
+        "db_name": os.environ.get("DB_NAME", "telegram_auto_sender"),
+        "jwt_secret": os.environ.get("JWT_SECRET", "your-secret-key"),
+        "jwt_algorithm": "HS256",
+        "api_token_secret": os.environ.get("API_TOKEN_SECRET"),  # Falls back to jwt_secret
+        "media_storage": os.environ.get("MEDIA_STORAGE", "local"),  # local | gridfs | memory
+        "media_root": os.environ.get("MEDIA_ROOT", "media"),
+        "media_max_bytes": int(os.environ.get("MEDIA_MAX_BYTES", str(50 * 1024 * 1024))),
+        "template_usage_flush_interval": float(os.environ.get("TEMPLATE_USAGE_FLUSH_INTERVAL", "1.0")),
+        "bcrypt_rounds": int(os.environ.get("BCRYPT_ROUNDS", "12")),
+        "password_hash_workers": int(os.environ.get("PASSWORD_HASH_WORKERS", "2")),
+        "password_hash_max_queue": int(os.environ.get("PASSWORD_HASH_MAX_QUEUE", "64")),
+        "http_client_timeout": float(os.environ.get("HTTP_CLIENT_TIMEOUT", "10")),
+        "http_client_max_connections": int(os.environ.get("HTTP_CLIENT_MAX_CONNECTIONS", "100")),
+        "rate_limit_enabled": os.environ.get("RATE_LIMIT_ENABLED", "true").lower() == "true",
+        "rate_limit_backend": os.environ.get("RATE_LIMIT_BACKEND", "memory"),  # memory | redis
+        "rate_limit_trust_forwarded": os.environ.get("RATE_LIMIT_TRUST_FORWARDED", "false").lower() == "true",
+        "metrics_token": os.environ.get("METRICS_TOKEN"),  # /metrics is disabled when unset
+        "cache_invalidation": os.environ.get("CACHE_INVALIDATION", "local"),  # local | redis
+        "redis_url": os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+    }
+
+
+def _optional_int(value: Optional[str]) -> Optional[int]:
+    """Parse optional integer setting."""
+    return int(value) if value else None
+
+
+@dataclass
+class Storage:
+    """Uncached repositories of one storage backend."""
+    users: UserRepository
+    telegram_sessions: TelegramSessionRepository
+    groups: GroupRepository
+    message_templates: MessageTemplateRepository
+    tombstones: TombstoneRepository
+    media_assets: MediaAssetRepository
+    media_file_references: MediaFileReferenceRepository
+
+
+class Container:
+    """Owns every application-scoped object, built once at startup.
+    
+    The Mongo client, repositories, services, caches and pools are created
+    here and shared by all requests, so request handling only looks them
+    up. Built in the application lifespan and stored on ``app.state``;
+    ``close`` releases everything in dependency order.
+    
+    With ``STORAGE_BACKEND=sqlite`` repositories use an embedded SQLite
+    file instead of MongoDB, for single-node installs; with ``memory``
+    they keep data in process memory, for benchmarks and test runs. In
+    both cases no Mongo client is created and ``database`` is None.
+    """
+    
+    def __init__(self, settings: Dict[str, Any]):
+        self.settings = settings
+        
+        self.db_client = None
+        self.database = None
+        self.sqlite_database: Optional[SQLiteDatabase] = None
+        storage = self._create_storage()
+        
+        # Caches shared across requests; with several workers, writes are broadcast through Redis
+        self.cache_invalidation_bus = (
+            RedisCacheInvalidationBus(settings["redis_url"])
+            if settings["cache_invalidation"] == "redis" else None
+        )
+        bus = self.cache_invalidation_bus
+        self.template_cache = ReadThroughCache("message_templates", maxsize=256, ttl=60, bus=bus)
+        self.user_cache = ReadThroughCache("users", maxsize=16384, ttl=30, bus=bus)
+        self.session_cache = ReadThroughCache("telegram_sessions", maxsize=4096, ttl=300, bus=bus)
+        self.file_reference_cache = ReadThroughCache("media_file_references", maxsize=10000, ttl=3600, bus=bus)
+        self.token_cache = TTLCache(maxsize=4096, ttl=300)
+        
+        # Pools
+        self.password_hasher = BcryptPasswordHasher(
+            rounds=settings["bcrypt_rounds"],
+            max_workers=settings["password_hash_workers"],
+            max_queue=settings["password_hash_max_queue"]
+        )
+        timeout = settings["http_client_timeout"]
+        self.http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout, connect=min(timeout, 5.0)),
+            limits=httpx.Limits(
+                max_connections=settings["http_client_max_connections"],
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0
+            )
+        )
+        self.rate_limit_backend = self._create_rate_limit_backend()
+        
+        # Repositories
+        self.user_repository: UserRepository = CachedUserRepository(storage.users, self.user_cache)
+        self.telegram_session_repository: TelegramSessionRepository = CachedTelegramSessionRepository(
+            storage.telegram_sessions, self.session_cache
+        )
+        self.group_repository: GroupRepository = storage.groups
+        self.message_template_repository: MessageTemplateRepository = CachedMessageTemplateRepository(
+            storage.message_templates, self.template_cache
+        )
+        self.tombstone_repository: TombstoneRepository = storage.tombstones
+        self.media_asset_repository: MediaAssetRepository = storage.media_assets
+        self.media_blob_store: MediaBlobStore = self._create_media_blob_store()
+        
+        # Services
+        self.authentication_service: AuthenticationService = CachedAuthenticationService(
+            user_repository=self.user_repository,
+            password_hasher=self.password_hasher,
+            jwt_secret=settings["jwt_secret"],
+            jwt_algorithm=settings["jwt_algorithm"],
+            api_token_secret=settings["api_token_secret"],
+            token_cache=self.token_cache
+        )
+        self.telegram_service = TelegramService(self.telegram_session_repository)
+        # Shared so concurrent sends of the same asset through one session join a single upload
+        self.media_service = MediaService(
+            asset_repository=self.media_asset_repository,
+            reference_repository=CachedMediaFileReferenceRepository(
+                storage.media_file_references, self.file_reference_cache
+            ),
+            blob_store=self.media_blob_store,
+            telegram_service=self.telegram_service
+        )
+        # Writes straight to storage: counters are not cached content
+        self.template_usage_buffer = TemplateUsageBuffer(
+            storage.message_templates,
+            flush_interval=settings["template_usage_flush_interval"]
+        )
+    
+    async def start(self) -> None:
+        """Warm the Mongo connection pool (or create the SQLite schema) and start background tasks."""
+        if self.database is not None:
+            await warm_up_mongo(self.database, self.settings["mongo_min_pool_size"])
+        if self.sqlite_database is not None:
+            await ensure_schema(self.sqlite_database)
+        self.template_usage_buffer.start()
+        if self.cache_invalidation_bus is not None:
+            self.cache_invalidation_bus.start()
+    
+    async def close(self) -> None:
+        """Flush pending writes and release pools and connections."""
+        try:
+            await self.template_usage_buffer.stop()
+        except Exception as e:
+            logger.error(f"❌ Failed to flush template usage on shutdown: {e}")
+        
+        await self.http_client.aclose()
+        await self.rate_limit_backend.close()
+        if self.cache_invalidation_bus is not None:
+            await self.cache_invalidation_bus.close()
+        self.password_hasher.close()
+        if self.db_client is not None:
+            self.db_client.close()
+        if self.sqlite_database is not None:
+            await self.sqlite_database.close()
+    
+    def _create_storage(self) -> Storage:
+        """Create repositories of the configured storage backend."""
+        backend = self.settings["storage_backend"]
+        if backend == "mongodb":
+            self.db_client = create_mongo_client(self.settings)
+            self.database = self.db_client[self.settings["db_name"]]
+            return Storage(
+                users=MongoDBUserRepository(self.database),
+                telegram_sessions=MongoDBTelegramSessionRepository(self.database),
+                groups=MongoDBGroupRepository(self.database),
+                message_templates=MongoDBMessageTemplateRepository(self.database),
+                tombstones=MongoDBTombstoneRepository(self.database),
+                media_assets=MongoDBMediaAssetRepository(self.database),
+                media_file_references=MongoDBMediaFileReferenceRepository(self.database)
+            )
+        if backend == "sqlite":
+            self.sqlite_database = SQLiteDatabase(self.settings["sqlite_path"])
+            return Storage(
+                users=SQLiteUserRepository(self.sqlite_database),
+                telegram_sessions=SQLiteTelegramSessionRepository(self.sqlite_database),
+                groups=SQLiteGroupRepository(self.sqlite_database),
+                message_templates=SQLiteMessageTemplateRepository(self.sqlite_database),
+                tombstones=SQLiteTombstoneRepository(self.sqlite_database),
+                media_assets=SQLiteMediaAssetRepository(self.sqlite_database),
+                media_file_references=SQLiteMediaFileReferenceRepository(self.sqlite_database)
+            )
+        if backend == "memory":
+            tombstones = InMemoryTombstoneRepository()
+            return Storage(
+                users=InMemoryUserRepository(),
+                telegram_sessions=InMemoryTelegramSessionRepository(tombstones),
+                groups=InMemoryGroupRepository(tombstones),
+                message_templates=InMemoryMessageTemplateRepository(tombstones),
+                tombstones=tombstones,
+                media_assets=InMemoryMediaAssetRepository(),
+                media_file_references=InMemoryMediaFileReferenceRepository()
+            )
+        raise ValueError(f"Unknown STORAGE_BACKEND: {backend}")
+    
+    def _create_media_blob_store(self) -> MediaBlobStore:
+        """Create the configured media blob store."""
+        media_storage = self.settings["media_storage"]
+        if media_storage == "gridfs":
+            if self.database is None:
+                raise ValueError("MEDIA_STORAGE=gridfs requires STORAGE_BACKEND=mongodb")
+            return GridFSMediaBlobStore(self.database)
+        if media_storage == "memory":
+            return InMemoryMediaBlobStore()
+        return LocalMediaBlobStore(self.settings["media_root"])
+    
+    def _create_rate_limit_backend(self) -> RateLimitBackend:
+        """Create rate limit counters: per process (memory) or shared through Redis."""
+        backend = self.settings["rate_limit_backend"]
+        if backend == "redis":
+            return RedisRateLimitBackend(self.settings["redis_url"])
+        if backend == "memory":
+            return InMemoryRateLimitBackend()
+        raise ValueError(f"Unknown RATE_LIMIT_BACKEND: {backend}")
\ No newline at end of file
@@ -0,0 +1,150 @@
+"""MongoDB index bootstrap and verification."""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Tuple
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import OperationFailure
+
+from .mongodb_user_repository import MongoDBUserRepository
+from .mongodb_telegram_session_repository import MongoDBTelegramSessionRepository
+from .mongodb_group_repository import MongoDBGroupRepository
+from .mongodb_message_template_repository import MongoDBMessageTemplateRepository
+from .mongodb_tombstone_repository import MongoDBTombstoneRepository
+from .mongodb_media_asset_repository import MongoDBMediaAssetRepository
+from .mongodb_media_file_reference_repository import MongoDBMediaFileReferenceRepository
+
+
+logger = logging.getLogger(__name__)
+
+# Repositories whose declared INDEXES are managed at startup
+INDEXED_REPOSITORIES = (
+    MongoDBUserRepository,
+    MongoDBTelegramSessionRepository,
+    MongoDBGroupRepository,
+    MongoDBMessageTemplateRepository,
+    MongoDBTombstoneRepository,
+    MongoDBMediaAssetRepository,
+    MongoDBMediaFileReferenceRepository,
+)
+
+# An index counts as unused only after its usage counters have run this long;
+# counters restart with the server and with index creation
+UNUSED_INDEX_MIN_AGE = timedelta(days=7)
+
+
+@dataclass
+class IndexReport:
+    """Index state of a single collection."""
+    collection: str
+    created: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+    unused: List[str] = field(default_factory=list)
+    undeclared: List[str] = field(default_factory=list)
+    
+    @property
+    def healthy(self) -> bool:
+        """True when every declared index exists."""
+        return not self.missing
+
+
+async def ensure_indexes(database: AsyncIOMotorDatabase) -> List[IndexReport]:
+    """Create all declared indexes and return a verification report.
+    
+    Creation is idempotent: indexes that already exist with the same
+    specification are left untouched. An index that cannot be built (e.g.
+    duplicate data under a unique index, or a conflicting definition under
+    the same name) is logged and reported as missing instead of aborting
+    startup.
+    """
+    reports = []
+    
+    for repository_class in INDEXED_REPOSITORIES:
+        collection = database[repository_class.COLLECTION]
+        existing = await _existing_index_names(collection)
+        created = []
+        
+        for index in repository_class.INDEXES:
+            name = index.document["name"]
+            if name in existing:
+                continue
+            try:
+                await collection.create_indexes([index])
+                created.append(name)
+            except OperationFailure as e:
+                logger.error(f"Failed to create index {repository_class.COLLECTION}.{name}: {e}")
+        
+        report = await _verify_collection(collection, repository_class.INDEXES)
+        report.created = created
+        reports.append(report)
+    
+    return reports
+
+
+async def verify_indexes(database: AsyncIOMotorDatabase) -> List[IndexReport]:
+    """Compare declared indexes with the ones present on the server."""
+    return [
+        await _verify_collection(database[repository_class.COLLECTION], repository_class.INDEXES)
+        for repository_class in INDEXED_REPOSITORIES
+    ]
+
+
+def log_index_reports(reports: List[IndexReport]) -> None:
+    """Log a startup summary of index state."""
+    for report in reports:
+        if report.created:
+            logger.info(f"🗂️ {report.collection}: created indexes {', '.join(report.created)}")
+        if report.missing:
+            logger.warning(f"⚠️ {report.collection}: missing indexes {', '.join(report.missing)}")
+        if report.undeclared:
+            logger.warning(f"⚠️ {report.collection}: undeclared indexes {', '.join(report.undeclared)}")
+        if report.unused:
+            logger.info(
+                f"ℹ️ {report.collection}: indexes unused for at least {UNUSED_INDEX_MIN_AGE.days} days "
+                f"{', '.join(report.unused)}"
+            )
+
+
+async def _verify_collection(collection, declared_indexes) -> IndexReport:
+    """Build the report for one collection."""
+    report = IndexReport(collection=collection.name)
+    declared = {index.document["name"] for index in declared_indexes}
+    existing = await _existing_index_names(collection)
+    
+    report.missing = sorted(declared - existing)
+    report.undeclared = sorted(existing - declared - {"_id_"})
+    
+    usage = await _index_usage(collection)
+    counted_after = datetime.utcnow() - UNUSED_INDEX_MIN_AGE
+    report.unused = sorted(
+        name for name, (ops, since) in usage.items()
+        if name != "_id_" and ops == 0 and since is not None and since <= counted_after
+    )
+    
+    return report
+
+
+async def _existing_index_names(collection) -> set:
+    """Names of indexes currently present on the collection."""
+    info = await collection.index_information()
+    return set(info.keys())
+
+
+async def _index_usage(collection) -> Dict[str, Tuple[int, Optional[datetime]]]:
+    """Access count per index and when counting began, as naive UTC ($indexStats)."""
+    try:
+        cursor = collection.aggregate([{"$indexStats": {}}])
+        stats: List[Dict[str, Any]] = await cursor.to_list(length=None)
+    except OperationFailure:
+        # $indexStats requires clusterMonitor privileges on some deployments
+        return {}
+    
+    usage = {}
+    for stat in stats:
+        accesses = stat.get("accesses", {})
+        since = accesses.get("since")
+        if since is not None and since.tzinfo is not None:
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+        usage[stat["name"]] = (accesses.get("ops", 0), since)
+    return usage
\ No newline at end of file
@@ -0,0 +1,125 @@
+"""MongoDB client construction, warmup and pool metrics."""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Any
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import monitoring
+from prometheus_client import Counter, Gauge, Histogram
+
+
+logger = logging.getLogger(__name__)
+
+MONGO_POOL_CHECKOUT_WAIT_SECONDS = Histogram(
+    "mongo_pool_checkout_wait_seconds",
+    "Time spent waiting to check a connection out of the MongoDB pool",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+MONGO_POOL_CHECKOUT_FAILURES = Counter(
+    "mongo_pool_checkout_failures_total",
+    "Failed MongoDB connection checkouts",
+    ["reason"]
+)
+MONGO_POOL_CHECKED_OUT = Gauge(
+    "mongo_pool_connections_checked_out",
+    "MongoDB connections currently checked out"
+)
+MONGO_POOL_OPEN = Gauge(
+    "mongo_pool_connections_open",
+    "MongoDB connections currently open"
+)
+
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """Exports connection pool usage and checkout wait as Prometheus metrics.
+    
+    A checkout starts and completes on the same driver thread, so the
+    start time is kept in a thread local. A wait histogram skewed towards
+    slow buckets means requests queue for connections and the pool is too
+    small for the worker's concurrency.
+    """
+    
+    def __init__(self):
+        self._local = threading.local()
+    
+    def connection_check_out_started(self, event):
+        self._local.started = time.perf_counter()
+    
+    def connection_checked_out(self, event):
+        MONGO_POOL_CHECKED_OUT.inc()
+        started = getattr(self._local, "started", None)
+        if started is not None:
+            MONGO_POOL_CHECKOUT_WAIT_SECONDS.observe(time.perf_counter() - started)
+            self._local.started = None
+    
+    def connection_check_out_failed(self, event):
+        MONGO_POOL_CHECKOUT_FAILURES.labels(reason=str(event.reason)).inc()
+        started = getattr(self._local, "started", None)
+        if started is not None:
+            MONGO_POOL_CHECKOUT_WAIT_SECONDS.observe(time.perf_counter() - started)
+            self._local.started = None
+    
+    def connection_checked_in(self, event):
+        MONGO_POOL_CHECKED_OUT.dec()
+    
+    def connection_created(self, event):
+        MONGO_POOL_OPEN.inc()
+    
+    def connection_closed(self, event):
+        MONGO_POOL_OPEN.dec()
+    
+    def connection_ready(self, event):
+        pass
+    
+    def pool_created(self, event):
+        pass
+    
+    def pool_ready(self, event):
+        pass
+    
+    def pool_cleared(self, event):
+        pass
+    
+    def pool_closed(self, event):
+        pass
+
+
+def create_mongo_client(settings: Dict[str, Any]) -> AsyncIOMotorClient:
+    """Create the MongoDB client with configured pool sizing and timeouts.
+    
+    No connection is made here; see ``warm_up_mongo``.
+    """
+    return AsyncIOMotorClient(
+        settings["mongo_url"],
+        maxPoolSize=settings["mongo_max_pool_size"],
+        minPoolSize=settings["mongo_min_pool_size"],
+        maxIdleTimeMS=settings["mongo_max_idle_time_ms"],
+        waitQueueTimeoutMS=settings["mongo_wait_queue_timeout_ms"],
+        serverSelectionTimeoutMS=settings["mongo_server_selection_timeout_ms"],
+        connectTimeoutMS=settings["mongo_connect_timeout_ms"],
+        appname="telegram-auto-sender",
+        event_listeners=[PoolMetricsListener()]
+    )
+
+
+async def warm_up_mongo(database: AsyncIOMotorDatabase, connections: int) -> None:
+    """Select a server with ``ping`` and open ``connections`` pooled connections.
+    
+    Concurrent pings check out connections in parallel, so the first
+    requests after startup neither wait for server selection nor pay the
+    TCP, TLS and handshake cost; the driver then keeps ``minPoolSize``
+    connections open.
+    """
+    started = time.perf_counter()
+    await database.command("ping")
+    
+    if connections > 1:
+        await asyncio.gather(*(database.command("ping") for _ in range(connections - 1)))
+    
+    logger.info(
+        f"🔌 MongoDB ready: {max(connections, 1)} pooled connections warmed "
+        f"in {(time.perf_counter() - started) * 1000:.0f} ms"
+    )
\ No newline at end of file
@@ -1,130 +1,335 @@
 """MongoDB implementation of group repository."""
 
+from datetime import datetime
 from typing import Optional, List
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, IndexModel, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 from ...domain.entities.group import Group, GroupId, GroupStatus, BlacklistReason
-from ...domain.repositories.group_repository import GroupRepository
+from ...domain.entities.tombstone import Tombstone
+from ...domain.read_models.group_summary import GroupSummary
+from ...domain.read_models.group_set import GroupSet, STATUS_VALUE_CODES, to_epoch
+from ...domain.repositories.group_repository import GroupRepository, GroupWriteError
+from .mongodb_tombstone_repository import MongoDBTombstoneRepository
+from .tracked_updates import tracked_update
+
+
+# Fields serialized by group list endpoints
+SUMMARY_PROJECTION = {
+    "_id": 0,
+    "id": 1,
+    "telegram_id": 1,
+    "name": 1,
+    "username": 1,
+    "invite_link": 1,
+    "status": 1,
+    "message_count": 1,
+    "last_message_sent": 1,
+    "created_at": 1
+}
+
+# Fields loaded into columnar GroupSet working sets
+GROUP_SET_PROJECTION = {
+    "_id": 0,
+    "id": 1,
+    "telegram_id": 1,
+    "status": 1,
+    "blacklist_until": 1
+}
 
 
 class MongoDBGroupRepository(GroupRepository):
     """MongoDB implementation of group repository."""
     
+    COLLECTION = "groups"
+    INDEXES = [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel(
+            [("user_id", ASCENDING), ("telegram_id", ASCENDING)],
+            name="user_id_telegram_id_unique",
+            unique=True
+        ),
+        IndexModel(
+            [("user_id", ASCENDING), ("status", ASCENDING), ("blacklist_until", ASCENDING)],
+            name="user_id_status_blacklist_until"
+        ),
+        IndexModel(
+            [("user_id", ASCENDING), ("created_at", DESCENDING)],
+            name="user_id_created_at"
+        ),
+        IndexModel(
+            [("user_id", ASCENDING), ("updated_at", ASCENDING)],
+            name="user_id_updated_at"
+        ),
+    ]
+    
     def __init__(self, database: AsyncIOMotorDatabase):
         self.db = database
-        self.collection = self.db.groups
+        self.collection = self.db[self.COLLECTION]
+        self.tombstones = MongoDBTombstoneRepository(database)
     
     async def save(self, group: Group) -> None:
-        """Save group to MongoDB."""
-        group_doc = {
-            "id": group.id.value,
-            "telegram_id": group.telegram_id,
-            "name": group.name,
-            "username": group.username,
-            "invite_link": group.invite_link,
-            "status": group.status.value,
-            "blacklist_reason": group.blacklist_reason.value if group.blacklist_reason else None,
-            "blacklist_until": group.blacklist_until,
-            "message_count": group.message_count,
-            "last_message_sent": group.last_message_sent,
-            "created_at": group.created_at,
-            "updated_at": group.updated_at
-        }
+        """Save group to MongoDB, writing only fields changed since it was loaded.
         
-        await self.collection.update_one(
-            {"id": group.id.value},
-            {"$set": group_doc},
-            upsert=True
-        )
+        Raises ValueError when the Telegram ID belongs to another of the user's groups.
+        """
+        update = tracked_update(group, self._group_to_doc(group))
+        if update:
+            try:
+                await self.collection.update_one(
+                    {"user_id": group.user_id, "id": group.id.value},
+                    update,
+                    upsert=group.is_new
+                )
+            except DuplicateKeyError:
+                raise ValueError(f"Group with Telegram ID {group.telegram_id} already exists")
+        group.mark_clean()
     
-    async def find_by_id(self, group_id: GroupId) -> Optional[Group]:
-        """Find group by ID."""
-        doc = await self.collection.find_one({"id": group_id.value})
+    async def find_by_id(self, user_id: str, group_id: GroupId) -> Optional[Group]:
+        """Find user's group by ID."""
+        doc = await self.collection.find_one({"user_id": user_id, "id": group_id.value})
         return self._doc_to_group(doc) if doc else None
     
-    async def find_by_telegram_id(self, telegram_id: str) -> Optional[Group]:
-        """Find group by Telegram ID."""
-        doc = await self.collection.find_one({"telegram_id": telegram_id})
+    async def find_by_ids(self, user_id: str, group_ids: List[GroupId]) -> List[Group]:
+        """Find user's groups by ID in one query, in the given order; missing IDs are skipped."""
+        if not group_ids:
+            return []
+        
+        ids = [group_id.value for group_id in group_ids]
+        docs = await self.collection.find({"user_id": user_id, "id": {"$in": ids}}).to_list(length=len(ids))
+        by_id = {doc["id"]: doc for doc in docs}
+        return [self._doc_to_group(by_id[group_id]) for group_id in dict.fromkeys(ids) if group_id in by_id]
+    
+    async def find_by_telegram_id(self, user_id: str, telegram_id: str) -> Optional[Group]:
+        """Find user's group by Telegram ID."""
+        doc = await self.collection.find_one({"user_id": user_id, "telegram_id": telegram_id})
         return self._doc_to_group(doc) if doc else None
     
-    async def list_by_status(self, status: GroupStatus) -> List[Group]:
-        """List groups by status."""
-        cursor = self.collection.find({"status": status.value})
-        docs = await cursor.to_list(length=None)
+    async def list_by_user(self, user_id: str, skip: int = 0, limit: int = 100) -> List[Group]:
+        """List user's groups with pagination."""
+        cursor = self.collection.find({"user_id": user_id}).sort("created_at", DESCENDING).skip(skip).limit(limit)
+        docs = await cursor.to_list(length=limit)
         return [self._doc_to_group(doc) for doc in docs]
     
-    async def list_available_for_sending(self) -> List[Group]:
-        """List groups available for sending messages."""
-        # Groups that are active or have expired temporary blacklists
-        cursor = self.collection.find({
-            "$or": [
-                {"status": GroupStatus.ACTIVE.value},
-                {
-                    "status": GroupStatus.BLACKLISTED_TEMP.value,
-                    "blacklist_until": {"$lt": datetime.utcnow()}
-                }
-            ]
-        })
+    async def list_by_status(self, user_id: str, status: GroupStatus,
+                             skip: int = 0, limit: int = 100) -> List[Group]:
+        """List user's groups by status."""
+        cursor = self.collection.find({"user_id": user_id, "status": status.value}).skip(skip).limit(limit)
+        docs = await cursor.to_list(length=limit)
+        return [self._doc_to_group(doc) for doc in docs]
+    
+    async def list_summaries(self, user_id: str, status: Optional[GroupStatus] = None,
+                             skip: int = 0, limit: int = 100) -> List[GroupSummary]:
+        """List lightweight summaries of user's groups, optionally filtered by status."""
+        query = {"user_id": user_id}
+        if status:
+            query["status"] = status.value
+        
+        cursor = (
+            self.collection.find(query, SUMMARY_PROJECTION)
+            .sort("created_at", DESCENDING)
+            .skip(skip)
+            .limit(limit)
+        )
+        docs = await cursor.to_list(length=limit)
+        return [self._doc_to_summary(doc) for doc in docs]
+    
+    async def list_changed_since(self, user_id: str, since: Optional[datetime] = None) -> List[GroupSummary]:
+        """List summaries of user's groups updated after the given time (all when None)."""
+        query = {"user_id": user_id}
+        if since is not None:
+            query["updated_at"] = {"$gt": since}
+        
+        cursor = self.collection.find(query, SUMMARY_PROJECTION)
         docs = await cursor.to_list(length=None)
-        groups = []
-        for doc in docs:
-            group = self._doc_to_group(doc)
-            if group.is_available_for_sending():
-                groups.append(group)
-        return groups
-    
-    async def count_by_status(self, status: GroupStatus) -> int:
-        """Count groups by status."""
-        return await self.collection.count_documents({"status": status.value})
-    
-    async def delete(self, group_id: GroupId) -> bool:
-        """Delete group."""
-        result = await self.collection.delete_one({"id": group_id.value})
-        return result.deleted_count > 0
+        return [self._doc_to_summary(doc) for doc in docs]
+    
+    async def load_group_set(self, user_id: str, statuses: Optional[List[GroupStatus]] = None) -> GroupSet:
+        """Load user's groups into a compact columnar working set."""
+        query = {"user_id": user_id}
+        if statuses:
+            query["status"] = {"$in": [group_status.value for group_status in statuses]}
+        
+        group_set = GroupSet()
+        cursor = self.collection.find(query, GROUP_SET_PROJECTION, batch_size=5000)
+        async for doc in cursor:
+            group_set.append_raw(
+                doc["id"],
+                doc["telegram_id"],
+                STATUS_VALUE_CODES[doc.get("status", "active")],
+                to_epoch(doc.get("blacklist_until"))
+            )
+        return group_set
+    
+    async def list_available_for_sending(self, user_id: str) -> List[Group]:
+        """List user's groups available for sending messages."""
+        await self.reactivate_expired_blacklists(user_id)
+        
+        cursor = self.collection.find({"user_id": user_id, "status": GroupStatus.ACTIVE.value})
+        docs = await cursor.to_list(length=None)
+        return [self._doc_to_group(doc) for doc in docs]
+    
+    async def reactivate_expired_blacklists(self, user_id: str) -> int:
+        """Reactivate user's temporarily blacklisted groups whose blacklist has expired.
+        
+        A temporary blacklist without a deadline counts as expired, as in
+        Group.is_available_for_sending and GroupSet.
+        """
+        now = datetime.utcnow()
+        result = await self.collection.update_many(
+            {
+                "user_id": user_id,
+                "status": GroupStatus.BLACKLISTED_TEMP.value,
+                "$or": [{"blacklist_until": {"$lte": now}}, {"blacklist_until": None}]
+            },
+            {"$set": {
+                "status": GroupStatus.ACTIVE.value,
+                "blacklist_reason": None,
+                "blacklist_until": None,
+                "updated_at": now
+            }}
+        )
+        return result.modified_count
+    
+    async def count_by_user(self, user_id: str) -> int:
+        """Count user's groups."""
+        return await self.collection.count_documents({"user_id": user_id})
+    
+    async def count_by_status(self, user_id: str, status: GroupStatus) -> int:
+        """Count user's groups by status."""
+        return await self.collection.count_documents({"user_id": user_id, "status": status.value})
+    
+    async def delete(self, user_id: str, group_id: GroupId) -> bool:
+        """Delete user's group."""
+        result = await self.collection.delete_one({"user_id": user_id, "id": group_id.value})
+        if result.deleted_count > 0:
+            await self._record_tombstones(user_id, [group_id.value])
+            return True
+        return False
     
     async def bulk_save(self, groups: List[Group]) -> None:
-        """Save multiple groups."""
-        if not groups:
-            return
+        """Save multiple groups; unchanged loaded groups are skipped.
         
+        The bulk write is unordered, so a taken Telegram ID fails only its
+        own group; GroupWriteError names the groups that were not written.
+        """
         operations = []
+        written = []
         for group in groups:
-            group_doc = {
-                "id": group.id.value,
-                "telegram_id": group.telegram_id,
-                "name": group.name,
-                "username": group.username,
-                "invite_link": group.invite_link,
-                "status": group.status.value,
-                "blacklist_reason": group.blacklist_reason.value if group.blacklist_reason else None,
-                "blacklist_until": group.blacklist_until,
-                "message_count": group.message_count,
-                "last_message_sent": group.last_message_sent,
-                "created_at": group.created_at,
-                "updated_at": group.updated_at
-            }
-            
-            operations.append({
-                "updateOne": {
-                    "filter": {"id": group.id.value},
-                    "update": {"$set": group_doc},
-                    "upsert": True
-                }
-            })
+            update = tracked_update(group, self._group_to_doc(group))
+            if update:
+                operations.append(UpdateOne(
+                    {"user_id": group.user_id, "id": group.id.value},
+                    update,
+                    upsert=group.is_new
+                ))
+                written.append(group)
         
+        failed = []
         if operations:
-            await self.collection.bulk_write(operations)
+            try:
+                await self.collection.bulk_write(operations, ordered=False)
+            except BulkWriteError as e:
+                failed = [written[error["index"]] for error in e.details.get("writeErrors", [])]
+                if not failed:
+                    raise
+        
+        failed_ids = {id(group) for group in failed}
+        for group in groups:
+            if id(group) not in failed_ids:
+                group.mark_clean()
+        
+        if failed:
+            raise GroupWriteError(failed, f"{len(failed)} of {len(operations)} group writes failed")
+    
+    async def bulk_delete(self, user_id: str, group_ids: Optional[List[GroupId]] = None,
+                          statuses: Optional[List[GroupStatus]] = None) -> List[str]:
+        """Delete user's groups matching IDs and/or statuses."""
+        query = self._selection_query(user_id, group_ids, statuses)
+        matched_ids = await self._matching_ids(query)
+        if not matched_ids:
+            return []
+        
+        await self.collection.delete_many({"user_id": user_id, "id": {"$in": matched_ids}})
+        await self._record_tombstones(user_id, matched_ids)
+        return matched_ids
+    
+    async def bulk_update_status(self, user_id: str, new_status: GroupStatus,
+                                 group_ids: Optional[List[GroupId]] = None,
+                                 statuses: Optional[List[GroupStatus]] = None,
+                                 blacklist_reason: Optional[BlacklistReason] = None,
+                                 blacklist_until: Optional[datetime] = None) -> List[str]:
+        """Set status of user's groups matching IDs and/or statuses."""
+        query = self._selection_query(user_id, group_ids, statuses)
+        matched_ids = await self._matching_ids(query)
+        if not matched_ids:
+            return []
+        
+        update = {"status": new_status.value, "updated_at": datetime.utcnow()}
+        if new_status == GroupStatus.ACTIVE:
+            update["blacklist_reason"] = None
+            update["blacklist_until"] = None
+        elif new_status in (GroupStatus.BLACKLISTED_TEMP, GroupStatus.BLACKLISTED_PERM):
+            update["blacklist_reason"] = blacklist_reason.value if blacklist_reason else None
+            update["blacklist_until"] = blacklist_until if new_status == GroupStatus.BLACKLISTED_TEMP else None
+        
+        await self.collection.update_many(
+            {"user_id": user_id, "id": {"$in": matched_ids}},
+            {"$set": update}
+        )
+        return matched_ids
+    
+    def _selection_query(self, user_id: str, group_ids: Optional[List[GroupId]],
+                         statuses: Optional[List[GroupStatus]]) -> dict:
+        """Build query selecting user's groups by IDs and/or statuses."""
+        query = {"user_id": user_id}
+        if group_ids is not None:
+            query["id"] = {"$in": [group_id.value for group_id in group_ids]}
+        if statuses:
+            query["status"] = {"$in": [group_status.value for group_status in statuses]}
+        return query
+    
+    async def _record_tombstones(self, user_id: str, group_ids: List[str]) -> None:
+        """Record deleted groups for delta sync."""
+        deleted_at = datetime.utcnow()
+        await self.tombstones.record([
+            Tombstone(entity_type="group", entity_id=group_id, user_id=user_id, deleted_at=deleted_at)
+            for group_id in group_ids
+        ])
+    
+    async def _matching_ids(self, query: dict) -> List[str]:
+        """IDs of groups matching query."""
+        cursor = self.collection.find(query, {"_id": 0, "id": 1})
+        return [doc["id"] async for doc in cursor]
+    
+    def _group_to_doc(self, group: Group) -> dict:
+        """Convert Group entity to MongoDB document."""
+        return {
+            "id": group.id.value,
+            "user_id": group.user_id,
+            "telegram_id": group.telegram_id,
+            "name": group.name,
+            "username": group.username,
+            "invite_link": group.invite_link,
+            "status": group.status.value,
+            "blacklist_reason": group.blacklist_reason.value if group.blacklist_reason else None,
+            "blacklist_until": group.blacklist_until,
+            "message_count": group.message_count,
+            "last_message_sent": group.last_message_sent,
+            "created_at": group.created_at,
+            "updated_at": group.updated_at
+        }
     
     def _doc_to_group(self, doc: dict) -> Group:
         """Convert MongoDB document to Group entity."""
-        from datetime import datetime
-        
         blacklist_reason = None
         if doc.get("blacklist_reason"):
             blacklist_reason = BlacklistReason(doc["blacklist_reason"])
         
-        return Group(
+        group = Group(
             id=GroupId(doc["id"]),
+            user_id=doc["user_id"],
             telegram_id=doc["telegram_id"],
             name=doc["name"],
             username=doc.get("username"),
@@ -136,4 +341,20 @@ class MongoDBGroupRepository(GroupRepository):
             last_message_sent=doc.get("last_message_sent"),
             created_at=doc.get("created_at"),
             updated_at=doc.get("updated_at")
+        )
+        group.mark_clean()
+        return group
+    
+    def _doc_to_summary(self, doc: dict) -> GroupSummary:
+        """Convert projected MongoDB document to GroupSummary."""
+        return GroupSummary(
+            id=doc["id"],
+            telegram_id=doc["telegram_id"],
+            name=doc["name"],
+            username=doc.get("username"),
+            invite_link=doc.get("invite_link"),
+            status=GroupStatus(doc.get("status", "active")),
+            message_count=doc.get("message_count", 0),
+            last_message_sent=doc.get("last_message_sent"),
+            created_at=doc.get("created_at")
         )
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""MongoDB implementation of media asset repository."""
+
+from typing import Optional
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, IndexModel, ReturnDocument
+
+from ...domain.entities.media import MediaAsset, MediaHash, MediaKind
+from ...domain.repositories.media_asset_repository import MediaAssetRepository
+
+
+class MongoDBMediaAssetRepository(MediaAssetRepository):
+    """MongoDB implementation of media asset repository."""
+    
+    COLLECTION = "media_assets"
+    INDEXES = [
+        IndexModel([("content_hash", ASCENDING)], name="content_hash_unique", unique=True),
+    ]
+    
+    def __init__(self, database: AsyncIOMotorDatabase):
+        self.db = database
+        self.collection = self.db[self.COLLECTION]
+    
+    async def save(self, asset: MediaAsset) -> MediaAsset:
+        """Insert asset unless the hash exists and link the uploader. Returns the stored asset."""
+        doc = await self.collection.find_one_and_update(
+            {"content_hash": asset.content_hash.value},
+            {"$setOnInsert": {
+                "content_hash": asset.content_hash.value,
+                "size": asset.size,
+                "mime_type": asset.mime_type,
+                "kind": asset.kind.value,
+                "uploaded_by": asset.uploaded_by,
+                "created_at": asset.created_at
+            }, "$addToSet": {"owner_ids": asset.uploaded_by}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        return self._doc_to_asset(doc)
+    
+    async def find_by_hash(self, content_hash: MediaHash) -> Optional[MediaAsset]:
+        """Find asset by content hash."""
+        doc = await self.collection.find_one({"content_hash": content_hash.value})
+        return self._doc_to_asset(doc) if doc else None
+    
+    async def find_linked(self, content_hash: MediaHash, user_id: str) -> Optional[MediaAsset]:
+        """Find asset by content hash if the user has uploaded it."""
+        # Assets stored before owner_ids existed only know their first uploader
+        doc = await self.collection.find_one({
+            "content_hash": content_hash.value,
+            "$or": [{"owner_ids": user_id}, {"uploaded_by": user_id}]
+        })
+        return self._doc_to_asset(doc) if doc else None
+    
+    async def delete(self, content_hash: MediaHash) -> bool:
+        """Delete asset."""
+        result = await self.collection.delete_one({"content_hash": content_hash.value})
+        return result.deleted_count > 0
+    
+    def _doc_to_asset(self, doc: dict) -> MediaAsset:
+        """Convert MongoDB document to MediaAsset entity."""
+        return MediaAsset(
+            content_hash=MediaHash(doc["content_hash"]),
+            size=doc["size"],
+            mime_type=doc["mime_type"],
+            kind=MediaKind(doc["kind"]),
+            uploaded_by=doc["uploaded_by"],
+            created_at=doc.get("created_at")
+        )
\ No newline at end of file
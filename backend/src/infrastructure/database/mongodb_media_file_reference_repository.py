@@ -0,0 +1,60 @@
+"""MongoDB implementation of media file reference repository."""
+
+from typing import Optional
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, IndexModel
+
+from ...domain.entities.media import MediaFileReference, MediaHash
+from ...domain.entities.telegram_session import SessionId
+from ...domain.repositories.media_file_reference_repository import MediaFileReferenceRepository
+
+
+class MongoDBMediaFileReferenceRepository(MediaFileReferenceRepository):
+    """MongoDB implementation of media file reference repository."""
+    
+    COLLECTION = "media_file_refs"
+    INDEXES = [
+        IndexModel(
+            [("content_hash", ASCENDING), ("session_id", ASCENDING)],
+            name="content_hash_session_id_unique",
+            unique=True
+        ),
+    ]
+    
+    def __init__(self, database: AsyncIOMotorDatabase):
+        self.db = database
+        self.collection = self.db[self.COLLECTION]
+    
+    async def save(self, reference: MediaFileReference) -> None:
+        """Save file reference."""
+        await self.collection.update_one(
+            {"content_hash": reference.content_hash.value, "session_id": reference.session_id.value},
+            {"$set": {
+                "file_reference": reference.file_reference,
+                "uploaded_at": reference.uploaded_at
+            }},
+            upsert=True
+        )
+    
+    async def find(self, session_id: SessionId, content_hash: MediaHash) -> Optional[MediaFileReference]:
+        """Find file reference of an asset uploaded through a session."""
+        doc = await self.collection.find_one(
+            {"content_hash": content_hash.value, "session_id": session_id.value},
+            {"_id": 0}
+        )
+        if not doc:
+            return None
+        
+        return MediaFileReference(
+            content_hash=content_hash,
+            session_id=session_id,
+            file_reference=doc["file_reference"],
+            uploaded_at=doc.get("uploaded_at")
+        )
+    
+    async def delete(self, session_id: SessionId, content_hash: MediaHash) -> bool:
+        """Delete file reference."""
+        result = await self.collection.delete_one(
+            {"content_hash": content_hash.value, "session_id": session_id.value}
+        )
+        return result.deleted_count > 0
\ No newline at end of file
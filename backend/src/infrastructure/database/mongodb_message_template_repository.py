@@ -1,38 +1,78 @@
 """MongoDB implementation of message template repository."""
 
+from datetime import datetime
 from typing import Optional, List
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, IndexModel, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
-from ...domain.entities.message_template import MessageTemplate, TemplateId
-from ...domain.repositories.message_template_repository import MessageTemplateRepository
+from ...domain.entities.media import MediaHash
+from ...domain.entities.message_template import MessageTemplate, TemplateId, TemplateVariant
+from ...domain.entities.template_usage import TemplateUsageDelta
+from ...domain.entities.tombstone import Tombstone
+from ...domain.repositories.message_template_repository import (
+    MessageTemplateRepository, DuplicateTemplateNameError, TemplateUsageWriteError
+)
+from .mongodb_tombstone_repository import MongoDBTombstoneRepository
+from .tracked_updates import tracked_update
 
 
 class MongoDBMessageTemplateRepository(MessageTemplateRepository):
     """MongoDB implementation of message template repository."""
     
+    COLLECTION = "message_templates"
+    INDEXES = [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("name", ASCENDING)], name="name_unique", unique=True),
+        IndexModel(
+            [("is_default", ASCENDING)],
+            name="is_default_partial",
+            partialFilterExpression={"is_default": True}
+        ),
+        IndexModel([("updated_at", ASCENDING)], name="updated_at"),
+    ]
+    
     def __init__(self, database: AsyncIOMotorDatabase):
         self.db = database
-        self.collection = self.db.message_templates
+        self.collection = self.db[self.COLLECTION]
+        self.tombstones = MongoDBTombstoneRepository(database)
     
     async def save(self, template: MessageTemplate) -> None:
-        """Save template to MongoDB."""
+        """Save template to MongoDB, writing only fields changed since it was loaded.
+        
+        Usage counters are only written on insert; afterwards they are owned
+        by apply_usage so a save never overwrites concurrent increments.
+        """
         template_doc = {
             "id": template.id.value,
             "name": template.name,
             "content": template.content,
             "is_default": template.is_default,
             "variables": template.variables,
-            "usage_count": template.usage_count,
-            "last_used_at": template.last_used_at,
+            "variants": [
+                {"name": variant.name, "content": variant.content, "weight": variant.weight}
+                for variant in template.variants
+            ],
+            "media_hash": template.media_hash.value if template.media_hash else None,
             "created_at": template.created_at,
             "updated_at": template.updated_at
         }
+        usage_doc = {
+            "variant_stats": template.variant_stats,
+            "usage_count": template.usage_count,
+            "last_used_at": template.last_used_at
+        }
         
-        await self.collection.update_one(
-            {"id": template.id.value},
-            {"$set": template_doc},
-            upsert=True
-        )
+        update = tracked_update(template, template_doc)
+        if template.is_new:
+            update["$setOnInsert"] = usage_doc
+        
+        if update:
+            try:
+                await self.collection.update_one({"id": template.id.value}, update, upsert=template.is_new)
+            except DuplicateKeyError:
+                raise DuplicateTemplateNameError()
+        template.mark_clean()
     
     async def find_by_id(self, template_id: TemplateId) -> Optional[MessageTemplate]:
         """Find template by ID."""
@@ -55,16 +95,58 @@ class MongoDBMessageTemplateRepository(MessageTemplateRepository):
         docs = await cursor.to_list(length=None)
         return [self._doc_to_template(doc) for doc in docs]
     
+    async def list_changed_since(self, since: Optional[datetime] = None) -> List[MessageTemplate]:
+        """List templates updated after the given time (all when None)."""
+        query = {"updated_at": {"$gt": since}} if since is not None else {}
+        cursor = self.collection.find(query)
+        docs = await cursor.to_list(length=None)
+        return [self._doc_to_template(doc) for doc in docs]
+    
+    async def apply_usage(self, deltas: List[TemplateUsageDelta]) -> None:
+        """Atomically add buffered usage counts and variant outcomes."""
+        operations = []
+        for delta in deltas:
+            increments = {"usage_count": delta.count}
+            for variant_name, outcomes in delta.variant_outcomes.items():
+                for counter, value in outcomes.items():
+                    if value:
+                        increments[f"variant_stats.{variant_name}.{counter}"] = value
+            
+            update = {"$inc": increments}
+            if delta.last_used_at is not None:
+                update["$max"] = {"last_used_at": delta.last_used_at}
+            operations.append(UpdateOne({"id": delta.template_id.value}, update))
+        
+        if not operations:
+            return
+        try:
+            await self.collection.bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            # Unordered: every operation not listed in writeErrors was applied
+            failed = [deltas[error["index"]] for error in e.details.get("writeErrors", [])]
+            raise TemplateUsageWriteError(failed, f"{len(failed)} of {len(deltas)} usage updates failed")
+    
     async def delete(self, template_id: TemplateId) -> bool:
         """Delete template."""
         result = await self.collection.delete_one({"id": template_id.value})
-        return result.deleted_count > 0
+        if result.deleted_count == 0:
+            return False
+        
+        await self.tombstones.record([
+            Tombstone(
+                entity_type="template",
+                entity_id=template_id.value,
+                user_id=None,
+                deleted_at=datetime.utcnow()
+            )
+        ])
+        return True
     
     async def clear_default_flags(self) -> None:
         """Clear all default flags."""
         await self.collection.update_many(
             {"is_default": True},
-            {"$set": {"is_default": False}}
+            {"$set": {"is_default": False, "updated_at": datetime.utcnow()}}
         )
     
     async def count_templates(self) -> int:
@@ -73,14 +155,22 @@ class MongoDBMessageTemplateRepository(MessageTemplateRepository):
     
     def _doc_to_template(self, doc: dict) -> MessageTemplate:
         """Convert MongoDB document to MessageTemplate entity."""
-        return MessageTemplate(
+        template = MessageTemplate(
             id=TemplateId(doc["id"]),
             name=doc["name"],
             content=doc["content"],
             is_default=doc.get("is_default", False),
             variables=doc.get("variables", {}),
+            variants=[
+                TemplateVariant(name=variant["name"], content=variant["content"], weight=variant.get("weight", 1.0))
+                for variant in doc.get("variants", [])
+            ],
+            variant_stats=doc.get("variant_stats", {}),
+            media_hash=MediaHash(doc["media_hash"]) if doc.get("media_hash") else None,
             usage_count=doc.get("usage_count", 0),
             last_used_at=doc.get("last_used_at"),
             created_at=doc.get("created_at"),
             updated_at=doc.get("updated_at")
-        )
\ No newline at end of file
+        )
+        template.mark_clean()
+        return template
\ No newline at end of file
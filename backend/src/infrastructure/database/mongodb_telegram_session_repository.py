@@ -1,48 +1,64 @@
 """MongoDB implementation of telegram session repository."""
 
+from datetime import datetime
 from typing import Optional, List
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, IndexModel
 
 from ...domain.entities.telegram_session import (
     TelegramSession, SessionId, TelegramCredentials, TelegramUser, SessionStatus
 )
+from ...domain.entities.tombstone import Tombstone
+from ...domain.read_models.session_summary import SessionSummary
 from ...domain.repositories.telegram_session_repository import TelegramSessionRepository
+from .mongodb_tombstone_repository import MongoDBTombstoneRepository
+from .tracked_updates import tracked_update
+
+
+# Fields serialized by session list endpoints; credentials and the
+# encrypted session blob are never loaded
+SUMMARY_PROJECTION = {
+    "_id": 0,
+    "id": 1,
+    "phone_number": 1,
+    "status": 1,
+    "telegram_user": 1,
+    "last_used_at": 1,
+    "created_at": 1
+}
+
+# Entity fields stored under other document keys
+SESSION_FIELD_KEYS = {
+    "credentials": ("api_id", "api_hash")
+}
 
 
 class MongoDBTelegramSessionRepository(TelegramSessionRepository):
     """MongoDB implementation of telegram session repository."""
     
+    COLLECTION = "telegram_sessions"
+    INDEXES = [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("phone_number", ASCENDING)], name="phone_number_unique", unique=True),
+        IndexModel([("user_id", ASCENDING), ("updated_at", ASCENDING)], name="user_id_updated_at"),
+        IndexModel([("status", ASCENDING)], name="status"),
+    ]
+    
     def __init__(self, database: AsyncIOMotorDatabase):
         self.db = database
-        self.collection = self.db.telegram_sessions
+        self.collection = self.db[self.COLLECTION]
+        self.tombstones = MongoDBTombstoneRepository(database)
     
     async def save(self, session: TelegramSession) -> None:
-        """Save session to MongoDB."""
-        session_doc = {
-            "id": session.id.value,
-            "user_id": session.user_id,
-            "phone_number": session.phone_number,
-            "api_id": session.credentials.api_id,
-            "api_hash": session.credentials.api_hash,
-            "encrypted_session_data": session.encrypted_session_data,
-            "telegram_user": {
-                "id": session.telegram_user.id,
-                "first_name": session.telegram_user.first_name,
-                "last_name": session.telegram_user.last_name,
-                "username": session.telegram_user.username,
-                "phone": session.telegram_user.phone
-            } if session.telegram_user else None,
-            "status": session.status.value,
-            "last_used_at": session.last_used_at,
-            "created_at": session.created_at,
-            "updated_at": session.updated_at
-        }
+        """Save session to MongoDB, writing only fields changed since it was loaded.
         
-        await self.collection.update_one(
-            {"id": session.id.value},
-            {"$set": session_doc},
-            upsert=True
-        )
+        Touching a session (last_used_at) does not rewrite credentials or
+        the encrypted session blob.
+        """
+        update = tracked_update(session, self._session_to_doc(session), SESSION_FIELD_KEYS)
+        if update:
+            await self.collection.update_one({"id": session.id.value}, update, upsert=session.is_new)
+        session.mark_clean()
     
     async def find_by_id(self, session_id: SessionId) -> Optional[TelegramSession]:
         """Find session by ID."""
@@ -55,6 +71,22 @@ class MongoDBTelegramSessionRepository(TelegramSessionRepository):
         docs = await cursor.to_list(length=None)
         return [self._doc_to_session(doc) for doc in docs]
     
+    async def list_summaries_by_user(self, user_id: str) -> List[SessionSummary]:
+        """List lightweight summaries of user's sessions."""
+        cursor = self.collection.find({"user_id": user_id}, SUMMARY_PROJECTION)
+        docs = await cursor.to_list(length=None)
+        return [self._doc_to_summary(doc) for doc in docs]
+    
+    async def list_changed_since(self, user_id: str, since: Optional[datetime] = None) -> List[SessionSummary]:
+        """List summaries of user's sessions updated after the given time (all when None)."""
+        query = {"user_id": user_id}
+        if since is not None:
+            query["updated_at"] = {"$gt": since}
+        
+        cursor = self.collection.find(query, SUMMARY_PROJECTION)
+        docs = await cursor.to_list(length=None)
+        return [self._doc_to_summary(doc) for doc in docs]
+    
     async def find_by_phone_number(self, phone_number: str) -> Optional[TelegramSession]:
         """Find session by phone number."""
         doc = await self.collection.find_one({"phone_number": phone_number})
@@ -68,27 +100,52 @@ class MongoDBTelegramSessionRepository(TelegramSessionRepository):
     
     async def delete(self, session_id: SessionId) -> bool:
         """Delete session."""
-        result = await self.collection.delete_one({"id": session_id.value})
-        return result.deleted_count > 0
+        doc = await self.collection.find_one_and_delete(
+            {"id": session_id.value},
+            projection={"_id": 0, "user_id": 1}
+        )
+        if not doc:
+            return False
+        
+        await self.tombstones.record([
+            Tombstone(
+                entity_type="session",
+                entity_id=session_id.value,
+                user_id=doc["user_id"],
+                deleted_at=datetime.utcnow()
+            )
+        ])
+        return True
     
     async def count_by_user(self, user_id: str) -> int:
         """Count sessions by user."""
         return await self.collection.count_documents({"user_id": user_id})
     
+    def _session_to_doc(self, session: TelegramSession) -> dict:
+        """Convert TelegramSession entity to MongoDB document."""
+        return {
+            "id": session.id.value,
+            "user_id": session.user_id,
+            "phone_number": session.phone_number,
+            "api_id": session.credentials.api_id,
+            "api_hash": session.credentials.api_hash,
+            "encrypted_session_data": session.encrypted_session_data,
+            "telegram_user": {
+                "id": session.telegram_user.id,
+                "first_name": session.telegram_user.first_name,
+                "last_name": session.telegram_user.last_name,
+                "username": session.telegram_user.username,
+                "phone": session.telegram_user.phone
+            } if session.telegram_user else None,
+            "status": session.status.value,
+            "last_used_at": session.last_used_at,
+            "created_at": session.created_at,
+            "updated_at": session.updated_at
+        }
+    
     def _doc_to_session(self, doc: dict) -> TelegramSession:
         """Convert MongoDB document to TelegramSession entity."""
-        telegram_user = None
-        if doc.get("telegram_user"):
-            tu = doc["telegram_user"]
-            telegram_user = TelegramUser(
-                id=tu["id"],
-                first_name=tu["first_name"],
-                last_name=tu.get("last_name"),
-                username=tu.get("username"),
-                phone=tu.get("phone")
-            )
-        
-        return TelegramSession(
+        session = TelegramSession(
             id=SessionId(doc["id"]),
             user_id=doc["user_id"],
             phone_number=doc["phone_number"],
@@ -97,9 +154,35 @@ class MongoDBTelegramSessionRepository(TelegramSessionRepository):
                 api_hash=doc["api_hash"]
             ),
             encrypted_session_data=doc["encrypted_session_data"],
-            telegram_user=telegram_user,
+            telegram_user=self._doc_to_telegram_user(doc.get("telegram_user")),
             status=SessionStatus(doc.get("status", "active")),
             last_used_at=doc.get("last_used_at"),
             created_at=doc.get("created_at"),
             updated_at=doc.get("updated_at")
+        )
+        session.mark_clean()
+        return session
+    
+    def _doc_to_summary(self, doc: dict) -> SessionSummary:
+        """Convert projected MongoDB document to SessionSummary."""
+        return SessionSummary(
+            session_id=doc["id"],
+            phone_number=doc["phone_number"],
+            status=SessionStatus(doc.get("status", "active")),
+            telegram_user=self._doc_to_telegram_user(doc.get("telegram_user")),
+            last_used_at=doc.get("last_used_at"),
+            created_at=doc.get("created_at")
+        )
+    
+    def _doc_to_telegram_user(self, tu: Optional[dict]) -> Optional[TelegramUser]:
+        """Convert embedded telegram_user document to TelegramUser."""
+        if not tu:
+            return None
+        
+        return TelegramUser(
+            id=tu["id"],
+            first_name=tu["first_name"],
+            last_name=tu.get("last_name"),
+            username=tu.get("username"),
+            phone=tu.get("phone")
         )
\ No newline at end of file
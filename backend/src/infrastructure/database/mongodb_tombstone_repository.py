@@ -0,0 +1,67 @@
+"""MongoDB implementation of tombstone repository."""
+
+from datetime import datetime
+from typing import List
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, IndexModel
+
+from ...domain.entities.tombstone import Tombstone
+from ...domain.repositories.tombstone_repository import TombstoneRepository
+
+
+# Tombstones older than this are purged; clients syncing from an older
+# watermark must fetch a full snapshot instead
+TOMBSTONE_RETENTION_SECONDS = 30 * 24 * 60 * 60
+
+
+class MongoDBTombstoneRepository(TombstoneRepository):
+    """MongoDB implementation of tombstone repository."""
+    
+    COLLECTION = "tombstones"
+    INDEXES = [
+        IndexModel([("user_id", ASCENDING), ("deleted_at", ASCENDING)], name="user_id_deleted_at"),
+        IndexModel(
+            [("deleted_at", ASCENDING)],
+            name="deleted_at_ttl",
+            expireAfterSeconds=TOMBSTONE_RETENTION_SECONDS
+        ),
+    ]
+    
+    def __init__(self, database: AsyncIOMotorDatabase):
+        self.db = database
+        self.collection = self.db[self.COLLECTION]
+    
+    async def record(self, tombstones: List[Tombstone]) -> None:
+        """Record deleted entities."""
+        if not tombstones:
+            return
+        
+        await self.collection.insert_many(
+            [
+                {
+                    "entity_type": tombstone.entity_type,
+                    "entity_id": tombstone.entity_id,
+                    "user_id": tombstone.user_id,
+                    "deleted_at": tombstone.deleted_at
+                }
+                for tombstone in tombstones
+            ],
+            ordered=False
+        )
+    
+    async def list_since(self, user_id: str, since: datetime) -> List[Tombstone]:
+        """List tombstones visible to user recorded after the given time."""
+        cursor = self.collection.find(
+            {"user_id": {"$in": [user_id, None]}, "deleted_at": {"$gt": since}},
+            {"_id": 0}
+        )
+        docs = await cursor.to_list(length=None)
+        return [
+            Tombstone(
+                entity_type=doc["entity_type"],
+                entity_id=doc["entity_id"],
+                user_id=doc.get("user_id"),
+                deleted_at=doc["deleted_at"]
+            )
+            for doc in docs
+        ]
\ No newline at end of file
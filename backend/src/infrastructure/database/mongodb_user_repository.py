@@ -1,42 +1,67 @@
 """MongoDB implementation of user repository."""
 
+import re
 from typing import Optional, List
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, IndexModel, ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
 from ...domain.entities.user import User, UserId, SubscriptionType, UserStatus
-from ...domain.repositories.user_repository import UserRepository
+from ...domain.repositories.user_repository import UserRepository, DuplicateUserError
+from .tracked_updates import tracked_update
 
 
 class MongoDBUserRepository(UserRepository):
     """MongoDB implementation of user repository."""
     
+    COLLECTION = "users"
+    COUNTERS_COLLECTION = "username_counters"
+    INDEXES = [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("username", ASCENDING)], name="username_unique", unique=True),
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+        IndexModel(
+            [("api_token", ASCENDING)],
+            name="api_token_unique",
+            unique=True,
+            partialFilterExpression={"api_token": {"$type": "string"}}
+        ),
+        IndexModel(
+            [("api_token_hash", ASCENDING)],
+            name="api_token_hash_unique",
+            unique=True,
+            partialFilterExpression={"api_token_hash": {"$type": "string"}}
+        ),
+        IndexModel([("subscription_type", ASCENDING)], name="subscription_type"),
+    ]
+    
     def __init__(self, database: AsyncIOMotorDatabase):
         self.db = database
-        self.collection = self.db.users
+        self.collection = self.db[self.COLLECTION]
+        self.counters = self.db[self.COUNTERS_COLLECTION]
+    
+    async def create(self, user: User) -> None:
+        """Insert new user in one round trip, relying on the unique indexes."""
+        try:
+            await self.collection.insert_one(self._user_to_doc(user))
+        except DuplicateKeyError as e:
+            raise DuplicateUserError(self._duplicate_field(e))
+        user.mark_clean()
     
     async def save(self, user: User) -> None:
-        """Save user to MongoDB."""
-        user_doc = {
-            "id": user.id.value,
-            "username": user.username,
-            "email": user.email,
-            "password_hash": user.password_hash,
-            "full_name": user.full_name,
-            "status": user.status.value,
-            "is_admin": user.is_admin,
-            "subscription_type": user.subscription_type.value,
-            "subscription_expires": user.subscription_expires,
-            "api_token": user.api_token,
-            "telegram_sessions": user.telegram_sessions,
-            "created_at": user.created_at,
-            "updated_at": user.updated_at
-        }
+        """Save user to MongoDB, writing only fields changed since it was loaded.
         
-        await self.collection.update_one(
-            {"id": user.id.value},
-            {"$set": user_doc},
-            upsert=True
-        )
+        Only the API token hash is stored.
+        """
+        token_rehashed = user.is_new or "api_token_hash" in user.pending_changes()[0]
+        update = tracked_update(user, self._user_to_doc(user))
+        if user.api_token_hash and token_rehashed:
+            # Drop legacy plaintext token once a hash exists
+            update["$unset"] = {"api_token": ""}
+        
+        if update:
+            await self.collection.update_one({"id": user.id.value}, update, upsert=user.is_new)
+        user.mark_clean()
     
     async def find_by_id(self, user_id: UserId) -> Optional[User]:
         """Find user by ID."""
@@ -54,10 +79,15 @@ class MongoDBUserRepository(UserRepository):
         return self._doc_to_user(doc) if doc else None
     
     async def find_by_api_token(self, api_token: str) -> Optional[User]:
-        """Find user by API token."""
+        """Find user by legacy plaintext API token."""
         doc = await self.collection.find_one({"api_token": api_token})
         return self._doc_to_user(doc) if doc else None
     
+    async def find_by_api_token_hash(self, api_token_hash: str) -> Optional[User]:
+        """Find user by keyed hash of API token."""
+        doc = await self.collection.find_one({"api_token_hash": api_token_hash})
+        return self._doc_to_user(doc) if doc else None
+    
     async def list_users(self, skip: int = 0, limit: int = 100) -> List[User]:
         """List users with pagination."""
         cursor = self.collection.find({}).skip(skip).limit(limit)
@@ -75,17 +105,73 @@ class MongoDBUserRepository(UserRepository):
     
     async def exists_username(self, username: str) -> bool:
         """Check if username exists."""
-        count = await self.collection.count_documents({"username": username})
-        return count > 0
+        doc = await self.collection.find_one({"username": username}, {"_id": 1})
+        return doc is not None
     
     async def exists_email(self, email: str) -> bool:
         """Check if email exists."""
-        count = await self.collection.count_documents({"email": email})
-        return count > 0
+        doc = await self.collection.find_one({"email": email}, {"_id": 1})
+        return doc is not None
+    
+    async def next_available_username(self, base: str) -> str:
+        """Return ``base`` if free, otherwise the next value of a per-base suffix counter."""
+        if not await self.exists_username(base):
+            return base
+        
+        counter = await self.counters.find_one_and_update(
+            {"_id": base}, {"$inc": {"seq": 1}}, return_document=ReturnDocument.AFTER
+        )
+        if counter is None:
+            counter = await self._seed_counter(base)
+        return f"{base}_{counter['seq']}"
+    
+    def _duplicate_field(self, error: DuplicateKeyError) -> str:
+        """Name of the unique field a duplicate key error was raised for."""
+        key_pattern = (error.details or {}).get("keyPattern") or {}
+        for field in ("username", "email"):
+            if field in key_pattern or f"{field}_unique" in str(error):
+                return field
+        return "user"
+    
+    async def _seed_counter(self, base: str) -> dict:
+        """Create the suffix counter of ``base`` above suffixes taken before it existed."""
+        # One-off range scan over username_unique; concurrent seeders agree through $max
+        matcher = re.compile(f"{re.escape(base)}_([1-9][0-9]*)")
+        cursor = self.collection.find(
+            {"username": {"$gt": f"{base}_", "$lt": f"{base}`"}}, {"_id": 0, "username": 1}
+        )
+        highest_suffix = 0
+        async for doc in cursor:
+            match = matcher.fullmatch(doc["username"])
+            if match:
+                highest_suffix = max(highest_suffix, int(match.group(1)))
+        
+        await self.counters.update_one({"_id": base}, {"$max": {"seq": highest_suffix}}, upsert=True)
+        return await self.counters.find_one_and_update(
+            {"_id": base}, {"$inc": {"seq": 1}}, return_document=ReturnDocument.AFTER
+        )
+    
+    def _user_to_doc(self, user: User) -> dict:
+        """Convert User entity to MongoDB document."""
+        return {
+            "id": user.id.value,
+            "username": user.username,
+            "email": user.email,
+            "password_hash": user.password_hash,
+            "full_name": user.full_name,
+            "status": user.status.value,
+            "is_admin": user.is_admin,
+            "subscription_type": user.subscription_type.value,
+            "subscription_expires": user.subscription_expires,
+            "api_token_hash": user.api_token_hash,
+            "telegram_sessions": user.telegram_sessions,
+            "created_at": user.created_at,
+            "updated_at": user.updated_at
+        }
     
     def _doc_to_user(self, doc: dict) -> User:
         """Convert MongoDB document to User entity."""
-        return User(
+        user = User(
             id=UserId(doc["id"]),
             username=doc["username"],
             email=doc["email"],
@@ -96,7 +182,10 @@ class MongoDBUserRepository(UserRepository):
             subscription_type=SubscriptionType(doc.get("subscription_type", "free")),
             subscription_expires=doc.get("subscription_expires"),
             api_token=doc.get("api_token"),
+            api_token_hash=doc.get("api_token_hash"),
             telegram_sessions=doc.get("telegram_sessions", []),
             created_at=doc.get("created_at"),
             updated_at=doc.get("updated_at")
-        )
\ No newline at end of file
+        )
+        user.mark_clean()
+        return user
\ No newline at end of file
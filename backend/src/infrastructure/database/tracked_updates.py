@@ -0,0 +1,38 @@
+"""Minimal MongoDB updates for change-tracked entities."""
+
+from typing import Dict, Tuple, Optional
+
+from ...domain.entities.dirty_tracking import DirtyTrackingMixin
+
+
+def tracked_update(entity: DirtyTrackingMixin, doc: dict,
+                   field_keys: Optional[Dict[str, Tuple[str, ...]]] = None) -> dict:
+    """Build the update writing only what changed on the entity.
+    
+    New entities get the whole document in ``$set``. Otherwise assigned
+    fields go to ``$set`` and counter increments to ``$inc``; an empty
+    dict means there is nothing to write. ``field_keys`` maps fields
+    stored under other or several document keys (e.g. a value object
+    flattened into two keys); other fields use their own name. Fields
+    without a document key (transient state) are never written.
+    """
+    if entity.is_new:
+        return {"$set": doc}
+    
+    dirty, increments = entity.pending_changes()
+    field_keys = field_keys or {}
+    
+    set_doc = {
+        key: doc[key]
+        for name in dirty
+        for key in field_keys.get(name, (name,))
+        if key in doc
+    }
+    inc_doc = {name: amount for name, amount in increments.items() if name in doc}
+    
+    update = {}
+    if set_doc:
+        update["$set"] = set_doc
+    if inc_doc:
+        update["$inc"] = inc_doc
+    return update
\ No newline at end of file
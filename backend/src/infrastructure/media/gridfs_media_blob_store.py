@@ -0,0 +1,77 @@
+"""GridFS implementation of media blob store."""
+
+import hashlib
+import uuid
+from typing import AsyncIterable, AsyncIterator, Tuple
+
+from gridfs.errors import NoFile
+from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorGridFSBucket
+
+from ...domain.entities.media import MediaHash, MediaNotFoundError, MediaTooLargeError
+from ...domain.repositories.media_blob_store import MediaBlobStore
+
+
+class GridFSMediaBlobStore(MediaBlobStore):
+    """Stores blobs in a GridFS bucket with the content hash as filename.
+    
+    Uploads are streamed under a temporary filename while hashing; once
+    complete the file is renamed to its hash, or dropped if that content
+    is already stored.
+    """
+    
+    BUCKET = "media"
+    
+    def __init__(self, database: AsyncIOMotorDatabase):
+        self.bucket = AsyncIOMotorGridFSBucket(database, bucket_name=self.BUCKET)
+    
+    async def store(self, chunks: AsyncIterable[bytes], max_size: int) -> Tuple[MediaHash, int]:
+        """Stream bytes into GridFS, then name the file by its hash."""
+        grid_in = self.bucket.open_upload_stream(f"upload-{uuid.uuid4().hex}")
+        digest = hashlib.sha256()
+        size = 0
+        
+        try:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > max_size:
+                    raise MediaTooLargeError(max_size)
+                digest.update(chunk)
+                await grid_in.write(chunk)
+            await grid_in.close()
+        except BaseException:
+            await grid_in.abort()
+            raise
+        
+        content_hash = MediaHash(digest.hexdigest())
+        if await self.exists(content_hash):
+            await self.bucket.delete(grid_in._id)
+        else:
+            await self.bucket.rename(grid_in._id, content_hash.value)
+        
+        return content_hash, size
+    
+    async def open(self, content_hash: MediaHash) -> AsyncIterator[bytes]:
+        """Stream blob contents chunk by chunk."""
+        try:
+            grid_out = await self.bucket.open_download_stream_by_name(content_hash.value)
+        except NoFile:
+            raise MediaNotFoundError(f"Media {content_hash.value} not found")
+        
+        while True:
+            chunk = await grid_out.readchunk()
+            if not chunk:
+                break
+            yield chunk
+    
+    async def exists(self, content_hash: MediaHash) -> bool:
+        """Check if blob exists."""
+        cursor = self.bucket.find({"filename": content_hash.value}, limit=1)
+        return bool(await cursor.to_list(length=1))
+    
+    async def delete(self, content_hash: MediaHash) -> bool:
+        """Delete all stored revisions of the blob."""
+        cursor = self.bucket.find({"filename": content_hash.value})
+        file_ids = [grid_out._id async for grid_out in cursor]
+        for file_id in file_ids:
+            await self.bucket.delete(file_id)
+        return bool(file_ids)
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""Local filesystem implementation of media blob store."""
+
+import hashlib
+import os
+import uuid
+from typing import AsyncIterable, AsyncIterator, Tuple
+
+import aiofiles
+import aiofiles.os
+
+from ...domain.entities.media import MediaHash, MediaNotFoundError, MediaTooLargeError
+from ...domain.repositories.media_blob_store import MediaBlobStore
+
+
+class LocalMediaBlobStore(MediaBlobStore):
+    """Stores blobs as files named by their hash under a root directory.
+    
+    Uploads are written to a temporary file while hashing and then moved
+    into place with an atomic rename, so a blob path is never visible
+    half-written. Files are fanned out as ``ab/cd/abcd...`` to keep
+    directories small.
+    """
+    
+    CHUNK_SIZE = 1024 * 1024
+    
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self.tmp_dir = os.path.join(self.root, "tmp")
+    
+    async def store(self, chunks: AsyncIterable[bytes], max_size: int) -> Tuple[MediaHash, int]:
+        """Stream bytes into a temporary file, then move it to its hash path."""
+        await aiofiles.os.makedirs(self.tmp_dir, exist_ok=True)
+        temp_path = os.path.join(self.tmp_dir, uuid.uuid4().hex)
+        digest = hashlib.sha256()
+        size = 0
+        
+        try:
+            async with aiofiles.open(temp_path, "wb") as file:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if size > max_size:
+                        raise MediaTooLargeError(max_size)
+                    digest.update(chunk)
+                    await file.write(chunk)
+            
+            content_hash = MediaHash(digest.hexdigest())
+            path = self._path(content_hash)
+            
+            if await aiofiles.os.path.exists(path):
+                # Same content already stored
+                await aiofiles.os.remove(temp_path)
+            else:
+                await aiofiles.os.makedirs(os.path.dirname(path), exist_ok=True)
+                await aiofiles.os.replace(temp_path, path)
+        except BaseException:
+            if await aiofiles.os.path.exists(temp_path):
+                await aiofiles.os.remove(temp_path)
+            raise
+        
+        return content_hash, size
+    
+    async def open(self, content_hash: MediaHash) -> AsyncIterator[bytes]:
+        """Stream blob contents in chunks."""
+        path = self._path(content_hash)
+        try:
+            file = await aiofiles.open(path, "rb")
+        except FileNotFoundError:
+            raise MediaNotFoundError(f"Media {content_hash.value} not found")
+        
+        try:
+            while True:
+                chunk = await file.read(self.CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            await file.close()
+    
+    async def exists(self, content_hash: MediaHash) -> bool:
+        """Check if blob exists."""
+        return await aiofiles.os.path.exists(self._path(content_hash))
+    
+    async def delete(self, content_hash: MediaHash) -> bool:
+        """Delete blob."""
+        try:
+            await aiofiles.os.remove(self._path(content_hash))
+            return True
+        except FileNotFoundError:
+            return False
+    
+    def _path(self, content_hash: MediaHash) -> str:
+        """Filesystem path of blob."""
+        value = content_hash.value
+        return os.path.join(self.root, value[:2], value[2:4], value)
\ No newline at end of file
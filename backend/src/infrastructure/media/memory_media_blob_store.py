@@ -0,0 +1,51 @@
+"""In-memory implementation of media blob store."""
+
+import hashlib
+from typing import AsyncIterable, AsyncIterator, Dict, Tuple
+
+from ...domain.entities.media import MediaHash, MediaNotFoundError, MediaTooLargeError
+from ...domain.repositories.media_blob_store import MediaBlobStore
+
+
+class InMemoryMediaBlobStore(MediaBlobStore):
+    """Keeps blobs in a dict keyed by content hash.
+    
+    For benchmarks and test runs only: blobs live as long as the process.
+    """
+    
+    CHUNK_SIZE = 1024 * 1024
+    
+    def __init__(self):
+        self._blobs: Dict[str, bytes] = {}
+    
+    async def store(self, chunks: AsyncIterable[bytes], max_size: int) -> Tuple[MediaHash, int]:
+        """Collect streamed bytes and keep them under their hash."""
+        digest = hashlib.sha256()
+        data = bytearray()
+        
+        async for chunk in chunks:
+            if len(data) + len(chunk) > max_size:
+                raise MediaTooLargeError(max_size)
+            digest.update(chunk)
+            data.extend(chunk)
+        
+        content_hash = MediaHash(digest.hexdigest())
+        self._blobs.setdefault(content_hash.value, bytes(data))
+        return content_hash, len(data)
+    
+    async def open(self, content_hash: MediaHash) -> AsyncIterator[bytes]:
+        """Stream blob contents in chunks."""
+        data = self._blobs.get(content_hash.value)
+        if data is None:
+            raise MediaNotFoundError(f"Media {content_hash.value} not found")
+        
+        for offset in range(0, len(data), self.CHUNK_SIZE):
+            yield data[offset:offset + self.CHUNK_SIZE]
+    
+    async def exists(self, content_hash: MediaHash) -> bool:
+        """Check if blob exists."""
+        return content_hash.value in self._blobs
+    
+    async def delete(self, content_hash: MediaHash) -> bool:
+        """Delete blob."""
+        return self._blobs.pop(content_hash.value, None) is not None
\ No newline at end of file
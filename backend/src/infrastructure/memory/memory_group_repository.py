@@ -0,0 +1,265 @@
+"""In-memory implementation of group repository."""
+
+from datetime import datetime
+from itertools import islice
+from typing import Dict, Optional, List, Tuple
+
+from ...domain.entities.group import Group, GroupId, GroupStatus, BlacklistReason
+from ...domain.entities.tombstone import Tombstone
+from ...domain.read_models.group_summary import GroupSummary
+from ...domain.read_models.group_set import GroupSet
+from ...domain.repositories.group_repository import GroupRepository, GroupWriteError
+from .memory_tombstone_repository import InMemoryTombstoneRepository
+from .tracked_changes import apply_tracked_changes, detached_copy
+
+
+PERSISTED_FIELDS = frozenset(Group.__dataclass_fields__)
+
+
+class InMemoryGroupRepository(GroupRepository):
+    """In-memory implementation of group repository.
+    
+    Groups are partitioned by owner like the MongoDB queries, with a
+    ``(user_id, telegram_id)`` dict standing in for the unique index.
+    No operation awaits, so bulk updates are atomic under asyncio.
+    Callers always receive copies.
+    """
+    
+    def __init__(self, tombstones: InMemoryTombstoneRepository):
+        self._groups: Dict[str, Dict[str, Group]] = {}
+        self._ids_by_telegram_id: Dict[Tuple[str, str], str] = {}
+        self.tombstones = tombstones
+    
+    async def save(self, group: Group) -> None:
+        """Save group, writing only fields changed since it was loaded."""
+        self._write(group)
+        group.mark_clean()
+    
+    async def find_by_id(self, user_id: str, group_id: GroupId) -> Optional[Group]:
+        """Find user's group by ID."""
+        stored = self._groups.get(user_id, {}).get(group_id.value)
+        return detached_copy(stored) if stored else None
+    
+    async def find_by_ids(self, user_id: str, group_ids: List[GroupId]) -> List[Group]:
+        """Find user's groups by ID, in the given order; missing IDs are skipped."""
+        groups = self._groups.get(user_id, {})
+        return [
+            detached_copy(groups[group_id])
+            for group_id in dict.fromkeys(group_id.value for group_id in group_ids)
+            if group_id in groups
+        ]
+    
+    async def find_by_telegram_id(self, user_id: str, telegram_id: str) -> Optional[Group]:
+        """Find user's group by Telegram ID."""
+        group_id = self._ids_by_telegram_id.get((user_id, telegram_id))
+        if group_id is None:
+            return None
+        return detached_copy(self._groups[user_id][group_id])
+    
+    async def list_by_user(self, user_id: str, skip: int = 0, limit: int = 100) -> List[Group]:
+        """List user's groups with pagination."""
+        return [detached_copy(group) for group in self._newest_first(user_id, None, skip, limit)]
+    
+    async def list_by_status(self, user_id: str, status: GroupStatus,
+                             skip: int = 0, limit: int = 100) -> List[Group]:
+        """List user's groups by status."""
+        matching = (group for group in self._user_groups(user_id) if group.status == status)
+        return [detached_copy(group) for group in islice(matching, skip, skip + limit)]
+    
+    async def list_summaries(self, user_id: str, status: Optional[GroupStatus] = None,
+                             skip: int = 0, limit: int = 100) -> List[GroupSummary]:
+        """List lightweight summaries of user's groups, optionally filtered by status."""
+        return [self._to_summary(group) for group in self._newest_first(user_id, status, skip, limit)]
+    
+    async def list_changed_since(self, user_id: str, since: Optional[datetime] = None) -> List[GroupSummary]:
+        """List summaries of user's groups updated after the given time (all when None)."""
+        return [
+            self._to_summary(group)
+            for group in self._user_groups(user_id)
+            if since is None or (group.updated_at is not None and group.updated_at > since)
+        ]
+    
+    async def load_group_set(self, user_id: str, statuses: Optional[List[GroupStatus]] = None) -> GroupSet:
+        """Load user's groups into a compact columnar working set."""
+        group_set = GroupSet()
+        for group in self._user_groups(user_id):
+            if not statuses or group.status in statuses:
+                group_set.append(group.id.value, group.telegram_id, group.status, group.blacklist_until)
+        return group_set
+    
+    async def list_available_for_sending(self, user_id: str) -> List[Group]:
+        """List user's groups available for sending messages."""
+        await self.reactivate_expired_blacklists(user_id)
+        return [
+            detached_copy(group)
+            for group in self._user_groups(user_id)
+            if group.status == GroupStatus.ACTIVE
+        ]
+    
+    async def reactivate_expired_blacklists(self, user_id: str) -> int:
+        """Reactivate user's temporarily blacklisted groups whose blacklist has expired.
+        
+        A temporary blacklist without a deadline counts as expired, as in
+        Group.is_available_for_sending and GroupSet.
+        """
+        now = datetime.utcnow()
+        reactivated = 0
+        for group in self._user_groups(user_id):
+            if (group.status == GroupStatus.BLACKLISTED_TEMP
+                    and (group.blacklist_until is None or group.blacklist_until <= now)):
+                self._set_fields(group, {
+                    "status": GroupStatus.ACTIVE,
+                    "blacklist_reason": None,
+                    "blacklist_until": None,
+                    "updated_at": now
+                })
+                reactivated += 1
+        return reactivated
+    
+    async def count_by_user(self, user_id: str) -> int:
+        """Count user's groups."""
+        return len(self._groups.get(user_id, {}))
+    
+    async def count_by_status(self, user_id: str, status: GroupStatus) -> int:
+        """Count user's groups by status."""
+        return sum(1 for group in self._user_groups(user_id) if group.status == status)
+    
+    async def delete(self, user_id: str, group_id: GroupId) -> bool:
+        """Delete user's group."""
+        if not self._remove(user_id, group_id.value):
+            return False
+        
+        await self._record_tombstones(user_id, [group_id.value])
+        return True
+    
+    async def bulk_save(self, groups: List[Group]) -> None:
+        """Save multiple groups; like an unordered bulk write, conflicts do not stop the others."""
+        failed = []
+        for group in groups:
+            try:
+                self._write(group)
+            except ValueError:
+                failed.append(group)
+                continue
+            group.mark_clean()
+        
+        if failed:
+            raise GroupWriteError(failed, f"Telegram ID already exists for {len(failed)} of the groups")
+    
+    async def bulk_delete(self, user_id: str, group_ids: Optional[List[GroupId]] = None,
+                          statuses: Optional[List[GroupStatus]] = None) -> List[str]:
+        """Delete user's groups matching IDs and/or statuses."""
+        matched_ids = self._matching_ids(user_id, group_ids, statuses)
+        if not matched_ids:
+            return []
+        
+        for group_id in matched_ids:
+            self._remove(user_id, group_id)
+        await self._record_tombstones(user_id, matched_ids)
+        return matched_ids
+    
+    async def bulk_update_status(self, user_id: str, new_status: GroupStatus,
+                                 group_ids: Optional[List[GroupId]] = None,
+                                 statuses: Optional[List[GroupStatus]] = None,
+                                 blacklist_reason: Optional[BlacklistReason] = None,
+                                 blacklist_until: Optional[datetime] = None) -> List[str]:
+        """Set status of user's groups matching IDs and/or statuses."""
+        matched_ids = self._matching_ids(user_id, group_ids, statuses)
+        if not matched_ids:
+            return []
+        
+        update = {"status": new_status, "updated_at": datetime.utcnow()}
+        if new_status == GroupStatus.ACTIVE:
+            update["blacklist_reason"] = None
+            update["blacklist_until"] = None
+        elif new_status in (GroupStatus.BLACKLISTED_TEMP, GroupStatus.BLACKLISTED_PERM):
+            update["blacklist_reason"] = blacklist_reason
+            update["blacklist_until"] = blacklist_until if new_status == GroupStatus.BLACKLISTED_TEMP else None
+        
+        groups = self._groups[user_id]
+        for group_id in matched_ids:
+            self._set_fields(groups[group_id], update)
+        return matched_ids
+    
+    def _write(self, group: Group) -> None:
+        """Apply a save to the stored group. Raises ValueError on a taken Telegram ID."""
+        groups = self._groups.setdefault(group.user_id, {})
+        stored = groups.get(group.id.value)
+        if stored is None and not group.is_new:
+            # Deleted meanwhile; MongoDB updates without upsert match nothing
+            return
+        
+        telegram_key = (group.user_id, group.telegram_id)
+        owner = self._ids_by_telegram_id.get(telegram_key)
+        if owner is not None and owner != group.id.value and (
+                group.is_new or "telegram_id" in group.pending_changes()[0]):
+            raise ValueError(f"Group with Telegram ID {group.telegram_id} already exists")
+        
+        if stored is None:
+            stored = detached_copy(group)
+            groups[group.id.value] = stored
+        else:
+            self._ids_by_telegram_id.pop((stored.user_id, stored.telegram_id), None)
+            apply_tracked_changes(stored, group, PERSISTED_FIELDS)
+        self._ids_by_telegram_id[(stored.user_id, stored.telegram_id)] = stored.id.value
+    
+    def _remove(self, user_id: str, group_id: str) -> bool:
+        """Remove stored group and its index entry."""
+        stored = self._groups.get(user_id, {}).pop(group_id, None)
+        if stored is None:
+            return False
+        
+        self._ids_by_telegram_id.pop((user_id, stored.telegram_id), None)
+        return True
+    
+    def _set_fields(self, group: Group, values: dict) -> None:
+        """Set fields of a stored group, as a filter-based MongoDB update does."""
+        for name, value in values.items():
+            object.__setattr__(group, name, value)
+    
+    def _user_groups(self, user_id: str):
+        """Stored groups of user in insertion order."""
+        return list(self._groups.get(user_id, {}).values())
+    
+    def _newest_first(self, user_id: str, status: Optional[GroupStatus], skip: int, limit: int) -> List[Group]:
+        """Page of user's stored groups, newest first, optionally filtered by status."""
+        groups = [
+            group for group in self._user_groups(user_id)
+            if status is None or group.status == status
+        ]
+        groups.sort(key=lambda group: group.created_at, reverse=True)
+        return groups[skip:skip + limit]
+    
+    def _matching_ids(self, user_id: str, group_ids: Optional[List[GroupId]],
+                      statuses: Optional[List[GroupStatus]]) -> List[str]:
+        """IDs of user's groups matching IDs and/or statuses."""
+        groups = self._groups.get(user_id, {})
+        if group_ids is not None:
+            ids = dict.fromkeys(group_id.value for group_id in group_ids if group_id.value in groups)
+            candidates = [groups[group_id] for group_id in ids]
+        else:
+            candidates = groups.values()
+        
+        return [group.id.value for group in candidates if not statuses or group.status in statuses]
+    
+    async def _record_tombstones(self, user_id: str, group_ids: List[str]) -> None:
+        """Record deleted groups for delta sync."""
+        deleted_at = datetime.utcnow()
+        await self.tombstones.record([
+            Tombstone(entity_type="group", entity_id=group_id, user_id=user_id, deleted_at=deleted_at)
+            for group_id in group_ids
+        ])
+    
+    def _to_summary(self, group: Group) -> GroupSummary:
+        """Convert stored group to GroupSummary."""
+        return GroupSummary(
+            id=group.id.value,
+            telegram_id=group.telegram_id,
+            name=group.name,
+            username=group.username,
+            invite_link=group.invite_link,
+            status=group.status,
+            message_count=group.message_count,
+            last_message_sent=group.last_message_sent,
+            created_at=group.created_at
+        )
\ No newline at end of file
@@ -0,0 +1,37 @@
+"""In-memory implementation of media asset repository."""
+
+import copy
+from typing import Dict, Optional, Set
+
+from ...domain.entities.media import MediaAsset, MediaHash
+from ...domain.repositories.media_asset_repository import MediaAssetRepository
+
+
+class InMemoryMediaAssetRepository(MediaAssetRepository):
+    """In-memory implementation of media asset repository."""
+    
+    def __init__(self):
+        self._assets: Dict[str, MediaAsset] = {}
+        self._owners: Dict[str, Set[str]] = {}
+    
+    async def save(self, asset: MediaAsset) -> MediaAsset:
+        """Insert asset unless the hash exists and link the uploader. Returns the stored asset."""
+        stored = self._assets.setdefault(asset.content_hash.value, copy.deepcopy(asset))
+        self._owners.setdefault(asset.content_hash.value, set()).add(asset.uploaded_by)
+        return copy.deepcopy(stored)
+    
+    async def find_by_hash(self, content_hash: MediaHash) -> Optional[MediaAsset]:
+        """Find asset by content hash."""
+        stored = self._assets.get(content_hash.value)
+        return copy.deepcopy(stored) if stored else None
+    
+    async def find_linked(self, content_hash: MediaHash, user_id: str) -> Optional[MediaAsset]:
+        """Find asset by content hash if the user has uploaded it."""
+        if user_id not in self._owners.get(content_hash.value, ()):
+            return None
+        return await self.find_by_hash(content_hash)
+    
+    async def delete(self, content_hash: MediaHash) -> bool:
+        """Delete asset and its uploader links."""
+        self._owners.pop(content_hash.value, None)
+        return self._assets.pop(content_hash.value, None) is not None
\ No newline at end of file
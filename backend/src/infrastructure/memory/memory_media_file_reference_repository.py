@@ -0,0 +1,29 @@
+"""In-memory implementation of media file reference repository."""
+
+import copy
+from typing import Dict, Optional, Tuple
+
+from ...domain.entities.media import MediaFileReference, MediaHash
+from ...domain.entities.telegram_session import SessionId
+from ...domain.repositories.media_file_reference_repository import MediaFileReferenceRepository
+
+
+class InMemoryMediaFileReferenceRepository(MediaFileReferenceRepository):
+    """In-memory implementation of media file reference repository."""
+    
+    def __init__(self):
+        self._references: Dict[Tuple[str, str], MediaFileReference] = {}
+    
+    async def save(self, reference: MediaFileReference) -> None:
+        """Save file reference."""
+        key = (reference.content_hash.value, reference.session_id.value)
+        self._references[key] = copy.deepcopy(reference)
+    
+    async def find(self, session_id: SessionId, content_hash: MediaHash) -> Optional[MediaFileReference]:
+        """Find file reference of an asset uploaded through a session."""
+        stored = self._references.get((content_hash.value, session_id.value))
+        return copy.deepcopy(stored) if stored else None
+    
+    async def delete(self, session_id: SessionId, content_hash: MediaHash) -> bool:
+        """Delete file reference."""
+        return self._references.pop((content_hash.value, session_id.value), None) is not None
\ No newline at end of file
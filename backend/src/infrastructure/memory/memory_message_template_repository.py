@@ -0,0 +1,130 @@
+"""In-memory implementation of message template repository."""
+
+from datetime import datetime
+from typing import Dict, Optional, List
+
+from ...domain.entities.message_template import MessageTemplate, TemplateId
+from ...domain.entities.template_usage import TemplateUsageDelta
+from ...domain.entities.tombstone import Tombstone
+from ...domain.repositories.message_template_repository import MessageTemplateRepository, DuplicateTemplateNameError
+from .memory_tombstone_repository import InMemoryTombstoneRepository
+from .tracked_changes import apply_tracked_changes, detached_copy
+
+
+# Usage counters are owned by apply_usage once the template exists
+USAGE_FIELDS = frozenset({"variant_stats", "usage_count", "last_used_at"})
+PERSISTED_FIELDS = frozenset(MessageTemplate.__dataclass_fields__) - USAGE_FIELDS
+
+
+class InMemoryMessageTemplateRepository(MessageTemplateRepository):
+    """In-memory implementation of message template repository.
+    
+    Templates are few and shared by all users, so lookups other than by
+    ID scan them. Callers always receive copies.
+    """
+    
+    def __init__(self, tombstones: InMemoryTombstoneRepository):
+        self._templates: Dict[str, MessageTemplate] = {}
+        self.tombstones = tombstones
+    
+    async def save(self, template: MessageTemplate) -> None:
+        """Save template, writing only fields changed since it was loaded.
+        
+        Usage counters are only written on insert, so a save never
+        overwrites increments applied by apply_usage.
+        """
+        stored = self._templates.get(template.id.value)
+        if (stored is None and template.is_new) or (stored is not None and stored.name != template.name):
+            self._check_name_free(template)
+        
+        if stored is None:
+            if template.is_new:
+                self._templates[template.id.value] = detached_copy(template)
+        else:
+            apply_tracked_changes(stored, template, PERSISTED_FIELDS)
+        template.mark_clean()
+    
+    async def find_by_id(self, template_id: TemplateId) -> Optional[MessageTemplate]:
+        """Find template by ID."""
+        stored = self._templates.get(template_id.value)
+        return detached_copy(stored) if stored else None
+    
+    async def find_default_template(self) -> Optional[MessageTemplate]:
+        """Find default template."""
+        return self._find(lambda template: template.is_default)
+    
+    async def find_by_name(self, name: str) -> Optional[MessageTemplate]:
+        """Find template by name."""
+        return self._find(lambda template: template.name == name)
+    
+    async def list_all(self) -> List[MessageTemplate]:
+        """List all templates."""
+        return [detached_copy(template) for template in self._templates.values()]
+    
+    async def list_changed_since(self, since: Optional[datetime] = None) -> List[MessageTemplate]:
+        """List templates updated after the given time (all when None)."""
+        return [
+            detached_copy(template)
+            for template in self._templates.values()
+            if since is None or (template.updated_at is not None and template.updated_at > since)
+        ]
+    
+    async def apply_usage(self, deltas: List[TemplateUsageDelta]) -> None:
+        """Atomically add buffered usage counts and variant outcomes."""
+        for delta in deltas:
+            stored = self._templates.get(delta.template_id.value)
+            if stored is None:
+                continue
+            
+            object.__setattr__(stored, "usage_count", stored.usage_count + delta.count)
+            if stored.variant_stats is None:
+                object.__setattr__(stored, "variant_stats", {})
+            for variant_name, outcomes in delta.variant_outcomes.items():
+                stats = stored.variant_stats.setdefault(variant_name, {})
+                for counter, value in outcomes.items():
+                    if value:
+                        stats[counter] = stats.get(counter, 0) + value
+            
+            if delta.last_used_at is not None and (
+                    stored.last_used_at is None or delta.last_used_at > stored.last_used_at):
+                object.__setattr__(stored, "last_used_at", delta.last_used_at)
+    
+    async def delete(self, template_id: TemplateId) -> bool:
+        """Delete template."""
+        if self._templates.pop(template_id.value, None) is None:
+            return False
+        
+        await self.tombstones.record([
+            Tombstone(
+                entity_type="template",
+                entity_id=template_id.value,
+                user_id=None,
+                deleted_at=datetime.utcnow()
+            )
+        ])
+        return True
+    
+    async def clear_default_flags(self) -> None:
+        """Clear all default flags."""
+        now = datetime.utcnow()
+        for template in self._templates.values():
+            if template.is_default:
+                object.__setattr__(template, "is_default", False)
+                object.__setattr__(template, "updated_at", now)
+    
+    async def count_templates(self) -> int:
+        """Count total templates."""
+        return len(self._templates)
+    
+    def _find(self, predicate) -> Optional[MessageTemplate]:
+        """Copy of the first stored template matching predicate, or None."""
+        for template in self._templates.values():
+            if predicate(template):
+                return detached_copy(template)
+        return None
+    
+    def _check_name_free(self, template: MessageTemplate) -> None:
+        """Raise DuplicateTemplateNameError if another template has the name."""
+        for other in self._templates.values():
+            if other.name == template.name and other.id != template.id:
+                raise DuplicateTemplateNameError()
\ No newline at end of file
@@ -0,0 +1,138 @@
+"""In-memory implementation of telegram session repository."""
+
+import copy
+from datetime import datetime
+from typing import Dict, Optional, List
+
+from ...domain.entities.telegram_session import TelegramSession, SessionId, SessionStatus
+from ...domain.entities.tombstone import Tombstone
+from ...domain.read_models.session_summary import SessionSummary
+from ...domain.repositories.telegram_session_repository import TelegramSessionRepository
+from .memory_tombstone_repository import InMemoryTombstoneRepository
+from .tracked_changes import apply_tracked_changes, detached_copy
+
+
+PERSISTED_FIELDS = frozenset(TelegramSession.__dataclass_fields__)
+
+
+class InMemoryTelegramSessionRepository(TelegramSessionRepository):
+    """In-memory implementation of telegram session repository.
+    
+    Sessions are kept by ID, with dicts standing in for the unique phone
+    number index and the per-user index. Callers always receive copies.
+    """
+    
+    def __init__(self, tombstones: InMemoryTombstoneRepository):
+        self._sessions: Dict[str, TelegramSession] = {}
+        self._ids_by_phone_number: Dict[str, str] = {}
+        # Dict as an insertion-ordered set of session IDs
+        self._ids_by_user: Dict[str, Dict[str, None]] = {}
+        self.tombstones = tombstones
+    
+    async def save(self, session: TelegramSession) -> None:
+        """Save session, writing only fields changed since it was loaded.
+        
+        Raises ValueError when the phone number belongs to another session.
+        """
+        stored = self._sessions.get(session.id.value)
+        if stored is None and not session.is_new:
+            # Deleted meanwhile; MongoDB updates without upsert match nothing
+            session.mark_clean()
+            return
+        
+        owner = self._ids_by_phone_number.get(session.phone_number)
+        if owner is not None and owner != session.id.value and (
+                session.is_new or "phone_number" in session.pending_changes()[0]):
+            raise ValueError(f"Session for {session.phone_number} already exists")
+        
+        if stored is None:
+            stored = detached_copy(session)
+            self._sessions[session.id.value] = stored
+        else:
+            self._unindex(stored)
+            apply_tracked_changes(stored, session, PERSISTED_FIELDS)
+        self._index(stored)
+        session.mark_clean()
+    
+    async def find_by_id(self, session_id: SessionId) -> Optional[TelegramSession]:
+        """Find session by ID."""
+        stored = self._sessions.get(session_id.value)
+        return detached_copy(stored) if stored else None
+    
+    async def find_by_user_id(self, user_id: str) -> List[TelegramSession]:
+        """Find sessions by user ID."""
+        return [detached_copy(session) for session in self._user_sessions(user_id)]
+    
+    async def list_summaries_by_user(self, user_id: str) -> List[SessionSummary]:
+        """List lightweight summaries of user's sessions."""
+        return [self._to_summary(session) for session in self._user_sessions(user_id)]
+    
+    async def list_changed_since(self, user_id: str, since: Optional[datetime] = None) -> List[SessionSummary]:
+        """List summaries of user's sessions updated after the given time (all when None)."""
+        return [
+            self._to_summary(session)
+            for session in self._user_sessions(user_id)
+            if since is None or (session.updated_at is not None and session.updated_at > since)
+        ]
+    
+    async def find_by_phone_number(self, phone_number: str) -> Optional[TelegramSession]:
+        """Find session by phone number."""
+        session_id = self._ids_by_phone_number.get(phone_number)
+        return detached_copy(self._sessions[session_id]) if session_id else None
+    
+    async def list_active_sessions(self) -> List[TelegramSession]:
+        """List all active sessions."""
+        return [
+            detached_copy(session)
+            for session in self._sessions.values()
+            if session.status == SessionStatus.ACTIVE
+        ]
+    
+    async def delete(self, session_id: SessionId) -> bool:
+        """Delete session."""
+        stored = self._sessions.pop(session_id.value, None)
+        if stored is None:
+            return False
+        
+        self._unindex(stored)
+        await self.tombstones.record([
+            Tombstone(
+                entity_type="session",
+                entity_id=session_id.value,
+                user_id=stored.user_id,
+                deleted_at=datetime.utcnow()
+            )
+        ])
+        return True
+    
+    async def count_by_user(self, user_id: str) -> int:
+        """Count sessions by user."""
+        return len(self._ids_by_user.get(user_id, {}))
+    
+    def _user_sessions(self, user_id: str) -> List[TelegramSession]:
+        """Stored sessions of user."""
+        return [self._sessions[session_id] for session_id in self._ids_by_user.get(user_id, {})]
+    
+    def _index(self, session: TelegramSession) -> None:
+        """Add stored session to the lookup indexes."""
+        self._ids_by_phone_number[session.phone_number] = session.id.value
+        self._ids_by_user.setdefault(session.user_id, {})[session.id.value] = None
+    
+    def _unindex(self, session: TelegramSession) -> None:
+        """Remove stored session from the lookup indexes."""
+        self._ids_by_phone_number.pop(session.phone_number, None)
+        user_sessions = self._ids_by_user.get(session.user_id, {})
+        user_sessions.pop(session.id.value, None)
+        if not user_sessions:
+            self._ids_by_user.pop(session.user_id, None)
+    
+    def _to_summary(self, session: TelegramSession) -> SessionSummary:
+        """Convert stored session to SessionSummary."""
+        return SessionSummary(
+            session_id=session.id.value,
+            phone_number=session.phone_number,
+            status=session.status,
+            telegram_user=copy.copy(session.telegram_user),
+            last_used_at=session.last_used_at,
+            created_at=session.created_at
+        )
\ No newline at end of file
@@ -0,0 +1,41 @@
+"""In-memory implementation of tombstone repository."""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from ...domain.entities.tombstone import Tombstone
+from ...domain.repositories.tombstone_repository import TombstoneRepository
+from ..database.mongodb_tombstone_repository import TOMBSTONE_RETENTION_SECONDS
+
+
+class InMemoryTombstoneRepository(TombstoneRepository):
+    """In-memory implementation of tombstone repository.
+    
+    Tombstones are kept per user (None for shared entities) and purged
+    after the same retention as the MongoDB TTL index.
+    """
+    
+    def __init__(self):
+        self._by_user: Dict[Optional[str], List[Tombstone]] = {}
+    
+    async def record(self, tombstones: List[Tombstone]) -> None:
+        """Record deleted entities."""
+        for tombstone in tombstones:
+            self._by_user.setdefault(tombstone.user_id, []).append(tombstone)
+        self._purge_expired()
+    
+    async def list_since(self, user_id: str, since: datetime) -> List[Tombstone]:
+        """List tombstones visible to user recorded after the given time."""
+        return [
+            tombstone
+            for owner in (user_id, None)
+            for tombstone in self._by_user.get(owner, [])
+            if tombstone.deleted_at > since
+        ]
+    
+    def _purge_expired(self) -> None:
+        """Drop tombstones older than the retention period."""
+        cutoff = datetime.utcnow() - timedelta(seconds=TOMBSTONE_RETENTION_SECONDS)
+        for owner, tombstones in list(self._by_user.items()):
+            if tombstones and tombstones[0].deleted_at < cutoff:
+                self._by_user[owner] = [tombstone for tombstone in tombstones if tombstone.deleted_at >= cutoff]
\ No newline at end of file
@@ -0,0 +1,147 @@
+"""In-memory implementation of user repository."""
+
+import re
+from itertools import islice
+from typing import Dict, Optional, List
+
+from ...domain.entities.user import User, UserId, SubscriptionType
+from ...domain.repositories.user_repository import UserRepository, DuplicateUserError
+from .tracked_changes import apply_tracked_changes, detached_copy
+
+
+# Only the API token hash is stored, never the plaintext token
+PERSISTED_FIELDS = frozenset(name for name in User.__dataclass_fields__ if name != "api_token")
+
+
+class InMemoryUserRepository(UserRepository):
+    """In-memory implementation of user repository.
+    
+    Users are kept by ID, with dicts standing in for the unique indexes
+    on username, email and API token hash. No operation awaits, so each
+    one is atomic under asyncio like a single-document MongoDB write.
+    Callers always receive copies.
+    """
+    
+    def __init__(self):
+        self._users: Dict[str, User] = {}
+        self._ids_by_username: Dict[str, str] = {}
+        self._ids_by_email: Dict[str, str] = {}
+        self._ids_by_api_token_hash: Dict[str, str] = {}
+    
+    async def create(self, user: User) -> None:
+        """Insert new user. Raises DuplicateUserError on a taken username or email."""
+        if user.id.value in self._users:
+            raise DuplicateUserError("user")
+        self._check_unique(user, PERSISTED_FIELDS)
+        
+        stored = detached_copy(user)
+        object.__setattr__(stored, "api_token", None)
+        self._users[user.id.value] = stored
+        self._index(stored)
+        user.mark_clean()
+    
+    async def save(self, user: User) -> None:
+        """Save user, writing only fields changed since it was loaded."""
+        stored = self._users.get(user.id.value)
+        if stored is None:
+            if user.is_new:
+                await self.create(user)
+            else:
+                user.mark_clean()
+            return
+        
+        changed = PERSISTED_FIELDS if user.is_new else user.pending_changes()[0]
+        self._check_unique(user, changed)
+        
+        self._unindex(stored)
+        apply_tracked_changes(stored, user, PERSISTED_FIELDS)
+        self._index(stored)
+        user.mark_clean()
+    
+    async def find_by_id(self, user_id: UserId) -> Optional[User]:
+        """Find user by ID."""
+        return self._copy_of(user_id.value)
+    
+    async def find_by_username(self, username: str) -> Optional[User]:
+        """Find user by username."""
+        return self._copy_of(self._ids_by_username.get(username))
+    
+    async def find_by_email(self, email: str) -> Optional[User]:
+        """Find user by email."""
+        return self._copy_of(self._ids_by_email.get(email))
+    
+    async def find_by_api_token(self, api_token: str) -> Optional[User]:
+        """Find user by legacy plaintext API token.
+        
+        Plaintext tokens only exist in legacy MongoDB records, so none matches here.
+        """
+        return None
+    
+    async def find_by_api_token_hash(self, api_token_hash: str) -> Optional[User]:
+        """Find user by keyed hash of API token."""
+        return self._copy_of(self._ids_by_api_token_hash.get(api_token_hash))
+    
+    async def list_users(self, skip: int = 0, limit: int = 100) -> List[User]:
+        """List users with pagination."""
+        return [detached_copy(user) for user in islice(self._users.values(), skip, skip + limit)]
+    
+    async def count_by_subscription_type(self, subscription_type: SubscriptionType) -> int:
+        """Count users by subscription type."""
+        return sum(1 for user in self._users.values() if user.subscription_type == subscription_type)
+    
+    async def delete(self, user_id: UserId) -> bool:
+        """Delete user."""
+        stored = self._users.pop(user_id.value, None)
+        if stored is None:
+            return False
+        
+        self._unindex(stored)
+        return True
+    
+    async def exists_username(self, username: str) -> bool:
+        """Check if username exists."""
+        return username in self._ids_by_username
+    
+    async def exists_email(self, email: str) -> bool:
+        """Check if email exists."""
+        return email in self._ids_by_email
+    
+    async def next_available_username(self, base: str) -> str:
+        """Return ``base`` if free, otherwise ``base_N`` with N above the highest taken suffix."""
+        if base not in self._ids_by_username:
+            return base
+        
+        matcher = re.compile(f"^{re.escape(base)}_([0-9]+)$")
+        highest_suffix = 0
+        for username in self._ids_by_username:
+            match = matcher.match(username)
+            if match:
+                highest_suffix = max(highest_suffix, int(match.group(1)))
+        return f"{base}_{highest_suffix + 1}"
+    
+    def _copy_of(self, user_id: Optional[str]) -> Optional[User]:
+        """Copy of stored user, or None."""
+        stored = self._users.get(user_id) if user_id is not None else None
+        return detached_copy(stored) if stored else None
+    
+    def _check_unique(self, user: User, fields) -> None:
+        """Raise DuplicateUserError if a written unique field belongs to another user."""
+        for field, index in (("username", self._ids_by_username), ("email", self._ids_by_email)):
+            if field in fields:
+                owner = index.get(getattr(user, field))
+                if owner is not None and owner != user.id.value:
+                    raise DuplicateUserError(field)
+    
+    def _index(self, user: User) -> None:
+        """Add stored user to the lookup indexes."""
+        self._ids_by_username[user.username] = user.id.value
+        self._ids_by_email[user.email] = user.id.value
+        if user.api_token_hash:
+            self._ids_by_api_token_hash[user.api_token_hash] = user.id.value
+    
+    def _unindex(self, user: User) -> None:
+        """Remove stored user from the lookup indexes."""
+        self._ids_by_username.pop(user.username, None)
+        self._ids_by_email.pop(user.email, None)
+        if user.api_token_hash:
+            self._ids_by_api_token_hash.pop(user.api_token_hash, None)
\ No newline at end of file
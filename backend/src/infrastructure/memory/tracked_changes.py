@@ -0,0 +1,40 @@
+"""Apply saves of change-tracked entities to stored in-memory copies."""
+
+import copy
+from typing import Collection, TypeVar
+
+from ...domain.entities.dirty_tracking import DirtyTrackingMixin
+
+
+E = TypeVar("E", bound=DirtyTrackingMixin)
+
+
+def detached_copy(entity: E) -> E:
+    """Clean deep copy of an entity, sharing no state with the original."""
+    result = copy.deepcopy(entity)
+    result.mark_clean()
+    return result
+
+
+def apply_tracked_changes(stored: DirtyTrackingMixin, entity: DirtyTrackingMixin,
+                          fields: Collection[str]) -> None:
+    """Write what a save of ``entity`` would write onto its stored copy.
+    
+    Mirrors ``tracked_update``: a new entity overwrites every persisted
+    field, a loaded one only its assigned fields, and counter increments
+    are added to the stored value. Two copies saving different fields
+    therefore both survive, as they do in MongoDB. Only ``fields`` are
+    persisted.
+    """
+    if entity.is_new:
+        dirty, increments = set(fields), {}
+    else:
+        dirty, increments = entity.pending_changes()
+    
+    # Stored copies are never saved themselves, so bypass their tracking
+    for name in dirty:
+        if name in fields:
+            object.__setattr__(stored, name, copy.deepcopy(getattr(entity, name)))
+    for name, amount in increments.items():
+        if name in fields:
+            object.__setattr__(stored, name, getattr(stored, name) + amount)
\ No newline at end of file
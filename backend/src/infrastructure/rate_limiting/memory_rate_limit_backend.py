@@ -0,0 +1,70 @@
+"""In-process sliding-window rate limit backend."""
+
+from collections import OrderedDict
+from typing import List, Sequence
+
+from .rate_limit_backend import (
+    RateLimitBackend, RateLimitDecision, RateLimitHit, all_or_nothing_decisions, current_window, exceeds_limit
+)
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Sliding-window counters held in process memory.
+    
+    Each key keeps only its window index and two counts, so a hit is a
+    dict lookup with no I/O and no lock (the event loop serializes
+    access). Keys are kept in LRU order and bounded by ``max_keys``; a
+    few stale keys are dropped on every hit. Limits are per process, so
+    use the Redis backend when running several workers.
+    """
+    
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        # key -> [window seconds, window index, previous count, current count]
+        self._counters: "OrderedDict[str, List[int]]" = OrderedDict()
+    
+    async def hit_all(self, hits: Sequence[RateLimitHit]) -> List[RateLimitDecision]:
+        counters = [self._counter(hit.key, hit.window_seconds) for hit in hits]
+        admitted = not any(
+            exceeds_limit(counter[2], counter[3], hit.limit, elapsed)
+            for hit, (counter, elapsed) in zip(hits, counters)
+        )
+        
+        if admitted:
+            for counter, _ in counters:
+                counter[3] += 1
+        
+        states = [(counter[2], counter[3], elapsed) for counter, elapsed in counters]
+        self._evict()
+        return all_or_nothing_decisions(hits, states, admitted)
+    
+    def _counter(self, key: str, window_seconds: int):
+        """Return the key's counter rolled over to the current window, and the elapsed fraction."""
+        index, elapsed = current_window(window_seconds)
+        counter = self._counters.get(key)
+        
+        if counter is None:
+            counter = self._counters[key] = [window_seconds, index, 0, 0]
+        elif counter[1] != index:
+            # Roll over: the current count becomes the previous one if adjacent
+            counter[2] = counter[3] if counter[1] == index - 1 else 0
+            counter[3] = 0
+            counter[1] = index
+        self._counters.move_to_end(key)
+        return counter, elapsed
+    
+    def _evict(self) -> None:
+        """Drop keys over capacity and a few keys that no longer affect any decision."""
+        while len(self._counters) > self.max_keys:
+            self._counters.popitem(last=False)
+        
+        for _ in range(2):
+            if not self._counters:
+                return
+            key, (window_seconds, index, _, _) = next(iter(self._counters.items()))
+            if index >= current_window(window_seconds)[0] - 1:
+                return
+            del self._counters[key]
+    
+    def __len__(self) -> int:
+        return len(self._counters)
\ No newline at end of file
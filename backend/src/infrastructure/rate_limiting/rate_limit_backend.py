@@ -0,0 +1,96 @@
+"""Sliding-window rate limit counter storage."""
+
+import math
+import time
+from abc import ABC, abstractmethod
+from typing import List, NamedTuple, Sequence, Tuple
+
+
+class RateLimitDecision(NamedTuple):
+    """Outcome of counting one request against a limit."""
+    allowed: bool
+    remaining: int
+    retry_after: int  # Seconds until a request would be allowed, 0 when allowed
+
+
+class RateLimitHit(NamedTuple):
+    """One limit a request is counted against."""
+    key: str
+    limit: int
+    window_seconds: int
+
+
+def current_window(window_seconds: int, now: float = None) -> Tuple[int, float]:
+    """Return ``(window index, fraction of the window elapsed)`` for now."""
+    now = time.time() if now is None else now
+    index = int(now // window_seconds)
+    return index, (now - index * window_seconds) / window_seconds
+
+
+def sliding_window_decision(previous: int, current: int, limit: int, window_seconds: int,
+                            elapsed: float, counted: bool) -> RateLimitDecision:
+    """Decide on a request from the previous and current window counts.
+    
+    The request rate is estimated as the previous window's count weighted
+    by how much of it still overlaps the sliding window, plus the current
+    window's count. ``counted`` is false when the request is over this
+    limit; otherwise ``current`` includes the request if it was recorded.
+    """
+    estimated = previous * (1.0 - elapsed) + current
+    
+    if counted:
+        return RateLimitDecision(True, max(0, int(limit - estimated)), 0)
+    
+    if current + 1 > limit:
+        # Blocked by this window alone: wait for it to roll over and decay
+        wait = (1.0 - elapsed) + max(0.0, 1.0 - (limit - 1) / current)
+    else:
+        # Blocked by the previous window's weight: wait for it to decay
+        wait = (1.0 - (limit - current - 1) / previous) - elapsed
+    
+    return RateLimitDecision(False, 0, max(1, math.ceil(wait * window_seconds)))
+
+
+def exceeds_limit(previous: int, current: int, limit: int, elapsed: float) -> bool:
+    """Check whether one more request would go over the sliding-window limit."""
+    return previous * (1.0 - elapsed) + current + 1 > limit
+
+
+def all_or_nothing_decisions(hits: Sequence[RateLimitHit], states: Sequence[Tuple[int, int, float]],
+                             admitted: bool) -> List[RateLimitDecision]:
+    """Decisions for a request counted against several limits at once.
+    
+    ``states`` holds ``(previous, current, elapsed)`` per hit, with
+    ``current`` including the request when it was ``admitted``. A rejected
+    request is denied by the limits it would exceed; the other limits
+    report their unchanged remaining budget.
+    """
+    decisions = []
+    for hit, (previous, current, elapsed) in zip(hits, states):
+        over = not admitted and exceeds_limit(previous, current, hit.limit, elapsed)
+        decisions.append(sliding_window_decision(
+            previous, current, hit.limit, hit.window_seconds, elapsed, counted=not over
+        ))
+    return decisions
+
+
+class RateLimitBackend(ABC):
+    """Counter storage for sliding-window rate limits."""
+    
+    @abstractmethod
+    async def hit_all(self, hits: Sequence[RateLimitHit]) -> List[RateLimitDecision]:
+        """Count a request against every limit, or against none.
+        
+        All limits are checked before any is counted, so a request
+        rejected by one limit does not spend the budget of the others.
+        Returns one decision per hit, in order.
+        """
+        pass
+    
+    async def hit(self, key: str, limit: int, window_seconds: int) -> RateLimitDecision:
+        """Count a request under key unless it would exceed ``limit`` per window."""
+        return (await self.hit_all([RateLimitHit(key, limit, window_seconds)]))[0]
+    
+    async def close(self) -> None:
+        """Release backend resources."""
+        pass
\ No newline at end of file
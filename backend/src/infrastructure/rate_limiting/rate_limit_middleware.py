@@ -0,0 +1,162 @@
+"""ASGI middleware enforcing route-level rate limits."""
+
+import json
+import logging
+from typing import Optional, Sequence
+
+import jwt
+from prometheus_client import Counter
+
+from ...domain.services.authentication_service import API_TOKEN_PREFIX
+from .rate_limit_backend import RateLimitBackend, RateLimitDecision, RateLimitHit
+from .rate_limit_policy import RateLimitPolicy, KEY_BY_USER
+
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_REJECTIONS = Counter(
+    "rate_limit_rejections_total",
+    "Requests rejected by a rate limit policy",
+    ["policy"]
+)
+
+
+class RateLimitMiddleware:
+    """Pure ASGI middleware counting requests against matching policies.
+    
+    Runs before routing, so a throttled request is answered with a 429
+    without resolving dependencies, touching the database or reading the
+    body. Per-user keys come from the bearer credential alone: a JWT is
+    verified locally (no user lookup). API tokens cannot be verified
+    without a lookup, so they are keyed by client IP like requests
+    without a valid credential; otherwise every random token would get
+    a fresh budget. A request is counted against all matching policies
+    or, when any of them rejects it, against none.
+    
+    Counters live in the container's rate limit backend, looked up per
+    request since the container is only built at startup. If the backend
+    fails, requests are let through rather than failed.
+    """
+    
+    def __init__(self, app, policies: Sequence[RateLimitPolicy], jwt_secret: str,
+                 jwt_algorithm: str = "HS256", trust_forwarded: bool = False):
+        self.app = app
+        self.policies = tuple(policies)
+        self.jwt_secret = jwt_secret
+        self.jwt_algorithm = jwt_algorithm
+        self.trust_forwarded = trust_forwarded
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        method, path = scope["method"], scope["path"]
+        policies = [policy for policy in self.policies if policy.matches(method, path)]
+        if not policies:
+            await self.app(scope, receive, send)
+            return
+        
+        hits = [
+            RateLimitHit(f"{policy.name}:{self._identity(policy, scope)}", policy.limit, policy.window_seconds)
+            for policy in policies
+        ]
+        try:
+            backend: RateLimitBackend = scope["app"].state.container.rate_limit_backend
+            decisions = await backend.hit_all(hits)
+        except Exception as e:
+            logger.warning(f"Rate limit backend unavailable, allowing request: {e}")
+            await self.app(scope, receive, send)
+            return
+        
+        rejections = [(policy, decision) for policy, decision in zip(policies, decisions) if not decision.allowed]
+        if rejections:
+            for policy, _ in rejections:
+                RATE_LIMIT_REJECTIONS.labels(policy=policy.name).inc()
+            # Report the limit that takes longest to free up
+            policy, decision = max(rejections, key=lambda rejection: rejection[1].retry_after)
+            await self._reject(send, policy, decision)
+            return
+        
+        tightest, tightest_decision = min(zip(policies, decisions), key=lambda pair: pair[1].remaining)
+        limit_headers = _limit_headers(tightest, tightest_decision)
+        
+        async def send_with_limit_headers(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + limit_headers
+            await send(message)
+        
+        await self.app(scope, receive, send_with_limit_headers)
+    
+    def _identity(self, policy: RateLimitPolicy, scope) -> str:
+        """Key requests by credential (for per-user policies) or client IP."""
+        if policy.key == KEY_BY_USER:
+            authorization = _header(scope, b"authorization")
+            identity = self._credential_identity(authorization) if authorization else None
+            if identity is not None:
+                return identity
+        
+        return f"ip:{self._client_ip(scope)}"
+    
+    def _credential_identity(self, authorization: bytes) -> Optional[str]:
+        """Identity of a bearer credential, or None when it is not valid."""
+        scheme, _, token = authorization.decode("latin-1").partition(" ")
+        token = token.strip()
+        if scheme.lower() != "bearer" or not token:
+            return None
+        
+        if token.startswith(API_TOKEN_PREFIX):
+            # Unverified: keying by digest would let random tokens dodge the limit
+            return None
+        
+        # Signature is checked so a forged token cannot spend another user's budget
+        try:
+            payload = jwt.decode(token, self.jwt_secret, algorithms=[self.jwt_algorithm])
+        except jwt.InvalidTokenError:
+            return None
+        
+        user_id = payload.get("user_id")
+        return f"user:{user_id}" if user_id else None
+    
+    def _client_ip(self, scope) -> str:
+        """Client address, from X-Forwarded-For when behind a trusted proxy."""
+        if self.trust_forwarded:
+            forwarded = _header(scope, b"x-forwarded-for")
+            if forwarded:
+                return forwarded.decode("latin-1").split(",")[0].strip()
+        
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+    
+    async def _reject(self, send, policy: RateLimitPolicy, decision: RateLimitDecision) -> None:
+        """Send 429 response."""
+        body = json.dumps({
+            "detail": f"Rate limit exceeded, retry in {decision.retry_after} seconds"
+        }).encode()
+        
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(decision.retry_after).encode()),
+            ] + _limit_headers(policy, decision)
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+def _header(scope, name: bytes) -> Optional[bytes]:
+    """First value of a request header."""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+    return None
+
+
+def _limit_headers(policy: RateLimitPolicy, decision: RateLimitDecision) -> list:
+    """X-RateLimit-* response headers."""
+    return [
+        (b"x-ratelimit-limit", str(policy.limit).encode()),
+        (b"x-ratelimit-remaining", str(decision.remaining).encode()),
+    ]
\ No newline at end of file
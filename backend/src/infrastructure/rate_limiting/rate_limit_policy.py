@@ -0,0 +1,50 @@
+"""Route-level rate limit policies."""
+
+from dataclasses import dataclass
+from typing import FrozenSet, Optional
+
+
+KEY_BY_IP = "ip"
+KEY_BY_USER = "user"  # User id from a verified JWT, falling back to IP
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """Allow ``limit`` requests per ``window_seconds`` on matching routes.
+    
+    A policy matches requests whose path is ``path_prefix`` or lies
+    below it, for the given methods (all methods when None).
+    """
+    name: str
+    path_prefix: str
+    limit: int
+    window_seconds: int
+    methods: Optional[FrozenSet[str]] = None
+    key: str = KEY_BY_IP
+    
+    def __post_init__(self):
+        if self.limit < 1 or self.window_seconds < 1:
+            raise ValueError("Rate limit and window must be positive")
+        if self.key not in (KEY_BY_IP, KEY_BY_USER):
+            raise ValueError(f"Unknown rate limit key: {self.key}")
+    
+    def matches(self, method: str, path: str) -> bool:
+        """Check whether policy applies to request."""
+        if self.methods is not None and method not in self.methods:
+            return False
+        
+        prefix = self.path_prefix.rstrip("/")
+        return path == prefix or path.startswith(prefix + "/")
+
+
+# Specific policies first: a request is counted against every matching policy
+DEFAULT_RATE_LIMIT_POLICIES = (
+    RateLimitPolicy("auth_login", "/api/auth/login", limit=10, window_seconds=60, methods=frozenset({"POST"})),
+    RateLimitPolicy("auth_register", "/api/auth/register", limit=10, window_seconds=3600, methods=frozenset({"POST"})),
+    RateLimitPolicy("auth_emergent", "/api/auth/emergent", limit=20, window_seconds=60, methods=frozenset({"POST"})),
+    RateLimitPolicy("groups_bulk", "/api/groups/bulk", limit=30, window_seconds=60, methods=frozenset({"POST"}),
+                    key=KEY_BY_USER),
+    RateLimitPolicy("media_upload", "/api/media", limit=60, window_seconds=60, methods=frozenset({"POST"}),
+                    key=KEY_BY_USER),
+    RateLimitPolicy("api", "/api", limit=1200, window_seconds=60, key=KEY_BY_USER),
+)
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""Redis sliding-window rate limit backend shared by all workers."""
+
+from typing import List, Sequence
+
+import redis.asyncio as redis
+
+from .rate_limit_backend import (
+    RateLimitBackend, RateLimitDecision, RateLimitHit, all_or_nothing_decisions, current_window
+)
+
+
+# KEYS: current and previous window counter, in pairs per limit
+# ARGV: limit, previous window weight and counter expiry in seconds, in triples per limit
+# Returns {admitted, current 1, previous 1, current 2, previous 2, ...}
+_SLIDING_WINDOW_HIT_ALL = """
+local result = {1}
+for i = 1, #KEYS / 2 do
+    local current = tonumber(redis.call('GET', KEYS[2 * i - 1]) or '0')
+    local previous = tonumber(redis.call('GET', KEYS[2 * i]) or '0')
+    if previous * tonumber(ARGV[3 * i - 1]) + current + 1 > tonumber(ARGV[3 * i - 2]) then
+        result[1] = 0
+    end
+    result[2 * i] = current
+    result[2 * i + 1] = previous
+end
+if result[1] == 1 then
+    for i = 1, #KEYS / 2 do
+        result[2 * i] = redis.call('INCR', KEYS[2 * i - 1])
+        if result[2 * i] == 1 then
+            redis.call('EXPIRE', KEYS[2 * i - 1], ARGV[3 * i])
+        end
+    end
+end
+return result
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Sliding-window counters in Redis, one key per key and window.
+    
+    All limits of a request are checked and counted in a single Lua
+    script, so each request costs one round trip and concurrent workers
+    can never both take the last slot. Counters expire after two windows
+    on their own. Socket timeouts are short: a slow Redis fails the hit
+    (and the middleware lets the request through) instead of stalling it.
+    """
+    
+    def __init__(self, url: str, key_prefix: str = "rate_limit:", timeout_seconds: float = 0.5):
+        self.key_prefix = key_prefix
+        self._client = redis.from_url(url, socket_timeout=timeout_seconds, socket_connect_timeout=timeout_seconds)
+        self._hit_script = self._client.register_script(_SLIDING_WINDOW_HIT_ALL)
+    
+    async def hit_all(self, hits: Sequence[RateLimitHit]) -> List[RateLimitDecision]:
+        keys, args, elapsed_fractions = [], [], []
+        for hit in hits:
+            index, elapsed = current_window(hit.window_seconds)
+            base = f"{self.key_prefix}{hit.key}:"
+            keys += [f"{base}{index}", f"{base}{index - 1}"]
+            args += [hit.limit, repr(1.0 - elapsed), hit.window_seconds * 2]
+            elapsed_fractions.append(elapsed)
+        
+        result = await self._hit_script(keys=keys, args=args)
+        
+        states = [
+            (int(result[2 * i + 2]), int(result[2 * i + 1]), elapsed)
+            for i, elapsed in enumerate(elapsed_fractions)
+        ]
+        return all_or_nothing_decisions(hits, states, admitted=bool(result[0]))
+    
+    async def close(self) -> None:
+        await self._client.aclose()
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""Bcrypt password hasher running on a dedicated bounded executor."""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+import bcrypt
+from prometheus_client import Gauge, Histogram
+
+from ...domain.services.password_hasher import PasswordHasher, PasswordHasherBusyError
+
+
+T = TypeVar("T")
+
+PASSWORD_HASH_QUEUE_DEPTH = Gauge(
+    "password_hash_queue_depth",
+    "Password hashing requests waiting for a worker"
+)
+PASSWORD_HASH_IN_FLIGHT = Gauge(
+    "password_hash_in_flight",
+    "Password hashing requests running on a worker"
+)
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_seconds",
+    "Time spent hashing or verifying a password on a worker",
+    ["operation"]
+)
+PASSWORD_HASH_WAIT_SECONDS = Histogram(
+    "password_hash_wait_seconds",
+    "Time a password hashing request waited for a worker"
+)
+
+_BCRYPT_MAX_BYTES = 72
+
+
+class BcryptPasswordHasher(PasswordHasher):
+    """Bcrypt hasher with its own thread pool and admission limit.
+    
+    Key derivation runs on a small dedicated executor (bcrypt releases
+    the GIL while hashing), so logins never block the event loop or
+    compete for the default executor. At most ``max_workers`` hashes run
+    at once; up to ``max_queue`` more wait on a semaphore, where the wait
+    is measured, and anything beyond that is rejected with
+    PasswordHasherBusyError instead of piling up.
+    
+    Legacy ``salt$sha256`` hashes still verify; needs_rehash reports them
+    so callers can upgrade on the next successful login.
+    """
+    
+    def __init__(self, rounds: int = 12, max_workers: int = 2, max_queue: int = 64):
+        self.rounds = rounds
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        self._slots = asyncio.Semaphore(max_workers)
+        self._waiting = 0
+    
+    async def hash(self, password: str) -> str:
+        """Hash password with bcrypt."""
+        secret = self._bcrypt_secret(password)
+        hashed = await self._run("hash", lambda: bcrypt.hashpw(secret, bcrypt.gensalt(self.rounds)))
+        return hashed.decode()
+    
+    async def verify(self, password: str, password_hash: str) -> bool:
+        """Verify password against a bcrypt or legacy hash."""
+        if self._is_bcrypt(password_hash):
+            secret = self._bcrypt_secret(password)
+            try:
+                return await self._run("verify", lambda: bcrypt.checkpw(secret, password_hash.encode()))
+            except ValueError:
+                return False
+        
+        return self._verify_legacy(password, password_hash)
+    
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Check if hash is legacy or uses a different bcrypt cost."""
+        if not self._is_bcrypt(password_hash):
+            return True
+        
+        try:
+            return int(password_hash.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
+    
+    def close(self) -> None:
+        """Shut down worker threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    async def _run(self, operation: str, work: Callable[[], T]) -> T:
+        """Run work on the executor within the concurrency and queue limits."""
+        if self._waiting >= self.max_queue:
+            raise PasswordHasherBusyError("Too many concurrent password operations")
+        
+        queued_at = time.perf_counter()
+        self._waiting += 1
+        PASSWORD_HASH_QUEUE_DEPTH.inc()
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+            PASSWORD_HASH_QUEUE_DEPTH.dec()
+        
+        started_at = time.perf_counter()
+        PASSWORD_HASH_WAIT_SECONDS.observe(started_at - queued_at)
+        PASSWORD_HASH_IN_FLIGHT.inc()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, work)
+        finally:
+            PASSWORD_HASH_IN_FLIGHT.dec()
+            PASSWORD_HASH_SECONDS.labels(operation=operation).observe(time.perf_counter() - started_at)
+            self._slots.release()
+    
+    def _is_bcrypt(self, password_hash: str) -> bool:
+        """Check for a modular-crypt bcrypt hash."""
+        return password_hash.startswith(("$2a$", "$2b$", "$2y$"))
+    
+    def _bcrypt_secret(self, password: str) -> bytes:
+        """Password bytes for bcrypt, pre-hashed when longer than bcrypt's 72-byte input limit."""
+        secret = password.encode()
+        if len(secret) > _BCRYPT_MAX_BYTES:
+            secret = base64.b64encode(hashlib.sha256(secret).digest())
+        return secret
+    
+    def _verify_legacy(self, password: str, password_hash: str) -> bool:
+        """Verify a legacy ``salt$sha256(password + salt)`` hash."""
+        try:
+            salt, stored_hash = password_hash.split("$")
+        except ValueError:
+            return False
+        
+        pwd_hash = hashlib.sha256(f"{password}{salt}".encode()).hexdigest()
+        return hmac.compare_digest(pwd_hash, stored_hash)
\ No newline at end of file
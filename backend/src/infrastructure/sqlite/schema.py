@@ -0,0 +1,43 @@
+"""SQLite schema bootstrap."""
+
+import logging
+
+from .sqlite_database import SQLiteDatabase
+from .sqlite_user_repository import SQLiteUserRepository
+from .sqlite_telegram_session_repository import SQLiteTelegramSessionRepository
+from .sqlite_group_repository import SQLiteGroupRepository
+from .sqlite_message_template_repository import SQLiteMessageTemplateRepository
+from .sqlite_tombstone_repository import SQLiteTombstoneRepository
+from .sqlite_media_asset_repository import SQLiteMediaAssetRepository
+from .sqlite_media_file_reference_repository import SQLiteMediaFileReferenceRepository
+
+
+logger = logging.getLogger(__name__)
+
+# Repositories whose declared SCHEMA (tables and indexes) is created at startup
+SCHEMA_REPOSITORIES = (
+    SQLiteUserRepository,
+    SQLiteTelegramSessionRepository,
+    SQLiteGroupRepository,
+    SQLiteMessageTemplateRepository,
+    SQLiteTombstoneRepository,
+    SQLiteMediaAssetRepository,
+    SQLiteMediaFileReferenceRepository,
+)
+
+
+async def ensure_schema(database: SQLiteDatabase) -> None:
+    """Create all declared tables and indexes.
+    
+    Statements use ``IF NOT EXISTS``, so this is idempotent and cheap on
+    an existing database.
+    """
+    def create(connection) -> None:
+        for repository_class in SCHEMA_REPOSITORIES:
+            for statement in repository_class.SCHEMA:
+                connection.execute(statement)
+        # Refresh planner statistics for the indexes
+        connection.execute("PRAGMA optimize")
+    
+    await database.run(create)
+    logger.info(f"🗂️ SQLite schema ready: {', '.join(cls.TABLE for cls in SCHEMA_REPOSITORIES)}")
\ No newline at end of file
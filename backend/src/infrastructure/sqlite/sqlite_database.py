@@ -0,0 +1,113 @@
+"""SQLite connection served by a dedicated thread."""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Iterable, List, Optional, Sequence, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Fixed width, so stored datetimes compare and sort chronologically as text
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+
+def to_db_datetime(value: Optional[datetime]) -> Optional[str]:
+    """Convert naive UTC datetime to its stored text form."""
+    return value.strftime(DATETIME_FORMAT) if value is not None else None
+
+
+def from_db_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Convert stored text back to a naive UTC datetime."""
+    return datetime.strptime(value, DATETIME_FORMAT) if value is not None else None
+
+
+def to_db_json(value: Any) -> Optional[str]:
+    """Serialize a nested value stored in a JSON column."""
+    return json.dumps(value) if value is not None else None
+
+
+def from_db_json(value: Optional[str], default: Any = None) -> Any:
+    """Deserialize a JSON column."""
+    return json.loads(value) if value is not None else default
+
+
+class SQLiteDatabase:
+    """One SQLite connection, used only by its own thread.
+    
+    sqlite3 calls block, so every operation runs on a single-thread
+    executor: the event loop never waits on disk, and operations are
+    serialized, so each runs as one transaction without further locking.
+    WAL journaling lets other processes (backups, the sqlite3 shell) read
+    during writes, and ``synchronous=NORMAL`` is durable against
+    application crashes while syncing only at checkpoints. Statements are
+    parameterized, so sqlite3 reuses them from its prepared statement
+    cache.
+    """
+    
+    def __init__(self, path: str, busy_timeout_ms: int = 5000, cached_statements: int = 256):
+        self.path = path
+        self.busy_timeout_ms = busy_timeout_ms
+        self.cached_statements = cached_statements
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        self._connection: Optional[sqlite3.Connection] = None
+    
+    async def run(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        """Run ``operation(connection)`` on the database thread as one transaction."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._run, operation)
+    
+    async def fetchone(self, sql: str, params: Sequence[Any] = ()) -> Optional[sqlite3.Row]:
+        """Run query and return its first row."""
+        return await self.run(lambda connection: connection.execute(sql, params).fetchone())
+    
+    async def fetchall(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        """Run query and return all rows."""
+        return await self.run(lambda connection: connection.execute(sql, params).fetchall())
+    
+    async def execute(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """Run statement and return the number of changed rows."""
+        return await self.run(lambda connection: connection.execute(sql, params).rowcount)
+    
+    async def executemany(self, sql: str, params: Iterable[Sequence[Any]]) -> int:
+        """Run statement once per parameter set in a single transaction."""
+        return await self.run(lambda connection: connection.executemany(sql, params).rowcount)
+    
+    async def close(self) -> None:
+        """Close the connection and stop the database thread."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._close)
+        self._executor.shutdown(wait=True)
+    
+    def _run(self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        """Run operation in a transaction, committing on success."""
+        connection = self._connect()
+        with connection:
+            return operation(connection)
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the connection on first use (on the database thread)."""
+        if self._connection is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            
+            connection = sqlite3.connect(self.path, cached_statements=self.cached_statements)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+            self._connection = connection
+            logger.info(f"🗄️ SQLite database opened at {self.path} (WAL)")
+        return self._connection
+    
+    def _close(self) -> None:
+        """Close the connection (on the database thread)."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
\ No newline at end of file
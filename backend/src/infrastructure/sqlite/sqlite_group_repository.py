@@ -0,0 +1,347 @@
+"""SQLite implementation of group repository."""
+
+import sqlite3
+from datetime import datetime
+from typing import Optional, List, Tuple
+
+from ...domain.entities.group import Group, GroupId, GroupStatus, BlacklistReason
+from ...domain.entities.tombstone import Tombstone
+from ...domain.read_models.group_summary import GroupSummary
+from ...domain.read_models.group_set import GroupSet, STATUS_VALUE_CODES, to_epoch
+from ...domain.repositories.group_repository import GroupRepository, GroupWriteError
+from ..database.tracked_updates import tracked_update
+from .sqlite_database import SQLiteDatabase, to_db_datetime, from_db_datetime
+from .sqlite_statements import Statement, placeholders, upsert_statement, tracked_update_statement
+from .sqlite_tombstone_repository import SQLiteTombstoneRepository
+
+
+# Columns serialized by group list endpoints
+SUMMARY_COLUMNS = "id, telegram_id, name, username, invite_link, status, message_count, last_message_sent, created_at"
+
+
+class SQLiteGroupRepository(GroupRepository):
+    """SQLite implementation of group repository."""
+    
+    TABLE = "groups"
+    SCHEMA = [
+        """CREATE TABLE IF NOT EXISTS groups (
+            id TEXT PRIMARY KEY,
+            user_id TEXT NOT NULL,
+            telegram_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            username TEXT,
+            invite_link TEXT,
+            status TEXT NOT NULL,
+            blacklist_reason TEXT,
+            blacklist_until TEXT,
+            message_count INTEGER NOT NULL DEFAULT 0,
+            last_message_sent TEXT,
+            created_at TEXT,
+            updated_at TEXT
+        )""",
+        "CREATE UNIQUE INDEX IF NOT EXISTS groups_user_id_telegram_id_unique ON groups (user_id, telegram_id)",
+        "CREATE INDEX IF NOT EXISTS groups_user_id_status_blacklist_until "
+        "ON groups (user_id, status, blacklist_until)",
+        "CREATE INDEX IF NOT EXISTS groups_user_id_created_at ON groups (user_id, created_at DESC)",
+        "CREATE INDEX IF NOT EXISTS groups_user_id_updated_at ON groups (user_id, updated_at)",
+    ]
+    
+    def __init__(self, database: SQLiteDatabase):
+        self.db = database
+        self.tombstones = SQLiteTombstoneRepository(database)
+    
+    async def save(self, group: Group) -> None:
+        """Save group, writing only fields changed since it was loaded.
+        
+        Raises ValueError when the Telegram ID belongs to another of the user's groups.
+        """
+        statement = self._save_statement(group)
+        if statement:
+            try:
+                await self.db.execute(*statement)
+            except sqlite3.IntegrityError as e:
+                if "telegram_id" not in str(e):
+                    raise
+                raise ValueError(f"Group with Telegram ID {group.telegram_id} already exists")
+        group.mark_clean()
+    
+    async def find_by_id(self, user_id: str, group_id: GroupId) -> Optional[Group]:
+        """Find user's group by ID."""
+        row = await self.db.fetchone("SELECT * FROM groups WHERE id = ? AND user_id = ?", (group_id.value, user_id))
+        return self._row_to_group(row) if row else None
+    
+    async def find_by_ids(self, user_id: str, group_ids: List[GroupId]) -> List[Group]:
+        """Find user's groups by ID in one query, in the given order; missing IDs are skipped."""
+        if not group_ids:
+            return []
+        
+        ids = list(dict.fromkeys(group_id.value for group_id in group_ids))
+        rows = await self.db.fetchall(
+            f"SELECT * FROM groups WHERE user_id = ? AND id IN ({placeholders(len(ids))})", (user_id, *ids)
+        )
+        by_id = {row["id"]: row for row in rows}
+        return [self._row_to_group(by_id[group_id]) for group_id in ids if group_id in by_id]
+    
+    async def find_by_telegram_id(self, user_id: str, telegram_id: str) -> Optional[Group]:
+        """Find user's group by Telegram ID."""
+        row = await self.db.fetchone(
+            "SELECT * FROM groups WHERE user_id = ? AND telegram_id = ?", (user_id, telegram_id)
+        )
+        return self._row_to_group(row) if row else None
+    
+    async def list_by_user(self, user_id: str, skip: int = 0, limit: int = 100) -> List[Group]:
+        """List user's groups with pagination."""
+        rows = await self.db.fetchall(
+            "SELECT * FROM groups WHERE user_id = ? ORDER BY created_at DESC LIMIT ? OFFSET ?",
+            (user_id, limit, skip)
+        )
+        return [self._row_to_group(row) for row in rows]
+    
+    async def list_by_status(self, user_id: str, status: GroupStatus,
+                             skip: int = 0, limit: int = 100) -> List[Group]:
+        """List user's groups by status."""
+        rows = await self.db.fetchall(
+            "SELECT * FROM groups WHERE user_id = ? AND status = ? LIMIT ? OFFSET ?",
+            (user_id, status.value, limit, skip)
+        )
+        return [self._row_to_group(row) for row in rows]
+    
+    async def list_summaries(self, user_id: str, status: Optional[GroupStatus] = None,
+                             skip: int = 0, limit: int = 100) -> List[GroupSummary]:
+        """List lightweight summaries of user's groups, optionally filtered by status."""
+        where, params = "user_id = ?", [user_id]
+        if status:
+            where += " AND status = ?"
+            params.append(status.value)
+        
+        rows = await self.db.fetchall(
+            f"SELECT {SUMMARY_COLUMNS} FROM groups WHERE {where} ORDER BY created_at DESC LIMIT ? OFFSET ?",
+            params + [limit, skip]
+        )
+        return [self._row_to_summary(row) for row in rows]
+    
+    async def list_changed_since(self, user_id: str, since: Optional[datetime] = None) -> List[GroupSummary]:
+        """List summaries of user's groups updated after the given time (all when None)."""
+        where, params = "user_id = ?", [user_id]
+        if since is not None:
+            where += " AND updated_at > ?"
+            params.append(to_db_datetime(since))
+        
+        rows = await self.db.fetchall(f"SELECT {SUMMARY_COLUMNS} FROM groups WHERE {where}", params)
+        return [self._row_to_summary(row) for row in rows]
+    
+    async def load_group_set(self, user_id: str, statuses: Optional[List[GroupStatus]] = None) -> GroupSet:
+        """Load user's groups into a compact columnar working set."""
+        where, params = "user_id = ?", [user_id]
+        if statuses:
+            where += f" AND status IN ({placeholders(len(statuses))})"
+            params.extend(group_status.value for group_status in statuses)
+        
+        rows = await self.db.fetchall(
+            f"SELECT id, telegram_id, status, blacklist_until FROM groups WHERE {where}", params
+        )
+        group_set = GroupSet()
+        for row in rows:
+            group_set.append_raw(
+                row["id"],
+                row["telegram_id"],
+                STATUS_VALUE_CODES[row["status"]],
+                to_epoch(from_db_datetime(row["blacklist_until"]))
+            )
+        return group_set
+    
+    async def list_available_for_sending(self, user_id: str) -> List[Group]:
+        """List user's groups available for sending messages."""
+        await self.reactivate_expired_blacklists(user_id)
+        
+        rows = await self.db.fetchall(
+            "SELECT * FROM groups WHERE user_id = ? AND status = ?", (user_id, GroupStatus.ACTIVE.value)
+        )
+        return [self._row_to_group(row) for row in rows]
+    
+    async def reactivate_expired_blacklists(self, user_id: str) -> int:
+        """Reactivate user's temporarily blacklisted groups whose blacklist has expired.
+        
+        A temporary blacklist without a deadline counts as expired, as in
+        Group.is_available_for_sending and GroupSet.
+        """
+        now = to_db_datetime(datetime.utcnow())
+        return await self.db.execute(
+            "UPDATE groups SET status = ?, blacklist_reason = NULL, blacklist_until = NULL, updated_at = ? "
+            "WHERE user_id = ? AND status = ? AND (blacklist_until IS NULL OR blacklist_until <= ?)",
+            (GroupStatus.ACTIVE.value, now, user_id, GroupStatus.BLACKLISTED_TEMP.value, now)
+        )
+    
+    async def count_by_user(self, user_id: str) -> int:
+        """Count user's groups."""
+        row = await self.db.fetchone("SELECT COUNT(*) FROM groups WHERE user_id = ?", (user_id,))
+        return row[0]
+    
+    async def count_by_status(self, user_id: str, status: GroupStatus) -> int:
+        """Count user's groups by status."""
+        row = await self.db.fetchone(
+            "SELECT COUNT(*) FROM groups WHERE user_id = ? AND status = ?", (user_id, status.value)
+        )
+        return row[0]
+    
+    async def delete(self, user_id: str, group_id: GroupId) -> bool:
+        """Delete user's group."""
+        deleted = await self.db.execute("DELETE FROM groups WHERE id = ? AND user_id = ?", (group_id.value, user_id))
+        if deleted > 0:
+            await self._record_tombstones(user_id, [group_id.value])
+            return True
+        return False
+    
+    async def bulk_save(self, groups: List[Group]) -> None:
+        """Save multiple groups in one transaction; unchanged loaded groups are skipped.
+        
+        Like an unordered bulk write, a taken Telegram ID fails only its own
+        group; GroupWriteError is raised after the others are written.
+        """
+        statements = [(group, self._save_statement(group)) for group in groups]
+        pending = [(group, statement) for group, statement in statements if statement]
+        
+        def write(connection) -> List[int]:
+            conflicts = []
+            # A failed statement rolls back only itself, not the transaction
+            for index, (_, (sql, params)) in enumerate(pending):
+                try:
+                    connection.execute(sql, params)
+                except sqlite3.IntegrityError as e:
+                    if "telegram_id" not in str(e):
+                        raise
+                    conflicts.append(index)
+            return conflicts
+        
+        conflicts = set(await self.db.run(write)) if pending else set()
+        failed = [group for index, (group, _) in enumerate(pending) if index in conflicts]
+        failed_ids = {id(group) for group in failed}
+        for group in groups:
+            if id(group) not in failed_ids:
+                group.mark_clean()
+        
+        if failed:
+            raise GroupWriteError(failed, f"Telegram ID already exists for {len(failed)} of the groups")
+    
+    async def bulk_delete(self, user_id: str, group_ids: Optional[List[GroupId]] = None,
+                          statuses: Optional[List[GroupStatus]] = None) -> List[str]:
+        """Delete user's groups matching IDs and/or statuses."""
+        where, params = self._selection(user_id, group_ids, statuses)
+        
+        def delete(connection) -> List[str]:
+            matched_ids = [row["id"] for row in connection.execute(f"SELECT id FROM groups WHERE {where}", params)]
+            connection.execute(f"DELETE FROM groups WHERE {where}", params)
+            return matched_ids
+        
+        matched_ids = await self.db.run(delete)
+        if matched_ids:
+            await self._record_tombstones(user_id, matched_ids)
+        return matched_ids
+    
+    async def bulk_update_status(self, user_id: str, new_status: GroupStatus,
+                                 group_ids: Optional[List[GroupId]] = None,
+                                 statuses: Optional[List[GroupStatus]] = None,
+                                 blacklist_reason: Optional[BlacklistReason] = None,
+                                 blacklist_until: Optional[datetime] = None) -> List[str]:
+        """Set status of user's groups matching IDs and/or statuses."""
+        where, params = self._selection(user_id, group_ids, statuses)
+        
+        update = {"status": new_status.value, "updated_at": to_db_datetime(datetime.utcnow())}
+        if new_status == GroupStatus.ACTIVE:
+            update["blacklist_reason"] = None
+            update["blacklist_until"] = None
+        elif new_status in (GroupStatus.BLACKLISTED_TEMP, GroupStatus.BLACKLISTED_PERM):
+            update["blacklist_reason"] = blacklist_reason.value if blacklist_reason else None
+            update["blacklist_until"] = (
+                to_db_datetime(blacklist_until) if new_status == GroupStatus.BLACKLISTED_TEMP else None
+            )
+        assignments = ", ".join(f"{column} = ?" for column in update)
+        
+        def update_status(connection) -> List[str]:
+            matched_ids = [row["id"] for row in connection.execute(f"SELECT id FROM groups WHERE {where}", params)]
+            if matched_ids:
+                connection.execute(f"UPDATE groups SET {assignments} WHERE {where}", list(update.values()) + params)
+            return matched_ids
+        
+        return await self.db.run(update_status)
+    
+    def _save_statement(self, group: Group) -> Optional[Statement]:
+        """Statement writing what changed on the group, or None."""
+        row = self._group_to_row(group)
+        if group.is_new:
+            return upsert_statement("groups", row, ("id",))
+        return tracked_update_statement(
+            "groups", tracked_update(group, row), {"id": group.id.value, "user_id": group.user_id}
+        )
+    
+    def _selection(self, user_id: str, group_ids: Optional[List[GroupId]],
+                   statuses: Optional[List[GroupStatus]]) -> Tuple[str, list]:
+        """WHERE clause selecting user's groups by IDs and/or statuses."""
+        where, params = "user_id = ?", [user_id]
+        if group_ids is not None:
+            where += f" AND id IN ({placeholders(len(group_ids))})"
+            params.extend(group_id.value for group_id in group_ids)
+        if statuses:
+            where += f" AND status IN ({placeholders(len(statuses))})"
+            params.extend(group_status.value for group_status in statuses)
+        return where, params
+    
+    async def _record_tombstones(self, user_id: str, group_ids: List[str]) -> None:
+        """Record deleted groups for delta sync."""
+        deleted_at = datetime.utcnow()
+        await self.tombstones.record([
+            Tombstone(entity_type="group", entity_id=group_id, user_id=user_id, deleted_at=deleted_at)
+            for group_id in group_ids
+        ])
+    
+    def _group_to_row(self, group: Group) -> dict:
+        """Convert Group entity to table row."""
+        return {
+            "id": group.id.value,
+            "user_id": group.user_id,
+            "telegram_id": group.telegram_id,
+            "name": group.name,
+            "username": group.username,
+            "invite_link": group.invite_link,
+            "status": group.status.value,
+            "blacklist_reason": group.blacklist_reason.value if group.blacklist_reason else None,
+            "blacklist_until": to_db_datetime(group.blacklist_until),
+            "message_count": group.message_count,
+            "last_message_sent": to_db_datetime(group.last_message_sent),
+            "created_at": to_db_datetime(group.created_at),
+            "updated_at": to_db_datetime(group.updated_at)
+        }
+    
+    def _row_to_group(self, row: sqlite3.Row) -> Group:
+        """Convert table row to Group entity."""
+        group = Group(
+            id=GroupId(row["id"]),
+            user_id=row["user_id"],
+            telegram_id=row["telegram_id"],
+            name=row["name"],
+            username=row["username"],
+            invite_link=row["invite_link"],
+            status=GroupStatus(row["status"]),
+            blacklist_reason=BlacklistReason(row["blacklist_reason"]) if row["blacklist_reason"] else None,
+            blacklist_until=from_db_datetime(row["blacklist_until"]),
+            message_count=row["message_count"],
+            last_message_sent=from_db_datetime(row["last_message_sent"]),
+            created_at=from_db_datetime(row["created_at"]),
+            updated_at=from_db_datetime(row["updated_at"])
+        )
+        group.mark_clean()
+        return group
+    
+    def _row_to_summary(self, row: sqlite3.Row) -> GroupSummary:
+        """Convert projected table row to GroupSummary."""
+        return GroupSummary(
+            id=row["id"],
+            telegram_id=row["telegram_id"],
+            name=row["name"],
+            username=row["username"],
+            invite_link=row["invite_link"],
+            status=GroupStatus(row["status"]),
+            message_count=row["message_count"],
+            last_message_sent=from_db_datetime(row["last_message_sent"]),
+            created_at=from_db_datetime(row["created_at"])
+        )
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""SQLite implementation of media asset repository."""
+
+import sqlite3
+from typing import Optional
+
+from ...domain.entities.media import MediaAsset, MediaHash, MediaKind
+from ...domain.repositories.media_asset_repository import MediaAssetRepository
+from .sqlite_database import SQLiteDatabase, to_db_datetime, from_db_datetime
+
+
+class SQLiteMediaAssetRepository(MediaAssetRepository):
+    """SQLite implementation of media asset repository."""
+    
+    TABLE = "media_assets"
+    SCHEMA = [
+        """CREATE TABLE IF NOT EXISTS media_assets (
+            content_hash TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            mime_type TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            uploaded_by TEXT NOT NULL,
+            created_at TEXT
+        )""",
+        """CREATE TABLE IF NOT EXISTS media_asset_owners (
+            content_hash TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            PRIMARY KEY (content_hash, user_id)
+        ) WITHOUT ROWID""",
+    ]
+    
+    def __init__(self, database: SQLiteDatabase):
+        self.db = database
+    
+    async def save(self, asset: MediaAsset) -> MediaAsset:
+        """Insert asset unless the hash exists and link the uploader. Returns the stored asset."""
+        def save(connection) -> sqlite3.Row:
+            connection.execute(
+                "INSERT INTO media_assets (content_hash, size, mime_type, kind, uploaded_by, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (content_hash) DO NOTHING",
+                (asset.content_hash.value, asset.size, asset.mime_type, asset.kind.value,
+                 asset.uploaded_by, to_db_datetime(asset.created_at))
+            )
+            connection.execute(
+                "INSERT INTO media_asset_owners (content_hash, user_id) VALUES (?, ?) "
+                "ON CONFLICT (content_hash, user_id) DO NOTHING",
+                (asset.content_hash.value, asset.uploaded_by)
+            )
+            return connection.execute(
+                "SELECT * FROM media_assets WHERE content_hash = ?", (asset.content_hash.value,)
+            ).fetchone()
+        
+        return self._row_to_asset(await self.db.run(save))
+    
+    async def find_by_hash(self, content_hash: MediaHash) -> Optional[MediaAsset]:
+        """Find asset by content hash."""
+        row = await self.db.fetchone("SELECT * FROM media_assets WHERE content_hash = ?", (content_hash.value,))
+        return self._row_to_asset(row) if row else None
+    
+    async def find_linked(self, content_hash: MediaHash, user_id: str) -> Optional[MediaAsset]:
+        """Find asset by content hash if the user has uploaded it."""
+        row = await self.db.fetchone(
+            "SELECT * FROM media_assets WHERE content_hash = ? AND (uploaded_by = ? OR EXISTS ("
+            "SELECT 1 FROM media_asset_owners WHERE content_hash = media_assets.content_hash AND user_id = ?))",
+            (content_hash.value, user_id, user_id)
+        )
+        return self._row_to_asset(row) if row else None
+    
+    async def delete(self, content_hash: MediaHash) -> bool:
+        """Delete asset and its uploader links."""
+        def delete(connection) -> int:
+            connection.execute("DELETE FROM media_asset_owners WHERE content_hash = ?", (content_hash.value,))
+            return connection.execute(
+                "DELETE FROM media_assets WHERE content_hash = ?", (content_hash.value,)
+            ).rowcount
+        
+        return await self.db.run(delete) > 0
+    
+    def _row_to_asset(self, row: sqlite3.Row) -> MediaAsset:
+        """Convert table row to MediaAsset entity."""
+        return MediaAsset(
+            content_hash=MediaHash(row["content_hash"]),
+            size=row["size"],
+            mime_type=row["mime_type"],
+            kind=MediaKind(row["kind"]),
+            uploaded_by=row["uploaded_by"],
+            created_at=from_db_datetime(row["created_at"])
+        )
\ No newline at end of file
@@ -0,0 +1,60 @@
+"""SQLite implementation of media file reference repository."""
+
+from typing import Optional
+
+from ...domain.entities.media import MediaFileReference, MediaHash
+from ...domain.entities.telegram_session import SessionId
+from ...domain.repositories.media_file_reference_repository import MediaFileReferenceRepository
+from .sqlite_database import SQLiteDatabase, to_db_datetime, from_db_datetime
+
+
+class SQLiteMediaFileReferenceRepository(MediaFileReferenceRepository):
+    """SQLite implementation of media file reference repository."""
+    
+    TABLE = "media_file_refs"
+    SCHEMA = [
+        """CREATE TABLE IF NOT EXISTS media_file_refs (
+            content_hash TEXT NOT NULL,
+            session_id TEXT NOT NULL,
+            file_reference TEXT NOT NULL,
+            uploaded_at TEXT,
+            PRIMARY KEY (content_hash, session_id)
+        )""",
+    ]
+    
+    def __init__(self, database: SQLiteDatabase):
+        self.db = database
+    
+    async def save(self, reference: MediaFileReference) -> None:
+        """Save file reference."""
+        await self.db.execute(
+            "INSERT INTO media_file_refs (content_hash, session_id, file_reference, uploaded_at) "
+            "VALUES (?, ?, ?, ?) ON CONFLICT (content_hash, session_id) "
+            "DO UPDATE SET file_reference = excluded.file_reference, uploaded_at = excluded.uploaded_at",
+            (reference.content_hash.value, reference.session_id.value,
+             reference.file_reference, to_db_datetime(reference.uploaded_at))
+        )
+    
+    async def find(self, session_id: SessionId, content_hash: MediaHash) -> Optional[MediaFileReference]:
+        """Find file reference of an asset uploaded through a session."""
+        row = await self.db.fetchone(
+            "SELECT file_reference, uploaded_at FROM media_file_refs WHERE content_hash = ? AND session_id = ?",
+            (content_hash.value, session_id.value)
+        )
+        if not row:
+            return None
+        
+        return MediaFileReference(
+            content_hash=content_hash,
+            session_id=session_id,
+            file_reference=row["file_reference"],
+            uploaded_at=from_db_datetime(row["uploaded_at"])
+        )
+    
+    async def delete(self, session_id: SessionId, content_hash: MediaHash) -> bool:
+        """Delete file reference."""
+        deleted = await self.db.execute(
+            "DELETE FROM media_file_refs WHERE content_hash = ? AND session_id = ?",
+            (content_hash.value, session_id.value)
+        )
+        return deleted > 0
\ No newline at end of file
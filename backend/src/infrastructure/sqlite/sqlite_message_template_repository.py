@@ -0,0 +1,203 @@
+"""SQLite implementation of message template repository."""
+
+import sqlite3
+from datetime import datetime
+from typing import Optional, List
+
+from ...domain.entities.media import MediaHash
+from ...domain.entities.message_template import MessageTemplate, TemplateId, TemplateVariant
+from ...domain.entities.template_usage import TemplateUsageDelta
+from ...domain.entities.tombstone import Tombstone
+from ...domain.repositories.message_template_repository import MessageTemplateRepository, DuplicateTemplateNameError
+from ..database.tracked_updates import tracked_update
+from .sqlite_database import SQLiteDatabase, to_db_datetime, from_db_datetime, to_db_json, from_db_json
+from .sqlite_statements import upsert_statement, tracked_update_statement
+from .sqlite_tombstone_repository import SQLiteTombstoneRepository
+
+
+class SQLiteMessageTemplateRepository(MessageTemplateRepository):
+    """SQLite implementation of message template repository."""
+    
+    TABLE = "message_templates"
+    SCHEMA = [
+        """CREATE TABLE IF NOT EXISTS message_templates (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            content TEXT NOT NULL,
+            is_default INTEGER NOT NULL DEFAULT 0,
+            variables TEXT,
+            variants TEXT,
+            variant_stats TEXT,
+            media_hash TEXT,
+            usage_count INTEGER NOT NULL DEFAULT 0,
+            last_used_at TEXT,
+            created_at TEXT,
+            updated_at TEXT
+        )""",
+        "DROP INDEX IF EXISTS message_templates_name",
+        "CREATE UNIQUE INDEX IF NOT EXISTS message_templates_name_unique ON message_templates (name)",
+        "CREATE INDEX IF NOT EXISTS message_templates_is_default_partial "
+        "ON message_templates (is_default) WHERE is_default = 1",
+        "CREATE INDEX IF NOT EXISTS message_templates_updated_at ON message_templates (updated_at)",
+    ]
+    
+    def __init__(self, database: SQLiteDatabase):
+        self.db = database
+        self.tombstones = SQLiteTombstoneRepository(database)
+    
+    async def save(self, template: MessageTemplate) -> None:
+        """Save template, writing only fields changed since it was loaded.
+        
+        Usage counters are only written on insert; afterwards they are owned
+        by apply_usage so a save never overwrites concurrent increments.
+        """
+        template_row = {
+            "id": template.id.value,
+            "name": template.name,
+            "content": template.content,
+            "is_default": int(template.is_default),
+            "variables": to_db_json(template.variables),
+            "variants": to_db_json([
+                {"name": variant.name, "content": variant.content, "weight": variant.weight}
+                for variant in template.variants
+            ]),
+            "media_hash": template.media_hash.value if template.media_hash else None,
+            "created_at": to_db_datetime(template.created_at),
+            "updated_at": to_db_datetime(template.updated_at)
+        }
+        usage_row = {
+            "variant_stats": to_db_json(template.variant_stats),
+            "usage_count": template.usage_count,
+            "last_used_at": to_db_datetime(template.last_used_at)
+        }
+        
+        if template.is_new:
+            statement = upsert_statement(
+                "message_templates", {**template_row, **usage_row}, ("id",),
+                update_columns=[column for column in template_row if column != "id"]
+            )
+        else:
+            statement = tracked_update_statement(
+                "message_templates", tracked_update(template, template_row), {"id": template.id.value}
+            )
+        
+        if statement:
+            try:
+                await self.db.execute(*statement)
+            except sqlite3.IntegrityError:
+                raise DuplicateTemplateNameError()
+        template.mark_clean()
+    
+    async def find_by_id(self, template_id: TemplateId) -> Optional[MessageTemplate]:
+        """Find template by ID."""
+        row = await self.db.fetchone("SELECT * FROM message_templates WHERE id = ?", (template_id.value,))
+        return self._row_to_template(row) if row else None
+    
+    async def find_default_template(self) -> Optional[MessageTemplate]:
+        """Find default template."""
+        row = await self.db.fetchone("SELECT * FROM message_templates WHERE is_default = 1 LIMIT 1")
+        return self._row_to_template(row) if row else None
+    
+    async def find_by_name(self, name: str) -> Optional[MessageTemplate]:
+        """Find template by name."""
+        row = await self.db.fetchone("SELECT * FROM message_templates WHERE name = ? LIMIT 1", (name,))
+        return self._row_to_template(row) if row else None
+    
+    async def list_all(self) -> List[MessageTemplate]:
+        """List all templates."""
+        rows = await self.db.fetchall("SELECT * FROM message_templates")
+        return [self._row_to_template(row) for row in rows]
+    
+    async def list_changed_since(self, since: Optional[datetime] = None) -> List[MessageTemplate]:
+        """List templates updated after the given time (all when None)."""
+        if since is None:
+            return await self.list_all()
+        
+        rows = await self.db.fetchall(
+            "SELECT * FROM message_templates WHERE updated_at > ?", (to_db_datetime(since),)
+        )
+        return [self._row_to_template(row) for row in rows]
+    
+    async def apply_usage(self, deltas: List[TemplateUsageDelta]) -> None:
+        """Atomically add buffered usage counts and variant outcomes."""
+        if not deltas:
+            return
+        
+        def apply(connection) -> None:
+            for delta in deltas:
+                row = connection.execute(
+                    "SELECT variant_stats, last_used_at FROM message_templates WHERE id = ?",
+                    (delta.template_id.value,)
+                ).fetchone()
+                if row is None:
+                    continue
+                
+                # Variant stats are JSON, so they are merged here; the transaction keeps it atomic
+                variant_stats = from_db_json(row["variant_stats"], {})
+                for variant_name, outcomes in delta.variant_outcomes.items():
+                    stats = variant_stats.setdefault(variant_name, {})
+                    for counter, value in outcomes.items():
+                        if value:
+                            stats[counter] = stats.get(counter, 0) + value
+                
+                last_used_at = from_db_datetime(row["last_used_at"])
+                if delta.last_used_at is not None and (last_used_at is None or delta.last_used_at > last_used_at):
+                    last_used_at = delta.last_used_at
+                
+                connection.execute(
+                    "UPDATE message_templates SET usage_count = usage_count + ?, variant_stats = ?, last_used_at = ? "
+                    "WHERE id = ?",
+                    (delta.count, to_db_json(variant_stats), to_db_datetime(last_used_at), delta.template_id.value)
+                )
+        
+        await self.db.run(apply)
+    
+    async def delete(self, template_id: TemplateId) -> bool:
+        """Delete template."""
+        deleted = await self.db.execute("DELETE FROM message_templates WHERE id = ?", (template_id.value,))
+        if deleted == 0:
+            return False
+        
+        await self.tombstones.record([
+            Tombstone(
+                entity_type="template",
+                entity_id=template_id.value,
+                user_id=None,
+                deleted_at=datetime.utcnow()
+            )
+        ])
+        return True
+    
+    async def clear_default_flags(self) -> None:
+        """Clear all default flags."""
+        await self.db.execute(
+            "UPDATE message_templates SET is_default = 0, updated_at = ? WHERE is_default = 1",
+            (to_db_datetime(datetime.utcnow()),)
+        )
+    
+    async def count_templates(self) -> int:
+        """Count total templates."""
+        row = await self.db.fetchone("SELECT COUNT(*) FROM message_templates")
+        return row[0]
+    
+    def _row_to_template(self, row: sqlite3.Row) -> MessageTemplate:
+        """Convert table row to MessageTemplate entity."""
+        template = MessageTemplate(
+            id=TemplateId(row["id"]),
+            name=row["name"],
+            content=row["content"],
+            is_default=bool(row["is_default"]),
+            variables=from_db_json(row["variables"], {}),
+            variants=[
+                TemplateVariant(name=variant["name"], content=variant["content"], weight=variant.get("weight", 1.0))
+                for variant in from_db_json(row["variants"], [])
+            ],
+            variant_stats=from_db_json(row["variant_stats"], {}),
+            media_hash=MediaHash(row["media_hash"]) if row["media_hash"] else None,
+            usage_count=row["usage_count"],
+            last_used_at=from_db_datetime(row["last_used_at"]),
+            created_at=from_db_datetime(row["created_at"]),
+            updated_at=from_db_datetime(row["updated_at"])
+        )
+        template.mark_clean()
+        return template
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""SQL statement builders for SQLite repositories."""
+
+from typing import List, Optional, Sequence, Tuple
+
+
+Statement = Tuple[str, List]
+
+
+def placeholders(count: int) -> str:
+    """Comma-separated parameter placeholders."""
+    return ", ".join("?" * count)
+
+
+def insert_statement(table: str, row: dict) -> Statement:
+    """INSERT of a whole row."""
+    columns = list(row)
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders(len(columns))})"
+    return sql, [row[column] for column in columns]
+
+
+def upsert_statement(table: str, row: dict, key_columns: Sequence[str],
+                     update_columns: Optional[Sequence[str]] = None) -> Statement:
+    """INSERT of a whole row that updates ``update_columns`` on a key conflict.
+    
+    By default every non-key column is updated, matching an upserted
+    MongoDB ``$set`` of the whole document.
+    """
+    columns = list(row)
+    if update_columns is None:
+        update_columns = [column for column in columns if column not in key_columns]
+    
+    conflict = (
+        "DO UPDATE SET " + ", ".join(f"{column} = excluded.{column}" for column in update_columns)
+        if update_columns else "DO NOTHING"
+    )
+    sql = (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders(len(columns))}) "
+        f"ON CONFLICT ({', '.join(key_columns)}) {conflict}"
+    )
+    return sql, [row[column] for column in columns]
+
+
+def tracked_update_statement(table: str, update: dict, where: dict) -> Optional[Statement]:
+    """UPDATE applying a ``tracked_update`` (``$set`` and ``$inc``), or None when empty."""
+    assignments = []
+    params = []
+    for column, value in update.get("$set", {}).items():
+        assignments.append(f"{column} = ?")
+        params.append(value)
+    for column, amount in update.get("$inc", {}).items():
+        assignments.append(f"{column} = {column} + ?")
+        params.append(amount)
+    
+    if not assignments:
+        return None
+    
+    conditions = " AND ".join(f"{column} = ?" for column in where)
+    sql = f"UPDATE {table} SET {', '.join(assignments)} WHERE {conditions}"
+    return sql, params + list(where.values())
\ No newline at end of file
@@ -0,0 +1,214 @@
+"""SQLite implementation of telegram session repository."""
+
+import sqlite3
+from datetime import datetime
+from typing import Optional, List
+
+from ...domain.entities.telegram_session import (
+    TelegramSession, SessionId, TelegramCredentials, TelegramUser, SessionStatus
+)
+from ...domain.entities.tombstone import Tombstone
+from ...domain.read_models.session_summary import SessionSummary
+from ...domain.repositories.telegram_session_repository import TelegramSessionRepository
+from ..database.tracked_updates import tracked_update
+from .sqlite_database import SQLiteDatabase, to_db_datetime, from_db_datetime, to_db_json, from_db_json
+from .sqlite_statements import upsert_statement, tracked_update_statement
+from .sqlite_tombstone_repository import SQLiteTombstoneRepository
+
+
+# Columns serialized by session list endpoints; credentials and the
+# encrypted session blob are never loaded
+SUMMARY_COLUMNS = "id, phone_number, status, telegram_user, last_used_at, created_at"
+
+# Entity fields stored under other columns
+SESSION_FIELD_COLUMNS = {
+    "credentials": ("api_id", "api_hash")
+}
+
+
+class SQLiteTelegramSessionRepository(TelegramSessionRepository):
+    """SQLite implementation of telegram session repository."""
+    
+    TABLE = "telegram_sessions"
+    SCHEMA = [
+        """CREATE TABLE IF NOT EXISTS telegram_sessions (
+            id TEXT PRIMARY KEY,
+            user_id TEXT NOT NULL,
+            phone_number TEXT NOT NULL,
+            api_id INTEGER NOT NULL,
+            api_hash TEXT NOT NULL,
+            encrypted_session_data TEXT NOT NULL,
+            telegram_user TEXT,
+            status TEXT NOT NULL,
+            last_used_at TEXT,
+            created_at TEXT,
+            updated_at TEXT
+        )""",
+        "CREATE UNIQUE INDEX IF NOT EXISTS telegram_sessions_phone_number_unique ON telegram_sessions (phone_number)",
+        "CREATE INDEX IF NOT EXISTS telegram_sessions_user_id_updated_at ON telegram_sessions (user_id, updated_at)",
+        "CREATE INDEX IF NOT EXISTS telegram_sessions_status ON telegram_sessions (status)",
+    ]
+    
+    def __init__(self, database: SQLiteDatabase):
+        self.db = database
+        self.tombstones = SQLiteTombstoneRepository(database)
+    
+    async def save(self, session: TelegramSession) -> None:
+        """Save session, writing only fields changed since it was loaded.
+        
+        Touching a session (last_used_at) does not rewrite credentials or
+        the encrypted session blob. Raises ValueError when the phone number
+        belongs to another session.
+        """
+        row = self._session_to_row(session)
+        if session.is_new:
+            statement = upsert_statement("telegram_sessions", row, ("id",))
+        else:
+            statement = tracked_update_statement(
+                "telegram_sessions",
+                tracked_update(session, row, SESSION_FIELD_COLUMNS),
+                {"id": session.id.value}
+            )
+        
+        if statement:
+            try:
+                await self.db.execute(*statement)
+            except sqlite3.IntegrityError as e:
+                if "phone_number" not in str(e):
+                    raise
+                raise ValueError(f"Session for {session.phone_number} already exists")
+        session.mark_clean()
+    
+    async def find_by_id(self, session_id: SessionId) -> Optional[TelegramSession]:
+        """Find session by ID."""
+        row = await self.db.fetchone("SELECT * FROM telegram_sessions WHERE id = ?", (session_id.value,))
+        return self._row_to_session(row) if row else None
+    
+    async def find_by_user_id(self, user_id: str) -> List[TelegramSession]:
+        """Find sessions by user ID."""
+        rows = await self.db.fetchall("SELECT * FROM telegram_sessions WHERE user_id = ?", (user_id,))
+        return [self._row_to_session(row) for row in rows]
+    
+    async def list_summaries_by_user(self, user_id: str) -> List[SessionSummary]:
+        """List lightweight summaries of user's sessions."""
+        rows = await self.db.fetchall(
+            f"SELECT {SUMMARY_COLUMNS} FROM telegram_sessions WHERE user_id = ?", (user_id,)
+        )
+        return [self._row_to_summary(row) for row in rows]
+    
+    async def list_changed_since(self, user_id: str, since: Optional[datetime] = None) -> List[SessionSummary]:
+        """List summaries of user's sessions updated after the given time (all when None)."""
+        where, params = "user_id = ?", [user_id]
+        if since is not None:
+            where += " AND updated_at > ?"
+            params.append(to_db_datetime(since))
+        
+        rows = await self.db.fetchall(f"SELECT {SUMMARY_COLUMNS} FROM telegram_sessions WHERE {where}", params)
+        return [self._row_to_summary(row) for row in rows]
+    
+    async def find_by_phone_number(self, phone_number: str) -> Optional[TelegramSession]:
+        """Find session by phone number."""
+        row = await self.db.fetchone("SELECT * FROM telegram_sessions WHERE phone_number = ?", (phone_number,))
+        return self._row_to_session(row) if row else None
+    
+    async def list_active_sessions(self) -> List[TelegramSession]:
+        """List all active sessions."""
+        rows = await self.db.fetchall(
+            "SELECT * FROM telegram_sessions WHERE status = ?", (SessionStatus.ACTIVE.value,)
+        )
+        return [self._row_to_session(row) for row in rows]
+    
+    async def delete(self, session_id: SessionId) -> bool:
+        """Delete session."""
+        def delete(connection) -> Optional[str]:
+            row = connection.execute(
+                "SELECT user_id FROM telegram_sessions WHERE id = ?", (session_id.value,)
+            ).fetchone()
+            if row:
+                connection.execute("DELETE FROM telegram_sessions WHERE id = ?", (session_id.value,))
+            return row["user_id"] if row else None
+        
+        user_id = await self.db.run(delete)
+        if user_id is None:
+            return False
+        
+        await self.tombstones.record([
+            Tombstone(
+                entity_type="session",
+                entity_id=session_id.value,
+                user_id=user_id,
+                deleted_at=datetime.utcnow()
+            )
+        ])
+        return True
+    
+    async def count_by_user(self, user_id: str) -> int:
+        """Count sessions by user."""
+        row = await self.db.fetchone("SELECT COUNT(*) FROM telegram_sessions WHERE user_id = ?", (user_id,))
+        return row[0]
+    
+    def _session_to_row(self, session: TelegramSession) -> dict:
+        """Convert TelegramSession entity to table row."""
+        return {
+            "id": session.id.value,
+            "user_id": session.user_id,
+            "phone_number": session.phone_number,
+            "api_id": session.credentials.api_id,
+            "api_hash": session.credentials.api_hash,
+            "encrypted_session_data": session.encrypted_session_data,
+            "telegram_user": to_db_json({
+                "id": session.telegram_user.id,
+                "first_name": session.telegram_user.first_name,
+                "last_name": session.telegram_user.last_name,
+                "username": session.telegram_user.username,
+                "phone": session.telegram_user.phone
+            } if session.telegram_user else None),
+            "status": session.status.value,
+            "last_used_at": to_db_datetime(session.last_used_at),
+            "created_at": to_db_datetime(session.created_at),
+            "updated_at": to_db_datetime(session.updated_at)
+        }
+    
+    def _row_to_session(self, row: sqlite3.Row) -> TelegramSession:
+        """Convert table row to TelegramSession entity."""
+        session = TelegramSession(
+            id=SessionId(row["id"]),
+            user_id=row["user_id"],
+            phone_number=row["phone_number"],
+            credentials=TelegramCredentials(
+                api_id=row["api_id"],
+                api_hash=row["api_hash"]
+            ),
+            encrypted_session_data=row["encrypted_session_data"],
+            telegram_user=self._to_telegram_user(from_db_json(row["telegram_user"])),
+            status=SessionStatus(row["status"]),
+            last_used_at=from_db_datetime(row["last_used_at"]),
+            created_at=from_db_datetime(row["created_at"]),
+            updated_at=from_db_datetime(row["updated_at"])
+        )
+        session.mark_clean()
+        return session
+    
+    def _row_to_summary(self, row: sqlite3.Row) -> SessionSummary:
+        """Convert projected table row to SessionSummary."""
+        return SessionSummary(
+            session_id=row["id"],
+            phone_number=row["phone_number"],
+            status=SessionStatus(row["status"]),
+            telegram_user=self._to_telegram_user(from_db_json(row["telegram_user"])),
+            last_used_at=from_db_datetime(row["last_used_at"]),
+            created_at=from_db_datetime(row["created_at"])
+        )
+    
+    def _to_telegram_user(self, tu: Optional[dict]) -> Optional[TelegramUser]:
+        """Convert stored telegram_user JSON to TelegramUser."""
+        if not tu:
+            return None
+        
+        return TelegramUser(
+            id=tu["id"],
+            first_name=tu["first_name"],
+            last_name=tu.get("last_name"),
+            username=tu.get("username"),
+            phone=tu.get("phone")
+        )
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""SQLite implementation of tombstone repository."""
+
+from datetime import datetime, timedelta
+from typing import List
+
+from ...domain.entities.tombstone import Tombstone
+from ...domain.repositories.tombstone_repository import TombstoneRepository
+from ..database.mongodb_tombstone_repository import TOMBSTONE_RETENTION_SECONDS
+from .sqlite_database import SQLiteDatabase, to_db_datetime, from_db_datetime
+
+
+class SQLiteTombstoneRepository(TombstoneRepository):
+    """SQLite implementation of tombstone repository.
+    
+    Tombstones past the retention period are purged whenever new ones are
+    recorded, standing in for the MongoDB TTL index.
+    """
+    
+    TABLE = "tombstones"
+    SCHEMA = [
+        """CREATE TABLE IF NOT EXISTS tombstones (
+            entity_type TEXT NOT NULL,
+            entity_id TEXT NOT NULL,
+            user_id TEXT,
+            deleted_at TEXT NOT NULL
+        )""",
+        "CREATE INDEX IF NOT EXISTS tombstones_user_id_deleted_at ON tombstones (user_id, deleted_at)",
+        "CREATE INDEX IF NOT EXISTS tombstones_deleted_at ON tombstones (deleted_at)",
+    ]
+    
+    def __init__(self, database: SQLiteDatabase):
+        self.db = database
+    
+    async def record(self, tombstones: List[Tombstone]) -> None:
+        """Record deleted entities."""
+        if not tombstones:
+            return
+        
+        rows = [
+            (tombstone.entity_type, tombstone.entity_id, tombstone.user_id, to_db_datetime(tombstone.deleted_at))
+            for tombstone in tombstones
+        ]
+        cutoff = to_db_datetime(datetime.utcnow() - timedelta(seconds=TOMBSTONE_RETENTION_SECONDS))
+        
+        def record(connection):
+            connection.executemany(
+                "INSERT INTO tombstones (entity_type, entity_id, user_id, deleted_at) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            connection.execute("DELETE FROM tombstones WHERE deleted_at < ?", (cutoff,))
+        
+        await self.db.run(record)
+    
+    async def list_since(self, user_id: str, since: datetime) -> List[Tombstone]:
+        """List tombstones visible to user recorded after the given time."""
+        rows = await self.db.fetchall(
+            "SELECT entity_type, entity_id, user_id, deleted_at FROM tombstones "
+            "WHERE (user_id = ? OR user_id IS NULL) AND deleted_at > ?",
+            (user_id, to_db_datetime(since))
+        )
+        return [
+            Tombstone(
+                entity_type=row["entity_type"],
+                entity_id=row["entity_id"],
+                user_id=row["user_id"],
+                deleted_at=from_db_datetime(row["deleted_at"])
+            )
+            for row in rows
+        ]
\ No newline at end of file
@@ -0,0 +1,193 @@
+"""SQLite implementation of user repository."""
+
+import re
+import sqlite3
+from typing import Optional, List
+
+from ...domain.entities.user import User, UserId, SubscriptionType, UserStatus
+from ...domain.repositories.user_repository import UserRepository, DuplicateUserError
+from ..database.tracked_updates import tracked_update
+from .sqlite_database import SQLiteDatabase, to_db_datetime, from_db_datetime, to_db_json, from_db_json
+from .sqlite_statements import (
+    Statement, insert_statement, upsert_statement, tracked_update_statement
+)
+
+
+class SQLiteUserRepository(UserRepository):
+    """SQLite implementation of user repository."""
+    
+    TABLE = "users"
+    SCHEMA = [
+        """CREATE TABLE IF NOT EXISTS users (
+            id TEXT PRIMARY KEY,
+            username TEXT NOT NULL,
+            email TEXT NOT NULL,
+            password_hash TEXT NOT NULL,
+            full_name TEXT,
+            status TEXT NOT NULL,
+            is_admin INTEGER NOT NULL DEFAULT 0,
+            subscription_type TEXT NOT NULL,
+            subscription_expires TEXT,
+            api_token_hash TEXT,
+            telegram_sessions TEXT,
+            created_at TEXT,
+            updated_at TEXT
+        )""",
+        "CREATE UNIQUE INDEX IF NOT EXISTS users_username_unique ON users (username)",
+        "CREATE UNIQUE INDEX IF NOT EXISTS users_email_unique ON users (email)",
+        "CREATE UNIQUE INDEX IF NOT EXISTS users_api_token_hash_unique ON users (api_token_hash) "
+        "WHERE api_token_hash IS NOT NULL",
+        "CREATE INDEX IF NOT EXISTS users_subscription_type ON users (subscription_type)",
+    ]
+    
+    def __init__(self, database: SQLiteDatabase):
+        self.db = database
+    
+    async def create(self, user: User) -> None:
+        """Insert new user, relying on the unique indexes."""
+        await self._write(insert_statement("users", self._user_to_row(user)))
+        user.mark_clean()
+    
+    async def save(self, user: User) -> None:
+        """Save user, writing only fields changed since it was loaded.
+        
+        Only the API token hash is stored.
+        """
+        row = self._user_to_row(user)
+        if user.is_new:
+            statement = upsert_statement("users", row, ("id",))
+        else:
+            statement = tracked_update_statement("users", tracked_update(user, row), {"id": user.id.value})
+        
+        if statement:
+            await self._write(statement)
+        user.mark_clean()
+    
+    async def find_by_id(self, user_id: UserId) -> Optional[User]:
+        """Find user by ID."""
+        return await self._find_one("id", user_id.value)
+    
+    async def find_by_username(self, username: str) -> Optional[User]:
+        """Find user by username."""
+        return await self._find_one("username", username)
+    
+    async def find_by_email(self, email: str) -> Optional[User]:
+        """Find user by email."""
+        return await self._find_one("email", email)
+    
+    async def find_by_api_token(self, api_token: str) -> Optional[User]:
+        """Find user by legacy plaintext API token.
+        
+        Plaintext tokens only exist in legacy MongoDB records, so none matches here.
+        """
+        return None
+    
+    async def find_by_api_token_hash(self, api_token_hash: str) -> Optional[User]:
+        """Find user by keyed hash of API token."""
+        return await self._find_one("api_token_hash", api_token_hash)
+    
+    async def list_users(self, skip: int = 0, limit: int = 100) -> List[User]:
+        """List users with pagination."""
+        rows = await self.db.fetchall("SELECT * FROM users ORDER BY rowid LIMIT ? OFFSET ?", (limit, skip))
+        return [self._row_to_user(row) for row in rows]
+    
+    async def count_by_subscription_type(self, subscription_type: SubscriptionType) -> int:
+        """Count users by subscription type."""
+        row = await self.db.fetchone(
+            "SELECT COUNT(*) FROM users WHERE subscription_type = ?", (subscription_type.value,)
+        )
+        return row[0]
+    
+    async def delete(self, user_id: UserId) -> bool:
+        """Delete user."""
+        return await self.db.execute("DELETE FROM users WHERE id = ?", (user_id.value,)) > 0
+    
+    async def exists_username(self, username: str) -> bool:
+        """Check if username exists."""
+        return await self.db.fetchone("SELECT 1 FROM users WHERE username = ?", (username,)) is not None
+    
+    async def exists_email(self, email: str) -> bool:
+        """Check if email exists."""
+        return await self.db.fetchone("SELECT 1 FROM users WHERE email = ?", (email,)) is not None
+    
+    async def next_available_username(self, base: str) -> str:
+        """Find a free username with one range query over users_username_unique."""
+        # "base_" up to (excluding) "base`", the next character after "_"
+        rows = await self.db.fetchall(
+            "SELECT username FROM users WHERE username = ? OR (username >= ? AND username < ?)",
+            (base, f"{base}_", f"{base}`")
+        )
+        
+        matcher = re.compile(f"^{re.escape(base)}(?:_([0-9]+))?$")
+        base_taken = False
+        highest_suffix = 0
+        for row in rows:
+            match = matcher.match(row["username"])
+            if not match:
+                continue
+            if match.group(1) is None:
+                base_taken = True
+            else:
+                highest_suffix = max(highest_suffix, int(match.group(1)))
+        
+        if not base_taken:
+            return base
+        return f"{base}_{highest_suffix + 1}"
+    
+    async def _find_one(self, column: str, value: str) -> Optional[User]:
+        """Find user by an indexed column."""
+        row = await self.db.fetchone(f"SELECT * FROM users WHERE {column} = ?", (value,))
+        return self._row_to_user(row) if row else None
+    
+    async def _write(self, statement: Statement) -> None:
+        """Run write statement, translating unique index violations."""
+        try:
+            await self.db.execute(*statement)
+        except sqlite3.IntegrityError as e:
+            raise DuplicateUserError(self._duplicate_field(e))
+    
+    def _duplicate_field(self, error: sqlite3.IntegrityError) -> str:
+        """Name of the unique field an integrity error was raised for."""
+        message = str(error)
+        for field in ("username", "email"):
+            if f"users.{field}" in message:
+                return field
+        return "user"
+    
+    def _user_to_row(self, user: User) -> dict:
+        """Convert User entity to table row."""
+        return {
+            "id": user.id.value,
+            "username": user.username,
+            "email": user.email,
+            "password_hash": user.password_hash,
+            "full_name": user.full_name,
+            "status": user.status.value,
+            "is_admin": int(user.is_admin),
+            "subscription_type": user.subscription_type.value,
+            "subscription_expires": to_db_datetime(user.subscription_expires),
+            "api_token_hash": user.api_token_hash,
+            "telegram_sessions": to_db_json(user.telegram_sessions),
+            "created_at": to_db_datetime(user.created_at),
+            "updated_at": to_db_datetime(user.updated_at)
+        }
+    
+    def _row_to_user(self, row: sqlite3.Row) -> User:
+        """Convert table row to User entity."""
+        user = User(
+            id=UserId(row["id"]),
+            username=row["username"],
+            email=row["email"],
+            password_hash=row["password_hash"],
+            full_name=row["full_name"],
+            status=UserStatus(row["status"]),
+            is_admin=bool(row["is_admin"]),
+            subscription_type=SubscriptionType(row["subscription_type"]),
+            subscription_expires=from_db_datetime(row["subscription_expires"]),
+            api_token_hash=row["api_token_hash"],
+            telegram_sessions=from_db_json(row["telegram_sessions"], []),
+            created_at=from_db_datetime(row["created_at"]),
+            updated_at=from_db_datetime(row["updated_at"])
+        )
+        user.mark_clean()
+        return user
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Authentication API routes."""
 
 import os
+import secrets
 import httpx
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Request
@@ -13,11 +14,15 @@ from ....application.use_cases.auth.login_user import LoginUserUseCase, LoginUse
 from ....domain.entities.user import User
 from ....domain.repositories.user_repository import UserRepository
 from ....domain.services.authentication_service import AuthenticationService
-from ..dependencies import get_user_repository, get_authentication_service, get_current_active_user
+from ....domain.services.password_hasher import PasswordHasherBusyError
+from ..dependencies import get_user_repository, get_authentication_service, get_current_active_user, get_http_client
 
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+EMERGENT_SESSION_DATA_URL = "https://demobackend.emergentagent.com/auth/v1/env/oauth/session-data"
+USERNAME_ALLOCATION_ATTEMPTS = 3
+
 
 # Request/Response Models
 class RegisterRequest(BaseModel):
@@ -81,6 +86,8 @@ async def register_user(
         return TokenResponse(**result)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except PasswordHasherBusyError:
+        raise _busy_error()
 
 
 @router.post("/login", response_model=TokenResponse)
@@ -101,6 +108,8 @@ async def login_user(
         return TokenResponse(**result)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+    except PasswordHasherBusyError:
+        raise _busy_error()
 
 
 @router.get("/me", response_model=UserResponse)
@@ -126,13 +135,10 @@ async def refresh_api_token(
     user_repository: UserRepository = Depends(get_user_repository),
     auth_service: AuthenticationService = Depends(get_authentication_service)
 ):
-    """Refresh user's API token."""
-    # Generate new API token
-    new_token = auth_service.generate_api_token()
-    current_user.api_token = new_token
-    current_user.updated_at = current_user.updated_at  # This will be set in the entity
+    """Rotate user's API token. The previous token stops working immediately."""
+    new_token = auth_service.issue_api_token(current_user)
     
-    # Save updated user
+    # Saving through the cached repository also evicts the old token hash
     await user_repository.save(current_user)
     
     return {"api_token": new_token}
@@ -143,84 +149,99 @@ async def emergent_auth_callback(
     request: EmergentAuthRequest,
     response: Response,
     user_repository: UserRepository = Depends(get_user_repository),
-    auth_service: AuthenticationService = Depends(get_authentication_service)
+    auth_service: AuthenticationService = Depends(get_authentication_service),
+    http_client: httpx.AsyncClient = Depends(get_http_client)
 ):
     """Handle Emergent authentication callback."""
+    # Call Emergent auth API to get user data
     try:
-        # Call Emergent auth API to get user data
-        async with httpx.AsyncClient() as client:
-            emergent_response = await client.get(
-                "https://demobackend.emergentagent.com/auth/v1/env/oauth/session-data",
-                headers={"X-Session-ID": request.session_id}
-            )
-            
-            if emergent_response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid session ID"
-                )
-            
-            user_data = EmergentUserData(**emergent_response.json())
-        
-        # Check if user exists by email
-        existing_user = await user_repository.find_by_email(user_data.email)
-        
-        if existing_user:
-            # User exists, generate JWT token
-            jwt_token = auth_service.create_access_token(data={"sub": existing_user.username})
-            user_response = {
-                "id": existing_user.id.value,
-                "username": existing_user.username,
-                "email": existing_user.email,
-                "full_name": existing_user.full_name,
-                "subscription_type": existing_user.subscription_type.value,
-                "subscription_active": existing_user.is_subscription_active(),
-                "api_token": existing_user.api_token,
-                "is_admin": existing_user.is_admin
-            }
-        else:
-            # Create new user
-            # Extract username from email (before @)
-            username = user_data.email.split('@')[0]
-            
-            # Make sure username is unique
-            counter = 1
-            original_username = username
-            while await user_repository.find_by_username(username):
-                username = f"{original_username}_{counter}"
-                counter += 1
-            
-            register_command = RegisterUserCommand(
-                username=username,
-                email=user_data.email,
-                password="emergent_auth",  # This won't be used for auth
-                full_name=user_data.name
-            )
-            
-            register_use_case = RegisterUserUseCase(user_repository, auth_service)
-            result = await register_use_case.execute(register_command)
-            user_response = result["user"]
-            jwt_token = result["access_token"]
-        
-        # Set session token as HttpOnly cookie
-        response.set_cookie(
-            key="session_token",
-            value=user_data.session_token,
-            max_age=7 * 24 * 60 * 60,  # 7 days
-            httponly=True,
-            secure=True,
-            samesite="none",
-            path="/"
+        emergent_response = await http_client.get(
+            EMERGENT_SESSION_DATA_URL,
+            headers={"X-Session-ID": request.session_id}
         )
-        
-        return TokenResponse(
-            access_token=jwt_token,
-            token_type="bearer",
-            user=user_response
+    except httpx.HTTPError as e:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Authentication provider unavailable: {type(e).__name__}"
         )
-        
-    except Exception as e:
+    
+    if emergent_response.status_code != 200:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Authentication failed: {str(e)}"
-        )
\ No newline at end of file
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid session ID"
+        )
+    
+    user_data = EmergentUserData(**emergent_response.json())
+    
+    # Check if user exists by email
+    existing_user = await user_repository.find_by_email(user_data.email)
+    
+    if existing_user:
+        # User exists, generate JWT token
+        jwt_token = auth_service.create_access_token(existing_user)
+        user_response = {
+            "id": existing_user.id.value,
+            "username": existing_user.username,
+            "email": existing_user.email,
+            "full_name": existing_user.full_name,
+            "subscription_type": existing_user.subscription_type.value,
+            "subscription_active": existing_user.is_subscription_active(),
+            "api_token": existing_user.api_token,
+            "is_admin": existing_user.is_admin
+        }
+    else:
+        result = await _register_emergent_user(user_data, user_repository, auth_service)
+        user_response = result["user"]
+        jwt_token = result["access_token"]
+    
+    # Set session token as HttpOnly cookie
+    response.set_cookie(
+        key="session_token",
+        value=user_data.session_token,
+        max_age=7 * 24 * 60 * 60,  # 7 days
+        httponly=True,
+        secure=True,
+        samesite="none",
+        path="/"
+    )
+    
+    return TokenResponse(
+        access_token=jwt_token,
+        token_type="bearer",
+        user=user_response
+    )
+
+
+async def _register_emergent_user(user_data: EmergentUserData, user_repository: UserRepository,
+                                  auth_service: AuthenticationService) -> dict:
+    """Register user signing in through Emergent for the first time."""
+    # Extract username from email (before @)
+    base_username = user_data.email.split('@')[0]
+    register_use_case = RegisterUserUseCase(user_repository, auth_service)
+    
+    # A concurrent signup can take the allocated name first; allocate again then
+    for _ in range(USERNAME_ALLOCATION_ATTEMPTS):
+        register_command = RegisterUserCommand(
+            username=await user_repository.next_available_username(base_username),
+            email=user_data.email,
+            password=secrets.token_urlsafe(32),  # Never used: these users sign in through Emergent
+            full_name=user_data.name
+        )
+        try:
+            return await register_use_case.execute(register_command)
+        except ValueError as e:
+            if str(e) != "Username already exists":
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        except PasswordHasherBusyError:
+            raise _busy_error()
+    
+    raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Could not allocate a username")
+
+
+def _busy_error() -> HTTPException:
+    """503 returned while the password hashing queue is full."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication is busy, please retry",
+        headers={"Retry-After": "1"}
+    )
\ No newline at end of file
@@ -1,16 +1,18 @@
 """Group management API routes."""
 
-from typing import List
+from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from pydantic import BaseModel
 
 from ....application.use_cases.groups.add_group import AddGroupUseCase, AddGroupCommand
 from ....application.use_cases.groups.bulk_add_groups import BulkAddGroupsUseCase, BulkAddGroupsCommand
+from ....application.use_cases.groups.bulk_update_groups import BulkGroupActionUseCase, BulkGroupActionCommand
 from ....domain.entities.user import User
 from ....domain.entities.group import GroupId, GroupStatus
+from ....domain.read_models.group_summary import GroupSummary
 from ....domain.repositories.group_repository import GroupRepository
 from ....domain.services.telegram_service import TelegramService
-from ..dependencies import get_current_active_user, get_telegram_service
+from ..dependencies import get_current_active_user, get_telegram_service, get_group_repository
 
 
 router = APIRouter(prefix="/groups", tags=["Groups"])
@@ -27,6 +29,23 @@ class BulkAddGroupsRequest(BaseModel):
     identifiers: List[str]
 
 
+class BulkGroupSelectionRequest(BaseModel):
+    group_ids: Optional[List[str]] = None
+    status_filter: Optional[str] = None
+
+
+class BulkBlacklistRequest(BulkGroupSelectionRequest):
+    reason: str
+    duration_seconds: Optional[int] = None
+
+
+class BulkGroupActionResponse(BaseModel):
+    action: str
+    matched: int
+    results: List[dict]
+    results_truncated: bool = False
+
+
 class GroupResponse(BaseModel):
     id: str
     telegram_id: str
@@ -47,43 +66,47 @@ class GroupStatsResponse(BaseModel):
     perm_blacklisted: int
 
 
-# This would need proper GroupRepository implementation
-# For now, using placeholder dependency
-def get_group_repository():
-    # Placeholder - would be implemented similar to other repositories
-    raise NotImplementedError("GroupRepository not yet implemented in this refactored version")
+def _summary_to_response(group: GroupSummary) -> GroupResponse:
+    """Convert group summary to API response."""
+    return GroupResponse(
+        id=group.id,
+        telegram_id=group.telegram_id,
+        name=group.name,
+        username=group.username,
+        invite_link=group.invite_link,
+        status=group.status.value,
+        message_count=group.message_count,
+        last_message_sent=group.last_message_sent.isoformat() if group.last_message_sent else None,
+        created_at=group.created_at.isoformat()
+    )
 
 
 @router.post("/single", response_model=GroupResponse, status_code=status.HTTP_201_CREATED)
 async def add_single_group(
     request: AddGroupRequest,
     current_user: User = Depends(get_current_active_user),
-    # group_repository: GroupRepository = Depends(get_group_repository),
+    group_repository: GroupRepository = Depends(get_group_repository),
     telegram_service: TelegramService = Depends(get_telegram_service)
 ):
     """Add single group."""
     # Check user subscription limits
-    # This would need to be implemented with proper GroupRepository
-    # For now, returning placeholder response
+    current_groups = await group_repository.count_by_user(current_user.id.value)
+    if not current_user.can_add_groups(current_groups):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Group limit exceeded for your subscription"
+        )
     
-    # use_case = AddGroupUseCase(group_repository, telegram_service)
-    # command = AddGroupCommand(
-    #     session_id=request.session_id,
-    #     identifier=request.identifier
-    # )
+    use_case = AddGroupUseCase(group_repository, telegram_service)
+    command = AddGroupCommand(
+        user_id=current_user.id.value,
+        session_id=request.session_id,
+        identifier=request.identifier
+    )
     
     try:
-        # result = await use_case.execute(command)
-        # return GroupResponse(**result)
-        
-        # Placeholder response
-        return GroupResponse(
-            id="placeholder-id",
-            telegram_id="placeholder-telegram-id",
-            name="Placeholder Group",
-            status="active",
-            created_at="2025-01-01T00:00:00Z"
-        )
+        result = await use_case.execute(command)
+        return GroupResponse(**result)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -92,94 +115,160 @@ async def add_single_group(
 async def add_bulk_groups(
     request: BulkAddGroupsRequest,
     current_user: User = Depends(get_current_active_user),
-    # group_repository: GroupRepository = Depends(get_group_repository),
+    group_repository: GroupRepository = Depends(get_group_repository),
     telegram_service: TelegramService = Depends(get_telegram_service)
 ):
     """Add multiple groups."""
     # Check user subscription limits
-    if not current_user.can_add_groups(0):  # Would get actual count from repository
+    current_groups = await group_repository.count_by_user(current_user.id.value)
+    if not current_user.can_add_groups(current_groups):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Group limit exceeded for your subscription"
         )
     
-    # use_case = BulkAddGroupsUseCase(group_repository, telegram_service)
-    # command = BulkAddGroupsCommand(
-    #     session_id=request.session_id,
-    #     identifiers=request.identifiers
-    # )
+    use_case = BulkAddGroupsUseCase(group_repository, telegram_service)
+    command = BulkAddGroupsCommand(
+        user_id=current_user.id.value,
+        session_id=request.session_id,
+        identifiers=request.identifiers
+    )
     
     try:
-        # result = await use_case.execute(command)
-        # return result
-        
-        # Placeholder response
-        return {
-            "added": [],
-            "skipped": [],
-            "errors": []
-        }
+        result = await use_case.execute(command)
+        return result
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+async def _run_bulk_action(
+    action: str,
+    request: BulkGroupSelectionRequest,
+    current_user: User,
+    group_repository: GroupRepository,
+    blacklist_reason: Optional[str] = None,
+    duration_seconds: Optional[int] = None
+) -> BulkGroupActionResponse:
+    """Execute a bulk group action for the current user."""
+    use_case = BulkGroupActionUseCase(group_repository)
+    command = BulkGroupActionCommand(
+        user_id=current_user.id.value,
+        action=action,
+        group_ids=request.group_ids,
+        status_filter=request.status_filter,
+        blacklist_reason=blacklist_reason,
+        duration_seconds=duration_seconds
+    )
+    
+    try:
+        result = await use_case.execute(command)
+        return BulkGroupActionResponse(**result)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post("/bulk/delete", response_model=BulkGroupActionResponse)
+async def bulk_delete_groups(
+    request: BulkGroupSelectionRequest,
+    current_user: User = Depends(get_current_active_user),
+    group_repository: GroupRepository = Depends(get_group_repository)
+):
+    """Delete groups by IDs or status filter."""
+    return await _run_bulk_action("delete", request, current_user, group_repository)
+
+
+@router.post("/bulk/activate", response_model=BulkGroupActionResponse)
+async def bulk_activate_groups(
+    request: BulkGroupSelectionRequest,
+    current_user: User = Depends(get_current_active_user),
+    group_repository: GroupRepository = Depends(get_group_repository)
+):
+    """Activate groups by IDs or status filter."""
+    return await _run_bulk_action("activate", request, current_user, group_repository)
+
+
+@router.post("/bulk/deactivate", response_model=BulkGroupActionResponse)
+async def bulk_deactivate_groups(
+    request: BulkGroupSelectionRequest,
+    current_user: User = Depends(get_current_active_user),
+    group_repository: GroupRepository = Depends(get_group_repository)
+):
+    """Deactivate groups by IDs or status filter."""
+    return await _run_bulk_action("deactivate", request, current_user, group_repository)
+
+
+@router.post("/bulk/blacklist", response_model=BulkGroupActionResponse)
+async def bulk_blacklist_groups(
+    request: BulkBlacklistRequest,
+    current_user: User = Depends(get_current_active_user),
+    group_repository: GroupRepository = Depends(get_group_repository)
+):
+    """Blacklist groups temporarily (with duration) or permanently."""
+    return await _run_bulk_action(
+        "blacklist", request, current_user, group_repository,
+        blacklist_reason=request.reason,
+        duration_seconds=request.duration_seconds
+    )
+
+
+@router.post("/bulk/unblacklist", response_model=BulkGroupActionResponse)
+async def bulk_unblacklist_groups(
+    request: BulkGroupSelectionRequest,
+    current_user: User = Depends(get_current_active_user),
+    group_repository: GroupRepository = Depends(get_group_repository)
+):
+    """Clear blacklist of groups by IDs or status filter."""
+    return await _run_bulk_action("unblacklist", request, current_user, group_repository)
+
+
 @router.get("", response_model=List[GroupResponse])
 async def get_groups(
     status_filter: str = Query(None, description="Filter by status"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     current_user: User = Depends(get_current_active_user),
-    # group_repository: GroupRepository = Depends(get_group_repository)
+    group_repository: GroupRepository = Depends(get_group_repository)
 ):
     """Get user's groups with optional filtering."""
     try:
-        # if status_filter:
-        #     groups = await group_repository.list_by_status(GroupStatus(status_filter))
-        # else:
-        #     groups = await group_repository.list_all()
-        
-        # Placeholder response
-        return []
-        
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+        group_status = GroupStatus(status_filter) if status_filter else None
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid status filter")
+    
+    groups = await group_repository.list_summaries(current_user.id.value, group_status, skip, limit)
+    return [_summary_to_response(group) for group in groups]
 
 
 @router.get("/stats", response_model=GroupStatsResponse)
 async def get_group_stats(
     current_user: User = Depends(get_current_active_user),
-    # group_repository: GroupRepository = Depends(get_group_repository)
+    group_repository: GroupRepository = Depends(get_group_repository)
 ):
     """Get group statistics."""
-    try:
-        # stats would be calculated from repository
-        # For now, returning placeholder
-        return GroupStatsResponse(
-            total=0,
-            active=0,
-            inactive=0,
-            temp_blacklisted=0,
-            perm_blacklisted=0
-        )
-        
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    user_id = current_user.id.value
+    await group_repository.reactivate_expired_blacklists(user_id)
+    
+    active = await group_repository.count_by_status(user_id, GroupStatus.ACTIVE)
+    inactive = await group_repository.count_by_status(user_id, GroupStatus.INACTIVE)
+    temp_blacklisted = await group_repository.count_by_status(user_id, GroupStatus.BLACKLISTED_TEMP)
+    perm_blacklisted = await group_repository.count_by_status(user_id, GroupStatus.BLACKLISTED_PERM)
+    
+    return GroupStatsResponse(
+        total=active + inactive + temp_blacklisted + perm_blacklisted,
+        active=active,
+        inactive=inactive,
+        temp_blacklisted=temp_blacklisted,
+        perm_blacklisted=perm_blacklisted
+    )
 
 
 @router.delete("/{group_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_group(
     group_id: str,
     current_user: User = Depends(get_current_active_user),
-    # group_repository: GroupRepository = Depends(get_group_repository)
+    group_repository: GroupRepository = Depends(get_group_repository)
 ):
     """Delete group."""
-    try:
-        # success = await group_repository.delete(GroupId(group_id))
-        # if not success:
-        #     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Group not found")
-        
-        # Placeholder - would implement actual deletion
-        pass
-        
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
\ No newline at end of file
+    success = await group_repository.delete(current_user.id.value, GroupId(group_id))
+    if not success:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Group not found")
\ No newline at end of file
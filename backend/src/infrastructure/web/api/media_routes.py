@@ -0,0 +1,111 @@
+"""Media API routes."""
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from ....domain.entities.user import User
+from ....domain.entities.media import MediaAsset, MediaHash, MediaNotFoundError, MediaTooLargeError
+from ....domain.services.media_service import MediaService
+from ..dependencies import get_current_active_user, get_media_service, get_settings
+
+
+router = APIRouter(prefix="/media", tags=["Media"])
+
+
+# Request/Response Models
+class MediaResponse(BaseModel):
+    content_hash: str
+    size: int
+    mime_type: str
+    kind: str
+    created_at: str
+
+
+@router.post("", response_model=MediaResponse, status_code=status.HTTP_201_CREATED)
+async def upload_media(
+    request: Request,
+    current_user: User = Depends(get_current_active_user),
+    media_service: MediaService = Depends(get_media_service)
+):
+    """Upload media as the raw request body.
+    
+    The body is streamed to storage and hashed on the way, so it is never
+    held in memory; identical content is stored once and returns the same
+    hash. The Content-Type header sets the media type.
+    """
+    mime_type = request.headers.get("content-type", "application/octet-stream").split(";")[0].strip()
+    
+    try:
+        asset = await media_service.store_upload(
+            user_id=current_user.id.value,
+            chunks=request.stream(),
+            mime_type=mime_type,
+            max_size=get_settings()["media_max_bytes"]
+        )
+    except MediaTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+    except MediaNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    
+    return _asset_to_response(asset)
+
+
+@router.get("/{content_hash}/info", response_model=MediaResponse)
+async def get_media_info(
+    content_hash: str,
+    current_user: User = Depends(get_current_active_user),
+    media_service: MediaService = Depends(get_media_service)
+):
+    """Get media metadata; lets clients skip uploading content they already stored."""
+    asset = await _get_asset(media_service, content_hash, current_user)
+    return _asset_to_response(asset)
+
+
+@router.get("/{content_hash}")
+async def download_media(
+    content_hash: str,
+    current_user: User = Depends(get_current_active_user),
+    media_service: MediaService = Depends(get_media_service)
+):
+    """Stream media contents."""
+    asset = await _get_asset(media_service, content_hash, current_user)
+    
+    return StreamingResponse(
+        media_service.open(asset.content_hash),
+        media_type=asset.mime_type,
+        headers={
+            "Content-Length": str(asset.size),
+            "ETag": f'"{asset.content_hash.value}"',
+            # Content-addressed: the bytes behind a hash never change
+            "Cache-Control": "private, max-age=31536000, immutable"
+        }
+    )
+
+
+async def _get_asset(media_service: MediaService, content_hash: str, user: User) -> MediaAsset:
+    """Load asset the user uploaded (any asset for admins) or raise 400/404.
+    
+    Media of other users is reported as missing, not forbidden, so hashes
+    cannot be probed for existence.
+    """
+    try:
+        media_hash = MediaHash(content_hash)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    asset = await media_service.get_asset(media_hash, None if user.is_admin else user.id.value)
+    if not asset:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Media not found")
+    return asset
+
+
+def _asset_to_response(asset: MediaAsset) -> MediaResponse:
+    """Convert MediaAsset to API response."""
+    return MediaResponse(
+        content_hash=asset.content_hash.value,
+        size=asset.size,
+        mime_type=asset.mime_type,
+        kind=asset.kind.value,
+        created_at=asset.created_at.isoformat()
+    )
\ No newline at end of file
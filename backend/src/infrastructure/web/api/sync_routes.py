@@ -0,0 +1,38 @@
+"""Delta sync API routes."""
+
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+
+from ....application.use_cases.sync.get_changes import GetChangesUseCase, GetChangesCommand
+from ....domain.entities.user import User
+from ....domain.repositories.group_repository import GroupRepository
+from ....domain.repositories.telegram_session_repository import TelegramSessionRepository
+from ....domain.repositories.message_template_repository import MessageTemplateRepository
+from ....domain.repositories.tombstone_repository import TombstoneRepository
+from ..dependencies import (
+    get_current_active_user, get_group_repository, get_telegram_session_repository,
+    get_message_template_repository, get_tombstone_repository
+)
+
+
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+
+@router.get("", response_model=dict)
+async def get_changes(
+    since: Optional[str] = Query(None, description="Watermark returned by the previous sync"),
+    current_user: User = Depends(get_current_active_user),
+    group_repository: GroupRepository = Depends(get_group_repository),
+    session_repository: TelegramSessionRepository = Depends(get_telegram_session_repository),
+    template_repository: MessageTemplateRepository = Depends(get_message_template_repository),
+    tombstone_repository: TombstoneRepository = Depends(get_tombstone_repository)
+):
+    """Get groups, sessions and templates changed since the watermark."""
+    try:
+        since_dt = datetime.fromisoformat(since) if since else None
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid watermark")
+    
+    use_case = GetChangesUseCase(group_repository, session_repository, template_repository, tombstone_repository)
+    return await use_case.execute(GetChangesCommand(user_id=current_user.id.value, since=since_dt))
\ No newline at end of file
@@ -86,24 +86,25 @@ async def authenticate_telegram_session(
 @router.get("/sessions", response_model=list[SessionResponse])
 async def get_user_sessions(
     current_user: User = Depends(get_current_active_user),
-    session_repository: TelegramSessionRepository = Depends(get_telegram_session_repository),
-    telegram_service: TelegramService = Depends(get_telegram_service)
+    session_repository: TelegramSessionRepository = Depends(get_telegram_session_repository)
 ):
     """Get all user's Telegram sessions."""
-    sessions = await session_repository.find_by_user_id(current_user.id.value)
-    
-    session_responses = []
-    for session in sessions:
-        session_info = await telegram_service.get_session_info(session.id)
-        if session_info:
-            session_responses.append(SessionResponse(
-                session_id=session_info["session_id"],
-                phone_number=session_info["phone_number"],
-                is_authenticated=session_info["is_authenticated"],
-                telegram_user=session_info["telegram_user"]
-            ))
+    sessions = await session_repository.list_summaries_by_user(current_user.id.value)
     
-    return session_responses
+    return [
+        SessionResponse(
+            session_id=session.session_id,
+            phone_number=session.phone_number,
+            is_authenticated=session.is_authenticated,
+            telegram_user={
+                "id": session.telegram_user.id,
+                "first_name": session.telegram_user.first_name,
+                "last_name": session.telegram_user.last_name,
+                "username": session.telegram_user.username
+            } if session.telegram_user else None
+        )
+        for session in sessions
+    ]
 
 
 @router.get("/sessions/{session_id}", response_model=SessionResponse)
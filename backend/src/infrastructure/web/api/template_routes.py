@@ -0,0 +1,192 @@
+"""Message template API routes."""
+
+from typing import Dict, Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import BaseModel
+
+from ....application.use_cases.templates.create_template import CreateTemplateUseCase, CreateTemplateCommand
+from ....application.use_cases.templates.update_template import UpdateTemplateUseCase, UpdateTemplateCommand
+from ....application.use_cases.templates.set_default_template import (
+    SetDefaultTemplateUseCase, SetDefaultTemplateCommand
+)
+from ....application.use_cases.templates.template_dto import template_to_dict
+from ....domain.entities.user import User
+from ....domain.entities.message_template import TemplateId
+from ....domain.repositories.media_asset_repository import MediaAssetRepository
+from ....domain.repositories.message_template_repository import MessageTemplateRepository
+from ..dependencies import (
+    get_current_active_user, get_admin_user, get_message_template_repository, get_media_asset_repository
+)
+
+
+router = APIRouter(prefix="/templates", tags=["Templates"])
+
+
+# Request/Response Models
+class TemplateVariantModel(BaseModel):
+    name: str
+    content: str
+    weight: float = 1.0
+
+
+class CreateTemplateRequest(BaseModel):
+    name: str
+    content: str
+    variables: Optional[Dict[str, Any]] = None
+    is_default: bool = False
+    variants: Optional[List[TemplateVariantModel]] = None
+    media_hash: Optional[str] = None
+
+
+class UpdateTemplateRequest(BaseModel):
+    name: str
+    content: str
+    variables: Optional[Dict[str, Any]] = None
+    variants: Optional[List[TemplateVariantModel]] = None
+    media_hash: Optional[str] = None  # Omit to keep, "" to detach
+
+
+class TemplateResponse(BaseModel):
+    id: str
+    name: str
+    content: str
+    is_default: bool
+    variables: Dict[str, Any]
+    variants: List[TemplateVariantModel] = []
+    variant_stats: Dict[str, Dict[str, int]] = {}
+    media_hash: str | None = None
+    missing_variables: List[str]
+    unused_variables: List[str]
+    usage_count: int = 0
+    last_used_at: str | None = None
+    created_at: str
+    updated_at: str
+
+
+@router.get("", response_model=List[TemplateResponse])
+async def list_templates(
+    current_user: User = Depends(get_current_active_user),
+    template_repository: MessageTemplateRepository = Depends(get_message_template_repository)
+):
+    """List all templates."""
+    templates = await template_repository.list_all()
+    return [TemplateResponse(**template_to_dict(template)) for template in templates]
+
+
+@router.post("", response_model=TemplateResponse, status_code=status.HTTP_201_CREATED)
+async def create_template(
+    request: CreateTemplateRequest,
+    current_user: User = Depends(get_admin_user),
+    template_repository: MessageTemplateRepository = Depends(get_message_template_repository),
+    media_repository: MediaAssetRepository = Depends(get_media_asset_repository)
+):
+    """Create new template."""
+    use_case = CreateTemplateUseCase(template_repository, media_repository)
+    command = CreateTemplateCommand(
+        name=request.name,
+        content=request.content,
+        variables=request.variables,
+        is_default=request.is_default,
+        variants=_variants_to_dicts(request.variants),
+        media_hash=request.media_hash
+    )
+    
+    try:
+        result = await use_case.execute(command)
+        return TemplateResponse(**result)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/default", response_model=TemplateResponse)
+async def get_default_template(
+    current_user: User = Depends(get_current_active_user),
+    template_repository: MessageTemplateRepository = Depends(get_message_template_repository)
+):
+    """Get default template."""
+    template = await template_repository.find_default_template()
+    
+    if not template:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No default template")
+    
+    return TemplateResponse(**template_to_dict(template))
+
+
+@router.get("/{template_id}", response_model=TemplateResponse)
+async def get_template(
+    template_id: str,
+    current_user: User = Depends(get_current_active_user),
+    template_repository: MessageTemplateRepository = Depends(get_message_template_repository)
+):
+    """Get template by ID."""
+    template = await template_repository.find_by_id(TemplateId(template_id))
+    
+    if not template:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Template not found")
+    
+    return TemplateResponse(**template_to_dict(template))
+
+
+@router.put("/{template_id}", response_model=TemplateResponse)
+async def update_template(
+    template_id: str,
+    request: UpdateTemplateRequest,
+    current_user: User = Depends(get_admin_user),
+    template_repository: MessageTemplateRepository = Depends(get_message_template_repository),
+    media_repository: MediaAssetRepository = Depends(get_media_asset_repository)
+):
+    """Update template."""
+    use_case = UpdateTemplateUseCase(template_repository, media_repository)
+    command = UpdateTemplateCommand(
+        template_id=template_id,
+        name=request.name,
+        content=request.content,
+        variables=request.variables,
+        variants=_variants_to_dicts(request.variants),
+        media_hash=request.media_hash
+    )
+    
+    try:
+        result = await use_case.execute(command)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    if not result:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Template not found")
+    
+    return TemplateResponse(**result)
+
+
+@router.post("/{template_id}/default", response_model=TemplateResponse)
+async def set_default_template(
+    template_id: str,
+    current_user: User = Depends(get_admin_user),
+    template_repository: MessageTemplateRepository = Depends(get_message_template_repository)
+):
+    """Mark template as the default."""
+    use_case = SetDefaultTemplateUseCase(template_repository)
+    result = await use_case.execute(SetDefaultTemplateCommand(template_id=template_id))
+    
+    if not result:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Template not found")
+    
+    return TemplateResponse(**result)
+
+
+@router.delete("/{template_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_template(
+    template_id: str,
+    current_user: User = Depends(get_admin_user),
+    template_repository: MessageTemplateRepository = Depends(get_message_template_repository)
+):
+    """Delete template."""
+    success = await template_repository.delete(TemplateId(template_id))
+    if not success:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Template not found")
+
+
+def _variants_to_dicts(variants: Optional[List[TemplateVariantModel]]) -> Optional[List[Dict[str, Any]]]:
+    """Convert request variant models to plain dicts for use case commands."""
+    if variants is None:
+        return None
+    return [variant.model_dump() for variant in variants]
\ No newline at end of file
@@ -1,9 +1,14 @@
-"""FastAPI dependencies for dependency injection."""
+"""FastAPI dependencies for dependency injection.
 
-import os
-from functools import lru_cache
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from fastapi import Depends, HTTPException, status
+Application-scoped objects live in the Container built at startup; these
+accessors only look them up, so resolving a dependency allocates nothing.
+"""
+
+from typing import Optional
+
+import httpx
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from ...domain.entities.user import User
@@ -11,81 +16,92 @@ from ...domain.repositories.user_repository import UserRepository
 from ...domain.repositories.telegram_session_repository import TelegramSessionRepository
 from ...domain.repositories.group_repository import GroupRepository
 from ...domain.repositories.message_template_repository import MessageTemplateRepository
-from ...domain.services.authentication_service import AuthenticationService
+from ...domain.repositories.tombstone_repository import TombstoneRepository
+from ...domain.repositories.media_asset_repository import MediaAssetRepository
+from ...domain.services.authentication_service import AuthenticationService, API_TOKEN_PREFIX
 from ...domain.services.telegram_service import TelegramService
-from ...infrastructure.database.mongodb_user_repository import MongoDBUserRepository
-from ...infrastructure.database.mongodb_telegram_session_repository import MongoDBTelegramSessionRepository
+from ...domain.services.media_service import MediaService
+from ...infrastructure.container import Container, get_settings
+from ...infrastructure.buffering.template_usage_buffer import TemplateUsageBuffer
 
 
 # Security
 security = HTTPBearer()
 
-# Global database instance
-_db_client = None
-_database = None
-
 
-@lru_cache()
-def get_settings():
-    """Get application settings."""
-    return {
-        "mongo_url": os.environ.get("MONGO_URL"),
-        "db_name": os.environ.get("DB_NAME", "telegram_auto_sender"),
-        "jwt_secret": os.environ.get("JWT_SECRET", "your-secret-key"),
-        "jwt_algorithm": "HS256"
-    }
+# Accessors are async so FastAPI calls them inline instead of in a threadpool
+async def get_container(request: Request) -> Container:
+    """Get the application container."""
+    return request.app.state.container
 
 
-async def get_database() -> AsyncIOMotorDatabase:
-    """Get MongoDB database instance."""
-    global _db_client, _database
-    
-    if _database is None:
-        settings = get_settings()
-        _db_client = AsyncIOMotorClient(settings["mongo_url"])
-        _database = _db_client[settings["db_name"]]
-    
-    return _database
+async def get_database(request: Request) -> Optional[AsyncIOMotorDatabase]:
+    """Get MongoDB database instance (None with in-memory storage)."""
+    return request.app.state.container.database
 
 
-async def get_user_repository(db: AsyncIOMotorDatabase = Depends(get_database)) -> UserRepository:
+async def get_user_repository(request: Request) -> UserRepository:
     """Get user repository instance."""
-    return MongoDBUserRepository(db)
+    return request.app.state.container.user_repository
 
 
-async def get_telegram_session_repository(db: AsyncIOMotorDatabase = Depends(get_database)) -> TelegramSessionRepository:
+async def get_telegram_session_repository(request: Request) -> TelegramSessionRepository:
     """Get telegram session repository instance."""
-    return MongoDBTelegramSessionRepository(db)
+    return request.app.state.container.telegram_session_repository
+
+
+async def get_group_repository(request: Request) -> GroupRepository:
+    """Get group repository instance."""
+    return request.app.state.container.group_repository
+
+
+async def get_message_template_repository(request: Request) -> MessageTemplateRepository:
+    """Get message template repository instance."""
+    return request.app.state.container.message_template_repository
+
+
+async def get_template_usage_buffer(request: Request) -> TemplateUsageBuffer:
+    """Get the application-wide template usage buffer."""
+    return request.app.state.container.template_usage_buffer
 
 
-async def get_authentication_service(
-    user_repository: UserRepository = Depends(get_user_repository)
-) -> AuthenticationService:
+async def get_media_asset_repository(request: Request) -> MediaAssetRepository:
+    """Get media asset repository instance."""
+    return request.app.state.container.media_asset_repository
+
+
+async def get_media_service(request: Request) -> MediaService:
+    """Get the application-wide media service."""
+    return request.app.state.container.media_service
+
+
+async def get_tombstone_repository(request: Request) -> TombstoneRepository:
+    """Get tombstone repository instance."""
+    return request.app.state.container.tombstone_repository
+
+
+async def get_http_client(request: Request) -> httpx.AsyncClient:
+    """Get the application-wide pooled HTTP client for outbound calls."""
+    return request.app.state.container.http_client
+
+
+async def get_authentication_service(request: Request) -> AuthenticationService:
     """Get authentication service instance."""
-    settings = get_settings()
-    return AuthenticationService(
-        user_repository=user_repository,
-        jwt_secret=settings["jwt_secret"],
-        jwt_algorithm=settings["jwt_algorithm"]
-    )
+    return request.app.state.container.authentication_service
 
 
-async def get_telegram_service(
-    session_repository: TelegramSessionRepository = Depends(get_telegram_session_repository)
-) -> TelegramService:
+async def get_telegram_service(request: Request) -> TelegramService:
     """Get telegram service instance."""
-    return TelegramService(session_repository)
+    return request.app.state.container.telegram_service
 
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     auth_service: AuthenticationService = Depends(get_authentication_service)
 ) -> User:
-    """Get current authenticated user."""
+    """Get current authenticated user from a JWT or a ``tk_`` API token."""
     try:
-        token = credentials.credentials
-        user = await auth_service.authenticate_by_token(token)
-        return user
+        return await _authenticate(auth_service, credentials.credentials)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -128,8 +144,13 @@ async def get_optional_current_user(
         return None
     
     try:
-        token = credentials.credentials
-        user = await auth_service.authenticate_by_token(token)
-        return user
+        return await _authenticate(auth_service, credentials.credentials)
     except Exception:
-        return None
\ No newline at end of file
+        return None
+
+
+async def _authenticate(auth_service: AuthenticationService, token: str) -> User:
+    """Authenticate bearer token: API tokens for machine clients, JWTs otherwise."""
+    if token.startswith(API_TOKEN_PREFIX):
+        return await auth_service.authenticate_by_api_token(token)
+    return await auth_service.authenticate_by_token(token)
\ No newline at end of file
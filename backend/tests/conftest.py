@@ -0,0 +1,89 @@
+"""Shared fixtures: one set of repositories per storage backend."""
+
+import os
+import uuid
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from src.infrastructure.database.indexes import ensure_indexes
+from src.infrastructure.database.mongodb_group_repository import MongoDBGroupRepository
+from src.infrastructure.database.mongodb_media_asset_repository import MongoDBMediaAssetRepository
+from src.infrastructure.database.mongodb_media_file_reference_repository import (
+    MongoDBMediaFileReferenceRepository
+)
+from src.infrastructure.database.mongodb_message_template_repository import MongoDBMessageTemplateRepository
+from src.infrastructure.database.mongodb_telegram_session_repository import MongoDBTelegramSessionRepository
+from src.infrastructure.database.mongodb_tombstone_repository import MongoDBTombstoneRepository
+from src.infrastructure.database.mongodb_user_repository import MongoDBUserRepository
+from src.infrastructure.container import Storage
+from src.infrastructure.memory.memory_group_repository import InMemoryGroupRepository
+from src.infrastructure.memory.memory_media_asset_repository import InMemoryMediaAssetRepository
+from src.infrastructure.memory.memory_media_file_reference_repository import InMemoryMediaFileReferenceRepository
+from src.infrastructure.memory.memory_message_template_repository import InMemoryMessageTemplateRepository
+from src.infrastructure.memory.memory_telegram_session_repository import InMemoryTelegramSessionRepository
+from src.infrastructure.memory.memory_tombstone_repository import InMemoryTombstoneRepository
+from src.infrastructure.memory.memory_user_repository import InMemoryUserRepository
+from src.infrastructure.sqlite.schema import ensure_schema
+from src.infrastructure.sqlite.sqlite_database import SQLiteDatabase
+from src.infrastructure.sqlite.sqlite_group_repository import SQLiteGroupRepository
+from src.infrastructure.sqlite.sqlite_media_asset_repository import SQLiteMediaAssetRepository
+from src.infrastructure.sqlite.sqlite_media_file_reference_repository import SQLiteMediaFileReferenceRepository
+from src.infrastructure.sqlite.sqlite_message_template_repository import SQLiteMessageTemplateRepository
+from src.infrastructure.sqlite.sqlite_telegram_session_repository import SQLiteTelegramSessionRepository
+from src.infrastructure.sqlite.sqlite_tombstone_repository import SQLiteTombstoneRepository
+from src.infrastructure.sqlite.sqlite_user_repository import SQLiteUserRepository
+
+# MongoDB scenarios run only against a server named here, e.g. mongodb://localhost:27017
+TEST_MONGO_URL = os.environ.get("TEST_MONGO_URL")
+
+
+@pytest.fixture(params=["memory", "sqlite", "mongodb"])
+async def storage(request, tmp_path):
+    """Uncached repositories of each storage backend, on empty data."""
+    if request.param == "memory":
+        tombstones = InMemoryTombstoneRepository()
+        yield Storage(
+            users=InMemoryUserRepository(),
+            telegram_sessions=InMemoryTelegramSessionRepository(tombstones),
+            groups=InMemoryGroupRepository(tombstones),
+            message_templates=InMemoryMessageTemplateRepository(tombstones),
+            tombstones=tombstones,
+            media_assets=InMemoryMediaAssetRepository(),
+            media_file_references=InMemoryMediaFileReferenceRepository()
+        )
+    elif request.param == "sqlite":
+        database = SQLiteDatabase(str(tmp_path / "test.db"))
+        await ensure_schema(database)
+        yield Storage(
+            users=SQLiteUserRepository(database),
+            telegram_sessions=SQLiteTelegramSessionRepository(database),
+            groups=SQLiteGroupRepository(database),
+            message_templates=SQLiteMessageTemplateRepository(database),
+            tombstones=SQLiteTombstoneRepository(database),
+            media_assets=SQLiteMediaAssetRepository(database),
+            media_file_references=SQLiteMediaFileReferenceRepository(database)
+        )
+        await database.close()
+    else:
+        if not TEST_MONGO_URL:
+            pytest.skip("TEST_MONGO_URL is not set")
+        client = AsyncIOMotorClient(TEST_MONGO_URL, serverSelectionTimeoutMS=2000)
+        database = client[f"test_{uuid.uuid4().hex}"]
+        yield await _mongo_storage(database)
+        await client.drop_database(database.name)
+        client.close()
+
+
+async def _mongo_storage(database) -> Storage:
+    """Repositories on a fresh MongoDB database with its indexes created."""
+    await ensure_indexes(database)
+    return Storage(
+        users=MongoDBUserRepository(database),
+        telegram_sessions=MongoDBTelegramSessionRepository(database),
+        groups=MongoDBGroupRepository(database),
+        message_templates=MongoDBMessageTemplateRepository(database),
+        tombstones=MongoDBTombstoneRepository(database),
+        media_assets=MongoDBMediaAssetRepository(database),
+        media_file_references=MongoDBMediaFileReferenceRepository(database)
+    )
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""Tests for password login and the metrics endpoint guard."""
+
+import pytest
+from starlette.requests import Request
+
+import main
+from src.infrastructure.container import get_settings
+from src.domain.entities.user import User, UserId
+from src.domain.services.authentication_service import AuthenticationService, AuthenticationError
+from src.infrastructure.memory.memory_user_repository import InMemoryUserRepository
+from src.infrastructure.security.bcrypt_password_hasher import BcryptPasswordHasher
+
+
+class CountingHasher(BcryptPasswordHasher):
+    """Bcrypt hasher recording every verified hash."""
+    
+    def __init__(self):
+        super().__init__(rounds=4)
+        self.verified = []
+    
+    async def verify(self, password: str, password_hash: str) -> bool:
+        """Record and verify."""
+        self.verified.append(password_hash)
+        return await super().verify(password, password_hash)
+
+
+@pytest.fixture
+async def auth():
+    """Authentication service with one registered user."""
+    hasher = CountingHasher()
+    users = InMemoryUserRepository()
+    await users.create(User(
+        id=UserId("u1"), username="alice", email="alice@example.com",
+        password_hash=await hasher.hash("correct horse"), full_name="Alice"
+    ))
+    yield AuthenticationService(users, hasher, jwt_secret="test-secret")
+    hasher.close()
+
+
+async def test_unknown_user_still_verifies_a_password(auth):
+    """Unknown usernames cost a bcrypt verify, like wrong passwords do."""
+    with pytest.raises(AuthenticationError, match="Invalid username or password"):
+        await auth.authenticate_user("mallory", "guess")
+    with pytest.raises(AuthenticationError, match="Invalid username or password"):
+        await auth.authenticate_user("alice", "guess")
+    
+    dummy_hash, real_hash = auth.password_hasher.verified
+    assert dummy_hash.startswith("$2b$04$")
+    assert real_hash.startswith("$2b$04$")
+
+
+async def test_dummy_hash_is_computed_once(auth):
+    """The dummy hash is reused across unknown-user logins."""
+    for _ in range(2):
+        with pytest.raises(AuthenticationError):
+            await auth.authenticate_user("mallory", "guess")
+    
+    first, second = auth.password_hasher.verified
+    assert first == second
+
+
+async def test_known_user_logs_in(auth):
+    """A correct password still authenticates."""
+    user = await auth.authenticate_user("alice", "correct horse")
+    assert user.id.value == "u1"
+
+
+@pytest.fixture
+def metrics_token(monkeypatch):
+    """Set METRICS_TOKEN (None to unset) and reload settings."""
+    def configure(value):
+        if value is None:
+            monkeypatch.delenv("METRICS_TOKEN", raising=False)
+        else:
+            monkeypatch.setenv("METRICS_TOKEN", value)
+        get_settings.cache_clear()
+    
+    yield configure
+    get_settings.cache_clear()
+
+
+def metrics_request(authorization=None):
+    """Bare GET /metrics request."""
+    headers = [(b"authorization", authorization.encode())] if authorization else []
+    return Request({"type": "http", "method": "GET", "path": "/metrics", "headers": headers})
+
+
+async def test_metrics_disabled_without_token(metrics_token):
+    """Without METRICS_TOKEN the endpoint does not exist."""
+    metrics_token(None)
+    response = await main.metrics(metrics_request("Bearer anything"))
+    assert response.status_code == 404
+
+
+async def test_metrics_require_token(metrics_token):
+    """Scrapers must present METRICS_TOKEN as bearer token."""
+    metrics_token("scrape-me")
+    
+    assert (await main.metrics(metrics_request())).status_code == 401
+    assert (await main.metrics(metrics_request("Bearer wrong"))).status_code == 401
+    
+    response = await main.metrics(metrics_request("Bearer scrape-me"))
+    assert response.status_code == 200
+    assert b"password_hash_seconds" in response.body
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""Tests for bulk group mutations."""
+
+import pytest
+
+from src.application.use_cases.groups import bulk_update_groups
+from src.application.use_cases.groups.bulk_update_groups import BulkGroupActionUseCase, BulkGroupActionCommand
+from src.domain.entities.group import Group, GroupId, GroupStatus
+
+
+async def _store_groups(storage, count):
+    """Store ``count`` active groups for user u1."""
+    await storage.groups.bulk_save([
+        Group(id=GroupId(f"g{index}"), user_id="u1", telegram_id=str(index), name=f"group {index}")
+        for index in range(count)
+    ])
+
+
+async def test_blacklist_with_duration_is_temporary(storage):
+    """A positive duration sets a temporary blacklist with a deadline."""
+    await _store_groups(storage, 2)
+    
+    result = await BulkGroupActionUseCase(storage.groups).execute(BulkGroupActionCommand(
+        user_id="u1", action="blacklist", group_ids=["g0", "missing"],
+        blacklist_reason="flood_wait", duration_seconds=60
+    ))
+    
+    assert result["matched"] == 1
+    assert result["results"] == [
+        {"group_id": "g0", "outcome": "updated"},
+        {"group_id": "missing", "outcome": "not_matched"},
+    ]
+    group = await storage.groups.find_by_id("u1", GroupId("g0"))
+    assert group.status == GroupStatus.BLACKLISTED_TEMP
+    assert group.blacklist_until is not None
+
+
+@pytest.mark.parametrize("duration_seconds", [0, -5])
+async def test_blacklist_rejects_non_positive_duration(storage, duration_seconds):
+    """Zero or negative durations are rejected instead of meaning permanent."""
+    await _store_groups(storage, 1)
+    
+    with pytest.raises(ValueError, match="must be positive"):
+        await BulkGroupActionUseCase(storage.groups).execute(BulkGroupActionCommand(
+            user_id="u1", action="blacklist", group_ids=["g0"],
+            blacklist_reason="flood_wait", duration_seconds=duration_seconds
+        ))
+    
+    group = await storage.groups.find_by_id("u1", GroupId("g0"))
+    assert group.status == GroupStatus.ACTIVE
+
+
+async def test_filter_only_results_are_capped(storage, monkeypatch):
+    """A status filter matching many groups lists a bounded number of outcomes."""
+    monkeypatch.setattr(bulk_update_groups, "MAX_BULK_RESULTS", 3)
+    await _store_groups(storage, 5)
+    
+    result = await BulkGroupActionUseCase(storage.groups).execute(BulkGroupActionCommand(
+        user_id="u1", action="deactivate", status_filter="active"
+    ))
+    
+    assert result["matched"] == 5
+    assert len(result["results"]) == 3
+    assert result["results_truncated"] is True
+    assert await storage.groups.count_by_user("u1") == 5
\ No newline at end of file
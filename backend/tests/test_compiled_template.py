@@ -0,0 +1,107 @@
+"""Tests for template content parsing and rendering."""
+
+import math
+import time
+
+import pytest
+
+from src.domain.entities.compiled_template import (
+    CompiledTemplate, MAX_NESTING_DEPTH, TemplateSyntaxError
+)
+from src.domain.entities.message_template import TemplateVariant
+
+
+def render_all(content: str, seeds: int = 64, **variables) -> set:
+    """Collect the distinct renders of content over several seeds."""
+    compiled = CompiledTemplate(content)
+    return {compiled.render(variables, seed) for seed in range(seeds)}
+
+
+def test_plain_text_renders_verbatim():
+    """Content without braces renders unchanged."""
+    assert render_all("Hello world") == {"Hello world"}
+
+
+def test_variable_uses_default_and_override():
+    """Variables fall back to template defaults unless overridden."""
+    compiled = CompiledTemplate("Hi {name}!", {"name": "there"})
+    assert compiled.render() == "Hi there!"
+    assert compiled.render({"name": "Ann"}) == "Hi Ann!"
+    assert compiled.missing_variables == []
+
+
+def test_missing_variable_keeps_placeholder():
+    """An unknown variable keeps its placeholder and is reported missing."""
+    compiled = CompiledTemplate("Hi {name}")
+    assert compiled.render() == "Hi {name}"
+    assert compiled.missing_variables == ["name"]
+
+
+def test_spintax_picks_each_option():
+    """Every spintax option is picked for some seed."""
+    assert render_all("{a|b|c}") == {"a", "b", "c"}
+
+
+def test_nested_spintax_with_variable():
+    """Nested options may contain variables."""
+    assert render_all("{x {name}|y}", name="Ann") == {"x Ann", "y"}
+
+
+def test_unbalanced_braces_are_literals():
+    """Braces without a partner are kept as text."""
+    assert render_all("{a") == {"{a"}
+    assert render_all("a}") == {"a}"}
+    assert render_all("}{") == {"}{"}
+    assert render_all("{{a|b}") == {"{a", "{b"}
+    assert render_all("{a|b}}") == {"a}", "b}"}
+
+
+def test_empty_group_is_literal():
+    """Empty or blank groups are kept as text."""
+    assert render_all("{}") == {"{}"}
+    assert render_all("{ }") == {"{ }"}
+
+
+def test_unclosed_braces_parse_in_linear_time():
+    """Many unclosed braces do not make parsing backtrack."""
+    started = time.perf_counter()
+    compiled = CompiledTemplate("{" * 40 + "x")
+    assert time.perf_counter() - started < 1
+    assert compiled.render() == "{" * 40 + "x"
+    
+    long_content = "{" * 4000 + "x"
+    assert CompiledTemplate(long_content).render() == long_content
+
+
+def test_nesting_up_to_limit_is_accepted():
+    """Spintax nested exactly MAX_NESTING_DEPTH deep compiles."""
+    content = "{a|" * (MAX_NESTING_DEPTH - 1) + "{name}" + "}" * (MAX_NESTING_DEPTH - 1)
+    assert CompiledTemplate(content).variable_names == ["name"]
+
+
+def test_nesting_beyond_limit_is_rejected():
+    """Deeper spintax raises TemplateSyntaxError."""
+    content = "{a|" * (MAX_NESTING_DEPTH + 1) + "x" + "}" * (MAX_NESTING_DEPTH + 1)
+    with pytest.raises(TemplateSyntaxError):
+        CompiledTemplate(content)
+
+
+def test_deep_nesting_does_not_overflow_the_stack():
+    """Very deep nesting is rejected, not a RecursionError."""
+    with pytest.raises(ValueError):
+        CompiledTemplate("{a|" * 1500 + "x" + "}" * 1500)
+
+
+def test_variants_are_picked_by_weight():
+    """Variants are picked in proportion to their weights."""
+    variants = [TemplateVariant("a", "A", 1.0), TemplateVariant("b", "B", 3.0)]
+    compiled = CompiledTemplate("", variants=variants)
+    picks = [compiled.render_variant(seed=seed)[0] for seed in range(2000)]
+    assert 0.65 < picks.count("b") / len(picks) < 0.85
+
+
+@pytest.mark.parametrize("weight", [0, -1, math.nan, math.inf, -math.inf])
+def test_variant_weight_must_be_positive_and_finite(weight):
+    """Zero, negative, NaN and infinite weights are rejected."""
+    with pytest.raises(ValueError):
+        TemplateVariant("a", "A", weight)
\ No newline at end of file
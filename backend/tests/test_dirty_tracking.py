@@ -0,0 +1,107 @@
+"""Round-trip tests for change-tracked saves on every storage backend."""
+
+from src.domain.entities.group import Group, GroupId
+from src.domain.entities.user import User, UserId
+from src.infrastructure.database.tracked_updates import tracked_update
+
+
+def _group() -> Group:
+    """New active group of user u1."""
+    return Group(id=GroupId("g1"), user_id="u1", telegram_id="1", name="before")
+
+
+def _user() -> User:
+    """New user without sessions."""
+    return User(id=UserId("u1"), username="alice", email="alice@example.com",
+                password_hash="hash", full_name="Alice")
+
+
+async def test_loaded_entity_saves_its_changes(storage):
+    """Load, mutate and save writes the changed fields back."""
+    await storage.groups.save(_group())
+    
+    group = await storage.groups.find_by_id("u1", GroupId("g1"))
+    group.update_info("after", "after_username")
+    await storage.groups.save(group)
+    
+    reloaded = await storage.groups.find_by_id("u1", GroupId("g1"))
+    assert (reloaded.name, reloaded.username) == ("after", "after_username")
+    assert reloaded.pending_changes() == (set(), {})
+
+
+async def test_in_place_list_mutation_is_saved(storage):
+    """Appending to a loaded list is written because the entity flags it."""
+    await storage.users.create(_user())
+    
+    user = await storage.users.find_by_id(UserId("u1"))
+    user.add_telegram_session("s1")
+    await storage.users.save(user)
+    
+    user = await storage.users.find_by_id(UserId("u1"))
+    assert user.telegram_sessions == ["s1"]
+    user.remove_telegram_session("s1")
+    await storage.users.save(user)
+    
+    assert (await storage.users.find_by_id(UserId("u1"))).telegram_sessions == []
+
+
+async def test_counter_increments_from_stale_copies_add_up(storage):
+    """Two copies incrementing the same counter both count, and other fields survive."""
+    await storage.groups.save(_group())
+    first = await storage.groups.find_by_id("u1", GroupId("g1"))
+    second = await storage.groups.find_by_id("u1", GroupId("g1"))
+    
+    first.record_message_sent()
+    first.record_message_sent()
+    second.record_message_sent()
+    second.update_info("renamed")
+    await storage.groups.save(first)
+    await storage.groups.save(second)
+    
+    reloaded = await storage.groups.find_by_id("u1", GroupId("g1"))
+    assert reloaded.message_count == 3
+    assert reloaded.name == "renamed"
+
+
+async def test_bulk_save_merges_increments_per_entity(storage):
+    """bulk_save applies each entity's own increments."""
+    await storage.groups.bulk_save([
+        _group(),
+        Group(id=GroupId("g2"), user_id="u1", telegram_id="2", name="other"),
+    ])
+    groups = [
+        await storage.groups.find_by_id("u1", GroupId("g1")),
+        await storage.groups.find_by_id("u1", GroupId("g2")),
+    ]
+    groups[0].record_message_sent()
+    groups[0].record_message_sent()
+    groups[1].record_message_sent()
+    await storage.groups.bulk_save(groups)
+    
+    counts = [(await storage.groups.find_by_id("u1", GroupId(group_id))).message_count for group_id in ("g1", "g2")]
+    assert counts == [2, 1]
+
+
+def test_tracked_update_is_minimal():
+    """Loaded entities $set only assigned fields and $inc counters; unchanged ones write nothing."""
+    group = _group()
+    group.mark_clean()
+    doc = {"name": "before", "message_count": 0, "last_message_sent": None, "updated_at": None}
+    
+    assert tracked_update(group, doc) == {}
+    
+    group.increment("message_count")
+    group.increment("message_count")
+    group.name = "after"
+    update = tracked_update(group, {**doc, "name": "after"})
+    assert update == {"$set": {"name": "after"}, "$inc": {"message_count": 2}}
+
+
+def test_assigned_counter_is_not_incremented():
+    """A counter that was also assigned is written as a value, not an increment."""
+    group = _group()
+    group.mark_clean()
+    group.increment("message_count")
+    group.message_count = 10
+    
+    assert group.pending_changes() == ({"message_count"}, {})
\ No newline at end of file
@@ -0,0 +1,35 @@
+"""Tests for the delta sync use case."""
+
+from datetime import datetime, timedelta, timezone
+
+from src.application.use_cases.sync.get_changes import GetChangesCommand, GetChangesUseCase
+from src.infrastructure.memory.memory_group_repository import InMemoryGroupRepository
+from src.infrastructure.memory.memory_message_template_repository import InMemoryMessageTemplateRepository
+from src.infrastructure.memory.memory_telegram_session_repository import InMemoryTelegramSessionRepository
+from src.infrastructure.memory.memory_tombstone_repository import InMemoryTombstoneRepository
+
+
+def test_aware_watermark_is_converted_to_naive_utc():
+    """An offset-aware watermark becomes the same instant in naive UTC."""
+    since = datetime(2024, 5, 1, 14, 30, tzinfo=timezone(timedelta(hours=2)))
+    assert GetChangesCommand(user_id="u1", since=since).since == datetime(2024, 5, 1, 12, 30)
+
+
+def test_naive_watermark_is_kept():
+    """Naive watermarks are already UTC and stay as given."""
+    since = datetime(2024, 5, 1, 12, 30)
+    assert GetChangesCommand(user_id="u1", since=since).since == since
+
+
+async def test_sync_accepts_aware_watermark():
+    """An aware watermark is compared with stored naive datetimes without error."""
+    tombstones = InMemoryTombstoneRepository()
+    use_case = GetChangesUseCase(
+        InMemoryGroupRepository(tombstones), InMemoryTelegramSessionRepository(tombstones),
+        InMemoryMessageTemplateRepository(tombstones), tombstones
+    )
+    since = datetime.now(timezone.utc) - timedelta(minutes=1)
+    
+    result = await use_case.execute(GetChangesCommand(user_id="u1", since=since))
+    
+    assert result["full"] is False
\ No newline at end of file
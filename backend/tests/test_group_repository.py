@@ -0,0 +1,130 @@
+"""Group repository contract tests shared by every storage backend."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+from src.domain.entities.group import Group, GroupId, GroupStatus
+from src.domain.repositories.group_repository import GroupWriteError
+from src.infrastructure.database.mongodb_group_repository import MongoDBGroupRepository
+
+
+def _group(group_id: str, telegram_id: str) -> Group:
+    """New group of user u1."""
+    return Group(id=GroupId(group_id), user_id="u1", telegram_id=telegram_id, name=group_id)
+
+
+async def test_find_by_ids_keeps_order_and_skips_missing(storage):
+    """Groups come back in the requested order, scoped to the owner."""
+    await storage.groups.bulk_save([_group("g1", "100"), _group("g2", "200"), _group("g3", "300")])
+    await storage.groups.save(Group(id=GroupId("other"), user_id="u2", telegram_id="100", name="other"))
+    
+    groups = await storage.groups.find_by_ids(
+        "u1", [GroupId("g3"), GroupId("missing"), GroupId("g1"), GroupId("other"), GroupId("g3")]
+    )
+    
+    assert [group.id.value for group in groups] == ["g3", "g1"]
+    assert all(not group.is_new for group in groups)
+    assert await storage.groups.find_by_ids("u1", []) == []
+
+
+async def test_reactivate_expired_blacklists_includes_missing_deadline(storage):
+    """Expired and deadline-less temporary blacklists are reactivated; pending ones stay."""
+    now = datetime.utcnow()
+    await storage.groups.bulk_save([
+        Group(id=GroupId("expired"), user_id="u1", telegram_id="1", name="expired",
+              status=GroupStatus.BLACKLISTED_TEMP, blacklist_until=now - timedelta(minutes=1)),
+        Group(id=GroupId("no_deadline"), user_id="u1", telegram_id="2", name="no_deadline",
+              status=GroupStatus.BLACKLISTED_TEMP),
+        Group(id=GroupId("pending"), user_id="u1", telegram_id="3", name="pending",
+              status=GroupStatus.BLACKLISTED_TEMP, blacklist_until=now + timedelta(hours=1)),
+        Group(id=GroupId("banned"), user_id="u1", telegram_id="4", name="banned",
+              status=GroupStatus.BLACKLISTED_PERM),
+    ])
+    
+    assert await storage.groups.reactivate_expired_blacklists("u1") == 2
+    
+    statuses = {
+        group.id.value: group.status
+        for group in await storage.groups.find_by_ids(
+            "u1", [GroupId(group_id) for group_id in ("expired", "no_deadline", "pending", "banned")]
+        )
+    }
+    assert statuses == {
+        "expired": GroupStatus.ACTIVE,
+        "no_deadline": GroupStatus.ACTIVE,
+        "pending": GroupStatus.BLACKLISTED_TEMP,
+        "banned": GroupStatus.BLACKLISTED_PERM,
+    }
+
+
+async def test_save_rejects_taken_telegram_id(storage):
+    """A second group with the same Telegram ID is a ValueError."""
+    await storage.groups.save(_group("g1", "100"))
+    
+    with pytest.raises(ValueError):
+        await storage.groups.save(_group("g2", "100"))
+    
+    assert await storage.groups.find_by_id("u1", GroupId("g2")) is None
+
+
+async def test_bulk_save_writes_others_and_names_conflicts(storage):
+    """A conflict fails only its own group, which stays unsaved and dirty."""
+    await storage.groups.save(_group("g1", "100"))
+    groups = [_group("g2", "200"), _group("g3", "100"), _group("g4", "400")]
+    
+    with pytest.raises(GroupWriteError) as error:
+        await storage.groups.bulk_save(groups)
+    
+    assert [group.id.value for group in error.value.failed] == ["g3"]
+    assert await storage.groups.find_by_id("u1", GroupId("g3")) is None
+    assert await storage.groups.count_by_user("u1") == 3
+    assert [group.is_new for group in groups] == [False, True, False]
+
+
+async def test_bulk_save_keeps_changes_of_failed_loaded_group(storage):
+    """A loaded group whose update conflicts keeps its pending changes for a retry."""
+    await storage.groups.bulk_save([_group("g1", "100"), _group("g2", "200")])
+    first = await storage.groups.find_by_id("u1", GroupId("g1"))
+    second = await storage.groups.find_by_id("u1", GroupId("g2"))
+    first.update_info("renamed")
+    second.telegram_id = "100"
+    
+    with pytest.raises(GroupWriteError) as error:
+        await storage.groups.bulk_save([first, second])
+    
+    assert error.value.failed == [second]
+    assert second.pending_changes()[0] == {"telegram_id"}
+    assert first.pending_changes() == (set(), {})
+    assert (await storage.groups.find_by_id("u1", GroupId("g1"))).name == "renamed"
+    assert (await storage.groups.find_by_id("u1", GroupId("g2"))).telegram_id == "200"
+
+
+class FailingCollection:
+    """Collection whose bulk writes fail for the given operation indexes."""
+    
+    def __init__(self, failed_indexes):
+        self.failed_indexes = failed_indexes
+        self.operations = []
+    
+    async def bulk_write(self, operations, ordered=True):
+        self.operations = operations
+        raise BulkWriteError({"writeErrors": [{"index": index, "code": 11000} for index in self.failed_indexes]})
+
+
+async def test_mongo_bulk_write_error_maps_to_written_groups():
+    """Write error indexes count only groups that produced an operation."""
+    repository = MongoDBGroupRepository.__new__(MongoDBGroupRepository)
+    repository.collection = FailingCollection([1])
+    unchanged = _group("g0", "0")
+    unchanged.mark_clean()
+    groups = [unchanged, _group("g1", "1"), _group("g2", "2")]
+    
+    with pytest.raises(GroupWriteError) as error:
+        await repository.bulk_save(groups)
+    
+    assert len(repository.collection.operations) == 2
+    assert error.value.failed == [groups[2]]
+    assert groups[1].is_new is False
+    assert groups[2].is_new is True
\ No newline at end of file
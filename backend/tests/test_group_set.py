@@ -0,0 +1,65 @@
+"""Tests for the columnar GroupSet read model."""
+
+import random
+from datetime import datetime, timedelta
+
+from src.domain.entities.group import GroupStatus
+from src.domain.read_models.group_set import GroupSet, to_epoch
+
+
+NOW = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def build_set(rows):
+    """Build a set from (status, blacklist_until) rows."""
+    group_set = GroupSet()
+    for index, (status, until) in enumerate(rows):
+        group_set.append(f"g{index}", f"@group{index}", status, until)
+    return group_set
+
+
+def test_available_mask_matches_statuses_and_deadlines():
+    """Active and expired temporary blacklists are available."""
+    group_set = build_set([
+        (GroupStatus.ACTIVE, None),
+        (GroupStatus.INACTIVE, None),
+        (GroupStatus.BLACKLISTED_TEMP, NOW - timedelta(minutes=1)),
+        (GroupStatus.BLACKLISTED_TEMP, NOW + timedelta(minutes=1)),
+        (GroupStatus.BLACKLISTED_PERM, None),
+    ])
+    
+    assert list(group_set.available_mask(to_epoch(NOW))) == [1, 0, 1, 0, 0]
+    assert group_set.available_ids(to_epoch(NOW)) == ["g0", "g2"]
+    assert group_set.available_indices(to_epoch(NOW)) == [0, 2]
+
+
+def test_available_mask_matches_row_by_row_check():
+    """The column scan agrees with a per-row check on random sets."""
+    rng = random.Random(7)
+    statuses = list(GroupStatus)
+    rows = []
+    for _ in range(2000):
+        status = rng.choice(statuses)
+        until = NOW + timedelta(seconds=rng.randint(-600, 600)) if status == GroupStatus.BLACKLISTED_TEMP else None
+        rows.append((status, until))
+    group_set = build_set(rows)
+    
+    expected = [
+        status == GroupStatus.ACTIVE or (status == GroupStatus.BLACKLISTED_TEMP and until <= NOW)
+        for status, until in rows
+    ]
+    assert [bool(flag) for flag in group_set.available_mask(to_epoch(NOW))] == expected
+
+
+def test_reactivate_expired_flips_only_expired_blacklists():
+    """Expired temporary blacklists become active with their deadline cleared."""
+    group_set = build_set([
+        (GroupStatus.BLACKLISTED_TEMP, NOW - timedelta(seconds=1)),
+        (GroupStatus.BLACKLISTED_TEMP, NOW + timedelta(seconds=1)),
+        (GroupStatus.ACTIVE, None),
+    ])
+    
+    assert group_set.reactivate_expired(to_epoch(NOW)) == [0]
+    assert group_set.status_at(0) == GroupStatus.ACTIVE
+    assert group_set.blacklist_until[0] == 0.0
+    assert group_set.status_at(1) == GroupStatus.BLACKLISTED_TEMP
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""Tests for startup index verification."""
+
+from datetime import datetime, timedelta, timezone
+
+from pymongo import IndexModel
+
+from src.infrastructure.database import indexes
+from src.infrastructure.database.indexes import UNUSED_INDEX_MIN_AGE
+
+
+class FakeCursor:
+    """Aggregation cursor over fixed documents."""
+    
+    def __init__(self, docs):
+        self.docs = docs
+    
+    async def to_list(self, length=None):
+        return self.docs
+
+
+class FakeCollection:
+    """Collection reporting fixed $indexStats."""
+    
+    name = "groups"
+    
+    def __init__(self, stats):
+        self.stats = stats
+    
+    async def index_information(self):
+        return {stat["name"]: {} for stat in self.stats}
+    
+    def aggregate(self, pipeline):
+        return FakeCursor(self.stats)
+
+
+def _stat(name, ops, since):
+    """One $indexStats document."""
+    return {"name": name, "accesses": {"ops": ops, "since": since}}
+
+
+async def test_only_indexes_idle_for_the_minimum_age_are_unused():
+    """Fresh counters (recent restart or creation) never flag an index."""
+    old = datetime.utcnow() - UNUSED_INDEX_MIN_AGE - timedelta(hours=1)
+    fresh = datetime.utcnow() - timedelta(minutes=5)
+    collection = FakeCollection([
+        _stat("_id_", 0, old),
+        _stat("idle_old", 0, old),
+        _stat("idle_old_aware", 0, old.replace(tzinfo=timezone.utc)),
+        _stat("idle_fresh", 0, fresh),
+        _stat("used_old", 12, old),
+    ])
+    declared = [IndexModel("a", name=name) for name in ("idle_old", "idle_old_aware", "idle_fresh", "used_old")]
+    
+    report = await indexes._verify_collection(collection, declared)
+    
+    assert report.unused == ["idle_old", "idle_old_aware"]
+    assert report.missing == []
\ No newline at end of file
@@ -0,0 +1,124 @@
+"""Tests for media storage and per-user access."""
+
+import hashlib
+
+import pytest
+
+from src.domain.entities.media import MediaAsset, MediaHash, MediaKind, MediaNotFoundError
+from src.domain.services.media_service import MediaService
+from src.infrastructure.media.memory_media_blob_store import InMemoryMediaBlobStore
+from src.infrastructure.memory.memory_media_asset_repository import InMemoryMediaAssetRepository
+from src.infrastructure.memory.memory_media_file_reference_repository import InMemoryMediaFileReferenceRepository
+
+
+PHOTO_HASH = MediaHash(hashlib.sha256(b"photo").hexdigest())
+
+
+async def _chunks(data: bytes):
+    """Stream bytes as a single chunk."""
+    yield data
+
+
+def _media_service(assets, blob_store=None) -> MediaService:
+    """Media service without Telegram uploads."""
+    return MediaService(assets, InMemoryMediaFileReferenceRepository(), blob_store or InMemoryMediaBlobStore(), None)
+
+
+async def test_asset_is_visible_only_to_its_uploaders(storage):
+    """Users who did not upload the content cannot look it up."""
+    service = _media_service(storage.media_assets)
+    asset = await service.store_upload("alice", _chunks(b"photo"), "image/png", max_size=1024)
+    
+    assert await service.get_asset(asset.content_hash, "alice")
+    assert await service.get_asset(asset.content_hash, "bob") is None
+    assert await service.get_asset(asset.content_hash) is not None
+
+
+async def test_uploading_existing_content_links_the_new_uploader(storage):
+    """A second upload of the same content grants its uploader access."""
+    service = _media_service(storage.media_assets)
+    first = await service.store_upload("alice", _chunks(b"photo"), "image/png", max_size=1024)
+    second = await service.store_upload("bob", _chunks(b"photo"), "image/png", max_size=1024)
+    
+    assert second.content_hash == first.content_hash
+    assert second.uploaded_by == "alice"
+    assert await service.get_asset(first.content_hash, "bob")
+
+
+class FailingMediaAssetRepository(InMemoryMediaAssetRepository):
+    """Asset repository whose saves fail."""
+    
+    async def save(self, asset):
+        raise RuntimeError("database unavailable")
+
+
+async def test_blob_is_deleted_when_asset_cannot_be_saved():
+    """A blob written for a failed upload is removed."""
+    blob_store = InMemoryMediaBlobStore()
+    service = _media_service(FailingMediaAssetRepository(), blob_store)
+    
+    with pytest.raises(RuntimeError):
+        await service.store_upload("alice", _chunks(b"photo"), "image/png", max_size=1024)
+    
+    assert len(blob_store._blobs) == 0
+
+
+async def test_shared_blob_is_kept_when_asset_cannot_be_saved():
+    """A blob another asset references survives a failed upload."""
+    blob_store = InMemoryMediaBlobStore()
+    assets = FailingMediaAssetRepository()
+    stored = await _media_service(InMemoryMediaAssetRepository(), blob_store).store_upload(
+        "alice", _chunks(b"photo"), "image/png", max_size=1024
+    )
+    await InMemoryMediaAssetRepository.save(assets, stored)
+    
+    with pytest.raises(RuntimeError):
+        await _media_service(assets, blob_store).store_upload("bob", _chunks(b"photo"), "image/png", max_size=1024)
+    
+    assert await blob_store.exists(stored.content_hash)
+
+
+class RacingMediaBlobStore(InMemoryMediaBlobStore):
+    """Blob store where another upload saves its asset just before a delete."""
+    
+    def __init__(self, assets):
+        super().__init__()
+        self.assets = assets
+    
+    async def delete(self, content_hash):
+        await InMemoryMediaAssetRepository.save(self.assets, MediaAsset(
+            content_hash=content_hash, size=5, mime_type="image/png", kind=MediaKind.PHOTO, uploaded_by="alice"
+        ))
+        return await super().delete(content_hash)
+
+
+async def test_blob_is_written_back_when_a_concurrent_upload_saves_its_asset():
+    """An asset saved between the orphan check and the delete keeps its blob."""
+    assets = FailingMediaAssetRepository()
+    blob_store = RacingMediaBlobStore(assets)
+    
+    with pytest.raises(RuntimeError):
+        await _media_service(assets, blob_store).store_upload("bob", _chunks(b"photo"), "image/png", max_size=1024)
+    
+    assert await blob_store.exists(PHOTO_HASH)
+
+
+class DiscardingMediaAssetRepository(InMemoryMediaAssetRepository):
+    """Asset repository whose save lands after another upload discarded the blob."""
+    
+    def __init__(self, blob_store):
+        super().__init__()
+        self.blob_store = blob_store
+    
+    async def save(self, asset):
+        await self.blob_store.delete(asset.content_hash)
+        return await super().save(asset)
+
+
+async def test_upload_fails_when_its_blob_was_discarded_meanwhile():
+    """An upload whose blob vanished before its asset was saved asks for a retry."""
+    blob_store = InMemoryMediaBlobStore()
+    service = _media_service(DiscardingMediaAssetRepository(blob_store), blob_store)
+    
+    with pytest.raises(MediaNotFoundError):
+        await service.store_upload("bob", _chunks(b"photo"), "image/png", max_size=1024)
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""Tests for sliding-window rate limiting."""
+
+import jwt
+import pytest
+
+from src.infrastructure.rate_limiting.memory_rate_limit_backend import InMemoryRateLimitBackend
+from src.infrastructure.rate_limiting.rate_limit_backend import RateLimitHit
+from src.infrastructure.rate_limiting.rate_limit_middleware import RateLimitMiddleware
+from src.infrastructure.rate_limiting.rate_limit_policy import RateLimitPolicy, KEY_BY_USER
+
+
+SECRET = "test-secret"
+
+
+async def test_hit_counts_until_limit():
+    """Requests are allowed until the limit, then rejected."""
+    backend = InMemoryRateLimitBackend()
+    decisions = [await backend.hit("k", 3, 3600) for _ in range(4)]
+    assert [decision.allowed for decision in decisions] == [True, True, True, False]
+    assert decisions[-1].retry_after > 0
+
+
+async def test_rejected_request_counts_against_no_limit():
+    """A request rejected by one limit is not counted by the others."""
+    backend = InMemoryRateLimitBackend()
+    tight, loose = RateLimitHit("tight", 1, 3600), RateLimitHit("loose", 5, 3600)
+    
+    first = await backend.hit_all([tight, loose])
+    assert all(decision.allowed for decision in first)
+    
+    for _ in range(3):
+        rejected = await backend.hit_all([tight, loose])
+        assert [decision.allowed for decision in rejected] == [False, True]
+    
+    # Only the admitted request was counted against the loose limit
+    assert (await backend.hit("loose", 5, 3600)).remaining == 3
+
+
+def _scope(authorization: str = None, client: str = "10.0.0.1"):
+    """Minimal HTTP scope for the middleware identity helpers."""
+    headers = [(b"authorization", authorization.encode())] if authorization else []
+    return {"type": "http", "headers": headers, "client": (client, 1234)}
+
+
+@pytest.fixture
+def middleware():
+    return RateLimitMiddleware(None, [], jwt_secret=SECRET)
+
+
+def test_verified_jwt_is_keyed_by_user(middleware):
+    """A JWT with a valid signature keys the limit by user."""
+    policy = RateLimitPolicy("api", "/api", 10, 60, key=KEY_BY_USER)
+    token = jwt.encode({"user_id": "u1"}, SECRET, algorithm="HS256")
+    assert middleware._identity(policy, _scope(f"Bearer {token}")) == "user:u1"
+
+
+def test_forged_jwt_is_keyed_by_ip(middleware):
+    """A JWT with a bad signature falls back to the client IP."""
+    policy = RateLimitPolicy("api", "/api", 10, 60, key=KEY_BY_USER)
+    token = jwt.encode({"user_id": "u1"}, "other-secret", algorithm="HS256")
+    assert middleware._identity(policy, _scope(f"Bearer {token}")) == "ip:10.0.0.1"
+
+
+def test_api_tokens_share_the_client_ip_budget(middleware):
+    """Random API tokens cannot mint fresh budgets."""
+    policy = RateLimitPolicy("api", "/api", 10, 60, key=KEY_BY_USER)
+    identities = {middleware._identity(policy, _scope(f"Bearer tk_random{n}")) for n in range(5)}
+    assert identities == {"ip:10.0.0.1"}
\ No newline at end of file
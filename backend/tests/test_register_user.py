@@ -0,0 +1,79 @@
+"""Tests for user registration."""
+
+import pytest
+
+from src.application.use_cases.auth.register_user import RegisterUserUseCase, RegisterUserCommand
+from src.domain.entities.user import User, UserId
+from src.domain.repositories.user_repository import DuplicateUserError
+from src.domain.services.authentication_service import AuthenticationService
+from src.infrastructure.security.bcrypt_password_hasher import BcryptPasswordHasher
+
+
+@pytest.fixture
+async def use_case(storage):
+    """Register use case on each storage backend."""
+    hasher = BcryptPasswordHasher(rounds=4)
+    yield RegisterUserUseCase(storage.users, AuthenticationService(storage.users, hasher, jwt_secret="secret"))
+    hasher.close()
+
+
+def _command(username="alice", email="alice@example.com") -> RegisterUserCommand:
+    """Valid registration command."""
+    return RegisterUserCommand(username=username, email=email, password="secret123", full_name="Alice")
+
+
+@pytest.mark.parametrize("field, username, email", [
+    ("username", "alice", "other@example.com"),
+    ("email", "bob", "alice@example.com"),
+])
+async def test_create_rejects_duplicate_through_unique_index(storage, field, username, email):
+    """The insert itself reports which unique field is taken."""
+    await storage.users.create(User(id=UserId("u1"), username="alice", email="alice@example.com",
+                                    password_hash="hash", full_name="Alice"))
+    
+    with pytest.raises(DuplicateUserError) as error:
+        await storage.users.create(User(id=UserId("u2"), username=username, email=email,
+                                        password_hash="hash", full_name="Other"))
+    
+    assert error.value.field == field
+    assert await storage.users.find_by_id(UserId("u2")) is None
+
+
+@pytest.mark.parametrize("username, email, message", [
+    ("alice", "other@example.com", "Username already exists"),
+    ("bob", "alice@example.com", "Email already exists"),
+])
+async def test_duplicate_registration_is_a_conflict(storage, use_case, username, email, message):
+    """A taken username or email fails the single insert and maps to the conflict error."""
+    await use_case.execute(_command())
+    
+    with pytest.raises(ValueError, match=message):
+        await use_case.execute(_command(username, email))
+    
+    assert (await storage.users.find_by_username("alice")).email == "alice@example.com"
+    assert await storage.users.find_by_username("bob") is None
+
+
+async def test_registration_returns_token(use_case):
+    """A free username and email register the user."""
+    result = await use_case.execute(_command())
+    
+    assert result["user"]["username"] == "alice"
+    assert result["user"]["api_token"].startswith("tk_")
+
+
+async def test_next_available_username_skips_taken_suffixes(storage):
+    """A taken base gets a suffix above every taken one, numerically."""
+    users = storage.users
+    assert await users.next_available_username("alice") == "alice"
+    
+    for index, username in enumerate(["alice", "alice_9", "alice_10", "alice_x", "alicebob"]):
+        await users.create(User(id=UserId(f"u{index}"), username=username, email=f"{index}@example.com",
+                                password_hash="hash", full_name="Alice"))
+    
+    first = await users.next_available_username("alice")
+    assert first == "alice_11"
+    await users.create(User(id=UserId("u11"), username=first, email="11@example.com",
+                            password_hash="hash", full_name="Alice"))
+    assert await users.next_available_username("alice") == "alice_12"
+    assert await users.next_available_username("bob") == "bob"
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""Tests for sending templates to groups."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.application.use_cases.telegram.send_template import SendTemplateUseCase, SendTemplateCommand
+from src.domain.entities.group import Group, GroupId, GroupStatus, BlacklistReason
+from src.domain.entities.message_template import MessageTemplate, TemplateId, TemplateVariant
+from src.domain.entities.telegram_session import SessionId, TelegramCredentials, TelegramSession
+from src.domain.services.media_service import MediaService
+from src.domain.services.telegram_service import TelegramService, TelegramError, TelegramFloodError
+from src.domain.services.template_renderer import TemplateRenderer
+from src.infrastructure.buffering.template_usage_buffer import TemplateUsageBuffer
+from src.infrastructure.media.memory_media_blob_store import InMemoryMediaBlobStore
+
+
+class ScriptedTelegramService(TelegramService):
+    """Records sent messages; groups named in ``outcomes`` fail instead."""
+    
+    def __init__(self, session_repository, outcomes=None):
+        super().__init__(session_repository)
+        self.outcomes = outcomes or {}
+        self.sent = []
+    
+    async def send_message_to_group(self, session_id, group, message, media_reference=None):
+        outcome = self.outcomes.get(group.name)
+        if outcome == "flood":
+            group.blacklist_temporarily(BlacklistReason.FLOOD_WAIT, 60)
+            raise TelegramFloodError(60)
+        if outcome == "banned":
+            group.blacklist_permanently(BlacklistReason.USER_BANNED)
+            raise TelegramError("User banned in channel")
+        
+        group.record_message_sent()
+        self.sent.append((group.name, message))
+        return {"success": True}
+
+
+async def _setup(storage, outcomes=None, variants=None):
+    """Store a session, a default template and four groups; return use case, telegram and usage buffer."""
+    await storage.telegram_sessions.save(TelegramSession(
+        id=SessionId("s1"), user_id="u1", phone_number="+100000000",
+        credentials=TelegramCredentials(api_id=1, api_hash="hash"), encrypted_session_data=""
+    ))
+    template = MessageTemplate(
+        id=TemplateId("t1"), name="Promo", content="Hi {group_name}", is_default=True, variants=variants
+    )
+    await storage.message_templates.save(template)
+    
+    groups = [
+        Group(id=GroupId("g1"), user_id="u1", telegram_id="1", name="one"),
+        Group(id=GroupId("g2"), user_id="u1", telegram_id="2", name="two"),
+        Group(id=GroupId("g3"), user_id="u1", telegram_id="3", name="three", status=GroupStatus.BLACKLISTED_PERM),
+        Group(id=GroupId("g4"), user_id="u1", telegram_id="4", name="four", status=GroupStatus.BLACKLISTED_TEMP,
+              blacklist_until=datetime.utcnow() - timedelta(minutes=1)),
+    ]
+    await storage.groups.bulk_save(groups)
+    
+    telegram = ScriptedTelegramService(storage.telegram_sessions, outcomes)
+    media = MediaService(storage.media_assets, storage.media_file_references, InMemoryMediaBlobStore(), telegram)
+    buffer = TemplateUsageBuffer(storage.message_templates)
+    use_case = SendTemplateUseCase(
+        storage.groups, storage.message_templates, storage.telegram_sessions, telegram, media,
+        TemplateRenderer(), buffer
+    )
+    return use_case, telegram, buffer
+
+
+async def test_sends_rendered_template_to_available_groups(storage):
+    """Available groups get the rendered default template and usage is recorded."""
+    use_case, telegram, buffer = await _setup(storage)
+    
+    result = await use_case.execute(SendTemplateCommand(user_id="u1", session_id="s1"))
+    
+    assert result["sent"] == 3 and result["failed"] == 0
+    assert sorted(telegram.sent) == [("four", "Hi four"), ("one", "Hi one"), ("two", "Hi two")]
+    
+    group = await storage.groups.find_by_id("u1", GroupId("g1"))
+    assert group.message_count == 1
+    
+    await buffer.flush()
+    template = await storage.message_templates.find_by_id(TemplateId("t1"))
+    assert template.usage_count == 3
+
+
+async def test_failures_are_counted_and_blacklists_saved(storage):
+    """Failed sends are counted per variant and the blacklist is stored."""
+    variants = [TemplateVariant("a", "A {group_name}"), TemplateVariant("b", "B {group_name}")]
+    use_case, telegram, buffer = await _setup(storage, outcomes={"two": "banned"}, variants=variants)
+    
+    result = await use_case.execute(SendTemplateCommand(user_id="u1", session_id="s1"))
+    
+    assert result["sent"] == 2 and result["failed"] == 1
+    assert (await storage.groups.find_by_id("u1", GroupId("g2"))).status == GroupStatus.BLACKLISTED_PERM
+    
+    await buffer.flush()
+    stats = (await storage.message_templates.find_by_id(TemplateId("t1"))).variant_stats
+    assert sum(outcome.get("sent", 0) for outcome in stats.values()) == 2
+    assert sum(outcome.get("failed", 0) for outcome in stats.values()) == 1
+
+
+async def test_flood_wait_stops_the_run(storage):
+    """A flood wait ends the run after the first failure."""
+    use_case, telegram, _ = await _setup(storage, outcomes={"one": "flood", "two": "flood", "four": "flood"})
+    
+    result = await use_case.execute(SendTemplateCommand(user_id="u1", session_id="s1"))
+    
+    assert result["attempted"] == 1
+    assert result["flood_wait_seconds"] == 60
+
+
+async def test_session_of_another_user_is_not_found(storage):
+    """Another user's session is reported as not found."""
+    use_case, _, _ = await _setup(storage)
+    assert await use_case.execute(SendTemplateCommand(user_id="u2", session_id="s1")) is None
+
+
+async def test_group_limit_is_validated(storage):
+    """max_groups outside the allowed range is rejected."""
+    use_case, _, _ = await _setup(storage)
+    with pytest.raises(ValueError):
+        await use_case.execute(SendTemplateCommand(user_id="u1", session_id="s1", max_groups=0))
\ No newline at end of file
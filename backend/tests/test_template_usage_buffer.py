@@ -0,0 +1,134 @@
+"""Tests for the template usage write-behind buffer."""
+
+import asyncio
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+from src.domain.entities.message_template import MessageTemplate, TemplateId
+from src.domain.repositories.message_template_repository import TemplateUsageWriteError
+from src.infrastructure.buffering.template_usage_buffer import TemplateUsageBuffer
+from src.infrastructure.database.mongodb_message_template_repository import MongoDBMessageTemplateRepository
+from src.infrastructure.memory.memory_message_template_repository import InMemoryMessageTemplateRepository
+from src.infrastructure.memory.memory_tombstone_repository import InMemoryTombstoneRepository
+
+
+class PartlyFailingTemplateRepository(InMemoryMessageTemplateRepository):
+    """Applies usage for every template except the one named ``failing``."""
+    
+    def __init__(self, failing: str):
+        super().__init__(InMemoryTombstoneRepository())
+        self.failing = failing
+    
+    async def apply_usage(self, deltas):
+        failed = [delta for delta in deltas if delta.template_id.value == self.failing]
+        await super().apply_usage([delta for delta in deltas if delta not in failed])
+        if failed:
+            raise TemplateUsageWriteError(failed, "write failed")
+
+
+async def _usage_count(repository, template_id: str) -> int:
+    """Stored usage count of a template."""
+    return (await repository.find_by_id(TemplateId(template_id))).usage_count
+
+
+async def test_flush_requeues_only_failed_deltas():
+    """Deltas applied before a partial failure are not written twice."""
+    repository = PartlyFailingTemplateRepository(failing="bad")
+    for template_id in ("good", "bad"):
+        await repository.save(MessageTemplate(id=TemplateId(template_id), name=template_id, content="Hi"))
+    
+    buffer = TemplateUsageBuffer(repository)
+    buffer.record(TemplateId("good"), count=2)
+    buffer.record(TemplateId("bad"), count=3)
+    
+    with pytest.raises(TemplateUsageWriteError):
+        await buffer.flush()
+    assert buffer.pending_uses == 3
+    
+    repository.failing = None
+    buffer.record(TemplateId("bad"))
+    await buffer.flush()
+    
+    assert await _usage_count(repository, "good") == 2
+    assert await _usage_count(repository, "bad") == 4
+    assert buffer.pending_uses == 0
+
+
+class FakeCollection:
+    """Collection whose bulk writes fail for the given operation indexes."""
+    
+    def __init__(self, failed_indexes):
+        self.failed_indexes = failed_indexes
+    
+    async def bulk_write(self, operations, ordered=True):
+        raise BulkWriteError({"writeErrors": [{"index": index, "errmsg": "boom"} for index in self.failed_indexes]})
+
+
+async def test_mongo_bulk_write_error_names_failed_deltas():
+    """BulkWriteError indexes map back to the deltas that failed."""
+    repository = MongoDBMessageTemplateRepository.__new__(MongoDBMessageTemplateRepository)
+    repository.collection = FakeCollection([1])
+    buffer = TemplateUsageBuffer(repository)
+    for template_id in ("a", "b", "c"):
+        buffer.record(TemplateId(template_id))
+    
+    with pytest.raises(TemplateUsageWriteError) as error:
+        await buffer.flush()
+    
+    assert [delta.template_id.value for delta in error.value.failed] == ["b"]
+    assert buffer.pending_uses == 1
+
+
+class SlowTemplateRepository(InMemoryMessageTemplateRepository):
+    """Blocks apply_usage until ``release`` is set."""
+    
+    def __init__(self):
+        super().__init__(InMemoryTombstoneRepository())
+        self.entered = asyncio.Event()
+        self.release = asyncio.Event()
+    
+    async def apply_usage(self, deltas):
+        self.entered.set()
+        await self.release.wait()
+        await super().apply_usage(deltas)
+
+
+async def test_stop_during_flush_persists_counts():
+    """Stopping while a flush is in flight finishes it and writes later uses too."""
+    repository = SlowTemplateRepository()
+    await repository.save(MessageTemplate(id=TemplateId("t1"), name="t1", content="Hi"))
+    buffer = TemplateUsageBuffer(repository, flush_interval=0.01)
+    buffer.start()
+    
+    buffer.record(TemplateId("t1"), count=4)
+    await asyncio.wait_for(repository.entered.wait(), timeout=1)
+    buffer.record(TemplateId("t1"), count=1)
+    
+    stopping = asyncio.create_task(buffer.stop())
+    await asyncio.sleep(0.05)
+    assert not stopping.done()
+    repository.release.set()
+    await asyncio.wait_for(stopping, timeout=1)
+    
+    assert await _usage_count(repository, "t1") == 5
+    assert buffer.pending_uses == 0
+
+
+async def test_cancelled_flush_requeues_deltas():
+    """A flush cancelled mid-write puts its deltas back."""
+    repository = SlowTemplateRepository()
+    await repository.save(MessageTemplate(id=TemplateId("t1"), name="t1", content="Hi"))
+    buffer = TemplateUsageBuffer(repository)
+    buffer.record(TemplateId("t1"), count=3)
+    
+    flushing = asyncio.create_task(buffer.flush())
+    await asyncio.wait_for(repository.entered.wait(), timeout=1)
+    flushing.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await flushing
+    
+    assert buffer.pending_uses == 3
+    repository.release.set()
+    await buffer.flush()
+    assert await _usage_count(repository, "t1") == 3
\ No newline at end of file
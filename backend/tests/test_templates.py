@@ -0,0 +1,67 @@
+"""Tests for template use cases against every storage backend."""
+
+import pytest
+
+from src.application.use_cases.templates.create_template import CreateTemplateUseCase, CreateTemplateCommand
+from src.application.use_cases.templates.update_template import UpdateTemplateUseCase, UpdateTemplateCommand
+from src.domain.entities.message_template import MessageTemplate, TemplateId
+from src.domain.repositories.message_template_repository import DuplicateTemplateNameError
+
+
+async def test_duplicate_name_is_rejected_on_insert(storage):
+    """A second template with a taken name is not stored."""
+    repository = storage.message_templates
+    await repository.save(MessageTemplate(id=TemplateId("t1"), name="Promo", content="A"))
+    
+    with pytest.raises(DuplicateTemplateNameError):
+        await repository.save(MessageTemplate(id=TemplateId("t2"), name="Promo", content="B"))
+    
+    assert await repository.count_templates() == 1
+
+
+async def test_duplicate_name_is_rejected_on_rename(storage):
+    """Renaming to a taken name is rejected."""
+    repository = storage.message_templates
+    await repository.save(MessageTemplate(id=TemplateId("t1"), name="Promo", content="A"))
+    await repository.save(MessageTemplate(id=TemplateId("t2"), name="News", content="B"))
+    
+    template = await repository.find_by_id(TemplateId("t2"))
+    template.update_content("Promo", "B")
+    with pytest.raises(DuplicateTemplateNameError):
+        await repository.save(template)
+    
+    assert (await repository.find_by_id(TemplateId("t2"))).name == "News"
+
+
+async def test_create_with_taken_name_keeps_the_default(storage):
+    """A rejected default template does not clear the current default."""
+    use_case = CreateTemplateUseCase(storage.message_templates)
+    first = await use_case.execute(CreateTemplateCommand(name="Promo", content="A", is_default=True))
+    
+    with pytest.raises(ValueError, match="already exists"):
+        await use_case.execute(CreateTemplateCommand(name="Promo", content="B", is_default=True))
+    
+    default = await storage.message_templates.find_default_template()
+    assert default.id.value == first["id"]
+
+
+async def test_update_to_taken_name_is_rejected(storage):
+    """The update use case reports a taken name."""
+    create = CreateTemplateUseCase(storage.message_templates)
+    await create.execute(CreateTemplateCommand(name="Promo", content="A"))
+    news = await create.execute(CreateTemplateCommand(name="News", content="B"))
+    
+    with pytest.raises(ValueError, match="already exists"):
+        await UpdateTemplateUseCase(storage.message_templates).execute(
+            UpdateTemplateCommand(template_id=news["id"], name="Promo", content="B")
+        )
+
+
+async def test_over_nested_spintax_is_rejected_before_saving(storage):
+    """Over-nested spintax fails validation and nothing is stored."""
+    content = "{a|" * 100 + "x" + "}" * 100
+    with pytest.raises(ValueError):
+        await CreateTemplateUseCase(storage.message_templates).execute(
+            CreateTemplateCommand(name="Deep", content=content)
+        )
+    assert await storage.message_templates.count_templates() == 0
\ No newline at end of file